@@ -0,0 +1,42 @@
+"""add_composite_query_indexes
+
+Revision ID: 3f7a2c91b5d4
+Revises: da2be2b840af
+Create Date: 2026-10-19 09:12:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f7a2c91b5d4'
+down_revision = 'da2be2b840af'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Question review list, keyset pagination and export (quiz_id, created_at, id);
+    # is_approved is included so approval filters and counts use the index
+    op.create_index(
+        'ix_question_quiz_id_created_at_id_active',
+        'question',
+        ['quiz_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_include=['is_approved'],
+        postgresql_where=sa.text('deleted = false'),
+    )
+    # Quiz listing per owner, newest first
+    op.create_index(
+        'ix_quiz_owner_id_created_at_id_active',
+        'quiz',
+        ['owner_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_quiz_owner_id_created_at_id_active', table_name='quiz')
+    op.drop_index('ix_question_quiz_id_created_at_id_active', table_name='question')
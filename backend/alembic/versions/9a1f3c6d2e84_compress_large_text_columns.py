@@ -0,0 +1,127 @@
+"""compress_large_text_columns
+
+Revision ID: 9a1f3c6d2e84
+Revises: b5d2e8f41c37
+Create Date: 2026-10-19 15:02:41.218530
+
+"""
+import os
+from pathlib import Path
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1f3c6d2e84'
+down_revision = 'b5d2e8f41c37'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+# (table, key column, value column)
+COLUMNS = [
+    ('contenttext', 'content_hash', 'content'),
+    ('manualmodulestaging', 'module_id', 'content'),
+]
+
+
+# The codec is copied here rather than imported from the application, so this
+# revision keeps producing the same bytes whatever src.compression becomes.
+# Values written here never use a dictionary.
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+COMPRESSION_LEVEL = 3
+MIN_BYTES = 256
+
+
+def _dictionaries():
+    """Load the zstd dictionaries values may have been written with since."""
+    paths = []
+    if os.environ.get('DB_COMPRESSION_DICTIONARY_DIR'):
+        directory = Path(os.environ['DB_COMPRESSION_DICTIONARY_DIR'])
+        paths.extend(path for path in sorted(directory.iterdir()) if path.is_file())
+    if os.environ.get('DB_COMPRESSION_DICTIONARY_PATH'):
+        paths.append(Path(os.environ['DB_COMPRESSION_DICTIONARY_PATH']))
+    dictionaries = {}
+    for path in paths:
+        dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+        dictionaries[dictionary.dict_id()] = dictionary
+    return dictionaries
+
+
+def _encode(value):
+    raw = value.encode('utf-8')
+    if len(raw) < MIN_BYTES:
+        return raw
+    compressed = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(raw)
+    return compressed if len(compressed) < len(raw) else raw
+
+
+def _decoder():
+    dictionaries = None
+    decompressors = {}
+
+    def decode(value):
+        nonlocal dictionaries
+        data = bytes(value)
+        if not data.startswith(ZSTD_MAGIC):
+            return data.decode('utf-8')
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        if dict_id not in decompressors:
+            if dict_id:
+                if dictionaries is None:
+                    dictionaries = _dictionaries()
+                if dict_id not in dictionaries:
+                    raise RuntimeError(
+                        f'Compressed value requires zstd dictionary {dict_id}; '
+                        'set DB_COMPRESSION_DICTIONARY_DIR to the directory '
+                        'holding it before downgrading'
+                    )
+                decompressors[dict_id] = zstandard.ZstdDecompressor(
+                    dict_data=dictionaries[dict_id]
+                )
+            else:
+                decompressors[dict_id] = zstandard.ZstdDecompressor()
+        return decompressors[dict_id].decompress(data).decode('utf-8')
+
+    return decode
+
+
+def _convert(table, key, column, new_type, transform):
+    """Rewrite a column through Python in batches, then swap it in."""
+    connection = op.get_bind()
+    staging = f'{column}_converted'
+    op.add_column(table, sa.Column(staging, new_type, nullable=True))
+
+    rows = connection.execute(
+        sa.text(
+            f'SELECT {key}, {column} FROM {table} WHERE {column} IS NOT NULL'
+        ).execution_options(stream_results=True)
+    )
+    update_row = sa.text(
+        f'UPDATE {table} SET {staging} = :value WHERE {key} = :key'
+    ).bindparams(sa.bindparam('value', type_=new_type))
+
+    for batch in rows.partitions(BATCH_SIZE):
+        connection.execute(
+            update_row,
+            [{'key': row[0], 'value': transform(row[1])} for row in batch],
+        )
+
+    op.drop_column(table, column)
+    op.alter_column(table, staging, new_column_name=column, nullable=False)
+
+
+def upgrade():
+    for table, key, column in COLUMNS:
+        _convert(table, key, column, sa.LargeBinary(), _encode)
+        # Values are already zstd-compressed; stop Postgres re-compressing
+        # them with pglz when they are TOASTed
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL')
+
+
+def downgrade():
+    for table, key, column in reversed(COLUMNS):
+        _convert(table, key, column, sa.Text(), _decoder())
@@ -0,0 +1,55 @@
+"""
+Train a zstd dictionary from stored extracted content.
+
+Usage:
+    python scripts/train_compression_dictionary.py OUTPUT_PATH [SAMPLE_COUNT]
+
+Write the dictionary into DB_COMPRESSION_DICTIONARY_DIR and point
+DB_COMPRESSION_DICTIONARY_PATH at it to use it for new writes. Keep every
+dictionary that has been deployed in that directory: values compressed with a
+dictionary can only be read while it is there.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from sqlalchemy import func
+from sqlmodel import col, select
+
+# Import all models to ensure SQLAlchemy can resolve relationships
+import src.auth.models  # noqa
+import src.question.models  # noqa
+from src.compression import train_compression_dictionary
+from src.database import get_session
+from src.quiz.models import ContentText
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_COUNT = 2000
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+
+    output_path = Path(sys.argv[1])
+    sample_count = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SAMPLE_COUNT
+
+    with get_session() as session:
+        samples = session.exec(
+            select(col(ContentText.content)).order_by(func.random()).limit(sample_count)
+        ).all()
+
+    logger.info(f"Training dictionary from {len(samples)} samples")
+    output_path.write_bytes(train_compression_dictionary(samples))
+    logger.info(f"Dictionary written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 """Authentication module for Canvas OAuth and user management."""
 
-from .dependencies import CurrentUser, get_current_user
+from .dependencies import (
+    AdminUser,
+    CurrentUser,
+    get_current_admin_user,
+    get_current_user,
+)
 from .models import User
 from .router import router, users_router
 from .schemas import (
@@ -23,7 +28,9 @@ __all__ = [
     "TokenPayload",
     "CanvasAuthRequest",
     "CanvasAuthResponse",
+    "AdminUser",
     "CurrentUser",
+    "get_current_admin_user",
     "get_current_user",
     "create_access_token",
 ]
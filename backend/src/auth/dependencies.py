@@ -92,3 +92,25 @@ def get_current_user(
 
 # Type alias for dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+def get_current_admin_user(current_user: CurrentUser) -> User:
+    """
+    Get the current user, requiring them to be an administrator.
+
+    Administrators are the users whose Canvas IDs are listed in
+    ADMIN_CANVAS_IDS.
+
+    **Raises:**
+        HTTPException(403): The user is not an administrator
+    """
+    if current_user.canvas_id not in settings.ADMIN_CANVAS_IDS:
+        logger.warning("admin_access_denied", user_id=str(current_user.id))
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator access required",
+        )
+    return current_user
+
+
+AdminUser = Annotated[User, Depends(get_current_admin_user)]
@@ -10,7 +10,7 @@ from src.auth.dependencies import CurrentUser
 from src.config import settings
 from src.database import SessionDep
 
-from .security import ensure_valid_canvas_token
+from .security import CanvasTokenProvider, ensure_valid_canvas_token
 from .url_builder import CanvasURLBuilder
 
 
@@ -65,6 +65,25 @@ async def get_canvas_token(current_user: CurrentUser, session: SessionDep) -> st
     return await ensure_valid_canvas_token(session, current_user)
 
 
+async def get_canvas_token_provider(
+    current_user: CurrentUser,
+    canvas_token: Annotated[str, Depends(get_canvas_token)],
+) -> CanvasTokenProvider:
+    """
+    FastAPI dependency that provides a Canvas token provider for background jobs.
+
+    Background orchestrations may run past the expiry of the request's token.
+    The provider starts from the token validated for this request and
+    refreshes it on demand, sharing refreshes with concurrent requests.
+
+    **Usage as Dependency:**
+        >>> @router.post("/quiz/{quiz_id}/export")
+        >>> async def export(token_provider: CanvasTokenProviderDep):
+        ...     background_tasks.add_task(orchestrate_export, token_provider)
+    """
+    return CanvasTokenProvider.for_user(current_user, canvas_token)
+
+
 def get_canvas_url_builder() -> CanvasURLBuilder:
     """
     FastAPI dependency that provides a configured Canvas URL builder.
@@ -101,4 +120,7 @@ def get_canvas_url_builder() -> CanvasURLBuilder:
 
 # Type aliases for dependency injection
 CanvasToken = Annotated[str, Depends(get_canvas_token)]
+CanvasTokenProviderDep = Annotated[
+    CanvasTokenProvider, Depends(get_canvas_token_provider)
+]
 CanvasURLBuilderDep = Annotated[CanvasURLBuilder, Depends(get_canvas_url_builder)]
@@ -1,7 +1,11 @@
+import asyncio
+import weakref
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 import httpx
 from fastapi import HTTPException
+from sqlalchemy import text
 from sqlmodel import Session
 
 from src.auth.models import User
@@ -11,18 +15,35 @@ from src.auth.service import (
     get_decrypted_refresh_token,
     update_user_tokens,
 )
+from src.circuit_breaker import get_circuit_breaker
 from src.config import get_logger, settings
+from src.database import get_session
 from src.exceptions import AuthenticationError, ExternalServiceError
 from src.retry import retry_on_failure
 
 ALGORITHM = "HS256"
 logger = get_logger("canvas_security")
+canvas_circuit_breaker = get_circuit_breaker("canvas")
+
+# Tokens expiring within this margin are refreshed before use
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Seconds between attempts to take another worker's refresh lock
+ADVISORY_LOCK_POLL_INTERVAL = 0.1
+
+# One lock per user serializes refreshes within this process; the Postgres
+# advisory lock extends that across workers
+_refresh_locks: weakref.WeakValueDictionary[UUID, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
 
 
 # Note: create_access_token has been moved to app.auth.utils
 
 
-@retry_on_failure(max_attempts=2, initial_delay=1.0)
+@retry_on_failure(
+    max_attempts=2, initial_delay=1.0, circuit_breaker=canvas_circuit_breaker
+)
 async def refresh_canvas_token(user: User, session: Session) -> None:
     """
     Refresh Canvas OAuth token for a user.
@@ -122,36 +143,137 @@ async def refresh_canvas_token(user: User, session: Session) -> None:
         raise
 
 
-async def ensure_valid_canvas_token(session: Session, user: User) -> str:
+def _expires_soon(expires_at: datetime | None) -> bool:
+    """Check whether a token expiring at expires_at should be refreshed."""
+    if expires_at is None:
+        return False
+
+    # Ensure both datetimes are timezone-aware for comparison
+    if expires_at.tzinfo is None:
+        # If stored datetime is naive, assume it's UTC
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+    return expires_at <= datetime.now(timezone.utc) + TOKEN_REFRESH_MARGIN
+
+
+async def _acquire_refresh_advisory_lock(session: Session, user: User) -> None:
     """
-    Ensure Canvas token is valid, refresh if needed.
-    Returns a valid Canvas access token.
+    Take the user's token refresh advisory lock for the current transaction.
+
+    The lock is polled rather than waited on so a refresh running in another
+    worker does not block this worker's event loop.
     """
-    # Check if token expires within 5 minutes
-    if user.expires_at:
-        expires_soon = datetime.now(timezone.utc) + timedelta(minutes=5)
-
-        # Ensure both datetimes are timezone-aware for comparison
-        if user.expires_at.tzinfo is None:
-            # If stored datetime is naive, assume it's UTC
-            user_expires_at = user.expires_at.replace(tzinfo=timezone.utc)
-        else:
-            user_expires_at = user.expires_at
-
-        if user_expires_at <= expires_soon:
-            try:
+    key = int.from_bytes(user.id.bytes[:8], "big", signed=True)
+    while not session.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key}
+    ).scalar():
+        await asyncio.sleep(ADVISORY_LOCK_POLL_INTERVAL)
+
+
+async def refresh_canvas_token_if_needed(session: Session, user: User) -> str:
+    """
+    Get the user's Canvas access token, refreshing it first if it expires soon.
+
+    Concurrent callers for the same user share a single refresh: the first
+    one takes the user's refresh locks and calls Canvas, the others wait for
+    it and then find the stored token already refreshed.
+
+    Args:
+        session: Database session the user was loaded in
+        user: User whose token is needed
+
+    Returns:
+        Decrypted Canvas access token
+
+    Raises:
+        AuthenticationError: If the token cannot be refreshed
+        ExternalServiceError: If Canvas API call fails
+    """
+    if not _expires_soon(user.expires_at):
+        return get_decrypted_access_token(user)
+
+    lock = _refresh_locks.setdefault(user.id, asyncio.Lock())
+    async with lock:
+        await _acquire_refresh_advisory_lock(session, user)
+        try:
+            # Another request or worker may have refreshed while we waited
+            session.refresh(user)
+            if _expires_soon(user.expires_at):
                 await refresh_canvas_token(user, session)
-            except AuthenticationError:
-                # Invalid canvas token - clear and force re-login
-                clear_user_tokens(session, user)
-                raise HTTPException(
-                    status_code=401,
-                    detail="Canvas session expired. Please re-login.",
-                )
-            except ExternalServiceError:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Canvas temporarily unavailable. Please try again.",
+            else:
+                logger.debug(
+                    "canvas_token_refresh_already_done",
+                    user_id=str(user.id),
+                    canvas_id=user.canvas_id,
                 )
+        finally:
+            # Saving the new token commits and releases the advisory lock;
+            # end the transaction on the paths that did not
+            if session.in_transaction():
+                session.commit()
 
     return get_decrypted_access_token(user)
+
+
+async def ensure_valid_canvas_token(session: Session, user: User) -> str:
+    """
+    Ensure Canvas token is valid, refresh if needed.
+    Returns a valid Canvas access token.
+    """
+    try:
+        return await refresh_canvas_token_if_needed(session, user)
+    except AuthenticationError:
+        # Invalid canvas token - clear and force re-login
+        clear_user_tokens(session, user)
+        raise HTTPException(
+            status_code=401,
+            detail="Canvas session expired. Please re-login.",
+        )
+    except ExternalServiceError:
+        raise HTTPException(
+            status_code=503,
+            detail="Canvas temporarily unavailable. Please try again.",
+        )
+
+
+class CanvasTokenProvider:
+    """
+    Supplies a valid Canvas access token to background jobs.
+
+    Background jobs can outlive the token they were started with. The provider
+    keeps the token known at trigger time and, once it expires soon, loads the
+    user and refreshes through the same single-flight path as requests.
+    """
+
+    def __init__(
+        self, user_id: UUID, access_token: str, expires_at: datetime | None = None
+    ) -> None:
+        self.user_id = user_id
+        self._access_token = access_token
+        self._expires_at = expires_at
+
+    @classmethod
+    def for_user(cls, user: User, access_token: str) -> "CanvasTokenProvider":
+        """Create a provider starting from a user's current valid token."""
+        return cls(user.id, access_token, user.expires_at)
+
+    async def get_token(self) -> str:
+        """
+        Get a valid Canvas access token, refreshing it when needed.
+
+        Raises:
+            AuthenticationError: If the user is gone or the token cannot be refreshed
+            ExternalServiceError: If Canvas API call fails
+        """
+        if not _expires_soon(self._expires_at):
+            return self._access_token
+
+        with get_session() as session:
+            user = session.get(User, self.user_id)
+            if not user:
+                raise AuthenticationError("User not found for Canvas token refresh")
+
+            self._access_token = await refresh_canvas_token_if_needed(session, user)
+            self._expires_at = user.expires_at
+
+        return self._access_token
@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.circuit_breaker import get_circuit_breaker
 from src.config import get_logger, settings
 from src.exceptions import ExternalServiceError
 from src.retry import retry_on_failure
@@ -16,6 +17,9 @@ from .url_builder import CanvasURLBuilder
 
 logger = get_logger("canvas_service")
 
+# Shared by every Canvas API call, including token refreshes
+canvas_circuit_breaker = get_circuit_breaker("canvas")
+
 
 def _get_canvas_url_builder() -> CanvasURLBuilder:
     """Get configured Canvas URL builder."""
@@ -33,7 +37,9 @@ def _get_canvas_headers(canvas_token: str) -> dict[str, str]:
     }
 
 
-@retry_on_failure(max_attempts=3, initial_delay=1.0)
+@retry_on_failure(
+    max_attempts=3, initial_delay=1.0, circuit_breaker=canvas_circuit_breaker
+)
 async def fetch_canvas_module_items(
     canvas_token: str, course_id: int, module_id: int
 ) -> list[dict[str, Any]]:
@@ -92,7 +98,9 @@ async def fetch_canvas_module_items(
         return []  # Return empty list on network/connection errors
 
 
-@retry_on_failure(max_attempts=2, initial_delay=0.5)
+@retry_on_failure(
+    max_attempts=2, initial_delay=0.5, circuit_breaker=canvas_circuit_breaker
+)
 async def fetch_canvas_page_content(
     canvas_token: str, course_id: int, page_url: str
 ) -> dict[str, Any]:
@@ -138,7 +146,9 @@ async def fetch_canvas_page_content(
         raise ExternalServiceError("canvas", f"Failed to fetch page content: {str(e)}")
 
 
-@retry_on_failure(max_attempts=2, initial_delay=0.5)
+@retry_on_failure(
+    max_attempts=2, initial_delay=0.5, circuit_breaker=canvas_circuit_breaker
+)
 async def fetch_canvas_file_info(
     canvas_token: str, course_id: int, file_id: int
 ) -> dict[str, Any]:
@@ -176,7 +186,9 @@ async def fetch_canvas_file_info(
         return {}
 
 
-@retry_on_failure(max_attempts=2, initial_delay=1.0)
+@retry_on_failure(
+    max_attempts=2, initial_delay=1.0, circuit_breaker=canvas_circuit_breaker
+)
 async def download_canvas_file_content(download_url: str) -> bytes:
     """
     Download file content from Canvas.
@@ -209,7 +221,9 @@ async def download_canvas_file_content(download_url: str) -> bytes:
 # Quiz Export Canvas API Functions
 
 
-@retry_on_failure(max_attempts=3, initial_delay=2.0)
+@retry_on_failure(
+    max_attempts=3, initial_delay=2.0, circuit_breaker=canvas_circuit_breaker
+)
 async def create_canvas_quiz(
     canvas_token: str, course_id: int, title: str, total_points: int
 ) -> dict[str, Any]:
@@ -336,9 +350,11 @@ async def create_canvas_quiz_items(
 
     async with httpx.AsyncClient(timeout=settings.CANVAS_API_TIMEOUT) as client:
         for i, question in enumerate(questions):
+            # Resumed exports pass their quiz-wide position along
+            position = question.get("position", i + 1)
             try:
                 # Convert question to Canvas New Quiz item format
-                item_data = convert_question_to_canvas_format(question, i + 1)
+                item_data = convert_question_to_canvas_format(question, position)
 
                 response = await client.post(
                     url_builder.quiz_api_items(course_id, quiz_id),
@@ -353,7 +369,7 @@ async def create_canvas_quiz_items(
                         "success": True,
                         "question_id": question["id"],
                         "item_id": item_response.get("id"),
-                        "position": i + 1,
+                        "position": position,
                     }
                 )
 
@@ -363,7 +379,7 @@ async def create_canvas_quiz_items(
                     canvas_quiz_id=quiz_id,
                     question_id=str(question["id"]),
                     canvas_item_id=item_response.get("id"),
-                    position=i + 1,
+                    position=position,
                 )
 
             except httpx.HTTPStatusError as e:
@@ -372,7 +388,7 @@ async def create_canvas_quiz_items(
                     course_id=course_id,
                     canvas_quiz_id=quiz_id,
                     question_id=str(question["id"]),
-                    position=i + 1,
+                    position=position,
                     status_code=e.response.status_code,
                     response_text=e.response.text,
                 )
@@ -390,21 +406,21 @@ async def create_canvas_quiz_items(
                                 "question_unapproved_due_to_502_error",
                                 question_id=str(question["id"]),
                                 canvas_quiz_id=quiz_id,
-                                position=i + 1,
+                                position=position,
                             )
                         else:
                             logger.warning(
                                 "question_unapproval_failed_502_error",
                                 question_id=str(question["id"]),
                                 canvas_quiz_id=quiz_id,
-                                position=i + 1,
+                                position=position,
                             )
                     except Exception as unapproval_error:
                         logger.error(
                             "question_unapproval_exception_502_error",
                             question_id=str(question["id"]),
                             canvas_quiz_id=quiz_id,
-                            position=i + 1,
+                            position=position,
                             error=str(unapproval_error),
                         )
 
@@ -414,7 +430,7 @@ async def create_canvas_quiz_items(
                         "success": False,
                         "question_id": question["id"],
                         "error": f"Canvas API error: {e.response.status_code}",
-                        "position": i + 1,
+                        "position": position,
                     }
                 )
 
@@ -424,7 +440,7 @@ async def create_canvas_quiz_items(
                     course_id=course_id,
                     canvas_quiz_id=quiz_id,
                     question_id=str(question["id"]),
-                    position=i + 1,
+                    position=position,
                     error=str(e),
                     error_type=type(e).__name__,
                 )
@@ -433,7 +449,7 @@ async def create_canvas_quiz_items(
                         "success": False,
                         "question_id": question["id"],
                         "error": str(e),
-                        "position": i + 1,
+                        "position": position,
                     }
                 )
 
@@ -465,6 +481,10 @@ def convert_question_to_canvas_format(
     Returns:
         Canvas quiz item data structure
     """
+    if "canvas_entry" in question:
+        # Already converted by prepare_questions_for_export
+        return _wrap_canvas_item(question["canvas_entry"], position)
+
     from src.question.types.base import QuestionType
     from src.question.types.registry import get_question_type_registry
 
@@ -501,7 +521,10 @@ def convert_question_to_canvas_format(
     # Convert question dict to the appropriate data model
     # Filter out fields that aren't part of the data model
     data_for_validation = {
-        k: v for k, v in question.items() if k not in ["id", "question_type"]
+        k: v
+        for k, v in question.items()
+        if k
+        not in ["id", "question_type", "position", "canvas_item_id", "canvas_entry"]
     }
 
     # For multiple choice, normalize invalid correct_answer to "A" (for backward compatibility)
@@ -525,7 +548,11 @@ def convert_question_to_canvas_format(
     # Use the question type's format_for_canvas method
     canvas_format = question_type_impl.format_for_canvas(question_data)
 
-    # Wrap in the Canvas API structure expected by the API
+    return _wrap_canvas_item(canvas_format, position)
+
+
+def _wrap_canvas_item(canvas_format: dict[str, Any], position: int) -> dict[str, Any]:
+    """Wrap a Canvas item entry in the Canvas API structure expected by the API."""
     return {
         "item": {
             "entry_type": "Item",
@@ -536,7 +563,9 @@ def convert_question_to_canvas_format(
     }
 
 
-@retry_on_failure(max_attempts=2, initial_delay=1.0)
+@retry_on_failure(
+    max_attempts=2, initial_delay=1.0, circuit_breaker=canvas_circuit_breaker
+)
 async def delete_canvas_quiz(canvas_token: str, course_id: int, quiz_id: str) -> bool:
     """
     Delete a Canvas quiz by ID.
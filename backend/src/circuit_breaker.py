@@ -0,0 +1,253 @@
+"""
+Circuit breakers for calls to external dependencies (Canvas, Azure OpenAI).
+
+After repeated failures a breaker opens and calls fail fast with
+CircuitOpenError instead of retrying against a dependency that is down.
+Once the recovery timeout has passed, a single probe call is let through
+(half-open): its success closes the breaker, its failure reopens it.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+import httpx
+
+from src.config import get_logger, settings
+from src.exceptions import ExternalServiceError
+
+logger = get_logger("circuit_breaker")
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ExternalServiceError):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+    def __init__(self, dependency: str, retry_after: float):
+        super().__init__(
+            dependency,
+            f"temporarily unavailable, retry in {retry_after:.0f} seconds",
+            503,
+        )
+        self.dependency = dependency
+        self.retry_after = retry_after
+
+
+def is_outage_error(error: BaseException) -> bool:
+    """Whether an error means the dependency is down rather than the request bad."""
+    if isinstance(error, ExternalServiceError):
+        return error.status_code >= 500 or error.status_code == 429
+    return isinstance(error, httpx.TransportError | TimeoutError)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one dependency.
+
+    Args:
+        name: Dependency name, e.g. "canvas" or "llm:openai:primary"
+        failure_threshold: Consecutive failures that open the breaker
+        recovery_timeout: Seconds the breaker stays open before a probe
+        is_failure: Whether an error counts against the dependency; other
+            errors show it is responding and reset the failure count
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+        is_failure: Callable[[BaseException], bool] = is_outage_error,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = (
+            failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        )
+        self.recovery_timeout = (
+            recovery_timeout or settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+        )
+        self.is_failure = is_failure
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Counters exposed in snapshot()
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open breaker turns half-open after the timeout."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def allows_request(self) -> bool:
+        """Whether a call would currently be let through."""
+        state = self.state
+        return state is CircuitState.CLOSED or (
+            state is CircuitState.HALF_OPEN and not self._probe_in_flight
+        )
+
+    def before_call(self) -> bool:
+        """
+        Admit a call or reject it.
+
+        Returns:
+            True if the call is the half-open probe
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with its
+                probe call already in flight
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return False
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        self.rejected_calls += 1
+        raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self) -> None:
+        """Record a call that reached the dependency."""
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        if self._state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed call; errors not caused by an outage count as success."""
+        if not self.is_failure(error):
+            self.record_success()
+            return
+
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            if self._state is not CircuitState.OPEN:
+                self.times_opened += 1
+                self._transition(CircuitState.OPEN, error=str(error))
+
+    async def call(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Call a dependency through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+        """
+        probe = self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            # A cancelled probe must not keep the breaker half-open forever
+            if probe:
+                self._probe_in_flight = False
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Breaker state and counters for monitoring."""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "retry_after": round(self.retry_after(), 1),
+            "rejected_calls": self.rejected_calls,
+            "times_opened": self.times_opened,
+        }
+
+    def reset(self) -> None:
+        """Close the breaker and clear its counters."""
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    def _transition(self, state: CircuitState, **details: Any) -> None:
+        log = logger.warning if state is CircuitState.OPEN else logger.info
+        log(
+            "circuit_breaker_state_changed",
+            dependency=self.name,
+            previous_state=self._state.value,
+            state=state.value,
+            consecutive_failures=self._consecutive_failures,
+            **details,
+        )
+        self._state = state
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, **kwargs: Any) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for a dependency.
+
+    Args:
+        name: Dependency name
+        **kwargs: CircuitBreaker arguments, used when the breaker is created
+
+    Returns:
+        The dependency's circuit breaker
+    """
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name, **kwargs)
+    return _breakers[name]
+
+
+def get_circuit_breaker_snapshots() -> list[dict[str, Any]]:
+    """Snapshots of every circuit breaker, for metrics."""
+    return [breaker.snapshot() for breaker in _breakers.values()]
+
+
+def find_open_circuit(prefix: str) -> CircuitOpenError | None:
+    """
+    Find an open breaker among dependencies whose name starts with prefix.
+
+    Returns:
+        The error a call to that dependency fails with, or None
+    """
+    for name, breaker in _breakers.items():
+        if name.startswith(prefix) and breaker.state is CircuitState.OPEN:
+            return CircuitOpenError(name, breaker.retry_after())
+    return None
+
+
+def reset_circuit_breakers() -> None:
+    """Close every circuit breaker and clear its counters (used by tests)."""
+    for breaker in _breakers.values():
+        breaker.reset()
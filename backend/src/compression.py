@@ -0,0 +1,143 @@
+"""
+Transparent zstd compression for large text columns.
+
+Values are compressed on write and stored as ``bytea``. Small values, and
+values that zstd cannot shrink, are stored as plain UTF-8 so they cost no CPU
+on read. Both forms are told apart by the zstd frame magic number, which can
+never begin a valid UTF-8 string.
+
+An optional dictionary trained on extracted Canvas content (see
+``scripts/train_compression_dictionary.py``) improves the ratio for the many
+short pages a course produces. Frames record the ID of the dictionary used,
+so frames written before or without one keep decoding. New values are written
+with DB_COMPRESSION_DICTIONARY_PATH; every dictionary in
+DB_COMPRESSION_DICTIONARY_DIR stays available for reading, so a dictionary can
+be rotated or unset without losing the values written with it.
+"""
+
+import threading
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import zstandard
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from src.config import settings
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd contexts are not thread-safe, so each thread keeps its own
+_local = threading.local()
+
+
+@cache
+def get_compression_dictionary() -> zstandard.ZstdCompressionDict | None:
+    """Load the zstd dictionary new values are written with, if any."""
+    if not settings.DB_COMPRESSION_DICTIONARY_PATH:
+        return None
+    return zstandard.ZstdCompressionDict(
+        Path(settings.DB_COMPRESSION_DICTIONARY_PATH).read_bytes()
+    )
+
+
+@cache
+def get_compression_dictionaries() -> dict[int, zstandard.ZstdCompressionDict]:
+    """Load every retained zstd dictionary, keyed by dictionary ID."""
+    dictionaries = {}
+    if settings.DB_COMPRESSION_DICTIONARY_DIR:
+        for path in sorted(Path(settings.DB_COMPRESSION_DICTIONARY_DIR).iterdir()):
+            if path.is_file():
+                dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+                dictionaries[dictionary.dict_id()] = dictionary
+    current = get_compression_dictionary()
+    if current is not None:
+        dictionaries[current.dict_id()] = current
+    return dictionaries
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    compressor: zstandard.ZstdCompressor | None = getattr(_local, "compressor", None)
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(
+            level=settings.DB_COMPRESSION_LEVEL,
+            dict_data=get_compression_dictionary(),
+        )
+        _local.compressor = compressor
+    return compressor
+
+
+def _decompressor(dict_id: int) -> zstandard.ZstdDecompressor:
+    decompressors: dict[int, zstandard.ZstdDecompressor] | None = getattr(
+        _local, "decompressors", None
+    )
+    if decompressors is None:
+        decompressors = _local.decompressors = {}
+
+    decompressor = decompressors.get(dict_id)
+    if decompressor is None:
+        if dict_id:
+            dictionary = get_compression_dictionaries().get(dict_id)
+            if dictionary is None:
+                raise ValueError(
+                    f"Compressed value requires zstd dictionary {dict_id}, "
+                    "which is not in DB_COMPRESSION_DICTIONARY_DIR"
+                )
+            decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+        else:
+            decompressor = zstandard.ZstdDecompressor()
+        decompressors[dict_id] = decompressor
+    return decompressor
+
+
+def compress_bytes(raw: bytes) -> bytes:
+    """Compress raw bytes, keeping them as-is when compression does not pay."""
+    if len(raw) < settings.DB_COMPRESSION_MIN_BYTES:
+        return raw
+    compressed = _compressor().compress(raw)
+    return compressed if len(compressed) < len(raw) else raw
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """Reverse ``compress_bytes``; plain values are returned unchanged."""
+    if not data.startswith(ZSTD_MAGIC):
+        return data
+    dict_id = zstandard.get_frame_parameters(data).dict_id
+    return _decompressor(dict_id).decompress(data)
+
+
+def train_compression_dictionary(
+    samples: Iterable[str], dict_size: int = 112_640
+) -> bytes:
+    """
+    Train a zstd dictionary from sample texts.
+
+    Args:
+        samples: Representative values of the compressed columns
+        dict_size: Maximum dictionary size in bytes
+
+    Returns:
+        Serialized dictionary, suitable for ``DB_COMPRESSION_DICTIONARY_PATH``
+    """
+    encoded = [sample.encode("utf-8") for sample in samples if sample]
+    return zstandard.train_dictionary(dict_size, encoded).as_bytes()
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text column stored zstd-compressed as ``bytea``."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return compress_bytes(value.encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        # psycopg returns memoryview for bytea, asyncpg returns bytes
+        return decompress_bytes(bytes(value)).decode("utf-8")
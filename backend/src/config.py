@@ -87,14 +87,49 @@ class Settings(BaseSettings):
     MAX_RETRY_DELAY: float = 30.0
     RETRY_BACKOFF_FACTOR: float = 2.0
 
+    # Circuit breakers around Canvas and each LLM deployment: consecutive
+    # outage errors that open a breaker, and seconds before a probe call
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = 30.0
+
     # Course filtering
     CANVAS_COURSE_PREFIX_FILTER: str = ""
 
+    # Fair sharing of LLM capacity per user and per course prefix (from
+    # CANVAS_COURSE_PREFIX_FILTER). Token quotas cover the tokens used within
+    # the window and are disabled when None; concurrency quotas limit the
+    # generation runs in progress across all API workers.
+    GENERATION_QUOTA_WINDOW_HOURS: int = 24
+    GENERATION_USER_TOKEN_QUOTA: int | None = None
+    GENERATION_COURSE_PREFIX_TOKEN_QUOTA: int | None = None
+    GENERATION_USER_MAX_CONCURRENT: int = 3
+    GENERATION_COURSE_PREFIX_MAX_CONCURRENT: int = 10
+    # Canvas user IDs allowed to view usage across all users
+    ADMIN_CANVAS_IDS: list[int] = []
+
     # Azure OpenAI settings
     AZURE_OPENAI_API_KEY: str | None = None
     AZURE_OPENAI_ENDPOINT: str | None = None
     AZURE_OPENAI_API_VERSION: str | None = None
     LLM_API_TIMEOUT: float = 500.0  # LLM request timeout in seconds (5 minutes)
+    AZURE_OPENAI_TOKENS_PER_MINUTE: int | None = None  # Quota of the deployment
+    # Further deployments pooled with the one above for load balancing and
+    # failover, as a JSON list of objects with azure_endpoint, api_key and
+    # optionally name, api_version, model, weight and tokens_per_minute
+    AZURE_OPENAI_DEPLOYMENTS: list[dict[str, Any]] = []
+    # Base seconds a deployment is skipped after a rate limit or server error,
+    # doubled per consecutive failure
+    LLM_ENDPOINT_COOLDOWN: float = 10.0
+    LLM_PROVIDER: str = "openai"  # Provider used for question generation
+    # Request schema-constrained JSON from providers that support it; the
+    # JSON correction round trips remain as the fallback
+    LLM_STRUCTURED_OUTPUT: bool = True
+    # Send a second request when one runs longer than the given percentile
+    # of recent latencies for its question type and size. The budget is the
+    # largest fraction of requests that may be duplicated this way.
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGE_PERCENTILE: float = 0.9
+    LLM_HEDGE_BUDGET: float = 0.05
 
     # Module-based question generation settings
     MAX_CONCURRENT_MODULES: int = 5  # Maximum concurrent module processing tasks
@@ -103,11 +138,51 @@ class Settings(BaseSettings):
     )
     MAX_JSON_CORRECTIONS: int = 2  # Maximum JSON correction attempts per module
     MODULE_GENERATION_TIMEOUT: int = (
-        300  # Timeout per module generation in seconds (5 minutes)
+        300  # Deadline per question batch in seconds (5 minutes)
     )
+    # LLM generation requests in flight at once, of which the reserved ones
+    # are kept for interactive batch regenerations
+    LLM_MAX_CONCURRENT_REQUESTS: int = 16
+    LLM_INTERACTIVE_RESERVED_REQUESTS: int = 4
+    # Generation runs of at least this many questions queue as bulk work
+    GENERATION_BULK_QUESTION_COUNT: int = 100
+    # Buffered LLM calls that trigger a write to the usage ledger; the buffer
+    # is also written when a generation run ends
+    LLM_USAGE_LEDGER_FLUSH_SIZE: int = 200
+    # USD per million tokens by model, e.g.
+    # {"gpt-4o": {"prompt": 2.5, "completion": 10.0}}; models without a
+    # price have no cost in the usage reports
+    LLM_TOKEN_PRICES: dict[str, dict[str, float]] = {}
     CONTENT_LENGTH_THRESHOLD: int = (
         100  # Minimum content length for question generation
     )
+    # Modules above the budget are chunked and each batch gets the most
+    # informative chunks that fit (estimated tokens, ~4 characters each)
+    GENERATION_CONTENT_TOKEN_BUDGET: int = 12000
+    GENERATION_CHUNK_TOKENS: int = 1500
+    GENERATION_CHUNK_OVERLAP_TOKENS: int = 150
+    # Batches expected to produce more completion tokens than this are split
+    # into parallel sub-requests, at most GENERATION_MAX_SUB_BATCHES of them
+    GENERATION_SUB_BATCH_OUTPUT_TOKENS: int = 4000
+    GENERATION_MAX_SUB_BATCHES: int = 4
+    # Estimated Jaccard similarity of question and answer text above which a
+    # newly generated question is dropped as a near-duplicate and replaced
+    DUPLICATE_QUESTION_SIMILARITY_THRESHOLD: float = 0.7
+
+    # Manual module uploads are staged server-side until the quiz is created
+    MANUAL_MODULE_STAGING_TTL_HOURS: int = 24
+    MANUAL_UPLOAD_WORKERS: int = 4  # Worker threads for per-file text extraction
+
+    # zstd compression of large text columns (page and manual module text)
+    DB_COMPRESSION_LEVEL: int = 3
+    DB_COMPRESSION_MIN_BYTES: int = 256  # Smaller values are stored uncompressed
+    DB_COMPRESSION_DICTIONARY_PATH: str | None = None  # Optional trained dictionary
+    # Every dictionary ever deployed, so values written with them stay readable
+    DB_COMPRESSION_DICTIONARY_DIR: str | None = None
+
+    # Orchestration profiling (opt-in, for diagnosing CPU regressions)
+    ORCHESTRATION_PROFILING_ENABLED: bool = False
+    ORCHESTRATION_PROFILE_DIR: str = "/tmp/quizcrafter-profiles"
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,6 +1,7 @@
 """Text processing utilities for content extraction."""
 
 import io
+import math
 import re
 from typing import Any
 
@@ -162,6 +163,21 @@ def estimate_word_count(text: str) -> int:
     return len(text.split())
 
 
+def estimate_token_count(text: str) -> int:
+    """
+    Estimate LLM token count using the ~4 characters per token heuristic.
+
+    Args:
+        text: Text to estimate tokens for
+
+    Returns:
+        Estimated number of tokens
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / 4)
+
+
 def truncate_content(
     content: str, max_length: int, suffix: str = "... [truncated]"
 ) -> str:
@@ -1,5 +1,7 @@
+from typing import Any
+
 import sentry_sdk
-from fastapi import APIRouter, FastAPI, Request
+from fastapi import APIRouter, Depends, FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
@@ -10,7 +12,9 @@ import src.question.models  # noqa
 import src.quiz.models  # noqa
 from src.auth import router as auth_router
 from src.auth import users_router
+from src.auth.dependencies import get_current_admin_user
 from src.canvas.router import router as canvas_router
+from src.circuit_breaker import get_circuit_breaker_snapshots
 from src.config import configure_logging, get_logger, settings
 from src.exceptions import (
     ServiceError,
@@ -18,9 +22,12 @@ from src.exceptions import (
     service_error_handler,
 )
 from src.middleware import LoggingMiddleware
+from src.question.providers import get_llm_provider_registry
 from src.question.router import router as question_router
+from src.question.workflows import get_generation_scheduler
 from src.quiz.router import router as quiz_router
 from src.quiz.sharing_router import router as quiz_sharing_router
+from src.quiz.usage_router import router as usage_router
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -59,6 +66,7 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Total-Count", "X-Next-Cursor"],
     )
     logger.info("cors_middleware_added", origins=settings.all_cors_origins)
 
@@ -75,6 +83,7 @@ api_router.include_router(canvas_router)
 api_router.include_router(quiz_router)
 api_router.include_router(quiz_sharing_router)
 api_router.include_router(question_router)
+api_router.include_router(usage_router)
 
 
 # Health check endpoint (moved from api/routes/utils.py)
@@ -89,6 +98,49 @@ async def health_check() -> bool:
     return True
 
 
+@api_router.get(
+    "/utils/circuit-breakers/",
+    tags=["utils"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+async def circuit_breakers() -> list[dict[str, Any]]:
+    """
+    State of the circuit breakers around Canvas and LLM deployments.
+
+    An open breaker means calls to that dependency currently fail fast.
+    Deployment names are exposed, so administrators only.
+    """
+    return get_circuit_breaker_snapshots()
+
+
+@api_router.get(
+    "/utils/generation-queue/",
+    tags=["utils"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+async def generation_queue() -> dict[str, Any]:
+    """
+    Capacity in use and queue waits per priority class of LLM generation.
+
+    Administrators only.
+    """
+    return get_generation_scheduler().snapshot()
+
+
+@api_router.get(
+    "/utils/llm-hedging/",
+    tags=["utils"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+async def llm_hedging() -> list[dict[str, Any]]:
+    """
+    Requests, hedges and hedges that won, per LLM provider pool.
+
+    Administrators only.
+    """
+    return get_llm_provider_registry().hedging_snapshots()
+
+
 # Add global exception handlers
 @app.exception_handler(ServiceError)
 async def handle_service_error(request: Request, exc: ServiceError) -> JSONResponse:
@@ -0,0 +1,47 @@
+"""
+Keyset pagination cursor helpers shared by list endpoints.
+
+Cursors encode the (created_at, id) of the last row on a page so the next
+page can seek past it instead of scanning with OFFSET.
+"""
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a keyset pagination cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        row_id: ID of the last row on the page
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a keyset pagination cursor produced by encode_keyset_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (created_at, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at_str, row_id_str = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_str), UUID(row_id_str)
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
@@ -58,8 +58,8 @@ def format_question_display_data(question: Question) -> dict[str, Any]:
     question_registry = get_question_type_registry()
     question_impl = question_registry.get_question_type(question.question_type)
 
-    # Validate and get typed data
-    typed_data = question_impl.validate_data(question.question_data)
+    # Validate and get typed data (reuses data validated earlier in the request)
+    typed_data = question.get_typed_data(question_registry)
 
     # Format for display using question type implementation
     return question_impl.format_for_display(typed_data)
@@ -132,9 +132,40 @@ def format_questions_batch(
     Returns:
         List of formatted question dictionaries
     """
+    if formatter_func is format_question_for_display:
+        prevalidate_questions(questions)
     return [formatter_func(question) for question in questions]
 
 
+def prevalidate_questions(questions: list[Question]) -> None:
+    """
+    Validate question data in one batch per question type and cache the result.
+
+    Questions that fail batch validation are left uncached so the per-question
+    formatter reports the error exactly as before.
+
+    Args:
+        questions: Questions about to be formatted
+    """
+    question_registry = get_question_type_registry()
+
+    questions_by_type: dict[Any, list[Question]] = {}
+    for question in questions:
+        questions_by_type.setdefault(question.question_type, []).append(question)
+
+    for question_type, typed_questions in questions_by_type.items():
+        try:
+            question_impl = question_registry.get_question_type(question_type)
+        except ValueError:
+            continue
+
+        result = question_impl.validate_batch(
+            [question.question_data for question in typed_questions]
+        )
+        for index, typed_data in result.valid.items():
+            typed_questions[index].cache_typed_data(typed_data)
+
+
 def create_display_formatter() -> Callable[[Question], dict[str, Any]]:
     """
     Create a display formatter function with error handling.
@@ -6,11 +6,13 @@ from .types.base import (
     GenerationResult,
     Question,
     QuestionDifficulty,
+    QuestionEdit,
     QuestionType,
 )
 
 __all__ = [
     "Question",
+    "QuestionEdit",
     "QuestionType",
     "QuestionDifficulty",
     "GenerationParameters",
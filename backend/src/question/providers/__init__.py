@@ -14,6 +14,7 @@ from .base import (
 )
 from .mock_provider import MockProvider
 from .openai_provider import OpenAIProvider
+from .pool import EndpointConfiguration, ProviderEndpoint, ProviderPool
 from .registry import LLMProviderRegistry, get_llm_provider_registry
 
 __all__ = [
@@ -32,6 +33,10 @@ __all__ = [
     # Provider implementations
     "OpenAIProvider",
     "MockProvider",
+    # Load balancing
+    "EndpointConfiguration",
+    "ProviderEndpoint",
+    "ProviderPool",
     # Registry
     "LLMProviderRegistry",
     "get_llm_provider_registry",
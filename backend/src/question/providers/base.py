@@ -1,14 +1,20 @@
 """Abstract base classes and interfaces for LLM providers."""
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
-from src.config import get_logger
+from src.circuit_breaker import CircuitOpenError
+from src.config import get_logger, settings
+
+from .hedging import HedgingPolicy
 
 logger = get_logger("llm_provider")
 
@@ -146,6 +152,7 @@ class BaseLLMProvider(ABC):
     def __init__(self, configuration: LLMConfiguration):
         self.configuration = configuration
         self._initialized = False
+        self.hedging_policy = HedgingPolicy() if settings.LLM_HEDGING_ENABLED else None
 
     @property
     @abstractmethod
@@ -153,6 +160,15 @@ class BaseLLMProvider(ABC):
         """Return the provider name."""
         pass
 
+    @property
+    def supports_structured_output(self) -> bool:
+        """
+        Whether generate() accepts a ``response_schema`` keyword argument.
+
+        Providers that do constrain their output to the given JSON Schema.
+        """
+        return False
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize the provider (authentication, setup, etc.)."""
@@ -165,7 +181,8 @@ class BaseLLMProvider(ABC):
 
         Args:
             messages: List of messages for the conversation
-            **kwargs: Additional generation parameters
+            **kwargs: Additional generation parameters; ``response_schema``
+                requests schema-constrained JSON when supported
 
         Returns:
             LLM response
@@ -196,13 +213,21 @@ class BaseLLMProvider(ABC):
         pass
 
     async def generate_with_retry(
-        self, messages: list[LLMMessage], **kwargs: Any
+        self,
+        messages: list[LLMMessage],
+        hedge_key: str | None = None,
+        request_slot: Callable[[], AbstractAsyncContextManager[None]] | None = None,
+        **kwargs: Any,
     ) -> LLMResponse:
         """
         Generate with automatic retry logic.
 
         Args:
             messages: List of messages for the conversation
+            hedge_key: Groups requests of similar expected latency, e.g. by
+                question type and count; requests without one are not hedged
+            request_slot: Capacity held by each request while it is sent,
+                so retry delays hold none and a hedge takes a slot of its own
             **kwargs: Additional generation parameters
 
         Returns:
@@ -216,10 +241,14 @@ class BaseLLMProvider(ABC):
             self._initialized = True
 
         last_exception = None
+        slot = request_slot or nullcontext
 
         for attempt in range(self.configuration.max_retries + 1):
             try:
-                return await self.generate(messages, **kwargs)
+                async with slot():
+                    return await self._generate_hedged(
+                        messages, hedge_key, slot, **kwargs
+                    )
 
             except LLMError as e:
                 last_exception = e
@@ -268,6 +297,10 @@ class BaseLLMProvider(ABC):
 
                 await asyncio.sleep(delay)
 
+            except CircuitOpenError:
+                # The dependency is known to be down, retrying cannot help
+                raise
+
             except Exception as e:
                 # Wrap unexpected errors
                 last_exception = LLMError(
@@ -293,6 +326,98 @@ class BaseLLMProvider(ABC):
                 "Failed to generate response after retries", provider=self.provider_name
             )
 
+    async def _generate_hedged(
+        self,
+        messages: list[LLMMessage],
+        hedge_key: str | None,
+        request_slot: Callable[[], AbstractAsyncContextManager[None]],
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Generate, sending a second request if the first one is unusually slow.
+
+        The first successful response is returned and the other request
+        cancelled. A pool routes the hedge away from the busy deployment, as
+        its routing weight accounts for requests in flight. The hedge waits
+        for a request slot of its own; its latency counts from when it got it.
+        The latencies of the other requests sent are kept in the response's
+        ``duplicate_request_latencies`` metadata, as they use tokens too.
+
+        Raises:
+            Exception: The first error if no request succeeded
+        """
+        policy = self.hedging_policy
+        if policy is None or hedge_key is None:
+            return await self.generate(messages, **kwargs)
+
+        hedge_delay = policy.request_started(hedge_key)
+        start = time.monotonic()
+        primary = asyncio.create_task(self.generate(messages, **kwargs))
+        started: dict[asyncio.Task[Any] | None, float] = {primary: start}
+        sent: set[asyncio.Task[Any] | None] = {primary}
+
+        async def send_hedge() -> LLMResponse:
+            async with request_slot():
+                started[asyncio.current_task()] = time.monotonic()
+                sent.add(asyncio.current_task())
+                return await self.generate(messages, **kwargs)
+
+        pending: set[asyncio.Task[LLMResponse]] = {primary}
+        errors: list[BaseException] = []
+        hedge_considered = hedge_delay is None
+
+        try:
+            while pending:
+                timeout = (
+                    None
+                    if hedge_considered or hedge_delay is None
+                    else max(hedge_delay - (time.monotonic() - start), 0.0)
+                )
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    hedge_considered = True
+                    if policy.try_hedge():
+                        logger.info(
+                            "llm_request_hedged",
+                            provider=self.provider_name.value,
+                            hedge_key=hedge_key,
+                            hedge_delay=hedge_delay,
+                        )
+                        hedge = asyncio.create_task(send_hedge())
+                        started[hedge] = time.monotonic()
+                        pending.add(hedge)
+                    continue
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        now = time.monotonic()
+                        policy.record(
+                            hedge_key, now - started[task], hedged=task is not primary
+                        )
+                        response: LLMResponse = task.result()
+                        duplicates = [
+                            now - started[other]
+                            for other in sent
+                            if other is not task
+                            and other is not None
+                            and not (other.done() and other.exception())
+                        ]
+                        if duplicates:
+                            response.metadata["duplicate_request_latencies"] = (
+                                duplicates
+                            )
+                        return response
+                    errors.append(error)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise errors[0]
+
     async def health_check(self) -> bool:
         """
         Perform a health check on the provider.
@@ -0,0 +1,92 @@
+"""Hedged requests: duplicate a slow LLM call and keep the first response."""
+
+import math
+from collections import defaultdict, deque
+
+from src.config import settings
+
+# Latencies kept per hedge key
+LATENCY_WINDOW = 200
+# Observations needed before a key's percentile is trusted
+MIN_LATENCY_SAMPLES = 20
+# Most unused hedges saved up during quiet periods
+MAX_HEDGE_CREDITS = 5.0
+
+
+class HedgingPolicy:
+    """
+    Decides when a request is slow enough to send a second copy.
+
+    Latencies are tracked per hedge key, e.g. question type and batch size,
+    since a large essay batch is expected to take longer than a few true/false
+    questions. A request is hedged once it outlives the configured percentile
+    of its key's recent latencies. Every request earns ``budget`` credits and
+    a hedge costs one, capping hedges at that fraction of requests.
+
+    Args:
+        percentile: Latency percentile after which a request is hedged
+        budget: Largest fraction of requests that may be hedged
+    """
+
+    def __init__(
+        self, percentile: float | None = None, budget: float | None = None
+    ) -> None:
+        self.percentile = percentile or settings.LLM_HEDGE_PERCENTILE
+        self.budget = budget if budget is not None else settings.LLM_HEDGE_BUDGET
+
+        self._latencies: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_WINDOW)
+        )
+        self._credits = 0.0
+
+        # Counters exposed in snapshot()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def request_started(self, key: str) -> float | None:
+        """
+        Count a request and earn its share of the hedge budget.
+
+        Returns:
+            Seconds after which the request should be hedged, or None while
+            too few latencies are known for its key
+        """
+        self.requests += 1
+        self._credits = min(self._credits + self.budget, MAX_HEDGE_CREDITS)
+
+        latencies = self._latencies[key]
+        if len(latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(latencies)
+        return ordered[max(math.ceil(self.percentile * len(ordered)) - 1, 0)]
+
+    def try_hedge(self) -> bool:
+        """Spend a hedge credit if the budget allows it."""
+        if self._credits < 1.0:
+            return False
+        self._credits -= 1.0
+        self.hedges += 1
+        return True
+
+    def record(self, key: str, latency: float, hedged: bool = False) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            key: Hedge key of the request
+            latency: Seconds the winning request took
+            hedged: Whether the winning request was the hedge
+        """
+        self._latencies[key].append(latency)
+        if hedged:
+            self.hedge_wins += 1
+
+    def snapshot(self) -> dict[str, float]:
+        """Hedging counters, for logging and monitoring."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+        }
@@ -29,6 +29,8 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, configuration: LLMConfiguration):
         super().__init__(configuration)
         self._client: AzureChatOpenAI | None = None
+        # Cleared when the deployment rejects json_schema response formats
+        self._structured_output_supported = True
 
         # Azure OpenAI model definitions (using deployment names)
         self._models = [
@@ -48,6 +50,11 @@ class OpenAIProvider(BaseLLMProvider):
         """Return the provider name."""
         return LLMProvider.OPENAI
 
+    @property
+    def supports_structured_output(self) -> bool:
+        """Return whether the deployment accepts json_schema response formats."""
+        return self._structured_output_supported
+
     async def initialize(self) -> None:
         """Initialize the Azure OpenAI client."""
         if self._client is not None:
@@ -108,7 +115,8 @@ class OpenAIProvider(BaseLLMProvider):
 
         Args:
             messages: List of messages for the conversation
-            **kwargs: Additional generation parameters
+            **kwargs: Additional generation parameters; ``response_schema``
+                constrains the output with Azure OpenAI structured outputs
 
         Returns:
             LLM response
@@ -119,6 +127,18 @@ class OpenAIProvider(BaseLLMProvider):
         if self._client is None:
             await self.initialize()
 
+        response_schema = kwargs.pop("response_schema", None)
+        invoke_kwargs: dict[str, Any] = {}
+        if response_schema is not None:
+            invoke_kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "question_batch",
+                    "schema": response_schema,
+                    "strict": True,
+                },
+            }
+
         start_time = time.time()
 
         try:
@@ -130,7 +150,7 @@ class OpenAIProvider(BaseLLMProvider):
             # Call the LangChain client
             if self._client is None:
                 raise RuntimeError("Azure OpenAI client not initialized")
-            result = await self._client.ainvoke(langchain_messages)
+            result = await self._client.ainvoke(langchain_messages, **invoke_kwargs)
 
             response_time = time.time() - start_time
 
@@ -152,6 +172,7 @@ class OpenAIProvider(BaseLLMProvider):
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
                 content_length=len(content),
+                structured_output=response_schema is not None,
             )
 
             return LLMResponse(
@@ -169,6 +190,16 @@ class OpenAIProvider(BaseLLMProvider):
             error_str = str(e).lower()
             error_type = type(e).__name__.lower()
 
+            if response_schema is not None and "response_format" in error_str:
+                # Deployment without structured outputs: use free-form JSON
+                logger.warning(
+                    "azure_openai_structured_output_unsupported",
+                    deployment=self.configuration.model,
+                    error=str(e),
+                )
+                self._structured_output_supported = False
+                return await self.generate(messages, **kwargs)
+
             logger.error(
                 "azure_openai_generation_failed",
                 deployment=self.configuration.model,
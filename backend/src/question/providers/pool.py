@@ -0,0 +1,285 @@
+"""Load balancing and failover across several deployments of one provider."""
+
+import random
+import time
+from collections import deque
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from src.config import get_logger, settings
+
+from .base import (
+    AuthenticationError,
+    BaseLLMProvider,
+    LLMConfiguration,
+    LLMError,
+    LLMMessage,
+    LLMModel,
+    LLMProvider,
+    LLMResponse,
+    ModelNotFoundError,
+    RateLimitError,
+)
+
+logger = get_logger("llm_provider_pool")
+
+# Weight of the newest observation in the latency moving average
+LATENCY_SMOOTHING = 0.3
+# Window over which token usage is counted against an endpoint's quota
+QUOTA_WINDOW_SECONDS = 60.0
+# Endpoints with an exhausted quota keep a small share of traffic so their
+# recovery is noticed
+MIN_QUOTA_FRACTION = 0.05
+# Longest time an endpoint is skipped after repeated failures
+MAX_COOLDOWN_SECONDS = 300.0
+
+
+class EndpointConfiguration(BaseModel):
+    """Configuration of one deployment in a provider pool."""
+
+    name: str
+    configuration: LLMConfiguration
+    weight: float = Field(default=1.0, gt=0.0)
+    tokens_per_minute: int | None = Field(default=None, ge=1)
+
+
+def _is_endpoint_failure(error: LLMError) -> bool:
+    """Whether an error is specific to the endpoint, so another may succeed."""
+    return error.retryable or isinstance(
+        error, RateLimitError | AuthenticationError | ModelNotFoundError
+    )
+
+
+class ProviderEndpoint:
+    """
+    One deployment in a provider pool, with its routing and health state.
+
+    Args:
+        name: Identifier used in logs, e.g. the deployment's region
+        provider: Provider instance calling this deployment
+        weight: Relative share of traffic when all endpoints are equal
+        tokens_per_minute: Deployment quota, None if unknown
+    """
+
+    def __init__(
+        self,
+        name: str,
+        provider: BaseLLMProvider,
+        weight: float = 1.0,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.name = name
+        self.provider = provider
+        self.weight = weight
+        self.tokens_per_minute = tokens_per_minute
+
+        self.latency: float | None = None
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.unavailable_until = 0.0
+        self._usage: deque[tuple[float, int]] = deque()
+
+        # Shared by every pool calling this deployment
+        self.circuit_breaker = get_circuit_breaker(
+            f"llm:{provider.provider_name.value}:{name}",
+            is_failure=lambda e: isinstance(e, LLMError) and _is_endpoint_failure(e),
+        )
+
+    def is_available(self, now: float) -> bool:
+        """Whether the endpoint is out of its cooldown and its breaker closed."""
+        return now >= self.unavailable_until and self.circuit_breaker.allows_request()
+
+    def tokens_used(self, now: float) -> int:
+        """Tokens used within the last quota window."""
+        while self._usage and self._usage[0][0] <= now - QUOTA_WINDOW_SECONDS:
+            self._usage.popleft()
+        return sum(tokens for _, tokens in self._usage)
+
+    def remaining_quota(self, now: float) -> float:
+        """Fraction of the per-minute token quota still available."""
+        if not self.tokens_per_minute:
+            return 1.0
+        remaining = 1.0 - self.tokens_used(now) / self.tokens_per_minute
+        return max(remaining, MIN_QUOTA_FRACTION)
+
+    def routing_weight(self, now: float, default_latency: float) -> float:
+        """
+        Share of new requests to send to this endpoint.
+
+        Scales the configured weight by the remaining quota and divides it by
+        the observed latency and the requests already in flight.
+        """
+        latency = self.latency if self.latency is not None else default_latency
+        return (
+            self.weight
+            * self.remaining_quota(now)
+            / (max(latency, 0.1) * (1 + self.in_flight))
+        )
+
+    def record_success(self, now: float, latency: float, tokens: int) -> None:
+        """Record a completed request."""
+        self.latency = (
+            latency
+            if self.latency is None
+            else LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+        )
+        self.consecutive_failures = 0
+        if tokens:
+            self._usage.append((now, tokens))
+
+    def record_failure(self, now: float, error: LLMError) -> float:
+        """
+        Take the endpoint out of rotation after a rate limit or server error.
+
+        Returns:
+            Seconds until the endpoint is tried again
+        """
+        self.consecutive_failures += 1
+        cooldown = min(
+            settings.LLM_ENDPOINT_COOLDOWN * 2.0 ** (self.consecutive_failures - 1),
+            MAX_COOLDOWN_SECONDS,
+        )
+        if isinstance(error, RateLimitError) and error.retry_after:
+            cooldown = max(cooldown, error.retry_after)
+        self.unavailable_until = now + cooldown
+        return cooldown
+
+    def snapshot(self, now: float) -> dict[str, Any]:
+        """Current health and routing state, for logging and monitoring."""
+        return {
+            "name": self.name,
+            "available": self.is_available(now),
+            "latency": self.latency,
+            "in_flight": self.in_flight,
+            "remaining_quota": self.remaining_quota(now),
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_state": self.circuit_breaker.state.value,
+        }
+
+
+class ProviderPool(BaseLLMProvider):
+    """
+    Provider spreading requests over several deployments of one provider.
+
+    Each request goes to an endpoint picked at random in proportion to its
+    routing weight. Rate limits, server errors and endpoint-specific
+    configuration errors put that endpoint in a cooldown and the request
+    fails over to the next one; errors caused by the request itself are
+    raised without trying other endpoints. Endpoints whose circuit breaker
+    is open are skipped, so a pool of failing deployments fails fast.
+    """
+
+    def __init__(
+        self, endpoints: list[ProviderEndpoint], rng: random.Random | None = None
+    ) -> None:
+        if not endpoints:
+            raise ValueError("A provider pool needs at least one endpoint")
+        super().__init__(endpoints[0].provider.configuration)
+        self.endpoints = endpoints
+        self._rng = rng or random.Random()
+
+    @property
+    def provider_name(self) -> LLMProvider:
+        """Return the provider name."""
+        return self.endpoints[0].provider.provider_name
+
+    @property
+    def supports_structured_output(self) -> bool:
+        """Return whether every endpoint accepts a response schema."""
+        return all(
+            endpoint.provider.supports_structured_output for endpoint in self.endpoints
+        )
+
+    async def initialize(self) -> None:
+        """Initialize every endpoint's provider."""
+        for endpoint in self.endpoints:
+            await endpoint.provider.initialize()
+
+    def _routing_order(self, now: float) -> list[ProviderEndpoint]:
+        """
+        Order the endpoints to try for one request.
+
+        Available endpoints are ordered by weighted random choice. Endpoints
+        in a cooldown are only tried when none is available, soonest first.
+        """
+        available = [e for e in self.endpoints if e.is_available(now)]
+        cooling = sorted(
+            (e for e in self.endpoints if not e.is_available(now)),
+            key=lambda e: e.unavailable_until,
+        )
+
+        known = [e.latency for e in available if e.latency is not None]
+        default_latency = sum(known) / len(known) if known else 1.0
+
+        order = []
+        while available:
+            weights = [e.routing_weight(now, default_latency) for e in available]
+            chosen = self._rng.choices(available, weights=weights)[0]
+            order.append(chosen)
+            available.remove(chosen)
+        return order or cooling
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        """
+        Generate a response on the best available endpoint.
+
+        Raises:
+            LLMError: The last endpoint's error when every endpoint failed,
+                or the first error not specific to an endpoint
+            CircuitOpenError: If every endpoint's circuit breaker is open
+        """
+        last_error: LLMError | None = None
+        circuit_error: CircuitOpenError | None = None
+
+        for endpoint in self._routing_order(time.monotonic()):
+            start = time.monotonic()
+            endpoint.in_flight += 1
+            try:
+                response = await endpoint.circuit_breaker.call(
+                    endpoint.provider.generate, messages, **kwargs
+                )
+            except CircuitOpenError as e:
+                circuit_error = e
+                continue
+            except LLMError as e:
+                if not _is_endpoint_failure(e):
+                    raise
+                last_error = e
+                cooldown = endpoint.record_failure(time.monotonic(), e)
+                logger.warning(
+                    "llm_endpoint_failover",
+                    endpoint=endpoint.name,
+                    error_code=e.error_code,
+                    cooldown=cooldown,
+                    consecutive_failures=endpoint.consecutive_failures,
+                )
+                continue
+            finally:
+                endpoint.in_flight -= 1
+
+            now = time.monotonic()
+            endpoint.record_success(now, now - start, response.total_tokens or 0)
+            response.metadata["endpoint"] = endpoint.name
+            return response
+
+        raise (
+            last_error
+            or circuit_error
+            or LLMError("No provider endpoint available", provider=self.provider_name)
+        )
+
+    async def get_available_models(self) -> list[LLMModel]:
+        """Return the models of the primary endpoint."""
+        return await self.endpoints[0].provider.get_available_models()
+
+    def validate_configuration(self) -> None:
+        """Validate every endpoint's configuration."""
+        for endpoint in self.endpoints:
+            endpoint.provider.validate_configuration()
+
+    def health_snapshot(self) -> list[dict[str, Any]]:
+        """Health and routing state of every endpoint."""
+        now = time.monotonic()
+        return [endpoint.snapshot(now) for endpoint in self.endpoints]
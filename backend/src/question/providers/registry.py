@@ -1,5 +1,7 @@
 """LLM provider registry for managing and creating provider instances."""
 
+from typing import Any
+
 from src.config import get_logger
 
 from .base import (
@@ -10,6 +12,7 @@ from .base import (
     LLMModel,
     LLMProvider,
 )
+from .pool import EndpointConfiguration, ProviderEndpoint, ProviderPool
 
 logger = get_logger("llm_provider_registry")
 
@@ -25,6 +28,9 @@ class LLMProviderRegistry:
     def __init__(self) -> None:
         self._provider_classes: dict[LLMProvider, type[BaseLLMProvider]] = {}
         self._default_configurations: dict[LLMProvider, LLMConfiguration] = {}
+        self._endpoints: dict[LLMProvider, list[EndpointConfiguration]] = {}
+        # Pools are shared so endpoint health outlives a single quiz
+        self._pools: dict[LLMProvider, ProviderPool] = {}
         self._initialized = False
 
     def register_provider(
@@ -113,6 +119,103 @@ class LLMProviderRegistry:
 
         return instance
 
+    def register_endpoint(
+        self, provider: LLMProvider, endpoint: EndpointConfiguration
+    ) -> None:
+        """
+        Add a deployment to a provider's pool.
+
+        Args:
+            provider: The provider
+            endpoint: The deployment's configuration and routing settings
+
+        Raises:
+            ValueError: If the endpoint's configuration is for another provider
+        """
+        if endpoint.configuration.provider != provider:
+            raise ValueError(
+                f"Endpoint provider {endpoint.configuration.provider} "
+                f"does not match provider {provider}"
+            )
+
+        self._endpoints.setdefault(provider, []).append(endpoint)
+        self._pools.pop(provider, None)
+
+        logger.info(
+            "llm_endpoint_registered",
+            provider=provider.value,
+            endpoint=endpoint.name,
+            weight=endpoint.weight,
+            tokens_per_minute=endpoint.tokens_per_minute,
+        )
+
+    def get_provider_pool(self, provider: LLMProvider) -> ProviderPool:
+        """
+        Get the pool balancing requests over a provider's deployments.
+
+        The pool is created on first use and shared afterwards. Without
+        registered endpoints it holds the provider's default configuration.
+
+        Args:
+            provider: The provider
+
+        Returns:
+            Provider pool
+
+        Raises:
+            ValueError: If the provider is not registered or has no valid
+                endpoint
+        """
+        if not self._initialized:
+            self._initialize_default_providers()
+
+        if provider in self._pools:
+            return self._pools[provider]
+
+        endpoint_configs = self._endpoints.get(provider) or [
+            EndpointConfiguration(
+                name="default",
+                configuration=self.get_provider(provider).configuration,
+            )
+        ]
+
+        endpoints = []
+        for endpoint_config in endpoint_configs:
+            try:
+                instance = self.get_provider(provider, endpoint_config.configuration)
+            except ValueError as e:
+                # One misconfigured deployment must not disable the others
+                logger.error(
+                    "llm_endpoint_invalid",
+                    provider=provider.value,
+                    endpoint=endpoint_config.name,
+                    error=str(e),
+                )
+                continue
+            endpoints.append(
+                ProviderEndpoint(
+                    endpoint_config.name,
+                    instance,
+                    weight=endpoint_config.weight,
+                    tokens_per_minute=endpoint_config.tokens_per_minute,
+                )
+            )
+
+        if not endpoints:
+            raise ValueError(f"No valid endpoint configured for provider {provider}")
+
+        pool = ProviderPool(endpoints)
+        self._pools[provider] = pool
+        return pool
+
+    def hedging_snapshots(self) -> list[dict[str, Any]]:
+        """Hedging counters of every provider pool in use, for monitoring."""
+        return [
+            {"provider": provider.value, **pool.hedging_policy.snapshot()}
+            for provider, pool in self._pools.items()
+            if pool.hedging_policy is not None
+        ]
+
     def get_available_providers(self) -> list[LLMProvider]:
         """
         Get list of all registered providers.
@@ -248,6 +351,9 @@ class LLMProviderRegistry:
         if provider in self._default_configurations:
             del self._default_configurations[provider]
 
+        self._endpoints.pop(provider, None)
+        self._pools.pop(provider, None)
+
         logger.info("llm_provider_unregistered", provider=provider.value)
 
     def _initialize_default_providers(self) -> None:
@@ -283,6 +389,8 @@ class LLMProviderRegistry:
                 self.register_provider(
                     LLMProvider.OPENAI, OpenAIProvider, openai_config
                 )
+                if settings.AZURE_OPENAI_DEPLOYMENTS:
+                    self._register_azure_deployments(openai_config)
 
             # Always register mock provider for testing
             mock_config = LLMConfiguration(
@@ -308,6 +416,49 @@ class LLMProviderRegistry:
 
         self._initialized = True
 
+    def _register_azure_deployments(self, primary: LLMConfiguration) -> None:
+        """Pool the configured extra Azure OpenAI deployments with the primary one."""
+        from src.config import settings
+
+        self.register_endpoint(
+            LLMProvider.OPENAI,
+            EndpointConfiguration(
+                name="primary",
+                configuration=primary,
+                tokens_per_minute=settings.AZURE_OPENAI_TOKENS_PER_MINUTE,
+            ),
+        )
+
+        for index, deployment in enumerate(settings.AZURE_OPENAI_DEPLOYMENTS):
+            name = deployment.get("name", f"deployment-{index + 1}")
+            try:
+                endpoint = EndpointConfiguration(
+                    name=name,
+                    configuration=primary.model_copy(
+                        update={
+                            "model": deployment.get("model", primary.model),
+                            "provider_settings": {
+                                "api_key": deployment["api_key"],
+                                "azure_endpoint": deployment["azure_endpoint"],
+                                "api_version": deployment.get(
+                                    "api_version", settings.AZURE_OPENAI_API_VERSION
+                                ),
+                            },
+                        }
+                    ),
+                    weight=deployment.get("weight", 1.0),
+                    tokens_per_minute=deployment.get("tokens_per_minute"),
+                )
+            except (KeyError, ValueError) as e:
+                logger.error(
+                    "llm_endpoint_invalid",
+                    provider=LLMProvider.OPENAI.value,
+                    endpoint=name,
+                    error=str(e),
+                )
+                continue
+            self.register_endpoint(LLMProvider.OPENAI, endpoint)
+
 
 # Global registry instance
 llm_provider_registry = LLMProviderRegistry()
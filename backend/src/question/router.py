@@ -3,25 +3,28 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import CurrentUser
 from src.config import get_logger
 from src.database import get_async_session
+from src.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 from . import service
-from .formatters import format_question_for_display
+from .formatters import format_question_for_display, format_questions_batch
 from .schemas import (
     BulkApproveRequest,
     BulkDeleteRequest,
     BulkOperationResponse,
     QuestionCreateRequest,
+    QuestionEditResponse,
     QuestionResponse,
     QuestionUpdateRequest,
 )
-from .types import QuestionType, RejectionReason
+from .types import QuestionDifficulty, QuestionType, RejectionReason
+from .utils import build_question_list_etag
 
 
 class QuestionDeleteRequest(BaseModel):
@@ -43,6 +46,8 @@ logger = get_logger("questions_v2")
 async def get_quiz_questions(
     quiz_id: UUID,
     current_user: CurrentUser,
+    request: Request,
+    response: Response,
     question_type: QuestionType | None = Query(
         None, description="Filter by question type"
     ),
@@ -51,9 +56,26 @@ async def get_quiz_questions(
         None, ge=1, le=100, description="Maximum questions to return"
     ),
     offset: int = Query(0, ge=0, description="Number of questions to skip"),
-) -> list[dict[str, Any]]:
+    cursor: str | None = Query(
+        None, description="Keyset cursor from the X-Next-Cursor header"
+    ),
+    module_id: str | None = Query(None, description="Filter by source module"),
+    difficulty: QuestionDifficulty | None = Query(
+        None, description="Filter by difficulty"
+    ),
+    is_approved: bool | None = Query(None, description="Filter by approval state"),
+    rejected: bool | None = Query(
+        None, description="Filter by rejection state (true returns rejected only)"
+    ),
+) -> Any:
     """
-    Retrieve questions for a quiz with filtering support.
+    Retrieve questions for a quiz with filtering and pagination support.
+
+    Pages are ordered by (created_at, id). Pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page without OFFSET scans.
+    X-Total-Count holds the number of questions matching the filters, and
+    an ETag is returned so unchanged pages can be revalidated with
+    If-None-Match (304 Not Modified).
 
     **Parameters:**
         quiz_id: Quiz identifier
@@ -61,6 +83,11 @@ async def get_quiz_questions(
         approved_only: Only return approved questions
         limit: Maximum number of questions to return
         offset: Number of questions to skip for pagination
+        cursor: Keyset cursor for the next page (optional, not with offset)
+        module_id: Filter by source module (optional)
+        difficulty: Filter by difficulty (optional)
+        is_approved: Filter by approval state (optional)
+        rejected: Filter by rejection state (optional)
 
     **Returns:**
         List of questions with formatted display data
@@ -71,28 +98,79 @@ async def get_quiz_questions(
         quiz_id=str(quiz_id),
         question_type=question_type if question_type else None,
         approved_only=approved_only,
+        has_cursor=cursor is not None,
     )
 
+    # A cursor already marks the page start; an offset would skip past it
+    if cursor and offset:
+        raise HTTPException(
+            status_code=400, detail="Use either cursor or offset, not both"
+        )
+
+    try:
+        after = decode_keyset_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    filters: dict[str, Any] = {
+        "question_type": question_type,
+        "approved_only": approved_only,
+        "module_id": module_id,
+        "difficulty": difficulty,
+        "is_approved": is_approved,
+        "rejected": rejected,
+    }
+
     try:
         # Verify quiz ownership
         await _verify_quiz_access(quiz_id, current_user.id)
 
-        # Get formatted questions (handled within single session)
         async with get_async_session() as session:
-            formatted_questions = await service.get_formatted_questions_by_quiz(
+            # Fetch one extra row to know whether another page exists
+            questions = await service.get_questions_by_quiz(
                 session=session,
                 quiz_id=quiz_id,
-                question_type=question_type,
-                approved_only=approved_only,
-                limit=limit,
+                limit=limit + 1 if limit else None,
                 offset=offset,
+                after=after,
+                **filters,
             )
+            total_count = await service.count_questions_by_quiz(
+                session=session, quiz_id=quiz_id, **filters
+            )
+
+        next_cursor = None
+        if limit and len(questions) > limit:
+            questions = questions[:limit]
+            last_question = questions[-1]
+            if last_question.created_at is not None:
+                next_cursor = encode_keyset_cursor(
+                    last_question.created_at, last_question.id
+                )
+
+        etag = build_question_list_etag(questions, total_count, next_cursor)
+        headers = {"ETag": etag, "X-Total-Count": str(total_count)}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            logger.info(
+                "quiz_questions_not_modified",
+                user_id=str(current_user.id),
+                quiz_id=str(quiz_id),
+            )
+            return Response(status_code=304, headers=headers)
+
+        formatted_questions = format_questions_batch(questions)
+        response.headers.update(headers)
 
         logger.info(
             "quiz_questions_retrieval_completed",
             user_id=str(current_user.id),
             quiz_id=str(quiz_id),
             questions_found=len(formatted_questions),
+            total_count=total_count,
         )
 
         return formatted_questions
@@ -174,6 +252,80 @@ async def get_question(
         )
 
 
+@router.get(
+    "/{quiz_id}/{question_id}/history", response_model=list[QuestionEditResponse]
+)
+async def get_question_history(
+    quiz_id: UUID,
+    question_id: UUID,
+    current_user: CurrentUser,
+    after_seq: int = Query(0, ge=0, description="Only return edits after this seq"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum edits to return"),
+) -> Any:
+    """
+    Retrieve the edit history of a question, oldest edit first.
+
+    History is kept for rejected (soft-deleted) questions as well. Pass the
+    seq of the last returned edit as `after_seq` to fetch the next page.
+
+    **Parameters:**
+        quiz_id: Quiz identifier
+        question_id: Question identifier
+        after_seq: Only return edits after this seq
+        limit: Maximum number of edits to return
+
+    **Returns:**
+        List of field-level edits
+    """
+    logger.info(
+        "question_history_retrieval_initiated",
+        user_id=str(current_user.id),
+        quiz_id=str(quiz_id),
+        question_id=str(question_id),
+    )
+
+    try:
+        # Verify quiz ownership
+        await _verify_quiz_access(quiz_id, current_user.id)
+
+        async with get_async_session() as session:
+            question = await service.get_question_by_id(
+                session, question_id, include_deleted=True
+            )
+            if not question or question.quiz_id != quiz_id:
+                raise HTTPException(status_code=404, detail="Question not found")
+
+            edits = await service.get_question_edit_history(
+                session, question_id, after_seq=after_seq, limit=limit
+            )
+
+        logger.info(
+            "question_history_retrieval_completed",
+            user_id=str(current_user.id),
+            quiz_id=str(quiz_id),
+            question_id=str(question_id),
+            edits_found=len(edits),
+        )
+
+        return edits
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "question_history_retrieval_failed",
+            user_id=str(current_user.id),
+            quiz_id=str(quiz_id),
+            question_id=str(question_id),
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to retrieve question history. Please try again.",
+        )
+
+
 @router.post("/{quiz_id}", response_model=QuestionResponse)
 async def create_question(
     quiz_id: UUID,
@@ -57,6 +57,16 @@ class QuestionResponse(BaseModel):
         use_enum_values = True
 
 
+class QuestionEditResponse(BaseModel):
+    """One recorded field-level edit of a question."""
+
+    seq: int
+    field: str
+    old_value: Any = None
+    new_value: Any = None
+    created_at: datetime | None = None
+
+
 class BulkApproveRequest(BaseModel):
     """Schema for bulk approving multiple questions."""
 
@@ -1,11 +1,23 @@
 """Question service functions following the quiz module pattern."""
 
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import (
+    String,
+    Uuid,
+    column,
+    func,
+    insert,
+    literal,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import asc, select
+from sqlmodel import asc, col, select
 
 # Removed unused transaction import
 from src.config import get_logger
@@ -13,12 +25,20 @@ from src.config import get_logger
 from .formatters import format_questions_batch
 from .types import (
     Question,
+    QuestionDifficulty,
+    QuestionEdit,
     QuestionType,
     get_question_type_registry,
 )
 
 logger = get_logger("question_service")
 
+# Export payloads of recently exported questions, keyed by (id, updated_at)
+CANVAS_PAYLOAD_CACHE_SIZE = 2048
+_canvas_payload_cache: OrderedDict[
+    tuple[UUID, datetime | None], tuple[dict[str, Any], dict[str, Any]]
+] = OrderedDict()
+
 
 async def save_questions(
     session: AsyncSession,
@@ -82,6 +102,7 @@ async def save_questions(
                 is_approved=False,
                 module_id=module_id,
             )
+            question.cache_typed_data(validated_data)
 
             session.add(question)
             saved_questions.append(question)
@@ -127,6 +148,46 @@ async def save_questions(
     }
 
 
+def _build_question_filters(
+    quiz_id: UUID,
+    question_type: QuestionType | None = None,
+    approved_only: bool = False,
+    include_deleted: bool = False,
+    module_id: str | None = None,
+    difficulty: QuestionDifficulty | None = None,
+    is_approved: bool | None = None,
+    rejected: bool | None = None,
+) -> list[Any]:
+    """Build the WHERE conditions shared by question list and count queries."""
+    conditions: list[Any] = [Question.quiz_id == quiz_id]
+
+    # Rejected questions are soft-deleted, so asking for them implies deleted rows
+    if not include_deleted and not rejected:
+        conditions.append(Question.deleted == False)  # noqa: E712
+
+    if question_type:
+        conditions.append(Question.question_type == question_type)
+
+    if approved_only:
+        conditions.append(Question.is_approved)
+
+    if module_id is not None:
+        conditions.append(Question.module_id == module_id)
+
+    if difficulty is not None:
+        conditions.append(Question.difficulty == difficulty)
+
+    if is_approved is not None:
+        conditions.append(Question.is_approved == is_approved)
+
+    if rejected is True:
+        conditions.append(col(Question.rejection_reason).is_not(None))
+    elif rejected is False:
+        conditions.append(col(Question.rejection_reason).is_(None))
+
+    return conditions
+
+
 async def get_questions_by_quiz(
     session: AsyncSession,
     quiz_id: UUID,
@@ -135,6 +196,11 @@ async def get_questions_by_quiz(
     limit: int | None = None,
     offset: int = 0,
     include_deleted: bool = False,
+    module_id: str | None = None,
+    difficulty: QuestionDifficulty | None = None,
+    is_approved: bool | None = None,
+    rejected: bool | None = None,
+    after: tuple[datetime, UUID] | None = None,
 ) -> list[Question]:
     """
     Get questions for a quiz, filtering out soft-deleted questions by default.
@@ -147,6 +213,11 @@ async def get_questions_by_quiz(
         limit: Maximum number of questions to return
         offset: Number of questions to skip
         include_deleted: Include soft-deleted questions in results
+        module_id: Filter by source module (optional)
+        difficulty: Filter by difficulty (optional)
+        is_approved: Filter by approval state (optional)
+        rejected: Filter by rejection state; True returns rejected questions
+        after: Keyset cursor (created_at, id); only questions after it are returned
 
     Returns:
         List of questions
@@ -158,20 +229,29 @@ async def get_questions_by_quiz(
         approved_only=approved_only,
         limit=limit,
         offset=offset,
+        keyset=after is not None,
     )
 
     # Build query
-    statement = select(Question).where(Question.quiz_id == quiz_id)
-
-    # Filter out soft-deleted questions unless requested
-    if not include_deleted:
-        statement = statement.where(Question.deleted == False)  # noqa: E712
-
-    if question_type:
-        statement = statement.where(Question.question_type == question_type)
+    statement = select(Question).where(
+        *_build_question_filters(
+            quiz_id,
+            question_type=question_type,
+            approved_only=approved_only,
+            include_deleted=include_deleted,
+            module_id=module_id,
+            difficulty=difficulty,
+            is_approved=is_approved,
+            rejected=rejected,
+        )
+    )
 
-    if approved_only:
-        statement = statement.where(Question.is_approved)
+    # Keyset pagination: seek past the last seen (created_at, id)
+    if after is not None:
+        statement = statement.where(
+            tuple_(col(Question.created_at), col(Question.id))
+            > tuple_(*(literal(value) for value in after))
+        )
 
     # Add ordering
     statement = statement.order_by(asc(Question.created_at), asc(Question.id))
@@ -195,6 +275,54 @@ async def get_questions_by_quiz(
     return questions
 
 
+async def count_questions_by_quiz(
+    session: AsyncSession,
+    quiz_id: UUID,
+    question_type: QuestionType | None = None,
+    approved_only: bool = False,
+    include_deleted: bool = False,
+    module_id: str | None = None,
+    difficulty: QuestionDifficulty | None = None,
+    is_approved: bool | None = None,
+    rejected: bool | None = None,
+) -> int:
+    """
+    Count questions for a quiz using the same filters as get_questions_by_quiz.
+
+    Args:
+        session: Database session
+        quiz_id: Quiz identifier
+        question_type: Filter by question type (optional)
+        approved_only: Only count approved questions
+        include_deleted: Include soft-deleted questions in the count
+        module_id: Filter by source module (optional)
+        difficulty: Filter by difficulty (optional)
+        is_approved: Filter by approval state (optional)
+        rejected: Filter by rejection state; True counts rejected questions
+
+    Returns:
+        Number of matching questions
+    """
+    statement = (
+        select(func.count())
+        .select_from(Question)
+        .where(
+            *_build_question_filters(
+                quiz_id,
+                question_type=question_type,
+                approved_only=approved_only,
+                include_deleted=include_deleted,
+                module_id=module_id,
+                difficulty=difficulty,
+                is_approved=is_approved,
+                rejected=rejected,
+            )
+        )
+    )
+    result = await session.execute(statement)
+    return int(result.scalar_one())
+
+
 async def get_formatted_questions_by_quiz(
     session: AsyncSession,
     quiz_id: UUID,
@@ -299,6 +427,68 @@ async def approve_question(session: AsyncSession, question_id: UUID) -> Question
     return question
 
 
+async def _append_question_edits(
+    session: AsyncSession, question_id: UUID, edit_entries: list[dict[str, Any]]
+) -> None:
+    """Append edit log entries to a question's history with the next seq numbers."""
+    # Lock the question so concurrent edits cannot take the same seq
+    await session.execute(
+        select(Question.id).where(Question.id == question_id).with_for_update()
+    )
+    last_seq: int = (
+        await session.execute(
+            select(func.coalesce(func.max(QuestionEdit.seq), 0)).where(
+                QuestionEdit.question_id == question_id
+            )
+        )
+    ).scalar_one()
+
+    await session.execute(
+        insert(QuestionEdit).values(
+            [
+                {
+                    "question_id": question_id,
+                    "seq": last_seq + offset,
+                    "field": entry["field"],
+                    "old_value": entry["old_value"],
+                    "new_value": entry["new_value"],
+                }
+                for offset, entry in enumerate(edit_entries, start=1)
+            ]
+        )
+    )
+
+
+async def get_question_edit_history(
+    session: AsyncSession,
+    question_id: UUID,
+    after_seq: int = 0,
+    limit: int | None = None,
+) -> list[QuestionEdit]:
+    """
+    Get the recorded edits of a question in the order they were made.
+
+    Args:
+        session: Database session
+        question_id: Question identifier
+        after_seq: Only return edits with a higher seq (for paging)
+        limit: Maximum number of edits to return
+
+    Returns:
+        List of question edits
+    """
+    statement = (
+        select(QuestionEdit)
+        .where(QuestionEdit.question_id == question_id, QuestionEdit.seq > after_seq)
+        .order_by(asc(QuestionEdit.seq))
+    )
+    if limit is not None:
+        statement = statement.limit(limit)
+
+    result = await session.execute(statement)
+    return list(result.scalars().all())
+
+
 async def update_question(
     session: AsyncSession,
     question_id: UUID,
@@ -307,6 +497,8 @@ async def update_question(
     """
     Update a question with the provided data.
 
+    Changes to question_data are appended to the question's edit history.
+
     Args:
         session: Database session
         question_id: Question identifier
@@ -334,8 +526,7 @@ async def update_question(
 
         # Only append if there are actual changes
         if edit_entries:
-            existing_log = question.edit_log or []
-            question.edit_log = existing_log + edit_entries
+            await _append_question_edits(session, question_id, edit_entries)
             logger.debug(
                 "edit_log_entries_generated",
                 question_id=str(question_id),
@@ -415,6 +606,47 @@ async def delete_question(
     return True
 
 
+def build_export_payloads(
+    question: Question,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Build a question's export data and Canvas item entry in one pass.
+
+    Results are memoized per question ID and ``updated_at``, so re-exports
+    and retries skip validation and formatting for unchanged questions.
+    Callers must treat the returned dictionaries as read-only.
+
+    Args:
+        question: Question to build payloads for
+
+    Returns:
+        Tuple of (format_for_export data, format_for_canvas entry)
+
+    Raises:
+        ValueError: If the question type is unsupported or its data is invalid
+    """
+    key = (question.id, question.updated_at)
+    cached = _canvas_payload_cache.get(key)
+    if cached is not None:
+        _canvas_payload_cache.move_to_end(key)
+        return cached
+
+    from src.question.types import get_question_type_registry
+
+    question_registry = get_question_type_registry()
+    question_impl = question_registry.get_question_type(question.question_type)
+    typed_data = question.get_typed_data(question_registry)
+    payloads = (
+        question_impl.format_for_export(typed_data),
+        question_impl.format_for_canvas(typed_data),
+    )
+
+    _canvas_payload_cache[key] = payloads
+    if len(_canvas_payload_cache) > CANVAS_PAYLOAD_CACHE_SIZE:
+        _canvas_payload_cache.popitem(last=False)
+    return payloads
+
+
 async def prepare_questions_for_export(quiz_id: UUID) -> list[dict[str, Any]]:
     """
     Load approved questions and extract their data for export.
@@ -429,7 +661,6 @@ async def prepare_questions_for_export(quiz_id: UUID) -> list[dict[str, Any]]:
         List of question data dictionaries ready for export
     """
     from src.database import get_async_session
-    from src.question.types import get_question_type_registry
 
     async with get_async_session() as async_session:
         # Load approved questions with all needed data
@@ -442,17 +673,18 @@ async def prepare_questions_for_export(quiz_id: UUID) -> list[dict[str, Any]]:
             return []
 
         # Extract all data while questions are still bound to session
-        question_registry = get_question_type_registry()
         question_data = []
 
-        for question in approved_questions:
+        for position, question in enumerate(approved_questions, start=1):
             try:
-                question_impl = question_registry.get_question_type(
-                    question.question_type
-                )
-                typed_data = question.get_typed_data(question_registry)
-                exported_data = question_impl.format_for_export(typed_data)
+                export_payload, canvas_entry = build_export_payloads(question)
+                exported_data = dict(export_payload)
                 exported_data["id"] = question.id
+                # Ready-made Canvas item body, reused for points and upload
+                exported_data["canvas_entry"] = canvas_entry
+                # Used to resume a partially completed export in place
+                exported_data["position"] = position
+                exported_data["canvas_item_id"] = question.canvas_item_id
                 question_data.append(exported_data)
             except ValueError as e:
                 # Log unsupported question types
@@ -477,30 +709,52 @@ async def update_question_canvas_ids(
     session: AsyncSession,
     question_data_list: list[dict[str, Any]],
     export_results: list[dict[str, Any]],
-) -> None:
+) -> int:
     """
     Update question Canvas item IDs after successful export.
 
+    All IDs are written with a single UPDATE ... FROM (VALUES ...) statement,
+    so this is cheap enough to call after every exported chunk.
+
     Args:
         session: Database session
         question_data_list: List of question data used for export
-        export_results: List of export results from Canvas API
+        export_results: List of export results from Canvas API, in the same order
+
+    Returns:
+        Number of questions updated
     """
+    exported = [
+        (question_data["id"], str(export_result["item_id"]))
+        for question_data, export_result in zip(
+            question_data_list, export_results, strict=False
+        )
+        if export_result.get("success") and export_result.get("item_id") is not None
+    ]
+
     logger.debug(
         "updating_question_canvas_ids",
         question_count=len(question_data_list),
         result_count=len(export_results),
+        exported_count=len(exported),
     )
 
-    for question_data, export_result in zip(
-        question_data_list, export_results, strict=False
-    ):
-        if export_result.get("success"):
-            question_obj = await session.get(Question, question_data["id"])
-            if question_obj:
-                question_obj.canvas_item_id = export_result.get("item_id")
+    if not exported:
+        return 0
+
+    exported_items = values(
+        column("id", Uuid()), column("canvas_item_id", String()), name="exported"
+    ).data(exported)
+    result = await session.execute(
+        update(Question)
+        .where(col(Question.id) == exported_items.c.id)
+        .values(canvas_item_id=exported_items.c.canvas_item_id)
+        .execution_options(synchronize_session=False)
+    )
 
-    logger.debug("question_canvas_ids_updated")
+    updated: int = result.rowcount or 0
+    logger.debug("question_canvas_ids_updated", updated_count=updated)
+    return updated
 
 
 def calculate_total_points_for_questions(question_data: list[dict[str, Any]]) -> int:
@@ -531,6 +785,11 @@ def calculate_total_points_for_questions(question_data: list[dict[str, Any]]) ->
     logger.debug("calculating_total_points", question_count=len(question_data))
 
     for i, question in enumerate(question_data):
+        # Payloads built by prepare_questions_for_export need no conversion
+        if "canvas_entry" in question:
+            total_points += question["canvas_entry"].get("points_possible", 1)
+            continue
+
         try:
             question_type_str = question.get("question_type", "multiple_choice")
 
@@ -563,7 +822,15 @@ def calculate_total_points_for_questions(question_data: list[dict[str, Any]]) ->
             data_for_validation = {
                 k: v
                 for k, v in question.items()
-                if k not in ["id", "question_type", "approved"]
+                if k
+                not in [
+                    "id",
+                    "question_type",
+                    "approved",
+                    "position",
+                    "canvas_item_id",
+                    "canvas_entry",
+                ]
             }
 
             # Validate and format the question data
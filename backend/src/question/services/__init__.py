@@ -4,6 +4,7 @@
 from .content_service import (
     get_content_from_quiz,
     get_content_statistics,
+    iter_content_from_quiz,
     prepare_and_validate_content,
     prepare_content_for_generation,
     validate_content_quality,
@@ -16,6 +17,7 @@ from .generation_service import QuestionGenerationService
 __all__ = [
     # Content processing functions
     "get_content_from_quiz",
+    "iter_content_from_quiz",
     "prepare_content_for_generation",
     "prepare_and_validate_content",
     "validate_content_quality",
@@ -1,5 +1,6 @@
 """Content processing functions for module-based question generation."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
 
@@ -52,6 +53,48 @@ async def get_content_from_quiz(quiz_id: UUID) -> dict[str, Any]:
         raise
 
 
+async def iter_content_from_quiz(
+    quiz_id: UUID, module_ids: list[str] | None = None
+) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]:
+    """
+    Stream extracted content from a quiz one module at a time.
+
+    Args:
+        quiz_id: Quiz identifier
+        module_ids: Only load these modules (all modules if None)
+
+    Yields:
+        Tuples of (module_id, list of page dictionaries)
+
+    Raises:
+        ValueError: If no content is found
+    """
+    logger.info("content_extraction_started", quiz_id=str(quiz_id))
+
+    from src.quiz.content_store import iter_quiz_content_modules
+
+    modules_count = 0
+    total_content_size = 0
+
+    async with get_async_session() as session:
+        async for module_id, pages in iter_quiz_content_modules(
+            session, quiz_id, module_ids
+        ):
+            modules_count += 1
+            total_content_size += _calculate_total_content_size({module_id: pages})
+            yield module_id, pages
+
+    if not modules_count:
+        raise ValueError(f"No extracted content found for quiz {quiz_id}")
+
+    logger.info(
+        "content_extraction_completed",
+        quiz_id=str(quiz_id),
+        modules_count=modules_count,
+        total_content_size=total_content_size,
+    )
+
+
 def validate_module_content(content_dict: dict[str, Any]) -> dict[str, str]:
     """
     Validate and prepare module content for question generation.
@@ -70,33 +113,9 @@ def validate_module_content(content_dict: dict[str, Any]) -> dict[str, str]:
     validated_modules = {}
 
     for module_id, pages in content_dict.items():
-        if not isinstance(pages, list):
-            logger.warning(
-                "module_content_invalid_format",
-                module_id=module_id,
-                type=type(pages).__name__,
-            )
-            continue
-
-        module_content = _combine_module_pages(module_id, pages)
-
-        if (
-            module_content
-            and len(module_content.strip()) >= settings.CONTENT_LENGTH_THRESHOLD
-        ):  # Minimum content length from configuration
+        module_content = _validate_module_pages(module_id, pages)
+        if module_content is not None:
             validated_modules[module_id] = module_content
-            logger.debug(
-                "module_content_validated",
-                module_id=module_id,
-                content_length=len(module_content),
-                word_count=len(module_content.split()),
-            )
-        else:
-            logger.warning(
-                "module_content_insufficient",
-                module_id=module_id,
-                content_length=len(module_content) if module_content else 0,
-            )
 
     logger.info(
         "module_content_validation_completed",
@@ -109,29 +128,49 @@ def validate_module_content(content_dict: dict[str, Any]) -> dict[str, str]:
 
 
 async def prepare_content_for_generation(
-    quiz_id: UUID, custom_content: dict[str, Any] | None = None
+    quiz_id: UUID,
+    custom_content: dict[str, Any] | None = None,
+    module_ids: list[str] | None = None,
 ) -> dict[str, str]:
     """
     Prepare content for module-based question generation.
 
+    Quiz content is streamed module by module, so only the combined text of
+    each module is kept rather than every page of the quiz.
+
     Args:
         quiz_id: Quiz identifier
         custom_content: Optional custom content to use instead of quiz content
+        module_ids: Only load these modules from the quiz (all modules if None)
 
     Returns:
         Dictionary mapping module_id to prepared module content
     """
     if custom_content:
-        content_dict = custom_content
         logger.info(
             "using_custom_content",
             quiz_id=str(quiz_id),
-            modules_count=len(content_dict),
+            modules_count=len(custom_content),
         )
-    else:
-        content_dict = await get_content_from_quiz(quiz_id)
+        return validate_module_content(custom_content)
+
+    validated_modules = {}
+    total_modules = 0
+
+    async for module_id, pages in iter_content_from_quiz(quiz_id, module_ids):
+        total_modules += 1
+        module_content = _validate_module_pages(module_id, pages)
+        if module_content is not None:
+            validated_modules[module_id] = module_content
 
-    return validate_module_content(content_dict)
+    logger.info(
+        "module_content_validation_completed",
+        total_modules=total_modules,
+        validated_modules=len(validated_modules),
+        total_content_size=sum(len(content) for content in validated_modules.values()),
+    )
+
+    return validated_modules
 
 
 def validate_content_quality(modules_content: dict[str, str]) -> dict[str, str]:
@@ -222,6 +261,38 @@ def get_content_statistics(modules_content: dict[str, str]) -> dict[str, Any]:
     }
 
 
+def _validate_module_pages(module_id: str, pages: Any) -> str | None:
+    """Combine a module's pages, returning None if the content is unusable."""
+    if not isinstance(pages, list):
+        logger.warning(
+            "module_content_invalid_format",
+            module_id=module_id,
+            type=type(pages).__name__,
+        )
+        return None
+
+    module_content = _combine_module_pages(module_id, pages)
+
+    if (
+        module_content
+        and len(module_content.strip()) >= settings.CONTENT_LENGTH_THRESHOLD
+    ):  # Minimum content length from configuration
+        logger.debug(
+            "module_content_validated",
+            module_id=module_id,
+            content_length=len(module_content),
+            word_count=len(module_content.split()),
+        )
+        return module_content
+
+    logger.warning(
+        "module_content_insufficient",
+        module_id=module_id,
+        content_length=len(module_content) if module_content else 0,
+    )
+    return None
+
+
 def _combine_module_pages(_module_id: str, pages: list[dict[str, Any]]) -> str:
     """Combine all pages from a module into a single content string."""
     module_content_parts = []
@@ -319,6 +390,7 @@ async def prepare_and_validate_content(
     quiz_id: UUID,
     custom_content: dict[str, Any] | None = None,
     quality_filter: bool = True,
+    module_ids: list[str] | None = None,
 ) -> dict[str, str]:
     """
     Complete content preparation pipeline with optional quality filtering.
@@ -327,11 +399,12 @@ async def prepare_and_validate_content(
         quiz_id: Quiz identifier
         custom_content: Optional custom content
         quality_filter: Whether to apply quality filtering
+        module_ids: Only load these modules from the quiz (all modules if None)
 
     Returns:
         Prepared and optionally filtered module content
     """
-    content = await prepare_content_for_generation(quiz_id, custom_content)
+    content = await prepare_content_for_generation(quiz_id, custom_content, module_ids)
 
     if quality_filter:
         content = validate_content_quality(content)
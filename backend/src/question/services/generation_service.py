@@ -10,6 +10,7 @@ from ..providers import get_llm_provider_registry
 from ..templates import get_template_manager
 from ..types import QuestionType, QuizLanguage
 from ..workflows.module_batch_workflow import ParallelModuleProcessor
+from ..workflows.scheduling import GenerationPriority
 
 logger = get_logger("generation_service")
 
@@ -27,6 +28,7 @@ class QuestionGenerationService:
         quiz_id: UUID,
         extracted_content: dict[str, str],
         provider_name: str = "openai",
+        priority: GenerationPriority = GenerationPriority.FIRST_GENERATION,
     ) -> tuple[dict[str, list[Any]], dict[str, list[str]]]:
         """
         Generate questions for quiz with batch-level tracking and selective retry support.
@@ -38,6 +40,7 @@ class QuestionGenerationService:
             quiz_id: Quiz identifier
             extracted_content: Module content mapped by module ID
             provider_name: LLM provider to use
+            priority: Priority class of the generation's LLM requests
 
         Returns:
             Dictionary mapping module IDs to lists of generated questions
@@ -77,7 +80,7 @@ class QuestionGenerationService:
                 from ..providers import LLMProvider
 
                 provider_enum = LLMProvider(provider_name.lower())
-                provider = self.provider_registry.get_provider(provider_enum)
+                provider = self.provider_registry.get_provider_pool(provider_enum)
 
                 # Build modules to process with their batches
                 modules_to_process = {}
@@ -181,11 +184,19 @@ class QuestionGenerationService:
                     custom_instructions=quiz.custom_instructions,
                 )
 
+                # Questions kept from earlier runs must not be generated again
+                from ..service import get_questions_by_quiz
+
+                existing_questions = await get_questions_by_quiz(session, quiz_id)
+
                 (
                     results,
                     batch_status,
                 ) = await processor.process_all_modules_with_batches(
-                    quiz_id, modules_to_process
+                    quiz_id,
+                    modules_to_process,
+                    existing_questions=[q.question_data for q in existing_questions],
+                    priority=priority,
                 )
 
                 # Logging moved to the logger.info call below
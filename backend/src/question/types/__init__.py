@@ -3,10 +3,12 @@
 from .base import (
     BaseQuestionData,
     BaseQuestionType,
+    BatchValidationResult,
     GenerationParameters,
     GenerationResult,
     Question,
     QuestionDifficulty,
+    QuestionEdit,
     QuestionType,
     QuizLanguage,
     RejectionReason,
@@ -18,7 +20,9 @@ __all__ = [
     # Base types
     "BaseQuestionData",
     "BaseQuestionType",
+    "BatchValidationResult",
     "Question",
+    "QuestionEdit",
     "QuestionType",
     "QuestionDifficulty",
     "QuizLanguage",
@@ -2,12 +2,15 @@
 
 import uuid
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from pydantic import BaseModel
-from sqlalchemy import Column, DateTime, func
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -81,6 +84,105 @@ class BaseQuestionData(BaseModel):
         extra = "forbid"
 
 
+@dataclass
+class BatchValidationResult:
+    """Outcome of validating a list of question data dictionaries.
+
+    Both mappings are keyed by the index of the item in the input list.
+    """
+
+    valid: dict[int, BaseQuestionData] = field(default_factory=dict)
+    errors: dict[int, str] = field(default_factory=dict)
+
+
+@cache
+def _get_list_adapter(
+    data_model: type[BaseQuestionData],
+) -> TypeAdapter[list[BaseQuestionData]]:
+    """Build (once per data model) a compiled validator for lists of that model."""
+    return TypeAdapter(list[data_model])  # type: ignore[valid-type]
+
+
+# Keywords strict structured output does not accept; the data model still
+# enforces them when the response is validated
+_UNSUPPORTED_SCHEMA_KEYWORDS = frozenset(
+    {
+        "default",
+        "format",
+        "maxItems",
+        "maxLength",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minimum",
+        "pattern",
+        "title",
+    }
+)
+
+
+def _to_strict_schema(schema: Any) -> Any:
+    """
+    Convert a pydantic JSON Schema to the strict structured-output subset.
+
+    Every object lists all of its properties as required and forbids extra
+    ones; properties that were optional become nullable instead.
+    """
+    if isinstance(schema, list):
+        return [_to_strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    strict: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key in _UNSUPPORTED_SCHEMA_KEYWORDS:
+            continue
+        if key in ("properties", "$defs"):
+            # Keys of these mappings are names, not schema keywords
+            strict[key] = {name: _to_strict_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = _to_strict_schema(value)
+
+    if strict.get("type") == "object" and "properties" in strict:
+        required = set(strict.get("required", []))
+        for name, prop in strict["properties"].items():
+            nullable = any(
+                option.get("type") == "null" for option in prop.get("anyOf", [])
+            )
+            if name not in required and not nullable:
+                strict["properties"][name] = {"anyOf": [prop, {"type": "null"}]}
+        strict["required"] = list(strict["properties"])
+        strict["additionalProperties"] = False
+
+    return strict
+
+
+@cache
+def _get_output_schema(data_model: type[BaseQuestionData]) -> dict[str, Any]:
+    """Build (once per data model) the structured-output schema of a batch."""
+    item_schema = _to_strict_schema(data_model.model_json_schema())
+    definitions = item_schema.pop("$defs", None)
+
+    schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"questions": {"type": "array", "items": item_schema}},
+        "required": ["questions"],
+        "additionalProperties": False,
+    }
+    if definitions:
+        schema["$defs"] = definitions
+    return schema
+
+
+def _format_item_errors(errors: list[ErrorDetails]) -> str:
+    """Render pydantic errors for one list item, dropping the list index."""
+    messages = []
+    for error in errors:
+        location = ".".join(str(part) for part in error["loc"][1:])
+        messages.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return "; ".join(messages)
+
+
 class BaseQuestionType(ABC):
     """Abstract base class for question type implementations."""
 
@@ -101,6 +203,73 @@ class BaseQuestionType(ABC):
         """Validate and parse question data."""
         pass
 
+    def post_validate(self, data: BaseQuestionData) -> BaseQuestionData:
+        """
+        Apply business rules that run after model validation.
+
+        Types whose rules span several fields override this; validate_data and
+        validate_batch both go through it.
+
+        Raises:
+            ValueError: If the data violates a business rule
+        """
+        return data
+
+    def get_output_schema(self) -> dict[str, Any]:
+        """
+        Get the JSON Schema for a generated batch of this question type.
+
+        Derived from the data model in the strict subset accepted by
+        structured output: an object whose ``questions`` array holds the
+        question data. Length and pattern limits are left to validation.
+
+        Returns:
+            JSON Schema dictionary (shared; do not modify)
+        """
+        return _get_output_schema(self.data_model)
+
+    def validate_batch(self, items: list[dict[str, Any]]) -> BatchValidationResult:
+        """
+        Validate a list of question data dictionaries in one pass.
+
+        Uses a cached TypeAdapter for list[data_model], so the whole batch is
+        validated by a single compiled validator. Items that fail are reported
+        by index; the remaining items are still returned as validated data.
+
+        Args:
+            items: Raw question data dictionaries
+
+        Returns:
+            Validated data and error messages keyed by item index
+        """
+        result = BatchValidationResult()
+        adapter = _get_list_adapter(self.data_model)
+
+        try:
+            validated_items = list(enumerate(adapter.validate_python(items)))
+        except ValidationError as e:
+            errors_by_index: dict[int, list[ErrorDetails]] = {}
+            for error in e.errors():
+                errors_by_index.setdefault(int(error["loc"][0]), []).append(error)
+
+            for index, item_errors in errors_by_index.items():
+                result.errors[index] = _format_item_errors(item_errors)
+
+            # Items that passed are re-validated individually (failure path only)
+            validated_items = [
+                (index, self.data_model.model_validate(item))
+                for index, item in enumerate(items)
+                if index not in errors_by_index
+            ]
+
+        for index, data in validated_items:
+            try:
+                result.valid[index] = self.post_validate(data)
+            except ValueError as e:
+                result.errors[index] = str(e)
+
+        return result
+
     @abstractmethod
     def format_for_display(self, data: BaseQuestionData) -> dict[str, Any]:
         """Format question data for API display."""
@@ -196,13 +365,6 @@ class Question(SQLModel, table=True):
         default=None, description="Canvas quiz item ID after export"
     )
 
-    # Edit tracking
-    edit_log: list[dict[str, Any]] | None = Field(
-        default=None,
-        sa_column=Column(JSONB, nullable=True, default=[]),
-        description="Field-level edit history for question_data changes",
-    )
-
     # Soft delete fields
     deleted: bool = Field(
         default=False,
@@ -227,12 +389,64 @@ class Question(SQLModel, table=True):
         description="Optional free-text feedback explaining rejection",
     )
 
+    __table_args__ = (
+        # Review list, keyset pagination and export: active questions of a quiz
+        # in order. is_approved is included so approval filters and
+        # total/approved counts are answered from the index.
+        Index(
+            "ix_question_quiz_id_created_at_id_active",
+            "quiz_id",
+            "created_at",
+            "id",
+            postgresql_include=["is_approved"],
+            postgresql_where=text("deleted = false"),
+        ),
+    )
+
     def get_typed_data(
         self, question_registry: "QuestionTypeRegistry"
     ) -> BaseQuestionData:
-        """Get strongly-typed question data using the question registry."""
+        """
+        Get strongly-typed question data using the question registry.
+
+        Reuses data cached by cache_typed_data as long as question_data has
+        not been reassigned since, avoiding a second validation pass.
+        """
+        cached = self.__dict__.get("_typed_data_cache")
+        if cached is not None and cached[0] is self.question_data:
+            return cached[1]  # type: ignore[no-any-return]
+
         question_impl = question_registry.get_question_type(self.question_type)
-        return question_impl.validate_data(self.question_data)
+        typed_data = question_impl.validate_data(self.question_data)
+        self.cache_typed_data(typed_data)
+        return typed_data
+
+    def cache_typed_data(self, typed_data: BaseQuestionData) -> None:
+        """Remember validated data for the current question_data (not persisted)."""
+        self.__dict__["_typed_data_cache"] = (self.question_data, typed_data)
+
+
+class QuestionEdit(SQLModel, table=True):
+    """
+    One field-level change to a question's data.
+
+    Rows are only ever appended, numbered per question by seq, so an edit
+    never rewrites earlier history and loading a question never loads it.
+    """
+
+    question_id: uuid.UUID = Field(
+        foreign_key="question.id", primary_key=True, ondelete="CASCADE"
+    )
+    seq: int = Field(primary_key=True, description="Edit order within the question")
+    field: str = Field(max_length=255, description="Changed question_data key")
+    old_value: Any | None = Field(default=None, sa_column=Column(JSONB, nullable=True))
+    new_value: Any | None = Field(default=None, sa_column=Column(JSONB, nullable=True))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=True
+        ),
+    )
 
 
 class GenerationParameters(BaseModel):
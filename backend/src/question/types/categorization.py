@@ -235,12 +235,29 @@ class CategorizationQuestionType(BaseQuestionType):
         Raises:
             ValidationError: If data is invalid
         """
-        categorization_data = CategorizationData(**data)
+        return self.post_validate(CategorizationData(**data))
+
+    def post_validate(self, data: BaseQuestionData) -> CategorizationData:
+        """
+        Apply categorization business rules to validated data.
+
+        Args:
+            data: Validated categorization data
+
+        Returns:
+            Cleaned categorization data
+
+        Raises:
+            ValueError: If item assignments are invalid
+        """
+        if not isinstance(data, CategorizationData):
+            raise ValueError("Expected CategorizationData")
+
         # Clean up LLM data inconsistencies (distractors in items array)
-        categorization_data.clean_distractor_duplicates()
+        data.clean_distractor_duplicates()
         # Additional validation for business logic
-        categorization_data.validate_item_assignments()
-        return categorization_data
+        data.validate_item_assignments()
+        return data
 
     def format_for_display(self, data: BaseQuestionData) -> dict[str, Any]:
         """
@@ -136,10 +136,26 @@ class MatchingQuestionType(BaseQuestionType):
         Raises:
             ValidationError: If data is invalid
         """
-        matching_data = MatchingData(**data)
-        # Additional validation
-        matching_data.validate_no_distractor_matches()
-        return matching_data
+        return self.post_validate(MatchingData(**data))
+
+    def post_validate(self, data: BaseQuestionData) -> MatchingData:
+        """
+        Apply matching business rules to validated data.
+
+        Args:
+            data: Validated matching data
+
+        Returns:
+            The same matching data
+
+        Raises:
+            ValueError: If a distractor matches a correct answer
+        """
+        if not isinstance(data, MatchingData):
+            raise ValueError("Expected MatchingData")
+
+        data.validate_no_distractor_matches()
+        return data
 
     def format_for_display(self, data: BaseQuestionData) -> dict[str, Any]:
         """
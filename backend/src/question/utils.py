@@ -1,7 +1,11 @@
 """Utility functions for question operations."""
 
+import hashlib
+from collections.abc import Sequence
 from typing import Any
 
+from .types import Question
+
 
 def generate_edit_log_entries(
     old_question_data: dict[str, Any], new_question_data: dict[str, Any]
@@ -39,3 +43,29 @@ def generate_edit_log_entries(
             )
 
     return edit_entries
+
+
+def build_question_list_etag(
+    questions: Sequence[Question], total_count: int, next_cursor: str | None
+) -> str:
+    """
+    Build a weak ETag for a page of the question list.
+
+    The tag changes whenever a question on the page is added, removed or
+    updated, or when the total count of matching questions changes, so the
+    page can be revalidated without formatting any question data.
+
+    Args:
+        questions: Questions on the current page
+        total_count: Total number of questions matching the filters
+        next_cursor: Cursor for the next page, if any
+
+    Returns:
+        Weak ETag header value
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(f"{total_count}|{next_cursor}".encode())
+    for question in questions:
+        updated_at = question.updated_at.isoformat() if question.updated_at else ""
+        digest.update(f"|{question.id}:{updated_at}".encode())
+    return f'W/"{digest.hexdigest()}"'
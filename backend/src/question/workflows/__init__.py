@@ -6,7 +6,15 @@ from .base import (
     WorkflowConfiguration,
     WorkflowState,
 )
+from .chunking import score_chunks, select_batch_contents, split_into_chunks
+from .dedup import DuplicateIndex
 from .registry import WorkflowRegistry, get_workflow_registry
+from .scheduling import (
+    GenerationPriority,
+    GenerationScheduler,
+    generation_priority,
+    get_generation_scheduler,
+)
 
 __all__ = [
     # Base classes
@@ -14,6 +22,17 @@ __all__ = [
     "WorkflowState",
     "WorkflowConfiguration",
     "ContentChunk",
+    # Content chunking
+    "split_into_chunks",
+    "score_chunks",
+    "select_batch_contents",
+    # Near-duplicate detection
+    "DuplicateIndex",
+    # Priority scheduling
+    "GenerationPriority",
+    "GenerationScheduler",
+    "generation_priority",
+    "get_generation_scheduler",
     # Registry
     "WorkflowRegistry",
     "get_workflow_registry",
@@ -0,0 +1,124 @@
+"""Output-token-aware splitting of generation batches into parallel sub-requests."""
+
+import math
+import re
+
+from src.config import get_logger, settings
+
+from ..types import Question, QuestionType
+
+logger = get_logger("batch_planning")
+
+# Starting estimates of completion tokens per generated question; refined
+# from the usage reported by each completed generation
+DEFAULT_TOKENS_PER_QUESTION: dict[QuestionType, float] = {
+    QuestionType.MULTIPLE_CHOICE: 180,
+    QuestionType.MULTIPLE_ANSWER: 220,
+    QuestionType.TRUE_FALSE: 120,
+    QuestionType.FILL_IN_BLANK: 200,
+    QuestionType.MATCHING: 450,
+    QuestionType.CATEGORIZATION: 600,
+}
+FALLBACK_TOKENS_PER_QUESTION = 300.0
+
+# Weight of the newest observation in the moving average
+OBSERVATION_WEIGHT = 0.2
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class OutputTokenEstimator:
+    """Tracks observed completion tokens per question for each question type."""
+
+    def __init__(self) -> None:
+        self._tokens_per_question: dict[QuestionType, float] = dict(
+            DEFAULT_TOKENS_PER_QUESTION
+        )
+
+    def tokens_per_question(self, question_type: QuestionType) -> float:
+        """Get the current estimate of completion tokens per question."""
+        return self._tokens_per_question.get(
+            question_type, FALLBACK_TOKENS_PER_QUESTION
+        )
+
+    def record(
+        self, question_type: QuestionType, completion_tokens: int, question_count: int
+    ) -> None:
+        """
+        Fold one completed generation into the estimate for its question type.
+
+        Args:
+            question_type: Type of the generated questions
+            completion_tokens: Completion tokens reported by the provider
+            question_count: Number of questions in the completion
+        """
+        if completion_tokens <= 0 or question_count <= 0:
+            return
+
+        observed = completion_tokens / question_count
+        current = self.tokens_per_question(question_type)
+        self._tokens_per_question[question_type] = (
+            1 - OBSERVATION_WEIGHT
+        ) * current + OBSERVATION_WEIGHT * observed
+
+    def plan(self, question_type: QuestionType, count: int) -> list[int]:
+        """
+        Split a batch into sub-request sizes bounded by the output token budget.
+
+        Args:
+            question_type: Type of questions in the batch
+            count: Number of questions the batch must produce
+
+        Returns:
+            Question count per sub-request, as evenly sized as possible
+        """
+        if count <= 0:
+            return [count]
+
+        per_request = max(
+            1,
+            int(
+                settings.GENERATION_SUB_BATCH_OUTPUT_TOKENS
+                // self.tokens_per_question(question_type)
+            ),
+        )
+        parts = min(
+            count,
+            settings.GENERATION_MAX_SUB_BATCHES,
+            math.ceil(count / per_request),
+        )
+        base, extra = divmod(count, max(parts, 1))
+        return [base + 1] * extra + [base] * (parts - extra)
+
+
+_output_token_estimator = OutputTokenEstimator()
+
+
+def get_output_token_estimator() -> OutputTokenEstimator:
+    """Get the process-wide output token estimator."""
+    return _output_token_estimator
+
+
+def dedupe_questions(questions: list[Question]) -> list[Question]:
+    """
+    Drop questions whose text repeats an earlier question.
+
+    Texts are compared case-insensitively with whitespace collapsed, which
+    catches the repeats parallel sub-requests over the same content produce.
+
+    Args:
+        questions: Questions merged from several sub-requests
+
+    Returns:
+        Questions in their original order, first occurrence kept
+    """
+    seen: set[str] = set()
+    unique = []
+    for question in questions:
+        text = str(question.question_data.get("question_text", ""))
+        key = _WHITESPACE.sub(" ", text).strip().casefold()
+        if key and key in seen:
+            continue
+        seen.add(key)
+        unique.append(question)
+    return unique
@@ -0,0 +1,233 @@
+"""Token-bounded chunking and relevance selection of module content."""
+
+import math
+import re
+from collections import Counter
+
+from src.config import get_logger, settings
+from src.content_extraction.utils import estimate_token_count
+
+from .base import ContentChunk
+
+logger = get_logger("content_chunking")
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TERM = re.compile(r"\w{2,}")
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def _split_units(text: str, max_tokens: int) -> list[str]:
+    """Split text into paragraphs, sentences or slices of at most max_tokens."""
+    units = []
+    for paragraph in _PARAGRAPH_SPLIT.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_token_count(paragraph) <= max_tokens:
+            units.append(paragraph)
+            continue
+
+        for sentence in _SENTENCE_SPLIT.split(paragraph):
+            if estimate_token_count(sentence) <= max_tokens:
+                units.append(sentence)
+            else:
+                # No sentence boundary to use, cut at the character budget
+                step = max_tokens * 4
+                units.extend(
+                    sentence[i : i + step] for i in range(0, len(sentence), step)
+                )
+    return units
+
+
+def split_into_chunks(
+    content: str,
+    max_tokens: int | None = None,
+    overlap_tokens: int | None = None,
+    source: str | None = None,
+) -> list[ContentChunk]:
+    """
+    Split content into token-bounded chunks along paragraph boundaries.
+
+    Consecutive chunks share up to ``overlap_tokens`` of trailing text so a
+    passage cut at a boundary keeps its context.
+
+    Args:
+        content: Module content to split
+        max_tokens: Maximum estimated tokens per chunk
+        overlap_tokens: Estimated tokens repeated from the previous chunk
+        source: Source identifier stored on each chunk
+
+    Returns:
+        Chunks in document order, with their index and token count in metadata
+    """
+    max_tokens = max_tokens or settings.GENERATION_CHUNK_TOKENS
+    if overlap_tokens is None:
+        overlap_tokens = settings.GENERATION_CHUNK_OVERLAP_TOKENS
+
+    chunks: list[ContentChunk] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        text = "\n\n".join(current)
+        chunks.append(
+            ContentChunk(
+                content=text,
+                source=source,
+                metadata={
+                    "index": len(chunks),
+                    "token_count": estimate_token_count(text),
+                },
+            )
+        )
+
+    for unit in _split_units(content, max_tokens):
+        unit_tokens = estimate_token_count(unit)
+        if current and current_tokens + unit_tokens > max_tokens:
+            flush()
+
+            # Carry trailing units over as overlap, within both budgets
+            overlap: list[str] = []
+            overlap_size = 0
+            for previous in reversed(current):
+                previous_tokens = estimate_token_count(previous)
+                if (
+                    overlap_size + previous_tokens > overlap_tokens
+                    or overlap_size + previous_tokens + unit_tokens > max_tokens
+                ):
+                    break
+                overlap.insert(0, previous)
+                overlap_size += previous_tokens
+            current, current_tokens = overlap, overlap_size
+
+        current.append(unit)
+        current_tokens += unit_tokens
+
+    if current:
+        flush()
+
+    return chunks
+
+
+def score_chunks(chunks: list[ContentChunk]) -> list[float]:
+    """
+    Score how informative each chunk is relative to the rest of the module.
+
+    Each chunk is scored with Okapi BM25 against the module's full vocabulary,
+    so chunks dense in terms that are distinctive within the module rank
+    above boilerplate and repeated text.
+
+    Args:
+        chunks: Chunks of a single module
+
+    Returns:
+        One score per chunk, in the same order
+    """
+    term_counts = [Counter(_TERM.findall(chunk.content.lower())) for chunk in chunks]
+    lengths = [sum(counts.values()) for counts in term_counts]
+    if not chunks or not any(lengths):
+        return [0.0] * len(chunks)
+
+    chunk_count = len(chunks)
+    average_length = sum(lengths) / chunk_count
+    document_frequency: Counter[str] = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+    idf = {
+        term: math.log(1 + (chunk_count - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+
+    scores = []
+    for counts, length in zip(term_counts, lengths, strict=True):
+        if not length:
+            scores.append(0.0)
+            continue
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+        score = sum(
+            idf[term] * tf * (BM25_K1 + 1) / (tf + norm) for term, tf in counts.items()
+        )
+        # Normalize by length so long chunks are not favoured per token spent
+        scores.append(score / math.sqrt(length))
+    return scores
+
+
+def select_batch_contents(
+    content: str,
+    batch_count: int,
+    token_budget: int | None = None,
+    source: str | None = None,
+) -> list[str]:
+    """
+    Select the module content to send with each of a module's batches.
+
+    Content within the budget is sent unchanged. Larger modules are chunked
+    and every batch receives the highest-scoring chunks that fit the budget.
+    The ranking is rotated per batch so different batches lead with, and
+    mostly cover, different chunks.
+
+    Args:
+        content: Full module content
+        batch_count: Number of batches generated from this module
+        token_budget: Maximum estimated content tokens per batch prompt
+        source: Module identifier, used for logging
+
+    Returns:
+        Content for each batch, in batch order
+    """
+    token_budget = token_budget or settings.GENERATION_CONTENT_TOKEN_BUDGET
+    if batch_count <= 0:
+        return []
+    if estimate_token_count(content) <= token_budget:
+        return [content] * batch_count
+
+    chunks = split_into_chunks(
+        content,
+        max_tokens=min(settings.GENERATION_CHUNK_TOKENS, token_budget),
+        source=source,
+    )
+    scores = score_chunks(chunks)
+    ranked = sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True)
+
+    contents = []
+    for batch_index in range(batch_count):
+        # This batch's share of the ranking first, then everything else
+        own = ranked[batch_index % len(ranked) :: batch_count]
+        own_set = set(own)
+        order = own + [i for i in ranked if i not in own_set]
+
+        selected: list[int] = []
+        used_tokens = 0
+        for i in order:
+            chunk_tokens = chunks[i].metadata["token_count"]
+            if used_tokens + chunk_tokens > token_budget:
+                continue
+            selected.append(i)
+            used_tokens += chunk_tokens
+
+        # Keep document order so the selected passages read naturally
+        contents.append("\n\n".join(chunks[i].content for i in sorted(selected)))
+
+        logger.debug(
+            "batch_content_selected",
+            source=source,
+            batch_index=batch_index,
+            total_chunks=len(chunks),
+            selected_chunks=len(selected),
+            selected_tokens=used_tokens,
+        )
+
+    logger.info(
+        "module_content_chunked",
+        source=source,
+        content_tokens=estimate_token_count(content),
+        total_chunks=len(chunks),
+        batch_count=batch_count,
+        token_budget=token_budget,
+    )
+
+    return contents
@@ -0,0 +1,163 @@
+"""Near-duplicate question detection with MinHash signatures."""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Any
+
+from src.config import get_logger, settings
+
+logger = get_logger("question_dedup")
+
+# 64 permutations in 16 LSH bands of 4 rows: pairs above ~0.5 Jaccard
+# similarity become candidates, which are then checked against the threshold
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)  # Fixed seed: signatures must be stable per process
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+_WORD = re.compile(r"\w+")
+
+# Fields that explain an answer rather than define the question
+_IGNORED_FIELDS = {"explanation", "difficulty"}
+
+
+def _string_leaves(value: Any) -> list[str]:
+    """Collect the string values of nested question data in key order."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [
+            leaf
+            for key in sorted(value)
+            if key not in _IGNORED_FIELDS
+            for leaf in _string_leaves(value[key])
+        ]
+    if isinstance(value, list):
+        return [leaf for item in value for leaf in _string_leaves(item)]
+    return []
+
+
+def question_fingerprint_text(question_data: dict[str, Any]) -> str:
+    """Build the text compared for duplicates: question text plus answers."""
+    return " ".join(_string_leaves(question_data))
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    """
+    Compute the MinHash signature of a text's word shingles.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        NUM_PERMUTATIONS minimum hash values
+    """
+    words = _WORD.findall(text.casefold())
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {
+            " ".join(words[i : i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+def estimate_similarity(first: tuple[int, ...], second: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    matches = sum(1 for a, b in zip(first, second, strict=True) if a == b)
+    return matches / NUM_PERMUTATIONS
+
+
+class DuplicateIndex:
+    """
+    Index of a quiz's questions for near-duplicate lookups.
+
+    Shared by all batches generating questions for the same quiz. Candidate
+    pairs are found through locality-sensitive hashing of the signature
+    bands, so a lookup only compares against questions sharing a band.
+    """
+
+    def __init__(self, threshold: float | None = None) -> None:
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else settings.DUPLICATE_QUESTION_SIMILARITY_THRESHOLD
+        )
+        self._signatures: list[tuple[int, ...]] = []
+        self._texts: list[str] = []
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (band, signature[band * LSH_ROWS : (band + 1) * LSH_ROWS])
+            for band in range(LSH_BANDS)
+        ]
+
+    def _match(self, signature: tuple[int, ...]) -> str | None:
+        candidates = {
+            index for key in self._bands(signature) for index in self._buckets[key]
+        }
+        for index in sorted(candidates):
+            if estimate_similarity(signature, self._signatures[index]) >= (
+                self.threshold
+            ):
+                return self._texts[index]
+        return None
+
+    def find(self, question_data: dict[str, Any]) -> str | None:
+        """
+        Look up an indexed question that a question nearly duplicates.
+
+        Args:
+            question_data: Question data to look up
+
+        Returns:
+            Question text of the duplicated question, or None if there is none
+        """
+        return self._match(minhash_signature(question_fingerprint_text(question_data)))
+
+    def add(self, question_data: dict[str, Any]) -> None:
+        """Add a question to the index."""
+        signature = minhash_signature(question_fingerprint_text(question_data))
+        self._add(signature, question_data)
+
+    def _add(self, signature: tuple[int, ...], question_data: dict[str, Any]) -> None:
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._texts.append(str(question_data.get("question_text", "")))
+        for key in self._bands(signature):
+            self._buckets[key].append(index)
+
+    def add_if_unique(self, question_data: dict[str, Any]) -> str | None:
+        """
+        Add a question unless it nearly duplicates an indexed one.
+
+        Args:
+            question_data: Question data to add
+
+        Returns:
+            Question text of the duplicated question, or None if it was added
+        """
+        signature = minhash_signature(question_fingerprint_text(question_data))
+        duplicate_of = self._match(signature)
+        if duplicate_of is None:
+            self._add(signature, question_data)
+        return duplicate_of
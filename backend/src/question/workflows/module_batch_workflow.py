@@ -2,15 +2,19 @@
 
 import asyncio
 import json
+import math
+from functools import cache, partial
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from pydantic import BaseModel, Field
 
 from src.config import get_logger, settings
 from src.database import get_async_session
 
+from ..config import get_configuration_service
 from ..providers import BaseLLMProvider, LLMMessage
 from ..templates.manager import TemplateManager, get_template_manager
 from ..types import (
@@ -20,10 +24,27 @@ from ..types import (
     QuestionType,
     QuizLanguage,
 )
+from .batch_planning import dedupe_questions, get_output_token_estimator
+from .chunking import select_batch_contents
+from .dedup import DuplicateIndex
+from .scheduling import BatchClock, GenerationPriority, get_generation_scheduler
 
 logger = get_logger("module_batch_workflow")
 
 
+def _drop_null_fields(value: Any) -> Any:
+    """Recursively remove null-valued keys from parsed JSON objects."""
+    if isinstance(value, dict):
+        return {
+            key: _drop_null_fields(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, list):
+        return [_drop_null_fields(item) for item in value]
+    return value
+
+
 class ModuleBatchState(BaseModel):
     """State for module batch generation workflow."""
 
@@ -31,17 +52,18 @@ class ModuleBatchState(BaseModel):
     quiz_id: UUID
     module_id: str
     module_name: str
-    module_content: str
+    # Key into the workflow's shared module_contents, so the (possibly
+    # large) content is not copied into every state snapshot
+    content_key: str
     target_question_count: int
     language: QuizLanguage = QuizLanguage.ENGLISH
     question_type: QuestionType  # Now passed per batch, not at init
     difficulty: QuestionDifficulty | None = None  # Difficulty level for this batch
     tone: str | None = None
     custom_instructions: str | None = None  # Custom instructions for LLM
-
-    # Provider configuration
-    llm_provider: BaseLLMProvider
-    template_manager: TemplateManager
+    batch_key: str | None = None  # Quiz batch, for the LLM usage ledger
+    # Leave saving to the caller, which saves a split batch as a whole
+    defer_save: bool = False
 
     # Workflow state
     generated_questions: list[Question] = Field(default_factory=list)
@@ -66,8 +88,14 @@ class ModuleBatchState(BaseModel):
     failed_questions_errors: list[str] = Field(default_factory=list)
     successful_questions_preserved: list[Question] = Field(default_factory=list)
 
+    # Texts of dropped near-duplicates, steered away from on retry
+    duplicate_question_texts: list[str] = Field(default_factory=list)
+
     # Current LLM interaction
     system_prompt: str = ""
+    # Why the next LLM call is made: initial, retry, json_correction or
+    # validation_correction
+    call_kind: str = "initial"
     user_prompt: str = ""
     raw_response: str = ""
 
@@ -83,6 +111,88 @@ class ModuleBatchState(BaseModel):
         arbitrary_types_allowed = True
 
 
+def _workflow_node(name: str) -> Any:
+    """Create a graph node running the named step of the invoking workflow."""
+
+    async def node(state: ModuleBatchState, config: RunnableConfig) -> ModuleBatchState:
+        workflow = config["configurable"]["workflow"]
+        result: ModuleBatchState = await getattr(workflow, name)(state)
+        return result
+
+    return node
+
+
+def _workflow_router(name: str) -> Any:
+    """Create a conditional edge using the named check of the invoking workflow."""
+
+    def router(state: ModuleBatchState, config: RunnableConfig) -> str:
+        workflow = config["configurable"]["workflow"]
+        result: str = getattr(workflow, name)(state)
+        return result
+
+    return router
+
+
+@cache
+def _build_graph() -> Any:
+    """
+    Build the module batch workflow graph.
+
+    Compiled once per process and shared by every workflow instance: nodes
+    dispatch to the workflow passed in the run config, so constructing a
+    workflow per batch does not recompile the graph.
+    """
+    workflow = StateGraph(ModuleBatchState)
+
+    # Add nodes
+    for name in (
+        "prepare_prompt",
+        "generate_batch",
+        "validate_batch",
+        "check_completion",
+        "prepare_correction",
+        "prepare_validation_correction",
+        "retry_generation",
+        "save_questions",
+    ):
+        workflow.add_node(name, _workflow_node(name))
+
+    # Add edges
+    workflow.add_edge(START, "prepare_prompt")
+    workflow.add_edge("prepare_prompt", "generate_batch")
+    workflow.add_edge("generate_batch", "validate_batch")
+
+    # Conditional edge from validate_batch
+    workflow.add_conditional_edges(
+        "validate_batch",
+        _workflow_router("check_error_type"),
+        {
+            "needs_json_correction": "prepare_correction",
+            "needs_validation_correction": "prepare_validation_correction",
+            "continue": "check_completion",
+        },
+    )
+
+    workflow.add_edge("prepare_correction", "generate_batch")
+    workflow.add_edge("prepare_validation_correction", "generate_batch")
+
+    # Conditional edges from check_completion
+    workflow.add_conditional_edges(
+        "check_completion",
+        _workflow_router("should_retry"),
+        {
+            "retry": "retry_generation",
+            "complete": "save_questions",
+            "failed": END,
+        },
+    )
+
+    workflow.add_edge("retry_generation", "prepare_prompt")
+    workflow.add_edge("save_questions", END)
+
+    return workflow.compile()
+
+
 class ModuleBatchWorkflow:
     """
     Workflow for generating multiple questions per module in batch.
@@ -103,64 +213,43 @@ class ModuleBatchWorkflow:
         language: QuizLanguage = QuizLanguage.ENGLISH,
         tone: str | None = None,
         custom_instructions: str | None = None,
+        duplicate_index: DuplicateIndex | None = None,
+        module_contents: dict[str, str] | None = None,
+        priority: GenerationPriority = GenerationPriority.FIRST_GENERATION,
     ):
         self.llm_provider = llm_provider
         self.template_manager = template_manager or get_template_manager()
         self.language = language
         self.tone = tone
         self.custom_instructions = custom_instructions
-        self.graph = self._build_graph()
-
-    def _build_graph(self) -> Any:
-        """Build the module batch workflow graph."""
-        workflow = StateGraph(ModuleBatchState)
-
-        # Add nodes
-        workflow.add_node("prepare_prompt", self.prepare_prompt)
-        workflow.add_node("generate_batch", self.generate_batch)
-        workflow.add_node("validate_batch", self.validate_batch)
-        workflow.add_node("check_completion", self.check_completion)
-        workflow.add_node("prepare_correction", self.prepare_correction)
-        workflow.add_node(
-            "prepare_validation_correction", self.prepare_validation_correction
-        )
-        workflow.add_node("retry_generation", self.retry_generation)
-        workflow.add_node("save_questions", self.save_questions)
-
-        # Add edges
-        workflow.add_edge(START, "prepare_prompt")
-        workflow.add_edge("prepare_prompt", "generate_batch")
-        workflow.add_edge("generate_batch", "validate_batch")
-
-        # Conditional edge from validate_batch
-        workflow.add_conditional_edges(
-            "validate_batch",
-            self.check_error_type,
-            {
-                "needs_json_correction": "prepare_correction",
-                "needs_validation_correction": "prepare_validation_correction",
-                "continue": "check_completion",
-            },
-        )
-
-        workflow.add_edge("prepare_correction", "generate_batch")
-        workflow.add_edge("prepare_validation_correction", "generate_batch")
-
-        # Conditional edges from check_completion
-        workflow.add_conditional_edges(
-            "check_completion",
-            self.should_retry,
-            {
-                "retry": "retry_generation",
-                "complete": "save_questions",
-                "failed": END,
-            },
+        # Shared by all batches of the quiz; None disables duplicate detection.
+        # Questions enter it once saved, and until then only this workflow's
+        # own index, so unsaved questions never block other batches.
+        self.duplicate_index = duplicate_index
+        self.pending_duplicates = DuplicateIndex(
+            duplicate_index.threshold if duplicate_index is not None else None
         )
+        # Module content by key, shared by the batches of a quiz
+        self.module_contents = module_contents if module_contents is not None else {}
+        # Queue position of the workflow's LLM requests
+        self.priority = priority
+        # Time in service of the batch, excluding waits for generation slots
+        self.clock = BatchClock()
+        self.graph = _build_graph()
+
+    def add_content(self, content: str) -> str:
+        """
+        Register module content for the workflow's batches.
 
-        workflow.add_edge("retry_generation", "prepare_prompt")
-        workflow.add_edge("save_questions", END)
+        Args:
+            content: Module content to generate questions from
 
-        return workflow.compile()
+        Returns:
+            Key to pass as a batch's content_key
+        """
+        content_key = uuid4().hex
+        self.module_contents[content_key] = content
+        return content_key
 
     async def prepare_prompt(self, state: ModuleBatchState) -> ModuleBatchState:
         """Prepare the prompt for batch generation."""
@@ -180,13 +269,15 @@ class ModuleBatchWorkflow:
                 custom_instructions=self.custom_instructions,
             )
 
+            module_content = self.module_contents[state.content_key]
+
             # Debug: Log content being passed to template
             logger.debug(
                 "module_batch_template_variables",
                 module_id=state.module_id,
-                module_content_length=len(state.module_content),
-                module_content_preview=state.module_content[:200]
-                if state.module_content
+                module_content_length=len(module_content),
+                module_content_preview=module_content[:200]
+                if module_content
                 else "EMPTY_CONTENT",
                 module_name=state.module_name,
                 question_count=remaining_questions,
@@ -197,7 +288,7 @@ class ModuleBatchWorkflow:
             # Template will be automatically selected based on question type and language
             messages = await self.template_manager.create_messages(
                 state.question_type,
-                state.module_content,
+                module_content,
                 generation_parameters,
                 template_name=None,  # Let template manager select based on question type
                 language=self.language,
@@ -212,6 +303,16 @@ class ModuleBatchWorkflow:
             state.system_prompt = messages[0].content
             state.user_prompt = messages[1].content
 
+            if state.duplicate_question_texts:
+                # Replacements for dropped near-duplicates must cover new ground
+                avoided = "\n".join(
+                    f"- {text[:200]}" for text in state.duplicate_question_texts[-20:]
+                )
+                state.user_prompt += (
+                    "\n\nThese questions already exist in the quiz. Do not repeat "
+                    "them or ask about the same facts:\n" + avoided
+                )
+
             logger.info(
                 "module_batch_prompt_prepared",
                 module_id=state.module_id,
@@ -243,11 +344,67 @@ class ModuleBatchWorkflow:
                 LLMMessage(role="user", content=state.user_prompt),
             ]
 
-            # Generate questions using LLM provider
-            response = await self.llm_provider.generate_with_retry(messages)
+            # Constrain the output to the question type's schema when the
+            # provider supports it, so malformed JSON is not produced
+            generation_kwargs = {}
+            if (
+                settings.LLM_STRUCTURED_OUTPUT
+                and self.llm_provider.supports_structured_output
+            ):
+                from ..types.registry import get_question_type_registry
+
+                question_type_impl = get_question_type_registry().get_question_type(
+                    state.question_type
+                )
+                generation_kwargs["response_schema"] = (
+                    question_type_impl.get_output_schema()
+                )
+
+            # Requests of one question type and similar size share the latency
+            # statistics that decide when a slow request is hedged
+            batch_size = state.target_question_count - len(state.generated_questions)
+            hedge_key = f"{state.question_type.value}:{math.ceil(batch_size / 5) * 5}"
+
+            # Generate questions using LLM provider; each request, hedges
+            # included, is queued by priority for a generation slot
+            response = await self.llm_provider.generate_with_retry(
+                messages,
+                hedge_key=hedge_key,
+                request_slot=partial(
+                    get_generation_scheduler().slot, self.priority, self.clock
+                ),
+                **generation_kwargs,
+            )
 
             state.raw_response = response.content
 
+            # Count the tokens against the quiz owner's and course's quotas
+            # and record the call in the usage ledger. The other copy of a
+            # hedged request is cut off without usage; it is counted at the
+            # usage of the response, its closest estimate.
+            from src.quiz.usage import add_generation_tokens
+            from src.quiz.usage_ledger import get_llm_usage_ledger
+
+            latencies = [
+                response.response_time,
+                *response.metadata.get("duplicate_request_latencies", []),
+            ]
+            for latency in latencies:
+                add_generation_tokens(state.quiz_id, response.total_tokens)
+                get_llm_usage_ledger().record(
+                    quiz_id=state.quiz_id,
+                    question_type=state.question_type.value,
+                    language=self.language.value,
+                    model=response.model,
+                    call_kind=state.call_kind,
+                    latency=latency,
+                    prompt_tokens=response.prompt_tokens,
+                    completion_tokens=response.completion_tokens,
+                    total_tokens=response.total_tokens,
+                    batch_key=state.batch_key,
+                    module_id=state.module_id,
+                )
+
             # Update metadata
             state.workflow_metadata.update(
                 {
@@ -257,6 +414,8 @@ class ModuleBatchWorkflow:
                     )
                     + (response.total_tokens or 0),
                     "last_model_used": response.model,
+                    "last_completion_tokens": response.completion_tokens,
+                    "structured_output": bool(generation_kwargs),
                 }
             )
 
@@ -287,50 +446,80 @@ class ModuleBatchWorkflow:
             # Parse the response to extract individual questions
             questions_data = self._parse_batch_response(state.raw_response)
 
+            # Feed observed output size back into batch splitting
+            get_output_token_estimator().record(
+                state.question_type,
+                state.workflow_metadata.get("last_completion_tokens") or 0,
+                len(questions_data),
+            )
+
             # Track validation state for smart retry
             questions_before_validation = len(state.generated_questions)
             failed_questions = []
             failed_errors = []
 
-            # Validate and create question objects
+            # Remove difficulty from question data if LLM provided it (we use batch difficulty instead)
             for q_data in questions_data:
-                try:
-                    # Remove difficulty from question data if LLM provided it (we use batch difficulty instead)
+                if isinstance(q_data, dict):
                     q_data.pop("difficulty", None)
 
-                    # Use dynamic validation based on question type
-                    from ..types.registry import get_question_type_registry
-
-                    registry = get_question_type_registry()
-                    question_type_impl = registry.get_question_type(state.question_type)
-                    validated_data = question_type_impl.validate_data(q_data)
-
-                    # Create question object with validated data
-                    # Always use batch difficulty (manually set, not from LLM)
-                    question = Question(
-                        quiz_id=state.quiz_id,
-                        question_type=state.question_type,
-                        question_data=validated_data.model_dump(),
-                        difficulty=state.difficulty,
-                        is_approved=False,
-                        module_id=state.module_id,
-                    )
-                    state.generated_questions.append(question)
+            # Validate the whole batch at once using the question type implementation
+            from ..types.registry import get_question_type_registry
 
-                except Exception as e:
+            registry = get_question_type_registry()
+            question_type_impl = registry.get_question_type(state.question_type)
+            validation_result = question_type_impl.validate_batch(questions_data)
+
+            # Create question objects in response order
+            for index, q_data in enumerate(questions_data):
+                validated_data = validation_result.valid.get(index)
+                if validated_data is None:
                     # Smart retry: Store failed question data and error for targeted retry
-                    error_detail = f"Question validation failed: {str(e)}"
+                    error = validation_result.errors.get(index, "unknown error")
                     failed_questions.append(q_data)
-                    failed_errors.append(error_detail)
+                    failed_errors.append(f"Question validation failed: {error}")
 
                     logger.warning(
                         "module_batch_question_validation_failed",
                         module_id=state.module_id,
                         question_data=q_data,
-                        error=str(e),
+                        error=error,
                     )
                     continue
 
+                question_data = validated_data.model_dump()
+
+                # Drop near-duplicates of questions already in the quiz; the
+                # shortfall is regenerated by the normal retry path
+                if self.duplicate_index is not None:
+                    duplicate_of = self.duplicate_index.find(
+                        question_data
+                    ) or self.pending_duplicates.add_if_unique(question_data)
+                    if duplicate_of is not None:
+                        state.duplicate_question_texts.append(
+                            question_data["question_text"]
+                        )
+                        logger.info(
+                            "module_batch_duplicate_question_dropped",
+                            module_id=state.module_id,
+                            question_text=question_data["question_text"][:100],
+                            duplicate_of=duplicate_of[:100],
+                        )
+                        continue
+
+                # Create question object with validated data
+                # Always use batch difficulty (manually set, not from LLM)
+                question = Question(
+                    quiz_id=state.quiz_id,
+                    question_type=state.question_type,
+                    question_data=question_data,
+                    difficulty=state.difficulty,
+                    is_approved=False,
+                    module_id=state.module_id,
+                )
+                question.cache_typed_data(validated_data)
+                state.generated_questions.append(question)
+
             # Smart retry logic: Handle mixed success/failure scenarios
             if failed_questions:
                 # Store failed question data for targeted retry
@@ -441,6 +630,7 @@ class ModuleBatchWorkflow:
 
             # Increment correction attempts
             state.correction_attempts += 1
+            state.call_kind = "json_correction"
 
             # Reset error state for retry
             state.parsing_error = False
@@ -510,6 +700,7 @@ class ModuleBatchWorkflow:
 
             # Increment validation correction attempts
             state.validation_correction_attempts += 1
+            state.call_kind = "validation_correction"
 
             # Reset error state for retry
             state.validation_error = False
@@ -580,6 +771,7 @@ class ModuleBatchWorkflow:
     async def retry_generation(self, state: ModuleBatchState) -> ModuleBatchState:
         """Prepare for retry with smart state management."""
         state.retry_count += 1
+        state.call_kind = "retry"
         state.error_message = None
         state.raw_response = ""
 
@@ -657,23 +849,20 @@ class ModuleBatchWorkflow:
             )
             return state
 
-        try:
-            async with get_async_session() as session:
-                # Add all questions to session
-                for question in all_questions:
-                    session.add(question)
+        if state.defer_save:
+            return state
 
-                # Commit all questions
-                await session.commit()
+        try:
+            await self.persist_questions(all_questions)
 
-                logger.info(
-                    "module_batch_questions_saved",
-                    module_id=state.module_id,
-                    questions_saved=len(all_questions),
-                    preserved_questions=len(state.successful_questions_preserved),
-                    newly_generated=len(state.generated_questions),
-                    target_questions=state.target_question_count,
-                )
+            logger.info(
+                "module_batch_questions_saved",
+                module_id=state.module_id,
+                questions_saved=len(all_questions),
+                preserved_questions=len(state.successful_questions_preserved),
+                newly_generated=len(state.generated_questions),
+                target_questions=state.target_question_count,
+            )
 
         except Exception as e:
             logger.error(
@@ -686,11 +875,23 @@ class ModuleBatchWorkflow:
 
         return state
 
+    async def persist_questions(self, questions: list[Question]) -> None:
+        """Save questions in a single transaction and index them for the quiz."""
+        async with get_async_session() as session:
+            for question in questions:
+                session.add(question)
+            await session.commit()
+
+        if self.duplicate_index is not None:
+            for question in questions:
+                self.duplicate_index.add(question.question_data)
+
     def _parse_batch_response(self, response: str) -> list[dict[str, Any]]:
         """
         Parse the LLM response to extract multiple questions.
 
-        IMPORTANT: This method ONLY accepts valid JSON arrays.
+        IMPORTANT: This method ONLY accepts valid JSON: an array of questions,
+        or the ``{"questions": [...]}`` object returned by structured output.
         No fallbacks to text parsing to ensure reliability.
         """
         try:
@@ -706,6 +907,11 @@ class ModuleBatchWorkflow:
             # Parse as JSON - this is the ONLY accepted format
             parsed = json.loads(cleaned_response)
 
+            # Structured output wraps the array and sends unset optional
+            # fields as null; drop those so model defaults apply
+            if isinstance(parsed, dict) and isinstance(parsed.get("questions"), list):
+                parsed = [_drop_null_fields(item) for item in parsed["questions"]]
+
             # Validate it's an array
             if not isinstance(parsed, list):
                 raise ValueError("Response must be a JSON array")
@@ -732,25 +938,38 @@ class ModuleBatchWorkflow:
         quiz_id: UUID,
         module_id: str,
         module_name: str,
-        module_content: str,
         question_count: int,
         question_type: QuestionType,  # Now passed as parameter
         difficulty: QuestionDifficulty | None = None,  # Difficulty for this batch
+        module_content: str | None = None,
+        content_key: str | None = None,
+        batch_key: str | None = None,
+        defer_save: bool = False,
     ) -> list[Question]:
-        """Process a single module to generate questions."""
+        """
+        Process a single module to generate questions.
+
+        The content is given either directly as module_content or as the
+        content_key of content already in module_contents. With defer_save
+        the questions are returned unsaved, for the caller to persist.
+        """
+        if content_key is None:
+            content_key = self.add_content(module_content or "")
+        module_content = self.module_contents[content_key]
+
         initial_state = ModuleBatchState(
             quiz_id=quiz_id,
             module_id=module_id,
             module_name=module_name,
-            module_content=module_content,
+            content_key=content_key,
             target_question_count=question_count,
             language=self.language,
             question_type=question_type,  # Set from parameter
             difficulty=difficulty,  # Difficulty level for this batch
             tone=self.tone,
             custom_instructions=self.custom_instructions,
-            llm_provider=self.llm_provider,
-            template_manager=self.template_manager,
+            batch_key=batch_key,
+            defer_save=defer_save,
         )
 
         logger.info(
@@ -762,7 +981,9 @@ class ModuleBatchWorkflow:
         )
 
         try:
-            final_state_dict = await self.graph.ainvoke(initial_state)
+            final_state_dict = await self.graph.ainvoke(
+                initial_state, config={"configurable": {"workflow": self}}
+            )
 
             # Convert dict result back to ModuleBatchState for type safety
             final_state = ModuleBatchState(**final_state_dict)
@@ -809,17 +1030,23 @@ class ParallelModuleProcessor:
         language: QuizLanguage = QuizLanguage.ENGLISH,
         tone: str | None = None,
         custom_instructions: str | None = None,
+        batch_timeout: float | None = None,
     ):
         self.llm_provider = llm_provider
         self.template_manager = template_manager or get_template_manager()
         self.language = language
         self.tone = tone
         self.custom_instructions = custom_instructions
+        # Deadline of each question batch, so one stuck LLM call fails its
+        # batch instead of running into the orchestration timeout
+        self.batch_timeout = batch_timeout or settings.MODULE_GENERATION_TIMEOUT
 
     async def process_all_modules_with_batches(
         self,
         quiz_id: UUID,
         modules_data: dict[str, dict[str, Any]],
+        existing_questions: list[dict[str, Any]] | None = None,
+        priority: GenerationPriority = GenerationPriority.FIRST_GENERATION,
     ) -> tuple[dict[str, list[Question]], dict[str, list[str]]]:
         """
         Process all modules with their batches in parallel.
@@ -838,6 +1065,10 @@ class ParallelModuleProcessor:
                     }
                 }
 
+            existing_questions: Question data already saved for the quiz,
+                which new questions must not duplicate
+            priority: Priority class of the batches' LLM requests
+
         Returns:
             Dictionary mapping module IDs to lists of generated questions
         """
@@ -845,23 +1076,61 @@ class ParallelModuleProcessor:
         tasks = []
         batch_info_map = {}  # Track which task belongs to which module/batch
 
+        estimator = get_output_token_estimator()
+        config_service = get_configuration_service()
+
+        # Content chunks are stored once and referenced by key from each batch
+        module_contents: dict[str, str] = {}
+
+        # Near-duplicates are detected across every batch of the quiz
+        duplicate_index = DuplicateIndex()
+        for question_data in existing_questions or []:
+            duplicate_index.add(question_data)
+
         for module_id, module_info in modules_data.items():
             module_name = module_info["name"]
-            module_content = module_info["content"]
 
-            for batch in module_info["batches"]:
+            # Split batches with long expected completions into sub-requests
+            sub_batch_plans = [
+                estimator.plan(batch["question_type"], batch["count"])
+                for batch in module_info["batches"]
+            ]
+
+            # Bound prompt size: large modules are chunked and spread over
+            # every sub-request
+            selected_contents = select_batch_contents(
+                module_info["content"],
+                sum(len(plan) for plan in sub_batch_plans),
+                source=module_id,
+            )
+            content_keys = []
+            for index, content in enumerate(selected_contents):
+                content_key = f"{module_id}:{index}"
+                module_contents[content_key] = content
+                content_keys.append(content_key)
+            remaining_keys = iter(content_keys)
+
+            for batch, sub_batch_counts in zip(
+                module_info["batches"], sub_batch_plans, strict=True
+            ):
+                batch_content_keys = [next(remaining_keys) for _ in sub_batch_counts]
                 question_type = batch["question_type"]
-                count = batch["count"]
                 difficulty = batch["difficulty"]
                 batch_key = batch["batch_key"]
 
                 # Create workflow for this specific batch
+                workflow_config = config_service.get_workflow_config(question_type)
                 workflow = ModuleBatchWorkflow(
                     llm_provider=self.llm_provider,
                     template_manager=self.template_manager,
                     language=self.language,
                     tone=self.tone,
                     custom_instructions=self.custom_instructions,
+                    duplicate_index=duplicate_index
+                    if workflow_config.allow_duplicate_detection
+                    else None,
+                    module_contents=module_contents,
+                    priority=priority,
                 )
 
                 # Create task for this batch
@@ -870,9 +1139,9 @@ class ParallelModuleProcessor:
                         workflow,
                         module_id,
                         module_name,
-                        module_content,
+                        batch_content_keys,
                         quiz_id,
-                        count,
+                        sub_batch_counts,
                         question_type,
                         difficulty,
                         batch_key,
@@ -892,6 +1161,7 @@ class ParallelModuleProcessor:
             quiz_id=str(quiz_id),
             total_batches=len(tasks),
             modules_count=len(modules_data),
+            priority=priority.name.lower(),
         )
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -945,9 +1215,11 @@ class ParallelModuleProcessor:
                         quiz_id=str(quiz_id),
                         module_id=module_id,
                         batch_key=batch_key,
-                        questions_generated=len(questions),
+                        questions_generated=metadata.get("questions_generated", 0),
                         target_count=metadata.get("target_count", 0),
-                        reason="Batch did not meet target question count",
+                        reason="Batch deadline exceeded"
+                        if metadata.get("timed_out")
+                        else "Batch did not meet target question count",
                     )
 
         # Note: Metadata update moved to orchestrator's transaction context
@@ -972,9 +1244,9 @@ class ParallelModuleProcessor:
         workflow: ModuleBatchWorkflow,
         module_id: str,
         module_name: str,
-        module_content: str,
+        content_keys: list[str],
         quiz_id: UUID,
-        target_count: int,
+        sub_batch_counts: list[int],
         question_type: QuestionType,
         difficulty: QuestionDifficulty,
         batch_key: str,
@@ -982,9 +1254,19 @@ class ParallelModuleProcessor:
         """
         Process a single batch for a module.
 
+        Large batches run as parallel sub-requests, one per entry of
+        sub_batch_counts, whose questions are merged and deduplicated.
+        Sub-requests still running at the batch deadline are cancelled and
+        the batch fails; time the batch only waits for generation slots does
+        not count towards the deadline. Questions are saved together, only
+        once the batch reaches its target, so duplicates across sub-requests
+        never reach the database and a failed batch saves none; its retry
+        regenerates the whole batch.
+
         Returns:
             Tuple of (questions, metadata)
         """
+        target_count = sum(sub_batch_counts)
         try:
             logger.info(
                 "processing_single_batch",
@@ -993,20 +1275,103 @@ class ParallelModuleProcessor:
                 batch_key=batch_key,
                 question_type=question_type.value,
                 target_count=target_count,
+                sub_batches=len(sub_batch_counts),
             )
 
-            questions = await workflow.process_module(
-                module_id=module_id,
-                module_name=module_name,
-                module_content=module_content,
-                quiz_id=quiz_id,
-                question_count=target_count,
-                question_type=question_type,
-                difficulty=difficulty,
-            )
+            sub_batches = [
+                asyncio.create_task(
+                    workflow.process_module(
+                        module_id=module_id,
+                        module_name=module_name,
+                        content_key=content_key,
+                        quiz_id=quiz_id,
+                        question_count=count,
+                        question_type=question_type,
+                        difficulty=difficulty,
+                        batch_key=batch_key,
+                        defer_save=True,
+                    )
+                )
+                for content_key, count in zip(
+                    content_keys, sub_batch_counts, strict=True
+                )
+            ]
+            timed_out = set(sub_batches)
+            try:
+                while timed_out:
+                    remaining = self.batch_timeout - workflow.clock.elapsed()
+                    if remaining <= 0:
+                        break
+                    done, timed_out = await asyncio.wait(
+                        timed_out,
+                        timeout=remaining,
+                        return_when=asyncio.FIRST_EXCEPTION,
+                    )
+                    if any(sub_batch.exception() for sub_batch in done):
+                        break
+            finally:
+                for sub_batch in sub_batches:
+                    if not sub_batch.done():
+                        sub_batch.cancel()
+                await asyncio.gather(*sub_batches, return_exceptions=True)
+
+            # A failed sub-request fails the batch as before
+            for sub_batch in sub_batches:
+                error = None if sub_batch in timed_out else sub_batch.exception()
+                if error:
+                    raise error
+
+            if timed_out:
+                logger.warning(
+                    "batch_deadline_exceeded",
+                    quiz_id=str(quiz_id),
+                    module_id=module_id,
+                    batch_key=batch_key,
+                    timeout=self.batch_timeout,
+                    timed_out_sub_batches=len(timed_out),
+                    completed_sub_batches=len(sub_batches) - len(timed_out),
+                )
+
+            sub_batch_results = [
+                sub_batch.result()
+                for sub_batch in sub_batches
+                if sub_batch not in timed_out
+            ]
+            merged = [q for questions in sub_batch_results for q in questions]
+            questions = dedupe_questions(merged)
+
+            if len(merged) != len(questions):
+                logger.info(
+                    "sub_batch_duplicates_removed",
+                    quiz_id=str(quiz_id),
+                    batch_key=batch_key,
+                    duplicates=len(merged) - len(questions),
+                )
+            questions = questions[:target_count]
 
             # Determine if batch was successful based on question count vs target
-            success = len(questions) >= target_count
+            success = not timed_out and len(questions) >= target_count
+
+            if success:
+                try:
+                    await workflow.persist_questions(questions)
+                except Exception as e:
+                    logger.error(
+                        "batch_save_failed",
+                        quiz_id=str(quiz_id),
+                        module_id=module_id,
+                        batch_key=batch_key,
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    success = False
+                else:
+                    logger.info(
+                        "batch_questions_saved",
+                        quiz_id=str(quiz_id),
+                        batch_key=batch_key,
+                        questions_saved=len(questions),
+                    )
 
             metadata = {
                 "batch_key": batch_key,
@@ -1014,9 +1379,11 @@ class ParallelModuleProcessor:
                 "target_count": target_count,
                 "question_type": question_type.value,
                 "success": success,
+                "timed_out": bool(timed_out),
             }
 
-            return questions, metadata
+            # Only saved questions are returned
+            return (questions if success else []), metadata
 
         except Exception as e:
             logger.error(
@@ -0,0 +1,224 @@
+"""Priority scheduling of LLM generation requests across quizzes."""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any
+
+from src.config import get_logger, settings
+
+logger = get_logger("generation_scheduler")
+
+# Queue waits kept per priority class for the reported statistics
+WAIT_WINDOW = 500
+
+
+class GenerationPriority(IntEnum):
+    """Priority class of a generation request, most urgent first."""
+
+    INTERACTIVE = 0  # Single batch regeneration a teacher is waiting on
+    FIRST_GENERATION = 1  # First generation of a quiz's questions
+    RETRY = 2  # Retry of a quiz's failed batches
+    BULK = 3  # Large generations, see GENERATION_BULK_QUESTION_COUNT
+
+
+def generation_priority(question_count: int, retry: bool = False) -> GenerationPriority:
+    """
+    Classify a quiz generation run.
+
+    Args:
+        question_count: Questions the run generates
+        retry: Whether the run retries failed batches
+
+    Returns:
+        Priority class of the run's LLM requests
+    """
+    if retry:
+        return GenerationPriority.RETRY
+    if question_count >= settings.GENERATION_BULK_QUESTION_COUNT:
+        return GenerationPriority.BULK
+    return GenerationPriority.FIRST_GENERATION
+
+
+class BatchClock:
+    """
+    Time a question batch has been in service.
+
+    The clock stops while every request of the batch is waiting for a
+    generation slot, so queueing behind other quizzes does not count against
+    the batch's deadline. Time spent between requests, validating responses
+    or waiting to retry, does count.
+    """
+
+    def __init__(self) -> None:
+        self._waiting = 0
+        self._running = 0
+        self._elapsed = 0.0
+        self._since: float | None = time.monotonic()
+
+    def track(self, waiting: int = 0, running: int = 0) -> None:
+        """Count requests of the batch starting or ending a wait or a run."""
+        now = time.monotonic()
+        if self._since is not None:
+            self._elapsed += now - self._since
+        self._waiting += waiting
+        self._running += running
+        queued = self._waiting > 0 and self._running == 0
+        self._since = None if queued else now
+
+    def elapsed(self) -> float:
+        """Seconds in service so far."""
+        if self._since is None:
+            return self._elapsed
+        return self._elapsed + time.monotonic() - self._since
+
+
+class GenerationScheduler:
+    """
+    Bounds concurrent LLM generation requests and admits them by priority.
+
+    Waiting requests are admitted most urgent class first, in arrival order
+    within a class. Part of the capacity is reserved for interactive
+    requests, so a regeneration never waits for a full pool of bulk work.
+
+    Args:
+        capacity: Most generation requests in flight at once
+        reserved_interactive: Slots only interactive requests may use
+    """
+
+    def __init__(
+        self, capacity: int | None = None, reserved_interactive: int | None = None
+    ) -> None:
+        self.capacity = capacity or settings.LLM_MAX_CONCURRENT_REQUESTS
+        reserved = (
+            reserved_interactive
+            if reserved_interactive is not None
+            else settings.LLM_INTERACTIVE_RESERVED_REQUESTS
+        )
+        self.reserved_interactive = min(reserved, self.capacity - 1)
+
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._waits: dict[GenerationPriority, deque[float]] = {
+            priority: deque(maxlen=WAIT_WINDOW) for priority in GenerationPriority
+        }
+        self._admitted: Counter[GenerationPriority] = Counter()
+
+    def _limit(self, priority: int) -> int:
+        """Slots a class may fill; the reserve is kept for interactive work."""
+        if priority == GenerationPriority.INTERACTIVE:
+            return self.capacity
+        return self.capacity - self.reserved_interactive
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: GenerationPriority, clock: BatchClock | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Hold a generation slot for the duration of the block.
+
+        Args:
+            priority: Priority class of the request
+            clock: Service clock of the request's batch, stopped while the
+                batch only waits for slots
+        """
+        start = time.monotonic()
+        if clock is not None:
+            clock.track(waiting=1)
+        try:
+            await self._acquire(priority)
+        finally:
+            if clock is not None:
+                clock.track(waiting=-1)
+        wait = time.monotonic() - start
+        self._waits[priority].append(wait)
+        self._admitted[priority] += 1
+        if wait >= 1.0:
+            logger.info(
+                "generation_request_queued",
+                priority=priority.name.lower(),
+                wait_seconds=round(wait, 2),
+                in_use=self._in_use,
+                waiting=len(self._waiters),
+            )
+        if clock is not None:
+            clock.track(running=1)
+        try:
+            yield
+        finally:
+            if clock is not None:
+                clock.track(running=-1)
+            self._release()
+
+    async def _acquire(self, priority: GenerationPriority) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._admit_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled waiters are dropped when they reach the front of the
+            # queue; a slot granted just before the cancellation is returned
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._in_use -= 1
+        self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.cancelled():
+                heapq.heappop(self._waiters)
+                continue
+            # Lower classes have no more slots than the front one
+            if self._in_use >= self._limit(priority):
+                return
+            heapq.heappop(self._waiters)
+            self._in_use += 1
+            future.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Capacity in use and per-class queue waits, for monitoring."""
+        waiting = Counter(
+            GenerationPriority(priority)
+            for priority, _, future in self._waiters
+            if not future.done()
+        )
+        classes = {}
+        for priority, waits in self._waits.items():
+            ordered = sorted(waits)
+            classes[priority.name.lower()] = {
+                "waiting": waiting[priority],
+                "admitted": self._admitted[priority],
+                "mean_wait": sum(ordered) / len(ordered) if ordered else 0.0,
+                "p95_wait": (
+                    ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+                    if ordered
+                    else 0.0
+                ),
+                "max_wait": ordered[-1] if ordered else 0.0,
+            }
+        return {
+            "capacity": self.capacity,
+            "reserved_interactive": self.reserved_interactive,
+            "in_use": self._in_use,
+            "classes": classes,
+        }
+
+
+_generation_scheduler = GenerationScheduler()
+
+
+def get_generation_scheduler() -> GenerationScheduler:
+    """Get the process-wide generation scheduler."""
+    return _generation_scheduler
@@ -57,6 +57,9 @@ OPERATION_TIMEOUTS = {
     "canvas_export": 600,  # 10 minutes timeout for Canvas export
 }
 
+# Questions exported to Canvas between progress checkpoints
+EXPORT_CHECKPOINT_SIZE = 20
+
 # Logging configuration for concurrent operations
 CORRELATION_ID_HEADER = "X-Correlation-ID"
 LOG_CONCURRENT_OPERATIONS = True
@@ -0,0 +1,296 @@
+"""Normalized storage for extracted quiz content.
+
+Extracted pages are stored one row per page in ``ContentPage``, keyed by quiz,
+module and position. Page text lives in ``ContentText`` keyed by its SHA-256
+hash, so quizzes that select the same Canvas modules share a single copy.
+
+Manual modules store their single page when the quiz is created, so the
+uploaded text is not kept in ``Quiz.selected_modules``; extraction reads it
+back from here.
+
+Quizzes extracted before this store existed keep their content in the legacy
+``Quiz.extracted_content`` JSONB column; the readers here fall back to it.
+"""
+
+import hashlib
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlmodel import Session, col
+
+from src.config import get_logger
+from src.content_extraction.utils import estimate_token_count, estimate_word_count
+
+from .models import ContentPage, ContentText, Quiz
+
+logger = get_logger("quiz_content_store")
+
+# Rows fetched per round trip when streaming pages
+CONTENT_PAGE_STREAM_BATCH_SIZE = 100
+
+
+def compute_content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest used to deduplicate page text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _content_rows(
+    quiz_id: UUID, extracted_content: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    """Build the ContentText rows by hash and the ContentPage rows to insert."""
+    texts: dict[str, dict[str, Any]] = {}
+    pages: list[dict[str, Any]] = []
+
+    for module_id, module_pages in extracted_content.items():
+        if not isinstance(module_pages, list):
+            continue
+
+        for position, page in enumerate(module_pages):
+            if not isinstance(page, dict):
+                continue
+
+            content = page.get("content") or ""
+            content_hash = compute_content_hash(content)
+            if content_hash not in texts:
+                texts[content_hash] = {
+                    "content_hash": content_hash,
+                    "content": content,
+                    "word_count": estimate_word_count(content),
+                    "token_estimate": estimate_token_count(content),
+                }
+
+            pages.append(
+                {
+                    "quiz_id": quiz_id,
+                    "module_id": str(module_id),
+                    "position": position,
+                    "content_hash": content_hash,
+                    "page_metadata": {
+                        key: value for key, value in page.items() if key != "content"
+                    },
+                }
+            )
+
+    return texts, pages
+
+
+def _upsert_texts_statement(texts: dict[str, dict[str, Any]]) -> Any:
+    # DO UPDATE (not DO NOTHING) locks the existing row, so a concurrent
+    # orphan cleanup cannot delete it before our pages reference it
+    statement = pg_insert(ContentText).values(list(texts.values()))
+    return statement.on_conflict_do_update(
+        index_elements=[col(ContentText.content_hash)],
+        set_={"word_count": statement.excluded.word_count},
+    )
+
+
+async def replace_quiz_content_pages(
+    session: AsyncSession,
+    quiz_id: UUID,
+    extracted_content: dict[str, Any],
+) -> int:
+    """
+    Replace all stored pages of a quiz with freshly extracted content.
+
+    Text already stored for another quiz is reused. Text that only the
+    replaced pages referenced is deleted.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+        extracted_content: Module ID mapped to a list of page dictionaries
+
+    Returns:
+        Number of pages stored
+    """
+    result = await session.execute(
+        delete(ContentPage)
+        .where(col(ContentPage.quiz_id) == quiz_id)
+        .returning(col(ContentPage.content_hash))
+    )
+    previous_hashes = set(result.scalars().all())
+
+    texts, pages = _content_rows(quiz_id, extracted_content)
+    if texts:
+        await session.execute(_upsert_texts_statement(texts))
+    if pages:
+        await session.execute(insert(ContentPage).values(pages))
+
+    orphaned_hashes = previous_hashes - texts.keys()
+    if orphaned_hashes:
+        await session.execute(
+            delete(ContentText).where(
+                col(ContentText.content_hash).in_(orphaned_hashes),
+                ~exists().where(
+                    col(ContentPage.content_hash) == col(ContentText.content_hash)
+                ),
+            )
+        )
+
+    logger.info(
+        "quiz_content_pages_stored",
+        quiz_id=str(quiz_id),
+        modules=len(extracted_content),
+        pages=len(pages),
+        distinct_texts=len(texts),
+        orphaned_texts_checked=len(orphaned_hashes),
+    )
+
+    return len(pages)
+
+
+def add_quiz_content_pages(
+    session: Session, quiz_id: UUID, module_pages: dict[str, Any]
+) -> int:
+    """
+    Store pages for modules of a quiz that has none stored for them yet.
+
+    Args:
+        session: Database session, left uncommitted
+        quiz_id: Quiz ID
+        module_pages: Module ID mapped to a list of page dictionaries
+
+    Returns:
+        Number of pages stored
+    """
+    texts, pages = _content_rows(quiz_id, module_pages)
+    if texts:
+        session.execute(_upsert_texts_statement(texts))
+    if pages:
+        session.execute(insert(ContentPage).values(pages))
+    return len(pages)
+
+
+def _content_pages_statement(
+    quiz_id: UUID, module_ids: list[str] | None = None
+) -> Select[Any]:
+    """Build the ordered page query for a quiz, optionally limited to modules."""
+    statement = (
+        select(
+            col(ContentPage.module_id),
+            col(ContentPage.page_metadata),
+            col(ContentText.content),
+        )
+        .join(
+            ContentText,
+            col(ContentText.content_hash) == col(ContentPage.content_hash),
+        )
+        .where(col(ContentPage.quiz_id) == quiz_id)
+        .order_by(col(ContentPage.module_id), col(ContentPage.position))
+    )
+    if module_ids is not None:
+        statement = statement.where(col(ContentPage.module_id).in_(module_ids))
+    return statement
+
+
+def _page_from_row(page_metadata: dict[str, Any], content: str) -> dict[str, Any]:
+    """Rebuild the page dictionary shape produced by content extraction."""
+    return {**page_metadata, "content": content}
+
+
+async def iter_quiz_content_modules(
+    session: AsyncSession,
+    quiz_id: UUID,
+    module_ids: list[str] | None = None,
+    include_deleted: bool = False,
+) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]:
+    """
+    Stream a quiz's extracted content one module at a time.
+
+    Pages are read with a server-side cursor in module order, so only the
+    current module's pages are held in memory.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+        module_ids: Only yield these modules (all modules if None)
+        include_deleted: Include soft-deleted quizzes
+
+    Yields:
+        Tuples of (module_id, list of page dictionaries)
+    """
+    statement = select(
+        col(Quiz.extracted_content), col(Quiz.content_extracted_at)
+    ).where(col(Quiz.id) == quiz_id)
+    if not include_deleted:
+        statement = statement.where(col(Quiz.deleted) == False)  # noqa: E712
+
+    row = (await session.execute(statement)).first()
+    if row is None:
+        return
+
+    legacy_content, content_extracted_at = row
+    if legacy_content is not None:
+        for module_id, pages in legacy_content.items():
+            if module_ids is None or module_id in module_ids:
+                yield module_id, pages
+        return
+
+    if content_extracted_at is None:
+        # Content was cleared for re-extraction; stored pages are stale
+        return
+
+    result = await session.stream(
+        _content_pages_statement(quiz_id, module_ids).execution_options(
+            yield_per=CONTENT_PAGE_STREAM_BATCH_SIZE
+        )
+    )
+
+    current_module: str | None = None
+    current_pages: list[dict[str, Any]] = []
+    async for module_id, page_metadata, content in result:
+        if module_id != current_module:
+            if current_module is not None:
+                yield current_module, current_pages
+            current_module = module_id
+            current_pages = []
+        current_pages.append(_page_from_row(page_metadata, content))
+
+    if current_module is not None:
+        yield current_module, current_pages
+
+
+async def get_stored_module_pages(
+    session: AsyncSession, quiz_id: UUID, module_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Get the stored pages of quiz modules, whether or not content was extracted.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+        module_ids: Modules to load
+
+    Returns:
+        Module ID mapped to its pages, for modules with stored pages
+    """
+    result = await session.execute(_content_pages_statement(quiz_id, module_ids))
+    modules: dict[str, list[dict[str, Any]]] = {}
+    for module_id, page_metadata, content in result.all():
+        modules.setdefault(module_id, []).append(_page_from_row(page_metadata, content))
+    return modules
+
+
+def get_quiz_module_pages(
+    session: Session, quiz_id: UUID, module_id: str
+) -> list[dict[str, Any]]:
+    """
+    Get the stored pages of a single quiz module.
+
+    Args:
+        session: Database session
+        quiz_id: Quiz ID
+        module_id: Module ID
+
+    Returns:
+        List of page dictionaries (empty if the module has no stored pages)
+    """
+    rows = session.execute(_content_pages_statement(quiz_id, [module_id])).all()
+    return [
+        _page_from_row(page_metadata, content) for _, page_metadata, content in rows
+    ]
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from src.circuit_breaker import CircuitOpenError
 from src.exceptions import ServiceError
 
 from .schemas import FailureReason
@@ -82,7 +83,10 @@ def determine_failure_reason(
     Returns:
         Appropriate FailureReason for the error type and operation
     """
-    if operation_name == "content_extraction":
+    if isinstance(exception, CircuitOpenError):
+        # Canvas or the LLM provider is down, not a problem with this quiz
+        return FailureReason.NETWORK_ERROR
+    elif operation_name == "content_extraction":
         # All content extraction failures map to content extraction error
         return FailureReason.CONTENT_EXTRACTION_ERROR
     elif operation_name == "canvas_export":
@@ -109,7 +113,10 @@ def categorize_generation_error(
     Returns:
         Appropriate FailureReason for the error type
     """
-    if isinstance(exception, ContentInsufficientError):
+    if isinstance(exception, CircuitOpenError):
+        # Every deployment of the LLM provider is down
+        return FailureReason.NETWORK_ERROR
+    elif isinstance(exception, ContentInsufficientError):
         # This indicates no meaningful content was available for generation
         return FailureReason.NO_CONTENT_FOUND
     elif isinstance(exception, OrchestrationTimeoutError):
@@ -121,3 +128,11 @@ def categorize_generation_error(
     else:
         # Default to LLM generation error for other failures
         return FailureReason.LLM_GENERATION_ERROR
+
+
+class GenerationQuotaExceededError(ServiceError):
+    """Raised when a user or course prefix is out of LLM generation quota."""
+
+    def __init__(self, message: str, scope: str):
+        super().__init__(f"Generation quota exceeded: {message}", 429)
+        self.scope = scope
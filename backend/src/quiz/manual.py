@@ -1,16 +1,26 @@
 """Manual module service functions for handling file uploads and text content."""
 
+import asyncio
+import time
 import uuid
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from tempfile import SpooledTemporaryFile
+from typing import Any, NoReturn
+from uuid import UUID
 
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import delete
+from sqlmodel import Session, col, select
 
-from src.config import get_logger
+from src.config import get_logger, settings
 from src.content_extraction.constants import MIN_MANUAL_TEXT_LENGTH
 from src.content_extraction.models import ProcessedContent, RawContent
 from src.content_extraction.processors import CONTENT_PROCESSORS
 from src.content_extraction.service import process_content
 
+from .models import ManualModuleStaging
 from .schemas import ManualModuleCreate, ManualModuleResponse
 
 logger = get_logger("manual_module_service")
@@ -20,6 +30,10 @@ MAX_FILE_SIZE = 5 * 1024 * 1024
 MAX_TOTAL_FILE_SIZE = 25 * 1024 * 1024
 MAX_FILES_COUNT = 5
 
+# Uploads are read in chunks and kept in memory up to 1MB before spilling to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_SPOOL_MAX_MEMORY = 1024 * 1024
+
 
 async def process_uploaded_file(file: UploadFile) -> RawContent:
     """
@@ -73,10 +87,116 @@ async def process_uploaded_file(file: UploadFile) -> RawContent:
     return raw_content
 
 
+async def _spool_upload(
+    file: UploadFile, remaining_total: int
+) -> tuple[SpooledTemporaryFile[bytes], int]:
+    """
+    Stream an upload into a spooled temporary file, enforcing size caps.
+
+    The declared size is checked before anything is read, and the running size
+    is checked per chunk, so oversized uploads are rejected without buffering.
+
+    Args:
+        file: FastAPI UploadFile object
+        remaining_total: Bytes left under MAX_TOTAL_FILE_SIZE
+
+    Returns:
+        Tuple of (spooled file rewound to the start, size in bytes)
+
+    Raises:
+        HTTPException: If the file exceeds the per-file or total size limit
+    """
+    limit = min(MAX_FILE_SIZE, remaining_total)
+    declared_size = getattr(file, "size", None)
+
+    if declared_size is not None and declared_size > limit:
+        _raise_upload_too_large(file.filename, declared_size, remaining_total)
+
+    spool: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(
+        max_size=UPLOAD_SPOOL_MAX_MEMORY
+    )
+    size = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > limit:
+                _raise_upload_too_large(file.filename, size, remaining_total)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return spool, size
+
+
+def _raise_upload_too_large(
+    filename: str | None, size: int, remaining_total: int
+) -> NoReturn:
+    """Raise the size-limit error matching whichever cap was exceeded."""
+    if size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File '{filename}' exceeds maximum size of {MAX_FILE_SIZE / (1024*1024):.1f}MB",
+        )
+
+    total_size = MAX_TOTAL_FILE_SIZE - remaining_total + size
+    raise HTTPException(
+        status_code=400,
+        detail=f"Total file size ({total_size / (1024*1024):.1f}MB) exceeds maximum limit of {MAX_TOTAL_FILE_SIZE / (1024*1024):.1f}MB",
+    )
+
+
+@cache
+def _get_upload_executor() -> ThreadPoolExecutor:
+    """Get the shared worker pool for per-file upload processing."""
+    return ThreadPoolExecutor(
+        max_workers=settings.MANUAL_UPLOAD_WORKERS,
+        thread_name_prefix="manual-upload",
+    )
+
+
+def _extract_uploaded_pdf(
+    spool: SpooledTemporaryFile[bytes], filename: str, file_index: int
+) -> tuple[ProcessedContent | None, float]:
+    """
+    Extract text from one spooled PDF upload. Runs in the upload worker pool.
+
+    Args:
+        spool: Spooled file positioned at the start
+        filename: Original filename
+        file_index: 1-based position of the file in the upload
+
+    Returns:
+        Tuple of (processed content or None on failure, processing seconds)
+    """
+    start_time = time.perf_counter()
+    content_bytes = spool.read()
+
+    raw_content = RawContent(
+        content=content_bytes.decode("latin-1"),
+        content_type="pdf",
+        title=filename,
+        metadata={
+            "source": "manual_multi_upload_individual",
+            "file_size": len(content_bytes),
+            "filename": filename,
+            "file_index": file_index,
+        },
+    )
+    processed = CONTENT_PROCESSORS[raw_content.content_type](raw_content)
+
+    return processed, time.perf_counter() - start_time
+
+
 async def process_multiple_uploaded_files(files: list[UploadFile]) -> RawContent:
     """
     Process multiple uploaded files and concatenate their content.
 
+    Uploads are streamed into spooled temporary files under the size caps, then
+    text extraction for each file runs in the upload worker pool. Results are
+    concatenated in upload order regardless of completion order.
+
     Args:
         files: List of FastAPI UploadFile objects
 
@@ -97,83 +217,64 @@ async def process_multiple_uploaded_files(files: list[UploadFile]) -> RawContent
             detail=f"Maximum {MAX_FILES_COUNT} files allowed per manual module",
         )
 
-    # Validate each file and store content to avoid multiple reads
-    total_size = 0
-    file_names = []
-    file_contents = []  # Store the content during validation
-
+    # Validate every file type before reading any upload
     for file in files:
-        # Validate file type
         if not file.filename or not file.filename.lower().endswith(".pdf"):
             raise HTTPException(
                 status_code=400,
                 detail=f"Only PDF files are supported. Invalid file: {file.filename}",
             )
 
-        # Read file content once and store it
-        content_bytes = await file.read()
-        file_size = len(content_bytes)
+    total_size = 0
+    file_names = []
+    file_sizes = []
+    spools: list[SpooledTemporaryFile[bytes]] = []
+    batch_start = time.perf_counter()
 
-        # Validate individual file size
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File '{file.filename}' exceeds maximum size of {MAX_FILE_SIZE / (1024*1024):.1f}MB",
+    try:
+        for file in files:
+            spool, file_size = await _spool_upload(
+                file, MAX_TOTAL_FILE_SIZE - total_size
+            )
+            spools.append(spool)
+            total_size += file_size
+            file_names.append(file.filename)
+            file_sizes.append(file_size)
+
+        # Fan out text extraction; gather keeps results in upload order
+        loop = asyncio.get_running_loop()
+        executor = _get_upload_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _extract_uploaded_pdf,
+                    spool,
+                    file.filename or f"document_{i + 1}.pdf",
+                    i + 1,
+                )
+                for i, (file, spool) in enumerate(zip(files, spools, strict=True))
             )
-
-        total_size += file_size
-        file_names.append(file.filename)
-        file_contents.append(content_bytes)  # Store content for later use
-
-    # Validate total size
-    if total_size > MAX_TOTAL_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Total file size ({total_size / (1024*1024):.1f}MB) exceeds maximum limit of {MAX_TOTAL_FILE_SIZE / (1024*1024):.1f}MB",
         )
+    finally:
+        for spool in spools:
+            spool.close()
 
-    # Process each file and concatenate content
+    # Concatenate extracted text in upload order
     concatenated_content_parts = []
-    all_metadata: dict[str, Any] = {
-        "source": "manual_multi_upload",
-        "total_files": len(files),
-        "total_file_size": total_size,
-        "filenames": file_names,
-        "individual_file_sizes": [len(content) for content in file_contents],
-    }
-
-    # Process each PDF individually and extract text content
-    for i, (file, content_bytes) in enumerate(zip(files, file_contents, strict=False)):
-        # Create individual RawContent for each file
-        individual_raw_content = RawContent(
-            content=content_bytes.decode("latin-1"),
-            content_type="pdf",
-            title=file.filename or f"document_{i+1}.pdf",
-            metadata={
-                "source": "manual_multi_upload_individual",
-                "file_size": len(content_bytes),
-                "filename": file.filename,
-                "file_index": i + 1,
-            },
-        )
-
-        # Process individual PDF through content extraction pipeline
-        if individual_raw_content.content_type not in CONTENT_PROCESSORS:
-            logger.warning(
-                "unsupported_content_type_in_multi_upload",
-                content_type=individual_raw_content.content_type,
-                filename=file.filename,
-            )
-            continue
+    processing_times = []
 
-        processor = CONTENT_PROCESSORS[individual_raw_content.content_type]
-        processed_individual = await process_content(individual_raw_content, processor)
+    for i, (file, (processed_individual, elapsed)) in enumerate(
+        zip(files, results, strict=True)
+    ):
+        processing_times.append(round(elapsed, 3))
 
         if not processed_individual:
             logger.warning(
                 "individual_file_processing_failed",
                 filename=file.filename,
                 file_index=i + 1,
+                processing_time=elapsed,
             )
             # Don't add error messages to content - just skip this file
             continue
@@ -190,12 +291,23 @@ async def process_multiple_uploaded_files(files: list[UploadFile]) -> RawContent
         logger.info(
             "multi_file_processed",
             filename=file.filename,
-            file_size=len(content_bytes),
+            file_size=file_sizes[i],
             extracted_word_count=processed_individual.word_count,
             file_index=i + 1,
             total_files=len(files),
+            processing_time=elapsed,
         )
 
+    all_metadata: dict[str, Any] = {
+        "source": "manual_multi_upload",
+        "total_files": len(files),
+        "total_file_size": total_size,
+        "filenames": file_names,
+        "individual_file_sizes": file_sizes,
+        "individual_processing_times": processing_times,
+        "total_processing_time": round(time.perf_counter() - batch_start, 3),
+    }
+
     # Combine all content
     combined_content = "".join(concatenated_content_parts)
 
@@ -236,6 +348,7 @@ async def process_multiple_uploaded_files(files: list[UploadFile]) -> RawContent
         total_size=total_size,
         combined_content_length=len(combined_content),
         title=title,
+        total_processing_time=all_metadata["total_processing_time"],
     )
 
     return raw_content
@@ -273,7 +386,7 @@ async def create_manual_module(
     module_data: ManualModuleCreate,
     file: UploadFile | None = None,
     files: list[UploadFile] | None = None,
-) -> ManualModuleResponse:
+) -> tuple[ManualModuleResponse, ProcessedContent]:
     """
     Create a manual module from single file, multiple files, or text content.
 
@@ -283,7 +396,8 @@ async def create_manual_module(
         files: Optional list of uploaded files (for multi-file upload)
 
     Returns:
-        ManualModuleResponse with processed content preview
+        ManualModuleResponse with processed content preview, and the processed
+        content to stage
 
     Raises:
         HTTPException: If processing fails or no content provided
@@ -389,7 +503,6 @@ async def create_manual_module(
             module_id=module_id,
             name=module_data.name,
             content_preview=content_preview,
-            full_content=processed_content.content,
             word_count=processed_content.word_count,
             processing_metadata=processed_content.processing_metadata,
         )
@@ -402,7 +515,7 @@ async def create_manual_module(
             content_type=raw_content.content_type,
         )
 
-        return response
+        return response, processed_content
 
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -416,6 +529,102 @@ async def create_manual_module(
         )
 
 
+def purge_expired_staged_modules(session: Session) -> int:
+    """
+    Delete staged manual module content whose TTL has passed.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of staged modules deleted
+    """
+    result = session.execute(
+        delete(ManualModuleStaging).where(
+            col(ManualModuleStaging.expires_at) <= datetime.now(timezone.utc)
+        )
+    )
+    purged: int = result.rowcount or 0  # type: ignore[attr-defined]
+
+    if purged:
+        logger.info("manual_module_staging_purged", purged_count=purged)
+
+    return purged
+
+
+def stage_manual_module(
+    session: Session,
+    owner_id: UUID,
+    response: ManualModuleResponse,
+    processed_content: ProcessedContent,
+) -> ManualModuleStaging:
+    """
+    Store processed manual module content server-side under its module ID.
+
+    Quiz creation then only needs to reference the module ID; the content is
+    resolved from the staging table instead of being posted back by the client.
+    Expired entries are purged opportunistically on every upload.
+
+    Args:
+        session: Database session
+        owner_id: ID of the uploading user
+        response: Module returned to the uploader by create_manual_module
+        processed_content: Processed content returned with it
+
+    Returns:
+        The staged module
+    """
+    purge_expired_staged_modules(session)
+
+    staged = ManualModuleStaging(
+        module_id=response.module_id,
+        owner_id=owner_id,
+        name=response.name,
+        content=processed_content.content,
+        word_count=response.word_count,
+        content_type=processed_content.content_type,
+        processing_metadata=response.processing_metadata,
+        expires_at=datetime.now(timezone.utc)
+        + timedelta(hours=settings.MANUAL_MODULE_STAGING_TTL_HOURS),
+    )
+    session.add(staged)
+    session.commit()
+    session.refresh(staged)
+
+    logger.info(
+        "manual_module_staged",
+        module_id=staged.module_id,
+        owner_id=str(owner_id),
+        content_length=len(processed_content.content),
+        expires_at=staged.expires_at.isoformat(),
+    )
+
+    return staged
+
+
+def get_staged_manual_module(
+    session: Session, module_id: str, owner_id: UUID
+) -> ManualModuleStaging | None:
+    """
+    Get unexpired staged content for a manual module uploaded by the user.
+
+    Args:
+        session: Database session
+        module_id: Manual module ID returned by the upload endpoint
+        owner_id: ID of the user creating the quiz
+
+    Returns:
+        The staged module, or None if it does not exist, belongs to another
+        user or has expired
+    """
+    statement = select(ManualModuleStaging).where(
+        ManualModuleStaging.module_id == module_id,
+        ManualModuleStaging.owner_id == owner_id,
+        col(ManualModuleStaging.expires_at) > datetime.now(timezone.utc),
+    )
+    return session.exec(statement).first()
+
+
 def generate_module_id() -> str:
     """Generate a unique manual module ID."""
     return f"manual_{uuid.uuid4().hex[:8]}"
@@ -454,7 +663,8 @@ def create_manual_module_selection_from_response(
     Create a complete manual module selection from ManualModuleResponse and question batches.
 
     This function bridges the gap between the manual module upload response and the
-    data structure needed for quiz creation.
+    data structure needed for quiz creation. The content is left out; quiz
+    creation takes it from the staged upload.
 
     Args:
         response: ManualModuleResponse from create_manual_module
@@ -466,14 +676,31 @@ def create_manual_module_selection_from_response(
     return {
         "name": response.name,
         "source_type": "manual",
-        "content": response.full_content,  # Use full content for question generation
-        "word_count": response.word_count,
-        "processing_metadata": response.processing_metadata,
-        "content_type": "text",  # Default for now, could be enhanced
         "question_batches": question_batches,
     }
 
 
+def manual_module_page(module_data: dict[str, Any], content: str) -> dict[str, Any]:
+    """
+    Build the single content page of a manual module, shaped like a Canvas page.
+
+    Args:
+        module_data: Manual module data with its name and content fields
+        content: Full content of the module
+
+    Returns:
+        Page dictionary as stored in the quiz's extracted content
+    """
+    return {
+        "content": content,
+        "word_count": module_data.get("word_count") or 0,
+        "source_type": "manual",
+        "processing_metadata": module_data.get("processing_metadata") or {},
+        "content_type": module_data.get("content_type") or "text",
+        "title": module_data["name"],
+    }
+
+
 async def prepare_manual_module_for_quiz(
     module_data: dict[str, Any], module_id: str
 ) -> dict[str, Any]:
@@ -496,9 +723,8 @@ async def prepare_manual_module_for_quiz(
         module_data["source_type"] = "manual"
         return module_data
 
-    # If we get here, we need to process content from a temporary storage or cache
-    # For now, this function expects the content to already be processed
-    # In a production system, you might store temporary content in Redis or similar
+    # Content uploaded through the upload endpoint is staged server-side and
+    # resolved by quiz creation (see get_staged_manual_module)
 
     logger.warning(
         "manual_module_missing_processed_content",
@@ -520,9 +746,8 @@ def get_full_manual_content(processed_content: ProcessedContent) -> str:
     """
     Get the full content for a manual module (not just the preview).
 
-    In the current implementation, we store the preview in the response,
-    but for question generation we need the full content. This function
-    would ideally retrieve the full content from a cache or storage system.
+    The full content is also kept in the staging table until quiz creation,
+    see stage_manual_module.
 
     Args:
         module_id: Manual module ID
@@ -531,6 +756,4 @@ def get_full_manual_content(processed_content: ProcessedContent) -> str:
     Returns:
         Full content string for question generation
     """
-    # For now, return the full content directly
-    # In production, this might retrieve from Redis/cache using module_id
     return processed_content.content
@@ -8,12 +8,14 @@ import sqlalchemy as sa
 from pydantic import field_validator
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from src.auth.models import User
     from src.question.models import Question
 
+from src.compression import CompressedText
 from src.question.types import QuizLanguage
 
 from .schemas import FailureReason, QuizStatus, QuizTone
@@ -73,6 +75,77 @@ class QuizInvite(SQLModel, table=True):
     __table_args__ = (sa.UniqueConstraint("token", name="uq_quiz_invite_token"),)
 
 
+# Compressed text columns are deferred, so loading a row does not decompress
+# its text until the attribute is read
+_staged_content_column = Column("content", CompressedText, nullable=False)
+_content_text_column = Column("content", CompressedText, nullable=False)
+
+
+class ManualModuleStaging(SQLModel, table=True):
+    """Processed manual module content held server-side until quiz creation."""
+
+    module_id: str = Field(primary_key=True, max_length=64)
+    owner_id: uuid.UUID = Field(
+        foreign_key="user.id", nullable=False, index=True, ondelete="CASCADE"
+    )
+    name: str = Field(max_length=255)
+    content: str = Field(sa_column=_staged_content_column)
+    word_count: int = Field(default=0)
+    content_type: str = Field(default="text", max_length=50)
+    processing_metadata: dict[str, Any] = Field(
+        default_factory=dict, sa_column=Column(JSONB, nullable=False, default={})
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=True
+        ),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+        description="Staged content is discarded after this time",
+    )
+
+    __mapper_args__ = {"properties": {"content": deferred(_staged_content_column)}}
+
+
+class ContentText(SQLModel, table=True):
+    """Extracted page text, stored once per distinct content across all quizzes."""
+
+    content_hash: str = Field(
+        primary_key=True, max_length=64, description="SHA-256 hex digest of content"
+    )
+    content: str = Field(sa_column=_content_text_column)
+    word_count: int = Field(default=0)
+    token_estimate: int = Field(default=0)
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=True
+        ),
+    )
+
+    __mapper_args__ = {"properties": {"content": deferred(_content_text_column)}}
+
+
+class ContentPage(SQLModel, table=True):
+    """One extracted page of a quiz module, pointing at its deduplicated text."""
+
+    quiz_id: uuid.UUID = Field(
+        foreign_key="quiz.id", primary_key=True, ondelete="CASCADE"
+    )
+    module_id: str = Field(primary_key=True, max_length=255)
+    position: int = Field(primary_key=True, description="Page order within module")
+    content_hash: str = Field(
+        foreign_key="contenttext.content_hash", max_length=64, index=True
+    )
+    page_metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, default={}),
+        description="Page fields other than content (title, type, source_type...)",
+    )
+
+
 class Quiz(SQLModel, table=True):
     """Quiz model representing a quiz with questions generated from Canvas content."""
 
@@ -177,6 +250,17 @@ class Quiz(SQLModel, table=True):
         description="Timestamp when quiz was soft deleted",
     )
 
+    __table_args__ = (
+        # Quiz listing: a user's active quizzes, newest first
+        sa.Index(
+            "ix_quiz_owner_id_created_at_id_active",
+            "owner_id",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("deleted = false"),
+        ),
+    )
+
     @property
     def module_batch_distribution(self) -> dict[str, list[dict[str, Any]]]:
         """Get question batch distribution per module."""
@@ -291,3 +375,95 @@ class Quiz(SQLModel, table=True):
         if v is not None and not isinstance(v, dict):
             raise ValueError("extracted_content must be a dictionary")
         return v
+
+
+class GenerationUsage(SQLModel, table=True):
+    """LLM tokens used by one question generation run of a quiz."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    quiz_id: uuid.UUID = Field(
+        foreign_key="quiz.id", nullable=False, index=True, ondelete="CASCADE"
+    )
+    owner_id: uuid.UUID | None = Field(
+        default=None, foreign_key="user.id", nullable=True, ondelete="SET NULL"
+    )
+    course_prefix: str | None = Field(
+        default=None,
+        max_length=255,
+        description="Matching CANVAS_COURSE_PREFIX_FILTER prefix at the time of use",
+    )
+    operation: str = Field(
+        max_length=50, description="generation or single_batch_regeneration"
+    )
+    total_tokens: int = Field(default=0)
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
+    )
+
+    __table_args__ = (
+        # Quota checks sum a user's or a course prefix's recent usage
+        sa.Index("ix_generationusage_owner_id_created_at", "owner_id", "created_at"),
+        sa.Index(
+            "ix_generationusage_course_prefix_created_at",
+            "course_prefix",
+            "created_at",
+        ),
+    )
+
+
+class GenerationRun(SQLModel, table=True):
+    """Concurrency slot of a question generation run, held until it ends."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    quiz_id: uuid.UUID = Field(
+        foreign_key="quiz.id", nullable=False, index=True, ondelete="CASCADE"
+    )
+    owner_id: uuid.UUID | None = Field(
+        default=None, foreign_key="user.id", nullable=True, ondelete="SET NULL"
+    )
+    course_prefix: str | None = Field(default=None, max_length=255)
+    started_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
+    )
+
+    __table_args__ = (
+        # Concurrency checks count a user's or a course prefix's live runs
+        sa.Index("ix_generationrun_owner_id_started_at", "owner_id", "started_at"),
+        sa.Index(
+            "ix_generationrun_course_prefix_started_at",
+            "course_prefix",
+            "started_at",
+        ),
+    )
+
+
+class LLMCallUsage(SQLModel, table=True):
+    """One LLM call of question generation, in the append-only usage ledger."""
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    quiz_id: uuid.UUID = Field(
+        foreign_key="quiz.id", nullable=False, index=True, ondelete="CASCADE"
+    )
+    batch_key: str | None = Field(default=None, max_length=255)
+    module_id: str | None = Field(default=None, max_length=255)
+    question_type: str = Field(max_length=50)
+    language: str = Field(max_length=10, description="Selects the prompt template")
+    model: str = Field(max_length=100)
+    call_kind: str = Field(
+        max_length=30,
+        description="initial, retry, json_correction or validation_correction",
+    )
+    prompt_tokens: int = Field(default=0)
+    completion_tokens: int = Field(default=0)
+    total_tokens: int = Field(default=0)
+    latency: float = Field(description="Response time in seconds")
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+        description="When the call completed; rows are written later in batches",
+    )
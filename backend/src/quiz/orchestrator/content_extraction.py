@@ -8,14 +8,18 @@ Canvas modules and manual modules, with automatic question generation triggering
 from typing import Any
 from uuid import UUID
 
+from src.circuit_breaker import CircuitOpenError, find_open_circuit
 from src.config import get_logger
 from src.database import execute_in_transaction
 
 from ..constants import OPERATION_TIMEOUTS
 from ..schemas import FailureReason, QuizStatus
 from .core import (
+    CanvasTokenSource,
     ContentExtractorFunc,
     ContentSummaryFunc,
+    profile_operation,
+    resolve_canvas_token,
     rollback_quiz_to_status,
     timeout_operation,
 )
@@ -26,10 +30,11 @@ logger = get_logger("quiz_orchestrator_content_extraction")
 async def _execute_content_extraction_workflow(
     quiz_id: UUID,
     canvas_course_id: int,
-    canvas_token: str,
+    canvas_token: CanvasTokenSource,
     selected_modules: dict[str, dict[str, Any]],
     content_extractor: ContentExtractorFunc,
     content_summarizer: ContentSummaryFunc,
+    manual_pages: dict[str, list[dict[str, Any]]] | None = None,
 ) -> tuple[dict[str, Any] | None, str, dict[str, dict[str, Any]] | None]:
     """
     Execute unified content extraction workflow for any combination of source types.
@@ -41,10 +46,11 @@ async def _execute_content_extraction_workflow(
     Args:
         quiz_id: UUID of the quiz to extract content for
         canvas_course_id: Canvas course ID
-        canvas_token: Canvas API authentication token
+        canvas_token: Canvas API token, or a provider refreshing it as needed
         selected_modules: Dictionary of selected modules with source_type info
         content_extractor: Function to extract content from Canvas modules
         content_summarizer: Function to generate content summary
+        manual_pages: Pages stored for manual modules when the quiz was created
 
     Returns:
         Tuple of (extracted_content, final_status, cleaned_selected_modules)
@@ -106,7 +112,9 @@ async def _execute_content_extraction_workflow(
                 canvas_module_ids=canvas_modules,
             )
             canvas_content = await content_extractor(
-                canvas_token, canvas_course_id, canvas_modules
+                await resolve_canvas_token(canvas_token),
+                canvas_course_id,
+                canvas_modules,
             )
             all_extracted_content.update(canvas_content)
 
@@ -117,21 +125,17 @@ async def _execute_content_extraction_workflow(
                 quiz_id=str(quiz_id),
                 manual_module_count=len(manual_modules),
             )
+            from ..manual import manual_module_page
+
+            stored_pages = manual_pages or {}
             for module_id, module_data in manual_modules:
-                # Manual modules already have processed content from quiz creation
-                # Format as single-page content to match Canvas structure
-                all_extracted_content[module_id] = [
-                    {
-                        "content": module_data.get("content", ""),
-                        "word_count": module_data.get("word_count", 0),
-                        "source_type": "manual",
-                        "processing_metadata": module_data.get(
-                            "processing_metadata", {}
-                        ),
-                        "content_type": module_data.get("content_type", "text"),
-                        "title": module_data["name"],
-                    }
-                ]
+                if module_id in stored_pages:
+                    all_extracted_content[module_id] = stored_pages[module_id]
+                else:
+                    # Older quizzes kept the content in selected_modules
+                    all_extracted_content[module_id] = [
+                        manual_module_page(module_data, module_data.get("content", ""))
+                    ]
 
         # Clean selected_modules to prevent content duplication
         # Keep only essential fields needed for question generation
@@ -162,6 +166,10 @@ async def _execute_content_extraction_workflow(
         total_pages = content_summary.get("total_pages", 0)
 
         if total_word_count == 0 or total_pages == 0:
+            # Module extraction tolerates failing pages, so nothing extracted
+            # while Canvas is down is an outage rather than an empty course
+            if find_open_circuit("canvas"):
+                return None, "unavailable", selected_modules
             logger.warning(
                 "extraction_completed_but_no_content_found",
                 quiz_id=str(quiz_id),
@@ -182,14 +190,17 @@ async def _execute_content_extraction_workflow(
             error_type=type(e).__name__,
             exc_info=True,
         )
+        if isinstance(e, CircuitOpenError):
+            return None, "unavailable", selected_modules
         return None, "failed", selected_modules
 
 
 @timeout_operation(OPERATION_TIMEOUTS["content_extraction"])
+@profile_operation("content_extraction")
 async def orchestrate_content_extraction(
     quiz_id: UUID,
     canvas_course_id: int,
-    canvas_token: str,
+    canvas_token: CanvasTokenSource,
     content_extractor: ContentExtractorFunc,
     content_summarizer: ContentSummaryFunc,
 ) -> None:
@@ -203,7 +214,7 @@ async def orchestrate_content_extraction(
     Args:
         quiz_id: UUID of the quiz to extract content for
         canvas_course_id: Canvas course ID
-        canvas_token: Canvas API authentication token
+        canvas_token: Canvas API token, or a provider refreshing it as needed
         content_extractor: Function to extract content from Canvas
         content_summarizer: Function to generate content summary
     """
@@ -218,9 +229,23 @@ async def orchestrate_content_extraction(
         session: Any, quiz_id: UUID
     ) -> dict[str, Any] | None:
         """Reserve extraction job and return quiz settings with selected_modules."""
+        from ..content_store import get_stored_module_pages
         from ..service import reserve_quiz_job
 
-        return await reserve_quiz_job(session, quiz_id, "extraction")
+        settings = await reserve_quiz_job(session, quiz_id, "extraction")
+        if settings:
+            manual_module_ids = [
+                module_id
+                for module_id, module in settings["selected_modules"].items()
+                if module.get("source_type") == "manual"
+            ]
+            # Manual modules store their content page on quiz creation
+            settings["manual_pages"] = (
+                await get_stored_module_pages(session, quiz_id, manual_module_ids)
+                if manual_module_ids
+                else {}
+            )
+        return settings
 
     quiz_settings = await execute_in_transaction(
         _reserve_extraction_job,
@@ -252,6 +277,7 @@ async def orchestrate_content_extraction(
         selected_modules,
         content_extractor,
         content_summarizer,
+        quiz_settings.get("manual_pages"),
     )
 
     # === Transaction 2: Save the Result ===
@@ -294,6 +320,15 @@ async def orchestrate_content_extraction(
             await update_quiz_status(
                 session, quiz_id, QuizStatus.FAILED, failure_reason, **additional_fields
             )
+        elif status == "unavailable":
+            # Canvas circuit breaker open, extraction can be retried later
+            await update_quiz_status(
+                session,
+                quiz_id,
+                QuizStatus.FAILED,
+                FailureReason.NETWORK_ERROR,
+                **additional_fields,
+            )
 
     await execute_in_transaction(
         _save_extraction_result,
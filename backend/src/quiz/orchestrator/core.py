@@ -6,13 +6,16 @@ workflows, including background task safety, timeout handling, and failure manag
 """
 
 import asyncio
+import cProfile
+import os
 import uuid
 from collections.abc import Callable
+from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, TypeVar
+from typing import Any, Protocol, TypeVar
 from uuid import UUID
 
-from src.config import get_logger
+from src.config import get_logger, settings
 from src.database import execute_in_transaction
 
 from ..exceptions import OrchestrationTimeoutError
@@ -282,8 +285,105 @@ def timeout_operation(
     return decorator
 
 
+# Only one profiler can observe the event loop at a time
+_profiling_active = False
+
+
+def profile_operation(
+    operation_name: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator to optionally profile orchestration operations with cProfile.
+
+    Profiling is opt-in via ORCHESTRATION_PROFILING_ENABLED and is checked on
+    every call. Each profiled run writes one .prof file to
+    ORCHESTRATION_PROFILE_DIR. The profiler observes the whole event loop, so
+    concurrent tasks appear in the output; while one operation is being
+    profiled, other operations run unprofiled.
+
+    Args:
+        operation_name: Name of the operation used in logs and file names
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            global _profiling_active
+
+            if not settings.ORCHESTRATION_PROFILING_ENABLED or _profiling_active:
+                return await func(*args, **kwargs)
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+            _profiling_active = True
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _profiling_active = False
+                quiz_id = str(args[0]) if args else None
+                _write_profile(profiler, operation_name, quiz_id)
+
+        return wrapper
+
+    return decorator
+
+
+def _write_profile(
+    profiler: cProfile.Profile, operation_name: str, quiz_id: str | None
+) -> None:
+    """Stop the profiler and write its output without affecting the operation."""
+    try:
+        profiler.disable()
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        os.makedirs(settings.ORCHESTRATION_PROFILE_DIR, exist_ok=True)
+        profile_path = os.path.join(
+            settings.ORCHESTRATION_PROFILE_DIR,
+            f"{operation_name}_{quiz_id or 'unknown'}_{timestamp}.prof",
+        )
+        profiler.dump_stats(profile_path)
+
+        logger.info(
+            "orchestration_profile_written",
+            operation=operation_name,
+            quiz_id=quiz_id,
+            profile_path=profile_path,
+        )
+    except Exception as error:
+        logger.warning(
+            "orchestration_profile_write_failed",
+            operation=operation_name,
+            quiz_id=quiz_id,
+            error=str(error),
+        )
+
+
+class CanvasTokenProvider(Protocol):
+    """Source of a Canvas token that stays valid for long-running jobs."""
+
+    async def get_token(self) -> str:
+        """Get a valid Canvas access token."""
+        ...
+
+
+async def resolve_canvas_token(canvas_token: "CanvasTokenSource") -> str:
+    """
+    Get the Canvas access token to use for the next Canvas call.
+
+    Args:
+        canvas_token: Raw access token, or a provider that refreshes it
+
+    Returns:
+        Canvas access token
+    """
+    if isinstance(canvas_token, str):
+        return canvas_token
+    return await canvas_token.get_token()
+
+
 # Type aliases for dependency injection
+CanvasTokenSource = str | CanvasTokenProvider
 ContentExtractorFunc = Callable[[str, int, list[int]], Any]
 ContentSummaryFunc = Callable[[dict[str, list[dict[str, str]]]], dict[str, Any]]
 QuizCreatorFunc = Callable[[str, int, str, int], Any]
 QuestionExporterFunc = Callable[[str, int, str, list[dict[str, Any]], Any], Any]
+ExportCheckpointFunc = Callable[[str, list[dict[str, Any]], list[dict[str, Any]]], Any]
@@ -1,8 +1,9 @@
 """
 Canvas export orchestration for quiz operations.
 
-This module handles the complete Canvas export workflow with all-or-nothing
-approach and automatic rollback on failures.
+This module handles the complete Canvas export workflow. Progress is
+checkpointed as questions are exported, so a failed export is resumed into
+the same Canvas quiz on retry instead of being rolled back.
 """
 
 from typing import Any
@@ -10,105 +11,151 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.circuit_breaker import CircuitOpenError
 from src.config import get_logger
 from src.database import execute_in_transaction
 
-from ..constants import OPERATION_TIMEOUTS
+from ..constants import EXPORT_CHECKPOINT_SIZE, OPERATION_TIMEOUTS
 from ..schemas import FailureReason, QuizStatus
-from .core import QuestionExporterFunc, QuizCreatorFunc, timeout_operation
+from .core import (
+    CanvasTokenSource,
+    ExportCheckpointFunc,
+    QuestionExporterFunc,
+    QuizCreatorFunc,
+    profile_operation,
+    resolve_canvas_token,
+    timeout_operation,
+)
 
 logger = get_logger("quiz_orchestrator_export")
 
 
 async def _execute_export_workflow(
     quiz_id: UUID,
-    canvas_token: str,
+    canvas_token: CanvasTokenSource,
     quiz_creator: QuizCreatorFunc,
     question_exporter: QuestionExporterFunc,
     export_data: dict[str, Any],
     session: AsyncSession,
+    checkpoint: ExportCheckpointFunc | None = None,
 ) -> dict[str, Any]:
     """
-    Execute the Canvas export workflow with all-or-nothing approach.
-    Either all questions export successfully or the entire quiz is rolled back.
+    Execute the Canvas export workflow with resumable checkpoints.
+
+    The Canvas quiz ID and each chunk of exported question IDs are passed to
+    ``checkpoint`` as soon as Canvas confirms them. When an earlier attempt
+    already created the Canvas quiz, the export resumes into it and skips
+    questions that already have a Canvas item.
 
     Returns:
         Export result dictionary with success status
     """
     from src.question.service import calculate_total_points_for_questions
 
-    total_questions = len(export_data["questions"])
-    total_points = calculate_total_points_for_questions(export_data["questions"])
+    questions = export_data["questions"]
+    total_questions = len(questions)
+    canvas_quiz_id = export_data.get("canvas_quiz_id")
 
-    logger.info(
-        "canvas_export_workflow_started",
-        quiz_id=str(quiz_id),
-        total_questions=total_questions,
-        total_points=total_points,
-        course_id=export_data["course_id"],
-    )
+    if canvas_quiz_id:
+        pending_questions = [q for q in questions if not q.get("canvas_item_id")]
 
-    # Create Canvas quiz using injected function
-    canvas_quiz = await quiz_creator(
-        canvas_token,
-        export_data["course_id"],
-        export_data["title"],
-        total_points,
-    )
+        logger.info(
+            "canvas_export_workflow_resumed",
+            quiz_id=str(quiz_id),
+            canvas_quiz_id=canvas_quiz_id,
+            total_questions=total_questions,
+            pending_questions=len(pending_questions),
+            course_id=export_data["course_id"],
+        )
+    else:
+        pending_questions = questions
+        total_points = calculate_total_points_for_questions(questions)
 
-    logger.info(
-        "canvas_quiz_created_for_export",
-        quiz_id=str(quiz_id),
-        canvas_quiz_id=canvas_quiz["id"],
-    )
+        logger.info(
+            "canvas_export_workflow_started",
+            quiz_id=str(quiz_id),
+            total_questions=total_questions,
+            total_points=total_points,
+            course_id=export_data["course_id"],
+        )
 
-    # Export questions using injected function
-    exported_items = await question_exporter(
-        canvas_token,
-        export_data["course_id"],
-        canvas_quiz["id"],
-        export_data["questions"],
-        session,
-    )
+        # Create Canvas quiz using injected function
+        canvas_quiz = await quiz_creator(
+            await resolve_canvas_token(canvas_token),
+            export_data["course_id"],
+            export_data["title"],
+            total_points,
+        )
+        canvas_quiz_id = canvas_quiz["id"]
 
-    # Analyze export results - ALL questions must succeed
-    successful_exports = len([r for r in exported_items if r.get("success")])
+        logger.info(
+            "canvas_quiz_created_for_export",
+            quiz_id=str(quiz_id),
+            canvas_quiz_id=canvas_quiz_id,
+        )
+
+        # Checkpoint the Canvas quiz so a failed export resumes into it
+        if checkpoint:
+            await checkpoint(str(canvas_quiz_id), [], [])
+
+    # Export questions in chunks, checkpointing Canvas item IDs after each
+    exported_items: list[dict[str, Any]] = []
+    for start in range(0, len(pending_questions), EXPORT_CHECKPOINT_SIZE):
+        chunk = pending_questions[start : start + EXPORT_CHECKPOINT_SIZE]
+        # Resolved per chunk so a long export never runs on an expired token
+        chunk_items = await question_exporter(
+            await resolve_canvas_token(canvas_token),
+            export_data["course_id"],
+            canvas_quiz_id,
+            chunk,
+            session,
+        )
+        exported_items.extend(chunk_items)
+
+        if checkpoint:
+            await checkpoint(str(canvas_quiz_id), chunk, chunk_items)
+
+    # Analyze export results - ALL questions must end up in Canvas
+    previously_exported = total_questions - len(pending_questions)
+    successful_exports = previously_exported + len(
+        [r for r in exported_items if r.get("success")]
+    )
     failed_exports = total_questions - successful_exports
 
     logger.info(
         "canvas_export_results_analyzed",
         quiz_id=str(quiz_id),
-        canvas_quiz_id=canvas_quiz["id"],
+        canvas_quiz_id=canvas_quiz_id,
         total_questions=total_questions,
+        previously_exported=previously_exported,
         successful_exports=successful_exports,
         failed_exports=failed_exports,
     )
 
-    # All-or-nothing: Either all questions succeed or we rollback
     if successful_exports == total_questions:
         # Complete success - all questions exported
         logger.info(
             "canvas_export_complete_success",
             quiz_id=str(quiz_id),
-            canvas_quiz_id=canvas_quiz["id"],
+            canvas_quiz_id=canvas_quiz_id,
             message="All questions exported successfully",
         )
 
         return {
             "success": True,
-            "canvas_quiz_id": canvas_quiz["id"],
+            "canvas_quiz_id": canvas_quiz_id,
             "exported_questions": successful_exports,
             "total_questions": total_questions,
-            "should_rollback": False,
+            "resumable": False,
             "message": "Quiz successfully exported to Canvas",
             "exported_items": exported_items,
         }
     else:
-        # Any failure - rollback the entire quiz
+        # Keep the Canvas quiz and exported items so a retry can resume
         logger.error(
-            "canvas_export_failure_rollback_needed",
+            "canvas_export_incomplete_resumable",
             quiz_id=str(quiz_id),
-            canvas_quiz_id=canvas_quiz["id"],
+            canvas_quiz_id=canvas_quiz_id,
             successful_exports=successful_exports,
             failed_exports=failed_exports,
             message=f"Export failed: {failed_exports} out of {total_questions} questions failed to export",
@@ -116,19 +163,20 @@ async def _execute_export_workflow(
 
         return {
             "success": False,
-            "canvas_quiz_id": canvas_quiz["id"],
+            "canvas_quiz_id": canvas_quiz_id,
             "exported_questions": successful_exports,
             "total_questions": total_questions,
-            "should_rollback": True,
-            "message": f"Export failed: {failed_exports} out of {total_questions} questions failed to export. Quiz will be removed from Canvas.",
+            "resumable": True,
+            "message": f"Export failed: {failed_exports} out of {total_questions} questions failed to export. Retrying the export will resume from where it stopped.",
             "exported_items": exported_items,
         }
 
 
 @timeout_operation(OPERATION_TIMEOUTS["canvas_export"])
+@profile_operation("canvas_export")
 async def orchestrate_quiz_export_to_canvas(
     quiz_id: UUID,
-    canvas_token: str,
+    canvas_token: CanvasTokenSource,
     quiz_creator: QuizCreatorFunc,
     question_exporter: QuestionExporterFunc,
 ) -> dict[str, Any]:
@@ -140,7 +188,7 @@ async def orchestrate_quiz_export_to_canvas(
 
     Args:
         quiz_id: UUID of the quiz to export
-        canvas_token: Canvas API authentication token
+        canvas_token: Canvas API token, or a provider refreshing it as needed
         quiz_creator: Function to create quiz in Canvas
         question_exporter: Function to export questions to Canvas
 
@@ -194,6 +242,36 @@ async def orchestrate_quiz_export_to_canvas(
         }
 
     # === Canvas Operations (outside transaction) ===
+    async def _save_export_checkpoint(
+        session: Any,
+        canvas_quiz_id: str,
+        questions: list[dict[str, Any]],
+        exported_items: list[dict[str, Any]],
+    ) -> None:
+        """Persist export progress so a failed export can resume."""
+        from src.question import service as question_service
+
+        from ..service import save_canvas_export_checkpoint
+
+        await save_canvas_export_checkpoint(session, quiz_id, canvas_quiz_id)
+        await question_service.update_question_canvas_ids(
+            session, questions, exported_items
+        )
+
+    async def _checkpoint(
+        canvas_quiz_id: str,
+        questions: list[dict[str, Any]],
+        exported_items: list[dict[str, Any]],
+    ) -> None:
+        await execute_in_transaction(
+            _save_export_checkpoint,
+            canvas_quiz_id,
+            questions,
+            exported_items,
+            isolation_level="REPEATABLE READ",
+            retries=3,
+        )
+
     # Create session for question unapproval during Canvas operations
     from src.database import get_async_session
 
@@ -206,9 +284,9 @@ async def orchestrate_quiz_export_to_canvas(
                 question_exporter,
                 export_data,
                 session,
+                checkpoint=_checkpoint,
             )
         canvas_quiz_id = workflow_result["canvas_quiz_id"]
-        exported_items = workflow_result["exported_items"]
         export_success = workflow_result["success"]
 
         # === Handle Export Results ===
@@ -218,10 +296,9 @@ async def orchestrate_quiz_export_to_canvas(
                 session: Any, quiz_id: UUID
             ) -> dict[str, Any]:
                 """Save the successful export results to the quiz."""
-                from src.question import service as question_service
-
                 from ..service import update_quiz_status
 
+                # Question Canvas IDs were already saved per exported chunk
                 await update_quiz_status(
                     session,
                     quiz_id,
@@ -229,11 +306,6 @@ async def orchestrate_quiz_export_to_canvas(
                     canvas_quiz_id=canvas_quiz_id,
                 )
 
-                # Update individual question Canvas IDs
-                await question_service.update_question_canvas_ids(
-                    session, export_data["questions"], exported_items
-                )
-
                 return {
                     "success": True,
                     "canvas_quiz_id": canvas_quiz_id,
@@ -258,58 +330,36 @@ async def orchestrate_quiz_export_to_canvas(
             return result
 
         else:
-            # === Failure: Rollback Canvas Quiz ===
+            # === Failure: Keep Canvas Quiz For Resume ===
             logger.warning(
-                "quiz_export_initiating_rollback",
+                "quiz_export_checkpoint_kept",
                 quiz_id=str(quiz_id),
                 canvas_quiz_id=canvas_quiz_id,
-                message="Export failed, rolling back Canvas quiz",
+                exported_questions=workflow_result["exported_questions"],
+                total_questions=workflow_result["total_questions"],
+                message="Export failed, Canvas quiz kept for resume",
             )
 
-            try:
-                from src.canvas.service import delete_canvas_quiz
-
-                rollback_success = await delete_canvas_quiz(
-                    canvas_token, export_data["course_id"], canvas_quiz_id
-                )
-
-                if rollback_success:
-                    logger.info(
-                        "quiz_export_rollback_completed",
-                        quiz_id=str(quiz_id),
-                        canvas_quiz_id=canvas_quiz_id,
-                        message="Canvas quiz deleted after export failure",
-                    )
-                else:
-                    logger.warning(
-                        "quiz_export_rollback_failed",
-                        quiz_id=str(quiz_id),
-                        canvas_quiz_id=canvas_quiz_id,
-                        message="Failed to delete Canvas quiz during rollback",
-                    )
-            except Exception as rollback_error:
-                logger.error(
-                    "quiz_export_rollback_error",
-                    quiz_id=str(quiz_id),
-                    canvas_quiz_id=canvas_quiz_id,
-                    error=str(rollback_error),
-                    message="Exception occurred during Canvas quiz rollback",
-                )
-                # Continue with failure handling even if rollback failed
-
             # Raise specific Canvas export exception to trigger failure handling
             from src.canvas.exceptions import CanvasQuizExportError
 
             raise CanvasQuizExportError(workflow_result["message"])
 
     except Exception as e:
+        # An open Canvas circuit is reported as an outage, not an export error
+        failure_reason = (
+            FailureReason.NETWORK_ERROR
+            if isinstance(e, CircuitOpenError)
+            else FailureReason.CANVAS_EXPORT_ERROR
+        )
+
         # === Transaction 3: Mark as Failed ===
         async def _mark_export_failed(session: Any, quiz_id: UUID) -> None:
             """Mark export as failed."""
             from ..service import update_quiz_status
 
             await update_quiz_status(
-                session, quiz_id, QuizStatus.FAILED, FailureReason.CANVAS_EXPORT_ERROR
+                session, quiz_id, QuizStatus.FAILED, failure_reason
             )
 
         try:
@@ -5,16 +5,20 @@ This module handles the module-based question generation workflow with batch tra
 and support for multiple question types per module.
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from src.config import get_logger
+from src.config import get_logger, settings
 from src.database import execute_in_transaction
 from src.question.types import QuestionDifficulty, QuestionType, QuizLanguage
+from src.question.workflows.scheduling import GenerationPriority, generation_priority
 
 from ..constants import OPERATION_TIMEOUTS
 from ..schemas import QuizStatus
-from .core import timeout_operation
+from .core import profile_operation, timeout_operation
+
+if TYPE_CHECKING:
+    from ..usage import GenerationReservation
 
 logger = get_logger("quiz_orchestrator_question_generation")
 
@@ -26,11 +30,15 @@ async def _execute_generation_workflow(
     _llm_temperature: float,
     language: QuizLanguage,
     generation_service: Any = None,
+    priority: GenerationPriority = GenerationPriority.FIRST_GENERATION,
+    reservation: "GenerationReservation | None" = None,
 ) -> tuple[str, str | None, Exception | None, dict[str, list[str]] | None]:
     """
     Execute the module-based question generation workflow with batch-level tracking.
 
     Now processes multiple question types per module based on quiz configuration.
+    The LLM requests are queued with the given priority class, admitted on the
+    run slots reserved when generation was requested, if any.
 
     Returns:
         Tuple of (final_status, error_message, failure_exception, batch_status)
@@ -74,16 +82,21 @@ async def _execute_generation_workflow(
             ),
         )
 
-        # Generate questions using module-based service with batch tracking
-        provider_name = "openai"  # Use default provider
-        (
-            batch_results,
-            batch_status,
-        ) = await generation_service.generate_questions_for_quiz_with_batch_tracking(
-            quiz_id=quiz_id,
-            extracted_content=extracted_content,
-            provider_name=provider_name,
-        )
+        # Generate questions using module-based service with batch tracking,
+        # admitted against the owner's and course's generation quotas
+        from ..usage import generation_admission
+
+        provider_name = settings.LLM_PROVIDER
+        async with generation_admission(quiz_id, "generation", reservation):
+            (
+                batch_results,
+                batch_status,
+            ) = await generation_service.generate_questions_for_quiz_with_batch_tracking(
+                quiz_id=quiz_id,
+                extracted_content=extracted_content,
+                provider_name=provider_name,
+                priority=priority,
+            )
 
         # Analyze batch-level results using the new batch structure
         # The generation service now handles batch tracking automatically
@@ -152,7 +165,16 @@ async def _execute_generation_workflow(
                 total_generated=total_generated,
                 failed_batches=len(current_failed_batches),
             )
-            return "failed", "No questions were generated from any module", None, None
+            # An open LLM circuit means the provider was down, so the failure
+            # is reported as such rather than as a generation error
+            from src.circuit_breaker import find_open_circuit
+
+            return (
+                "failed",
+                "No questions were generated from any module",
+                find_open_circuit("llm:"),
+                None,
+            )
 
         elif total_successful_batches >= total_expected_batches:
             # Complete success - all expected batches succeeded
@@ -187,8 +209,14 @@ async def _execute_generation_workflow(
         )
         return "failed", str(e), e, None
 
+    finally:
+        # Free the reserved slots if the run ended before it was admitted
+        if reservation:
+            await reservation.release()
+
 
 @timeout_operation(OPERATION_TIMEOUTS["question_generation"])
+@profile_operation("question_generation")
 async def orchestrate_quiz_question_generation(
     quiz_id: UUID,
     target_question_count: int,
@@ -196,6 +224,8 @@ async def orchestrate_quiz_question_generation(
     llm_temperature: float,
     language: QuizLanguage,
     generation_service: Any = None,
+    retry: bool = False,
+    reservation: "GenerationReservation | None" = None,
 ) -> None:
     """
     Orchestrate the complete question generation workflow for a quiz.
@@ -210,7 +240,12 @@ async def orchestrate_quiz_question_generation(
         llm_temperature: Temperature setting for LLM
         language: Language for question generation
         generation_service: Optional injected generation service (creates default if None)
+        retry: Whether the run retries failed batches, which queues its LLM
+            requests behind first-time generations
+        reservation: Run slots reserved when generation was requested
     """
+    priority = generation_priority(target_question_count, retry=retry)
+
     logger.info(
         "quiz_question_generation_orchestration_started",
         quiz_id=str(quiz_id),
@@ -218,6 +253,7 @@ async def orchestrate_quiz_question_generation(
         llm_model=llm_model,
         llm_temperature=llm_temperature,
         language=language.value,
+        priority=priority.name.lower(),
     )
 
     # === Transaction 1: Reserve the Job ===
@@ -238,6 +274,8 @@ async def orchestrate_quiz_question_generation(
             quiz_id=str(quiz_id),
             reason="job_already_running_or_complete",
         )
+        if reservation:
+            await reservation.release()
         return
 
     # === Question Generation (outside transaction) ===
@@ -253,6 +291,8 @@ async def orchestrate_quiz_question_generation(
         llm_temperature,
         language,
         generation_service,
+        priority,
+        reservation,
     )
 
     # === Helper: Update Generation Metadata ===
@@ -342,6 +382,7 @@ async def orchestrate_quiz_question_generation(
 
 
 @timeout_operation(OPERATION_TIMEOUTS["question_generation"])
+@profile_operation("single_batch_regeneration")
 async def orchestrate_single_batch_regeneration(
     quiz_id: UUID,
     module_id: str,
@@ -355,6 +396,7 @@ async def orchestrate_single_batch_regeneration(
     language: QuizLanguage,
     tone: str | None = None,
     custom_instructions: str | None = None,
+    reservation: "GenerationReservation | None" = None,
 ) -> None:
     """
     Orchestrate regeneration of a single batch of questions.
@@ -375,6 +417,7 @@ async def orchestrate_single_batch_regeneration(
         language: Language for question generation
         tone: Optional tone of voice for generation
         custom_instructions: Optional custom instructions for the LLM
+        reservation: Run slots reserved when regeneration was requested
     """
     batch_key = f"{module_id}_{question_type.value}_{count}_{difficulty.value}"
 
@@ -395,32 +438,39 @@ async def orchestrate_single_batch_regeneration(
         from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
 
         provider_registry = get_llm_provider_registry()
-        # Note: LLMProvider.OPENAI is used for both regular OpenAI and Azure OpenAI.
-        # The actual backend (Azure vs OpenAI) is determined by environment config
-        # (AZURE_OPENAI_API_KEY). The llm_model parameter stores the model name only.
-        provider_enum = LLMProvider("openai")
-        provider = provider_registry.get_provider(provider_enum)
+        # Same deployment pool as quiz generation, with its failover and
+        # circuit breakers. The llm_model parameter stores the model name only.
+        provider_enum = LLMProvider(settings.LLM_PROVIDER.lower())
+        provider = provider_registry.get_provider_pool(provider_enum)
         template_manager = get_template_manager()
 
-        # Create workflow for this batch
+        # Create workflow for this batch; a teacher is waiting on it, so its
+        # LLM requests go ahead of quiz generations
         workflow = ModuleBatchWorkflow(
             llm_provider=provider,
             template_manager=template_manager,
             language=language,
             tone=tone,
             custom_instructions=custom_instructions,
+            priority=GenerationPriority.INTERACTIVE,
         )
 
-        # Process the single batch
-        questions = await workflow.process_module(
-            module_id=module_id,
-            module_name=module_name,
-            module_content=module_content,
-            quiz_id=quiz_id,
-            question_count=count,
-            question_type=question_type,
-            difficulty=difficulty,
-        )
+        # Process the single batch within the generation quotas
+        from ..usage import generation_admission
+
+        async with generation_admission(
+            quiz_id, "single_batch_regeneration", reservation
+        ):
+            questions = await workflow.process_module(
+                module_id=module_id,
+                module_name=module_name,
+                module_content=module_content,
+                quiz_id=quiz_id,
+                question_count=count,
+                question_type=question_type,
+                difficulty=difficulty,
+                batch_key=batch_key,
+            )
 
         # Determine success based on question count
         success = len(questions) >= count
@@ -501,3 +551,8 @@ async def orchestrate_single_batch_regeneration(
             exc_info=True,
         )
         raise
+
+    finally:
+        # Free the reserved slots if the run ended before it was admitted
+        if reservation:
+            await reservation.release()
@@ -1,12 +1,22 @@
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
 
 from src.auth.dependencies import CurrentUser
-from src.canvas.dependencies import CanvasToken
+from src.canvas.dependencies import CanvasTokenProviderDep
 from src.config import get_logger
 from src.database import SessionDep
 from src.exceptions import ServiceError
+from src.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 from .constants import ERROR_MESSAGES, SUCCESS_MESSAGES
 from .dependencies import (
@@ -19,7 +29,8 @@ from .dependencies import (
     validate_quiz_has_approved_questions,
     validate_single_batch_regeneration_ready,
 )
-from .manual import create_manual_module
+from .exceptions import GenerationQuotaExceededError
+from .manual import create_manual_module, stage_manual_module
 from .models import Quiz
 from .orchestrator import (
     orchestrate_content_extraction,
@@ -32,18 +43,20 @@ from .schemas import (
     ManualModuleCreate,
     ManualModuleResponse,
     QuizCreate,
+    QuizListItem,
     QuizUpdate,
     RegenerateBatchRequest,
 )
 from .service import (
     create_quiz,
     delete_quiz,
-    get_user_quizzes,
+    get_user_quiz_listing,
     prepare_content_extraction,
     prepare_question_generation,
     prepare_single_batch_generation,
     update_quiz,
 )
+from .usage import reserve_generation_quota
 
 router = APIRouter(prefix="/quiz", tags=["quiz"])
 logger = get_logger("quiz")
@@ -54,7 +67,7 @@ async def create_new_quiz(
     quiz_data: QuizCreate,
     current_user: CurrentUser,
     session: SessionDep,
-    canvas_token: CanvasToken,
+    canvas_token_provider: CanvasTokenProviderDep,
     background_tasks: BackgroundTasks,
 ) -> Quiz:
     """
@@ -130,7 +143,7 @@ async def create_new_quiz(
             quiz.id,
             quiz.id,
             quiz_data.canvas_course_id,
-            canvas_token,
+            canvas_token_provider,
             extract_content_for_modules,  # Inject Canvas content extractor
             get_content_summary,  # Inject content summarizer
         )
@@ -144,6 +157,9 @@ async def create_new_quiz(
 
         return quiz
 
+    except ServiceError:
+        # Service errors are automatically handled by global handlers
+        raise
     except Exception as e:
         logger.error(
             "quiz_creation_failed",
@@ -159,6 +175,7 @@ async def create_new_quiz(
 @router.post("/manual-modules/upload", response_model=ManualModuleResponse)
 async def upload_manual_module(
     current_user: CurrentUser,
+    session: SessionDep,
     name: str = Form(..., description="Module name"),
     text_content: str | None = Form(None, description="Direct text content"),
     file: UploadFile | None = File(None, description="Single PDF file upload (legacy)"),
@@ -171,6 +188,10 @@ async def upload_manual_module(
     a manual module. The content is immediately processed and a preview is returned.
     Multiple files are concatenated into a single content block.
 
+    The processed content is staged server-side for MANUAL_MODULE_STAGING_TTL_HOURS,
+    so quiz creation only needs to reference the returned module_id and can omit
+    the module's content fields.
+
     **Parameters:**
         name (str): Name for the manual module
         text_content (str, optional): Direct text content for the module
@@ -225,7 +246,9 @@ async def upload_manual_module(
         module_data = ManualModuleCreate(name=name, text_content=text_content)
 
         # Process the manual module with single or multiple files
-        result = await create_manual_module(module_data, file, files)
+        result, processed_content = await create_manual_module(module_data, file, files)
+        # The full content stays server-side; the client only gets a preview
+        stage_manual_module(session, current_user.id, result, processed_content)
 
         logger.info(
             "manual_module_upload_completed",
@@ -373,19 +396,32 @@ def update_quiz_endpoint(
         )
 
 
-@router.get("/", response_model=list[Quiz])
+@router.get("/", response_model=list[QuizListItem])
 def get_user_quizzes_endpoint(
     current_user: CurrentUser,
     session: SessionDep,
-) -> list[Quiz]:
+    response: Response,
+    limit: int | None = Query(
+        None, ge=1, le=100, description="Maximum quizzes to return"
+    ),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from the X-Next-Cursor header"
+    ),
+) -> list[QuizListItem]:
     """
-    Retrieve all quizzes created by the authenticated user.
+    Retrieve quizzes owned by or shared with the authenticated user.
+
+    Returns quizzes ordered by creation date (most recent first). Each quiz
+    includes full details plus an `is_owner` flag distinguishing owned from
+    shared quizzes. When `limit` is given and more quizzes exist, the
+    X-Next-Cursor response header holds the cursor for the next page.
 
-    Returns a list of all quizzes owned by the current user, ordered by creation date
-    (most recent first). Each quiz includes full details including settings and metadata.
+    **Parameters:**
+        limit: Maximum number of quizzes to return (optional)
+        cursor: Keyset cursor for the next page (optional)
 
     **Returns:**
-        List[Quiz]: List of quiz objects owned by the user
+        List[QuizListItem]: List of quiz objects with ownership flag
 
     **Authentication:**
         Requires valid JWT token in Authorization header
@@ -414,7 +450,8 @@ def get_user_quizzes_endpoint(
                 "llm_model": "gpt-4o",
                 "llm_temperature": 1,
                 "created_at": "2023-01-01T12:00:00Z",
-                "updated_at": "2023-01-01T12:00:00Z"
+                "updated_at": "2023-01-01T12:00:00Z",
+                "is_owner": true
             }
         ]
         ```
@@ -425,7 +462,31 @@ def get_user_quizzes_endpoint(
     )
 
     try:
-        quizzes = get_user_quizzes(session, current_user.id)
+        after = decode_keyset_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    try:
+        # Fetch one extra row to know whether another page exists
+        listing = get_user_quiz_listing(
+            session,
+            current_user.id,
+            limit=limit + 1 if limit else None,
+            after=after,
+        )
+
+        if limit and len(listing) > limit:
+            listing = listing[:limit]
+            last_quiz = listing[-1][0]
+            if last_quiz.created_at is not None:
+                response.headers["X-Next-Cursor"] = encode_keyset_cursor(
+                    last_quiz.created_at, last_quiz.id
+                )
+
+        quizzes = [
+            QuizListItem.model_validate(quiz, update={"is_owner": is_owner})
+            for quiz, is_owner in listing
+        ]
 
         logger.info(
             "user_quizzes_retrieval_completed",
@@ -454,7 +515,7 @@ async def trigger_content_extraction(
     quiz: QuizAccessWithLock,
     current_user: CurrentUser,
     session: SessionDep,
-    canvas_token: CanvasToken,
+    canvas_token_provider: CanvasTokenProviderDep,
     background_tasks: BackgroundTasks,
 ) -> dict[str, str]:
     """
@@ -503,7 +564,7 @@ async def trigger_content_extraction(
             quiz.id,
             quiz.id,
             extraction_params["course_id"],
-            canvas_token,
+            canvas_token_provider,
             extract_content_for_modules,  # Inject Canvas content extractor
             get_content_summary,  # Inject content summarizer
         )
@@ -657,6 +718,7 @@ async def trigger_question_generation(
         HTTPException: 404 if quiz not found or user doesn't own it
         HTTPException: 400 if content extraction not completed
         HTTPException: 409 if question generation already in progress
+        HTTPException: 429 if the owner or course is out of generation quota
         HTTPException: 500 if unable to trigger generation
     """
     logger.info(
@@ -669,10 +731,18 @@ async def trigger_question_generation(
         # Validate quiz status and determine generation type
         generation_type = validate_question_generation_ready_with_partial_support(quiz)
 
+        # Refuse the generation before it is marked as started, and hold its
+        # run slots until the background run is admitted
+        reservation = reserve_generation_quota(session, quiz)
+
         # Prepare generation using service layer
-        generation_params = prepare_question_generation(
-            session, quiz.id, current_user.id
-        )
+        try:
+            generation_params = prepare_question_generation(
+                session, quiz.id, current_user.id
+            )
+        except Exception:
+            await reservation.release()
+            raise
 
         # Trigger question generation in the background using safe orchestrator wrapper
         background_tasks.add_task(
@@ -685,6 +755,8 @@ async def trigger_question_generation(
             generation_params["llm_model"],
             generation_params["llm_temperature"],
             generation_params["language"],
+            retry=generation_type == "retry",
+            reservation=reservation,
         )
 
         logger.info(
@@ -717,6 +789,8 @@ async def trigger_question_generation(
             status_code = 409
 
         raise HTTPException(status_code=status_code, detail=str(e))
+    except GenerationQuotaExceededError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error(
             "manual_question_generation_failed",
@@ -761,6 +835,7 @@ async def regenerate_single_batch(
         HTTPException: 404 if quiz not found or user doesn't have access
         HTTPException: 400 if batch specification is invalid
         HTTPException: 409 if quiz not in valid state for regeneration
+        HTTPException: 429 if the owner or course is out of generation quota
     """
     logger.info(
         "single_batch_regeneration_triggered",
@@ -776,10 +851,16 @@ async def regenerate_single_batch(
         # Validate quiz state and batch specification
         validate_single_batch_regeneration_ready(quiz, batch_request)
 
+        reservation = reserve_generation_quota(session, quiz)
+
         # Prepare generation parameters
-        generation_params = prepare_single_batch_generation(
-            session, quiz.id, current_user.id, batch_request
-        )
+        try:
+            generation_params = prepare_single_batch_generation(
+                session, quiz.id, current_user.id, batch_request
+            )
+        except Exception:
+            await reservation.release()
+            raise
 
         # Trigger single batch regeneration in the background
         background_tasks.add_task(
@@ -799,6 +880,7 @@ async def regenerate_single_batch(
             generation_params["language"],
             generation_params["tone"],
             generation_params["custom_instructions"],
+            reservation=reservation,
         )
 
         logger.info(
@@ -820,6 +902,8 @@ async def regenerate_single_batch(
             error=str(e),
         )
         raise HTTPException(status_code=400, detail=str(e))
+    except GenerationQuotaExceededError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error(
             "single_batch_regeneration_failed",
@@ -903,7 +987,7 @@ async def export_quiz_to_canvas(
     quiz: QuizOwnership,
     current_user: CurrentUser,
     session: SessionDep,
-    canvas_token: CanvasToken,
+    canvas_token_provider: CanvasTokenProviderDep,
     background_tasks: BackgroundTasks,
 ) -> dict[str, str]:
     """
@@ -965,7 +1049,7 @@ async def export_quiz_to_canvas(
             "canvas_export",
             quiz.id,
             quiz.id,
-            canvas_token,
+            canvas_token_provider,
             create_canvas_quiz_flow,  # Inject Canvas quiz creator
             export_questions_batch_flow,  # Inject question exporter
         )
@@ -64,9 +64,11 @@ class ModuleSelection(SQLModel):
     source_type: str = Field(
         default="canvas", description="Module source: 'canvas' or 'manual'"
     )
-    # Optional fields for manual modules (populated when source_type is 'manual')
+    # Optional fields for manual modules (populated when source_type is 'manual').
+    # When content is omitted, the content staged at upload time is used.
     content: str | None = Field(
-        default=None, description="Full content for manual modules"
+        default=None,
+        description="Full content for manual modules (omit to use staged upload)",
     )
     word_count: int | None = Field(
         default=None, description="Word count for manual modules"
@@ -105,7 +107,6 @@ class ManualModuleResponse(SQLModel):
     module_id: str = Field(description="Generated manual module ID")
     name: str = Field(description="Module name")
     content_preview: str = Field(description="Preview of processed content")
-    full_content: str = Field(description="Full processed content")
     word_count: int = Field(description="Word count of processed content")
     processing_metadata: dict[str, Any] = Field(
         default_factory=dict, description="Processing details"
@@ -164,8 +165,12 @@ class QuizCreate(SQLModel):
                         f"Manual module {module_id} must have 'manual_' prefix"
                     )
 
-                # Manual modules must have content fields
-                if module_selection.source_type == "manual":
+                # Inline manual content must be complete; omitted content is
+                # resolved from the upload staging table on quiz creation
+                if (
+                    module_selection.source_type == "manual"
+                    and module_selection.content is not None
+                ):
                     if not module_selection.content:
                         raise ValueError(f"Manual module {module_id} must have content")
                     if (
@@ -233,6 +238,12 @@ class QuizPublic(SQLModel):
     module_question_distribution: dict[str, int] = Field(default_factory=dict)
 
 
+class QuizListItem(QuizPublic):
+    """Quiz entry in the user's quiz list, flagged as owned or shared."""
+
+    is_owner: bool
+
+
 class QuizStatusUpdate(SQLModel):
     """Schema for updating quiz status."""
 
@@ -310,3 +321,61 @@ class RegenerateBatchRequest(SQLModel):
         ge=1, le=20, description="Number of questions to generate (1-20)"
     )
     difficulty: QuestionDifficulty = Field(description="Difficulty level for questions")
+
+
+class GenerationUsageTotal(SQLModel):
+    """LLM tokens used by one user, course prefix or quiz within a window."""
+
+    key: str | None = Field(description="User ID, course prefix or quiz ID")
+    label: str | None = Field(default=None, description="User name or quiz title")
+    total_tokens: int
+    runs: int = Field(description="Generation runs that used tokens")
+
+
+class GenerationUsageSummary(SQLModel):
+    """LLM usage and quotas across users, for administrators."""
+
+    window_hours: int
+    user_token_quota: int | None
+    course_prefix_token_quota: int | None
+    total_tokens: int
+    by_user: list[GenerationUsageTotal]
+    by_course_prefix: list[GenerationUsageTotal]
+    top_quizzes: list[GenerationUsageTotal]
+    active_runs: dict[str, int] = Field(
+        description="Generation runs in progress across all workers, by quota scope"
+    )
+
+
+class LLMCostBreakdown(SQLModel):
+    """LLM calls, tokens and cost of one quiz or question type within a window."""
+
+    key: str = Field(description="Quiz ID, or question type and language")
+    label: str | None = Field(default=None, description="Quiz title")
+    calls: int
+    corrective_calls: int = Field(
+        description="Retries and JSON or validation corrections"
+    )
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    mean_latency: float = Field(description="Mean response time in seconds")
+    cost: float | None = Field(
+        description="USD from LLM_TOKEN_PRICES, None if a model has no price"
+    )
+    approved_questions: int
+    tokens_per_approved_question: float | None
+
+
+class LLMCostReport(SQLModel):
+    """Cost of question generation from the LLM usage ledger."""
+
+    window_hours: int
+    calls: int
+    total_tokens: int
+    cost: float | None
+    by_quiz: list[LLMCostBreakdown]
+    by_question_type: list[LLMCostBreakdown]
+    ledger: dict[str, int] = Field(
+        description="Calls buffered, written and dropped by this process"
+    )
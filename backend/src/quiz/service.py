@@ -4,13 +4,22 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Integer, cast, delete, func
+from sqlalchemy import Integer, cast, delete, func, literal, tuple_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import Session, select
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, select
 
 from src.config import get_logger
+from src.exceptions import ValidationError
 
-from .models import Quiz
+from .content_store import (
+    add_quiz_content_pages,
+    get_quiz_module_pages,
+    iter_quiz_content_modules,
+    replace_quiz_content_pages,
+)
+from .manual import get_staged_manual_module, manual_module_page
+from .models import ManualModuleStaging, Quiz
 from .schemas import (
     FailureReason,
     QuizCreate,
@@ -49,6 +58,8 @@ def create_quiz(session: Session, quiz_create: QuizCreate, owner_id: UUID) -> Qu
 
     # Convert ModuleSelection objects to dict for storage
     selected_modules: dict[str, dict[str, Any]] = {}
+    consumed_staging: list[ManualModuleStaging] = []
+    manual_pages: dict[str, list[dict[str, Any]]] = {}
     for module_id, module_selection in quiz_create.selected_modules.items():
         # ModuleSelection object - convert with proper batch structure
         module_dict = module_selection.model_dump()
@@ -78,16 +89,30 @@ def create_quiz(session: Session, quiz_create: QuizCreate, owner_id: UUID) -> Qu
             "source_type": module_dict.get("source_type", "canvas"),
         }
 
-        # For manual modules, preserve content fields if they exist
+        # Manual module text is stored as the module's content page, which
+        # content extraction reads back, rather than in selected_modules
         if module_dict.get("source_type") == "manual":
-            module_data.update(
-                {
-                    "content": module_dict.get("content", ""),
-                    "word_count": module_dict.get("word_count", 0),
-                    "processing_metadata": module_dict.get("processing_metadata", {}),
-                    "content_type": module_dict.get("content_type", "text"),
-                }
-            )
+            if module_dict.get("content") is None:
+                # Content was staged at upload time; the client only sends the ID
+                staged = get_staged_manual_module(session, str(module_id), owner_id)
+                if staged is None:
+                    raise ValidationError(
+                        f"Uploaded content for manual module {module_id} has "
+                        "expired or was not found. Please upload it again."
+                    )
+                module_dict.update(
+                    {
+                        "content": staged.content,
+                        "word_count": staged.word_count,
+                        "processing_metadata": staged.processing_metadata,
+                        "content_type": staged.content_type,
+                    }
+                )
+                consumed_staging.append(staged)
+
+            manual_pages[str(module_id)] = [
+                manual_module_page(module_dict, module_dict["content"])
+            ]
 
         selected_modules[str(module_id)] = module_data
 
@@ -111,6 +136,12 @@ def create_quiz(session: Session, quiz_create: QuizCreate, owner_id: UUID) -> Qu
     )
 
     session.add(quiz)
+    if manual_pages:
+        session.flush()
+        add_quiz_content_pages(session, quiz.id, manual_pages)
+    # Staged manual content now lives in the quiz, so drop it in the same commit
+    for staged in consumed_staging:
+        session.delete(staged)
     session.commit()
     session.refresh(quiz)
 
@@ -146,6 +177,71 @@ def get_quiz_by_id(
     return session.exec(statement).first()
 
 
+def get_user_quiz_listing(
+    session: Session,
+    user_id: UUID,
+    include_deleted: bool = False,
+    include_shared: bool = True,
+    limit: int | None = None,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[tuple[Quiz, bool]]:
+    """
+    Get a user's owned and shared quizzes in a single query, newest first.
+
+    Owned and shared quizzes are combined with UNION ALL and ordered by
+    (created_at, id) descending in SQL, so pages can be fetched with a keyset
+    cursor instead of loading every quiz.
+
+    Args:
+        session: Database session
+        user_id: User ID
+        include_deleted: Include soft-deleted quizzes in results
+        include_shared: Include quizzes shared with the user
+        limit: Maximum number of quizzes to return
+        after: Keyset cursor (created_at, id); only older quizzes are returned
+
+    Returns:
+        List of (quiz, is_owner) tuples sorted by created_at descending
+    """
+    from .models import QuizCollaborator
+
+    def _apply_common_filters(statement: Any) -> Any:
+        if not include_deleted:
+            statement = statement.where(Quiz.deleted == False)  # noqa: E712
+        if after is not None:
+            statement = statement.where(
+                tuple_(col(Quiz.created_at), col(Quiz.id))
+                < tuple_(*(literal(value) for value in after))
+            )
+        return statement
+
+    owned_stmt = _apply_common_filters(
+        select(Quiz, literal(True).label("is_owner")).where(Quiz.owner_id == user_id)
+    )
+
+    if include_shared:
+        shared_stmt = _apply_common_filters(
+            select(Quiz, literal(False).label("is_owner"))
+            .join(QuizCollaborator, Quiz.id == QuizCollaborator.quiz_id)  # type: ignore[arg-type]
+            .where(
+                QuizCollaborator.user_id == user_id,
+                col(Quiz.owner_id).is_distinct_from(user_id),
+            )
+        )
+        listing = union_all(owned_stmt, shared_stmt).subquery("user_quizzes")
+    else:
+        listing = owned_stmt.subquery("user_quizzes")
+
+    quiz_alias = aliased(Quiz, listing)
+    statement = select(quiz_alias, listing.c.is_owner).order_by(
+        listing.c.created_at.desc(), listing.c.id.desc()
+    )
+    if limit:
+        statement = statement.limit(limit)
+
+    return [(quiz, bool(is_owner)) for quiz, is_owner in session.exec(statement)]
+
+
 def get_user_quizzes(
     session: Session,
     user_id: UUID,
@@ -164,32 +260,13 @@ def get_user_quizzes(
     Returns:
         List of user's owned and shared quizzes, sorted by created_at descending
     """
-    from .models import QuizCollaborator
-
-    # Get owned quizzes
-    owned_stmt = select(Quiz).where(Quiz.owner_id == user_id)
-    if not include_deleted:
-        owned_stmt = owned_stmt.where(Quiz.deleted == False)  # noqa: E712
-    owned_quizzes = list(session.exec(owned_stmt).all())
-
-    if not include_shared:
-        owned_quizzes.sort(key=lambda q: q.created_at or datetime.min, reverse=True)
-        return owned_quizzes
-
-    # Get shared quizzes
-    shared_stmt = (
-        select(Quiz)
-        .join(QuizCollaborator, Quiz.id == QuizCollaborator.quiz_id)  # type: ignore[arg-type]
-        .where(QuizCollaborator.user_id == user_id)
+    listing = get_user_quiz_listing(
+        session,
+        user_id,
+        include_deleted=include_deleted,
+        include_shared=include_shared,
     )
-    if not include_deleted:
-        shared_stmt = shared_stmt.where(Quiz.deleted == False)  # noqa: E712
-    shared_quizzes = list(session.exec(shared_stmt).all())
-
-    # Combine and sort by created_at (most recent first)
-    all_quizzes = owned_quizzes + shared_quizzes
-    all_quizzes.sort(key=lambda q: q.created_at or datetime.min, reverse=True)
-    return all_quizzes
+    return [quiz for quiz, _ in listing]
 
 
 def delete_quiz(session: Session, quiz_id: UUID, user_id: UUID) -> bool:
@@ -310,13 +387,13 @@ async def get_content_from_quiz(
     Returns:
         Extracted content or None
     """
-    statement = select(Quiz.extracted_content).where(Quiz.id == quiz_id)
-    if not include_deleted:
-        statement = statement.where(Quiz.deleted == False)  # noqa: E712
-
-    result = await session.execute(statement)
-    content = result.scalar_one_or_none()
-    return content
+    content = {
+        module_id: pages
+        async for module_id, pages in iter_quiz_content_modules(
+            session, quiz_id, include_deleted=include_deleted
+        )
+    }
+    return content or None
 
 
 async def get_question_counts(
@@ -488,17 +565,22 @@ def prepare_single_batch_generation(
     source_type = module_data.get("source_type", "canvas")
 
     # Get module content based on source type
-    if source_type == "manual":
-        # For manual modules, content is stored directly in selected_modules
-        module_content = module_data.get("content", "")
+    if source_type == "manual" and module_data.get("content"):
+        # Older manual modules kept their content in selected_modules
+        module_content = module_data["content"]
         module_name = module_data.get(
             "name", f"Manual Module {batch_request.module_id}"
         )
     else:
-        # For canvas modules, get content from extracted_content
+        # Canvas and manual modules alike, get content from extracted_content
         # extracted_content stores pages as a list: {module_id: [{content: ...}, ...]}
-        extracted_content = quiz.extracted_content or {}
-        pages = extracted_content.get(batch_request.module_id, [])
+        if quiz.extracted_content is not None:
+            # Legacy quizzes keep extracted content in the JSONB column
+            pages = quiz.extracted_content.get(batch_request.module_id, [])
+        elif quiz.content_extracted_at is not None:
+            pages = get_quiz_module_pages(session, quiz_id, batch_request.module_id)
+        else:
+            pages = []
         if isinstance(pages, list):
             # Combine all pages from the module into a single content string
             module_content = _combine_module_pages_for_regeneration(pages)
@@ -693,6 +775,8 @@ async def reserve_quiz_job(
         quiz.last_status_update = datetime.now(timezone.utc)
         settings = {
             "already_exported": False,
+            # Set when an earlier attempt created the Canvas quiz; resume into it
+            "canvas_quiz_id": quiz.canvas_quiz_id,
             "course_id": quiz.canvas_course_id,
             "title": quiz.title,
         }
@@ -749,7 +833,11 @@ async def update_quiz_status(
 
     # Handle specific status transitions and additional fields
     if "extracted_content" in additional_fields:
-        quiz.extracted_content = additional_fields["extracted_content"]
+        # Pages go to the normalized content store; the legacy column is cleared
+        await replace_quiz_content_pages(
+            session, quiz_id, additional_fields["extracted_content"] or {}
+        )
+        quiz.extracted_content = None
         quiz.content_extracted_at = datetime.now(timezone.utc)
 
     if "selected_modules" in additional_fields:
@@ -768,6 +856,33 @@ async def update_quiz_status(
     )
 
 
+async def save_canvas_export_checkpoint(
+    session: AsyncSession, quiz_id: UUID, canvas_quiz_id: str
+) -> None:
+    """
+    Record the Canvas quiz an in-progress export is writing to.
+
+    The quiz stays in EXPORTING_TO_CANVAS; a failed export can then be
+    resumed into the same Canvas quiz instead of creating a new one.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+        canvas_quiz_id: ID of the Canvas quiz created for the export
+    """
+    quiz = await get_quiz_for_update(session, quiz_id)
+    if not quiz:
+        logger.error("quiz_not_found_during_export_checkpoint", quiz_id=str(quiz_id))
+        return
+
+    quiz.canvas_quiz_id = canvas_quiz_id
+    logger.debug(
+        "canvas_export_checkpoint_saved",
+        quiz_id=str(quiz_id),
+        canvas_quiz_id=canvas_quiz_id,
+    )
+
+
 async def set_quiz_failed(
     session: AsyncSession,
     quiz_id: UUID,
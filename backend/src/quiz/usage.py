@@ -0,0 +1,477 @@
+"""
+LLM usage accounting and fair-share quotas for question generation.
+
+Every generation run is admitted against token quotas over a sliding window
+and concurrency quotas, both per quiz owner and per Canvas course prefix
+(CANVAS_COURSE_PREFIX_FILTER). The tokens a run uses are persisted per quiz
+when it ends. Tokens of runs still in progress are not yet counted against
+the token quotas; the concurrency quotas bound that overshoot.
+
+Concurrency slots are generationrun rows, so the quotas hold across all API
+workers: a run counts the live runs of its scopes under a Postgres advisory
+lock per scope before inserting its row, and deletes the row when it ends.
+The row of a worker that stopped mid-run expires once the run would have
+timed out.
+
+Runs requested through the API reserve their concurrency slots when the
+request is accepted, so a burst of requests is refused with 429 up front
+rather than failing in the background.
+"""
+
+import hashlib
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, text
+from sqlmodel import Session, col, select
+
+from src.config import get_logger, settings
+
+from .constants import OPERATION_TIMEOUTS
+from .exceptions import GenerationQuotaExceededError
+from .models import GenerationRun, GenerationUsage, Quiz
+from .schemas import GenerationUsageSummary, GenerationUsageTotal
+from .usage_ledger import get_llm_usage_ledger
+
+logger = get_logger("generation_usage")
+
+# Largest number of quizzes listed in the usage summary
+TOP_QUIZZES_LIMIT = 20
+
+# Tokens used by quizzes with a run in progress
+_run_tokens: Counter[UUID] = Counter()
+# Runs in progress per quiz, so tokens are only counted for admitted runs
+_admitted_quizzes: Counter[UUID] = Counter()
+
+# Runs are cut off at the question generation timeout, so older slots were
+# left by a worker that stopped mid-run
+RUN_SLOT_EXPIRY = timedelta(seconds=OPERATION_TIMEOUTS["question_generation"] + 300)
+
+# Serializes the slot checks of one quota scope until the transaction ends
+_LOCK_SCOPE = text("SELECT pg_advisory_xact_lock(:key)")
+
+
+def course_prefix_for(course_name: str) -> str | None:
+    """Return the configured course prefix a course name starts with, if any."""
+    for prefix in settings.canvas_course_prefixes:
+        if course_name.startswith(prefix):
+            return prefix
+    return None
+
+
+def add_generation_tokens(quiz_id: UUID, tokens: int | None) -> None:
+    """Count the tokens of an LLM request made for a quiz's generation run."""
+    if tokens and quiz_id in _admitted_quizzes:
+        _run_tokens[quiz_id] += tokens
+
+
+def _window_start() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(
+        hours=settings.GENERATION_QUOTA_WINDOW_HOURS
+    )
+
+
+def _token_quota_checks(
+    owner_id: UUID | None, course_prefix: str | None
+) -> list[tuple[str, int, Any]]:
+    """Build (scope, quota, usage statement) for each enabled token quota."""
+    used: Any = select(func.coalesce(func.sum(GenerationUsage.total_tokens), 0)).where(
+        col(GenerationUsage.created_at) >= _window_start()
+    )
+    checks = []
+    if owner_id and settings.GENERATION_USER_TOKEN_QUOTA is not None:
+        checks.append(
+            (
+                f"user:{owner_id}",
+                settings.GENERATION_USER_TOKEN_QUOTA,
+                used.where(GenerationUsage.owner_id == owner_id),
+            )
+        )
+    if course_prefix and settings.GENERATION_COURSE_PREFIX_TOKEN_QUOTA is not None:
+        checks.append(
+            (
+                f"prefix:{course_prefix}",
+                settings.GENERATION_COURSE_PREFIX_TOKEN_QUOTA,
+                used.where(GenerationUsage.course_prefix == course_prefix),
+            )
+        )
+    return checks
+
+
+def _check_token_usage(scope: str, used: int, quota: int) -> None:
+    if used >= quota:
+        logger.warning(
+            "generation_token_quota_exceeded", scope=scope, used=used, quota=quota
+        )
+        raise GenerationQuotaExceededError(
+            f"{used} of {quota} tokens used in the last "
+            f"{settings.GENERATION_QUOTA_WINDOW_HOURS} hours",
+            scope,
+        )
+
+
+def _run_scopes(
+    owner_id: UUID | None, course_prefix: str | None
+) -> dict[str, tuple[int, Any]]:
+    """Concurrency quota scopes of a run, with their limits and run filters."""
+    scopes: dict[str, tuple[int, Any]] = {}
+    if owner_id:
+        scopes[f"user:{owner_id}"] = (
+            settings.GENERATION_USER_MAX_CONCURRENT,
+            GenerationRun.owner_id == owner_id,
+        )
+    if course_prefix:
+        scopes[f"prefix:{course_prefix}"] = (
+            settings.GENERATION_COURSE_PREFIX_MAX_CONCURRENT,
+            GenerationRun.course_prefix == course_prefix,
+        )
+    return scopes
+
+
+def _scope_lock_key(scope: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(scope.encode(), digest_size=8).digest(), "big", signed=True
+    )
+
+
+def _live_runs() -> Any:
+    expired_before = datetime.now(timezone.utc) - RUN_SLOT_EXPIRY
+    return col(GenerationRun.started_at) >= expired_before
+
+
+def _count_live_runs(condition: Any) -> Any:
+    return (
+        select(func.count()).select_from(GenerationRun).where(condition, _live_runs())
+    )
+
+
+def _check_concurrency(scope: str, limit: int, active: int) -> None:
+    if active >= limit:
+        logger.warning(
+            "generation_concurrency_quota_exceeded",
+            scope=scope,
+            active=active,
+            limit=limit,
+        )
+        raise GenerationQuotaExceededError(
+            f"{limit} generations already in progress", scope
+        )
+
+
+class GenerationReservation:
+    """
+    Concurrency slots of a run, held as its generationrun row.
+
+    Slots taken when the run was requested are taken over by the run's
+    admission; a run that ends before it is admitted must release them.
+    """
+
+    def __init__(self, run_id: UUID | None) -> None:
+        self.run_id = run_id
+        self.released = False
+
+    async def release(self) -> None:
+        """Give the slots back; later calls do nothing."""
+        if not self.released:
+            self.released = True
+            if self.run_id:
+                await _end_run(self.run_id)
+
+
+def reserve_generation_quota(session: Session, quiz: Quiz) -> GenerationReservation:
+    """
+    Check the quotas for a generation of the quiz and reserve its run slots.
+
+    Args:
+        session: Database session, committed to release the scope locks
+        quiz: Quiz to generate questions for
+
+    Returns:
+        Reservation to hand to the run's generation_admission
+
+    Raises:
+        GenerationQuotaExceededError: If the quiz owner or its course prefix
+            is out of token or concurrency quota
+    """
+    course_prefix = course_prefix_for(quiz.canvas_course_name)
+    for scope, quota, statement in _token_quota_checks(quiz.owner_id, course_prefix):
+        _check_token_usage(scope, session.exec(statement).one(), quota)
+    scopes = _run_scopes(quiz.owner_id, course_prefix)
+    if not scopes:
+        return GenerationReservation(None)
+
+    run = GenerationRun(
+        quiz_id=quiz.id, owner_id=quiz.owner_id, course_prefix=course_prefix
+    )
+    run_id = run.id
+    # Lock the scopes in a fixed order so runs sharing them cannot deadlock
+    for scope in sorted(scopes):
+        session.execute(_LOCK_SCOPE, {"key": _scope_lock_key(scope)})
+    try:
+        for scope, (limit, condition) in scopes.items():
+            _check_concurrency(
+                scope, limit, session.exec(_count_live_runs(condition)).one()
+            )
+    except GenerationQuotaExceededError:
+        # Ending the transaction releases the scope locks
+        session.commit()
+        raise
+    session.add(run)
+    session.commit()
+    return GenerationReservation(run_id)
+
+
+@asynccontextmanager
+async def generation_admission(
+    quiz_id: UUID,
+    operation: str,
+    reservation: GenerationReservation | None = None,
+) -> AsyncIterator[None]:
+    """
+    Admit a generation run against the quotas and record its token usage.
+
+    Args:
+        quiz_id: Quiz the run generates questions for
+        operation: Kind of run, stored with its usage
+        reservation: Slots reserved when the run was requested, in which case
+            the quotas were checked then
+
+    Raises:
+        GenerationQuotaExceededError: If the quiz owner or its course prefix
+            is out of token or concurrency quota
+    """
+    owner_id, course_prefix, usage = await _load_quota_usage(quiz_id)
+    if reservation is None or reservation.released:
+        for scope, used, quota in usage:
+            _check_token_usage(scope, used, quota)
+        reservation = await _start_run(quiz_id, owner_id, course_prefix)
+    _admitted_quizzes[quiz_id] += 1
+
+    try:
+        yield
+    finally:
+        await reservation.release()
+        _admitted_quizzes[quiz_id] -= 1
+        if _admitted_quizzes[quiz_id] <= 0:
+            del _admitted_quizzes[quiz_id]
+        tokens = _run_tokens.pop(quiz_id, 0)
+        if tokens:
+            await _record_usage(quiz_id, owner_id, course_prefix, operation, tokens)
+        # Write the run's calls to the LLM usage ledger as the run ends
+        await get_llm_usage_ledger().flush()
+
+
+async def _load_quota_usage(
+    quiz_id: UUID,
+) -> tuple[UUID | None, str | None, list[tuple[str, int, int]]]:
+    """Load the quiz's owner, course prefix and (scope, used, quota) tokens."""
+    from src.database import get_async_session
+
+    try:
+        async with get_async_session() as session:
+            quiz = await session.get(Quiz, quiz_id)
+            if not quiz:
+                return None, None, []
+            owner_id = quiz.owner_id
+            course_prefix = course_prefix_for(quiz.canvas_course_name)
+            usage = []
+            for scope, quota, statement in _token_quota_checks(owner_id, course_prefix):
+                used = (await session.execute(statement)).scalar_one()
+                usage.append((scope, used, quota))
+            return owner_id, course_prefix, usage
+    except Exception as e:
+        # Quotas share capacity fairly; a failed lookup must not block the
+        # generation, which then runs outside the quotas
+        logger.error(
+            "generation_quota_lookup_failed",
+            quiz_id=str(quiz_id),
+            error=str(e),
+            exc_info=True,
+        )
+        return None, None, []
+
+
+async def _start_run(
+    quiz_id: UUID, owner_id: UUID | None, course_prefix: str | None
+) -> GenerationReservation:
+    """Take the run slots of a run that was not reserved when requested."""
+    from src.database import get_async_session
+
+    scopes = _run_scopes(owner_id, course_prefix)
+    if not scopes:
+        return GenerationReservation(None)
+
+    run = GenerationRun(quiz_id=quiz_id, owner_id=owner_id, course_prefix=course_prefix)
+    run_id = run.id
+    try:
+        async with get_async_session() as session:
+            for scope in sorted(scopes):
+                await session.execute(_LOCK_SCOPE, {"key": _scope_lock_key(scope)})
+            for scope, (limit, condition) in scopes.items():
+                active = (
+                    await session.execute(_count_live_runs(condition))
+                ).scalar_one()
+                _check_concurrency(scope, limit, active)
+            session.add(run)
+    except GenerationQuotaExceededError:
+        raise
+    except Exception as e:
+        # As with the quota lookup, the run then goes ahead outside the quotas
+        logger.error(
+            "generation_run_start_failed",
+            quiz_id=str(quiz_id),
+            error=str(e),
+            exc_info=True,
+        )
+        return GenerationReservation(None)
+    return GenerationReservation(run_id)
+
+
+async def _end_run(run_id: UUID) -> None:
+    from src.database import get_async_session
+
+    try:
+        async with get_async_session() as session:
+            await session.execute(
+                delete(GenerationRun).where(col(GenerationRun.id) == run_id)
+            )
+    except Exception as e:
+        # The slot is freed once it expires
+        logger.error(
+            "generation_run_end_failed",
+            run_id=str(run_id),
+            error=str(e),
+            exc_info=True,
+        )
+
+
+async def _record_usage(
+    quiz_id: UUID,
+    owner_id: UUID | None,
+    course_prefix: str | None,
+    operation: str,
+    tokens: int,
+) -> None:
+    from src.database import get_async_session
+
+    try:
+        async with get_async_session() as session:
+            session.add(
+                GenerationUsage(
+                    quiz_id=quiz_id,
+                    owner_id=owner_id,
+                    course_prefix=course_prefix,
+                    operation=operation,
+                    total_tokens=tokens,
+                )
+            )
+        logger.info(
+            "generation_usage_recorded",
+            quiz_id=str(quiz_id),
+            course_prefix=course_prefix,
+            operation=operation,
+            total_tokens=tokens,
+        )
+    except Exception as e:
+        # Losing one run's accounting must not fail the generation
+        logger.error(
+            "generation_usage_record_failed",
+            quiz_id=str(quiz_id),
+            total_tokens=tokens,
+            error=str(e),
+            exc_info=True,
+        )
+
+
+def get_generation_usage_summary(
+    session: Session, window_hours: int | None = None
+) -> GenerationUsageSummary:
+    """
+    Summarize LLM usage per user, course prefix and quiz.
+
+    Args:
+        session: Database session
+        window_hours: Hours of usage to include, the quota window by default
+
+    Returns:
+        Usage totals, the configured quotas and the runs in progress
+    """
+    from src.auth.models import User
+
+    hours = window_hours or settings.GENERATION_QUOTA_WINDOW_HOURS
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    tokens: Any = func.sum(GenerationUsage.total_tokens).label("tokens")
+    runs = func.count().label("runs")
+    recent = col(GenerationUsage.created_at) >= since
+    live = _live_runs()
+
+    by_user = session.exec(
+        select(GenerationUsage.owner_id, User.name, tokens, runs)
+        .join(User, col(User.id) == GenerationUsage.owner_id, isouter=True)
+        .where(recent)
+        .group_by(col(GenerationUsage.owner_id), col(User.name))
+        .order_by(tokens.desc())
+    ).all()
+    by_prefix = session.exec(
+        select(GenerationUsage.course_prefix, tokens, runs)
+        .where(recent)
+        .group_by(col(GenerationUsage.course_prefix))
+        .order_by(tokens.desc())
+    ).all()
+    top_quizzes = session.exec(
+        select(GenerationUsage.quiz_id, Quiz.title, tokens, runs)
+        .join(Quiz, col(Quiz.id) == GenerationUsage.quiz_id)
+        .where(recent)
+        .group_by(col(GenerationUsage.quiz_id), col(Quiz.title))
+        .order_by(tokens.desc())
+        .limit(TOP_QUIZZES_LIMIT)
+    ).all()
+    runs_by_user = session.exec(
+        select(GenerationRun.owner_id, func.count())
+        .where(live, col(GenerationRun.owner_id).is_not(None))
+        .group_by(col(GenerationRun.owner_id))
+    ).all()
+    runs_by_prefix = session.exec(
+        select(GenerationRun.course_prefix, func.count())
+        .where(live, col(GenerationRun.course_prefix).is_not(None))
+        .group_by(col(GenerationRun.course_prefix))
+    ).all()
+
+    return GenerationUsageSummary(
+        window_hours=hours,
+        user_token_quota=settings.GENERATION_USER_TOKEN_QUOTA,
+        course_prefix_token_quota=settings.GENERATION_COURSE_PREFIX_TOKEN_QUOTA,
+        total_tokens=sum(prefix_tokens for _, prefix_tokens, _ in by_prefix),
+        by_user=[
+            GenerationUsageTotal(
+                key=str(owner_id) if owner_id else None,
+                label=name,
+                total_tokens=user_tokens,
+                runs=user_runs,
+            )
+            for owner_id, name, user_tokens, user_runs in by_user
+        ],
+        by_course_prefix=[
+            GenerationUsageTotal(
+                key=prefix, total_tokens=prefix_tokens, runs=prefix_runs
+            )
+            for prefix, prefix_tokens, prefix_runs in by_prefix
+        ],
+        top_quizzes=[
+            GenerationUsageTotal(
+                key=str(quiz_id),
+                label=title,
+                total_tokens=quiz_tokens,
+                runs=quiz_runs,
+            )
+            for quiz_id, title, quiz_tokens, quiz_runs in top_quizzes
+        ],
+        active_runs={
+            **{f"user:{owner_id}": count for owner_id, count in runs_by_user},
+            **{f"prefix:{prefix}": count for prefix, count in runs_by_prefix},
+        },
+    )
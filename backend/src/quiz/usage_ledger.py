@@ -0,0 +1,286 @@
+"""
+Append-only ledger of the LLM calls made for question generation.
+
+Each call is buffered in memory and written in batches, when the buffer
+reaches LLM_USAGE_LEDGER_FLUSH_SIZE and when a generation run ends, so
+generation never waits on the ledger. Reports built from the ledger show
+where tokens go: cost per quiz and per question type and template language,
+and tokens per approved question.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import case, func, insert
+from sqlmodel import Session, col, select
+
+from src.config import get_logger, settings
+
+from .models import LLMCallUsage, Quiz
+from .schemas import LLMCostBreakdown, LLMCostReport
+
+logger = get_logger("llm_usage_ledger")
+
+# Default window of the cost report, in hours
+DEFAULT_REPORT_HOURS = 24 * 7
+# Largest number of quizzes listed in the cost report
+TOP_QUIZZES_LIMIT = 50
+
+
+class LLMUsageLedger:
+    """
+    Buffers LLM call records and writes them to the ledger in batches.
+
+    Args:
+        flush_size: Buffered calls that trigger a write
+    """
+
+    def __init__(self, flush_size: int | None = None) -> None:
+        self.flush_size = flush_size or settings.LLM_USAGE_LEDGER_FLUSH_SIZE
+        self._buffer: list[dict[str, Any]] = []
+        self._flush_tasks: set[asyncio.Task[int]] = set()
+        self.written = 0
+        self.dropped = 0
+
+    def record(
+        self,
+        quiz_id: UUID,
+        question_type: str,
+        language: str,
+        model: str,
+        call_kind: str,
+        latency: float,
+        prompt_tokens: int | None = None,
+        completion_tokens: int | None = None,
+        total_tokens: int | None = None,
+        batch_key: str | None = None,
+        module_id: str | None = None,
+    ) -> None:
+        """Buffer one LLM call, scheduling a write once the buffer is full."""
+        self._buffer.append(
+            {
+                "quiz_id": quiz_id,
+                "batch_key": batch_key,
+                "module_id": module_id,
+                "question_type": question_type,
+                "language": language,
+                "model": model,
+                "call_kind": call_kind,
+                "prompt_tokens": prompt_tokens or 0,
+                "completion_tokens": completion_tokens or 0,
+                "total_tokens": total_tokens or 0,
+                "latency": latency,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+        if len(self._buffer) >= self.flush_size:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """
+        Write the buffered calls to the ledger.
+
+        Returns:
+            Number of calls written
+        """
+        if not self._buffer:
+            return 0
+        rows, self._buffer = self._buffer, []
+
+        from src.database import get_async_session
+
+        try:
+            async with get_async_session() as session:
+                await session.execute(insert(LLMCallUsage), rows)
+        except Exception as e:
+            # The ledger is for analysis; losing a batch must not fail generation
+            self.dropped += len(rows)
+            logger.error(
+                "llm_usage_ledger_write_failed",
+                calls=len(rows),
+                error=str(e),
+                exc_info=True,
+            )
+            return 0
+
+        self.written += len(rows)
+        logger.debug("llm_usage_ledger_written", calls=len(rows))
+        return len(rows)
+
+    def snapshot(self) -> dict[str, int]:
+        """Calls buffered, written and dropped, for monitoring."""
+        return {
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+
+_llm_usage_ledger = LLMUsageLedger()
+
+
+def get_llm_usage_ledger() -> LLMUsageLedger:
+    """Get the process-wide LLM usage ledger."""
+    return _llm_usage_ledger
+
+
+def _token_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float | None:
+    price = settings.LLM_TOKEN_PRICES.get(model)
+    if price is None:
+        return None
+    return (
+        prompt_tokens * price.get("prompt", 0.0)
+        + completion_tokens * price.get("completion", 0.0)
+    ) / 1_000_000
+
+
+class _Totals:
+    """Running totals of ledger rows for one breakdown entry."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.corrective_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.latency = 0.0
+        self.cost: float | None = 0.0
+        self.approved_questions = 0
+
+    def add(self, row: Any) -> None:
+        self.calls += row.calls
+        self.corrective_calls += row.corrective_calls
+        self.prompt_tokens += row.prompt_tokens
+        self.completion_tokens += row.completion_tokens
+        self.total_tokens += row.total_tokens
+        self.latency += row.latency
+        cost = _token_cost(row.model, row.prompt_tokens, row.completion_tokens)
+        self.cost = None if cost is None or self.cost is None else self.cost + cost
+
+    def breakdown(self, key: str, label: str | None = None) -> LLMCostBreakdown:
+        return LLMCostBreakdown(
+            key=key,
+            label=label,
+            calls=self.calls,
+            corrective_calls=self.corrective_calls,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_tokens=self.total_tokens,
+            mean_latency=self.latency / self.calls if self.calls else 0.0,
+            cost=self.cost,
+            approved_questions=self.approved_questions,
+            tokens_per_approved_question=(
+                self.total_tokens / self.approved_questions
+                if self.approved_questions
+                else None
+            ),
+        )
+
+
+def get_llm_cost_report(
+    session: Session, window_hours: int | None = None
+) -> LLMCostReport:
+    """
+    Report LLM cost per quiz and per question type from the usage ledger.
+
+    Approved questions are those of the reported quizzes, whenever they were
+    generated, so tokens per approved question is most meaningful for quizzes
+    generated within the window.
+
+    Args:
+        session: Database session
+        window_hours: Hours of LLM calls to include, a week by default
+
+    Returns:
+        Calls, tokens and cost per quiz and per question type and language
+    """
+    from src.question.models import Question, QuestionType
+
+    hours = window_hours or DEFAULT_REPORT_HOURS
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    group = (
+        col(LLMCallUsage.quiz_id),
+        col(LLMCallUsage.question_type),
+        col(LLMCallUsage.language),
+        col(LLMCallUsage.model),
+    )
+    # Wider than sqlmodel's typed select, so run through SQLAlchemy directly
+    rows = session.execute(
+        sa.select(
+            *group,
+            func.count().label("calls"),
+            func.sum(
+                case((col(LLMCallUsage.call_kind) != "initial", 1), else_=0)
+            ).label("corrective_calls"),
+            func.sum(LLMCallUsage.prompt_tokens).label("prompt_tokens"),
+            func.sum(LLMCallUsage.completion_tokens).label("completion_tokens"),
+            func.sum(LLMCallUsage.total_tokens).label("total_tokens"),
+            func.sum(LLMCallUsage.latency).label("latency"),
+        )
+        .where(col(LLMCallUsage.created_at) >= since)
+        .group_by(*group)
+    ).all()
+
+    by_quiz: dict[UUID, _Totals] = {}
+    by_type: dict[tuple[str, str], _Totals] = {}
+    overall = _Totals()
+    for row in rows:
+        by_quiz.setdefault(row.quiz_id, _Totals()).add(row)
+        by_type.setdefault((row.question_type, row.language), _Totals()).add(row)
+        overall.add(row)
+
+    titles: dict[UUID, str] = {}
+    if by_quiz:
+        titles = dict(
+            session.exec(
+                select(Quiz.id, Quiz.title).where(col(Quiz.id).in_(by_quiz.keys()))
+            ).all()
+        )
+        approved = session.exec(
+            select(Question.quiz_id, Question.question_type, func.count())
+            .where(
+                col(Question.quiz_id).in_(by_quiz.keys()),
+                col(Question.is_approved).is_(True),
+                col(Question.deleted).is_(False),
+            )
+            .group_by(col(Question.quiz_id), col(Question.question_type))
+        ).all()
+        languages = {row.quiz_id: row.language for row in rows}
+        for quiz_id, question_type, count in approved:
+            by_quiz[quiz_id].approved_questions += count
+            type_key = (QuestionType(question_type).value, languages[quiz_id])
+            if type_key in by_type:
+                by_type[type_key].approved_questions += count
+            overall.approved_questions += count
+
+    quizzes = sorted(
+        by_quiz.items(),
+        key=lambda item: item[1].total_tokens,
+        reverse=True,
+    )[:TOP_QUIZZES_LIMIT]
+    types = sorted(
+        by_type.items(),
+        key=lambda item: item[1].total_tokens,
+        reverse=True,
+    )
+
+    return LLMCostReport(
+        window_hours=hours,
+        calls=overall.calls,
+        total_tokens=overall.total_tokens,
+        cost=overall.cost,
+        by_quiz=[
+            totals.breakdown(str(quiz_id), titles.get(quiz_id))
+            for quiz_id, totals in quizzes
+        ],
+        by_question_type=[
+            totals.breakdown(f"{question_type}:{language}")
+            for (question_type, language), totals in types
+        ],
+        ledger=get_llm_usage_ledger().snapshot(),
+    )
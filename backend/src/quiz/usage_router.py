@@ -0,0 +1,68 @@
+"""Router for administrator views of LLM usage."""
+
+from fastapi import APIRouter, Query
+
+from src.auth.dependencies import AdminUser
+from src.config import get_logger
+from src.database import SessionDep
+
+from .schemas import GenerationUsageSummary, LLMCostReport
+from .usage import get_generation_usage_summary
+from .usage_ledger import get_llm_cost_report
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+logger = get_logger("generation_usage")
+
+
+@router.get("/llm-usage", response_model=GenerationUsageSummary)
+def get_llm_usage(
+    current_user: AdminUser,
+    session: SessionDep,
+    hours: int | None = Query(default=None, ge=1, le=24 * 90),
+) -> GenerationUsageSummary:
+    """
+    LLM token usage per user, course prefix and quiz.
+
+    **Parameters:**
+        hours: Hours of usage to include, the quota window by default
+
+    **Returns:**
+        GenerationUsageSummary: Usage totals, quotas and runs in progress
+
+    **Authentication:**
+        Requires an administrator, see ADMIN_CANVAS_IDS
+
+    **Raises:**
+        HTTPException: 403 if the user is not an administrator
+    """
+    logger.info("llm_usage_requested", user_id=str(current_user.id), window_hours=hours)
+    return get_generation_usage_summary(session, hours)
+
+
+@router.get("/llm-cost", response_model=LLMCostReport)
+def get_llm_cost(
+    current_user: AdminUser,
+    session: SessionDep,
+    hours: int | None = Query(default=None, ge=1, le=24 * 90),
+) -> LLMCostReport:
+    """
+    LLM calls, tokens and cost per quiz and per question type.
+
+    Built from the per-call usage ledger. Cost uses LLM_TOKEN_PRICES, and
+    tokens per approved question shows how much generation an accepted
+    question takes, including retries and corrections.
+
+    **Parameters:**
+        hours: Hours of LLM calls to include, a week by default
+
+    **Returns:**
+        LLMCostReport: Cost per quiz and per question type and language
+
+    **Authentication:**
+        Requires an administrator, see ADMIN_CANVAS_IDS
+
+    **Raises:**
+        HTTPException: 403 if the user is not an administrator
+    """
+    logger.info("llm_cost_requested", user_id=str(current_user.id), window_hours=hours)
+    return get_llm_cost_report(session, hours)
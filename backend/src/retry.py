@@ -7,6 +7,7 @@ import functools
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
 from src.config import get_logger
 
 logger = get_logger("retry")
@@ -19,6 +20,7 @@ def retry_on_failure(
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     max_delay: float = 60.0,
+    circuit_breaker: CircuitBreaker | None = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
     Decorator for adding retry logic to functions.
@@ -28,6 +30,8 @@ def retry_on_failure(
         initial_delay: Initial delay between retries (seconds)
         backoff_factor: Exponential backoff multiplier
         max_delay: Maximum delay between retries (seconds)
+        circuit_breaker: Breaker of the called dependency; every attempt goes
+            through it and an open breaker fails the call without retrying
     """
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
@@ -37,8 +41,19 @@ def retry_on_failure(
 
             for attempt in range(max_attempts):
                 try:
+                    if circuit_breaker is not None:
+                        return await circuit_breaker.call(func, *args, **kwargs)
                     return await func(*args, **kwargs)
 
+                except CircuitOpenError as e:
+                    logger.warning(
+                        "retry_skipped_circuit_open",
+                        function=func.__name__,
+                        dependency=e.dependency,
+                        retry_after=e.retry_after,
+                    )
+                    raise
+
                 except Exception as e:
                     last_exception = e
 
@@ -0,0 +1,126 @@
+"""Tests for Canvas token refresh and token providers."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+def _expire_tokens(session, user):
+    from src.auth.service import update_user_tokens
+
+    update_user_tokens(
+        session,
+        user=user,
+        access_token="old-token",
+        refresh_token="refresh-token",
+        expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+
+def _fake_refresh(calls: list[str]):
+    """Build a refresh_canvas_token stand-in that stores a new token."""
+    from src.auth.service import update_user_tokens
+
+    async def refresh(user, session):
+        calls.append(str(user.id))
+        await asyncio.sleep(0.05)
+        update_user_tokens(
+            session,
+            user=user,
+            access_token="new-token",
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+
+    return refresh
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_canvas_call(session, user):
+    """Test that concurrent requests for one user refresh the token once."""
+    from src.canvas.security import ensure_valid_canvas_token
+
+    _expire_tokens(session, user)
+    calls: list[str] = []
+
+    with patch(
+        "src.canvas.security.refresh_canvas_token",
+        AsyncMock(side_effect=_fake_refresh(calls)),
+    ):
+        tokens = await asyncio.gather(
+            *(ensure_valid_canvas_token(session, user) for _ in range(3))
+        )
+
+    assert tokens == ["new-token"] * 3
+    assert calls == [str(user.id)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_waits_for_another_worker(session, user):
+    """Test that a refresh done by another worker is reused, not repeated."""
+    from sqlalchemy import text
+
+    from src.auth.service import update_user_tokens
+    from src.canvas.security import refresh_canvas_token_if_needed
+    from tests.database import get_test_engine
+
+    _expire_tokens(session, user)
+    key = int.from_bytes(user.id.bytes[:8], "big", signed=True)
+
+    with get_test_engine().connect() as other_worker:
+        # The other worker holds the refresh lock while it calls Canvas
+        other_worker.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": key})
+
+        refresh = AsyncMock()
+        with patch("src.canvas.security.refresh_canvas_token", refresh):
+            task = asyncio.create_task(refresh_canvas_token_if_needed(session, user))
+            await asyncio.sleep(0.3)
+            assert not task.done()
+
+            # It saves the new token, then its commit releases the lock
+            update_user_tokens(
+                session,
+                user=user,
+                access_token="worker-token",
+                expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+            )
+            other_worker.commit()
+            token = await asyncio.wait_for(task, timeout=5)
+
+    assert token == "worker-token"
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_token_provider_refreshes_only_when_expiring(session, user):
+    """Test that background jobs get a refreshed token once theirs expires."""
+    from src.canvas.security import CanvasTokenProvider
+    from src.quiz.orchestrator.core import resolve_canvas_token
+
+    @contextmanager
+    def test_session():
+        yield session
+
+    valid = CanvasTokenProvider(
+        user.id, "fresh-token", datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    assert await resolve_canvas_token(valid) == "fresh-token"
+    assert await resolve_canvas_token("raw-token") == "raw-token"
+
+    _expire_tokens(session, user)
+    provider = CanvasTokenProvider.for_user(user, "old-token")
+    calls: list[str] = []
+
+    with (
+        patch("src.canvas.security.get_session", test_session),
+        patch(
+            "src.canvas.security.refresh_canvas_token",
+            AsyncMock(side_effect=_fake_refresh(calls)),
+        ),
+    ):
+        assert await provider.get_token() == "new-token"
+        assert await provider.get_token() == "new-token"
+
+    assert len(calls) == 1
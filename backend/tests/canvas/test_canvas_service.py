@@ -270,6 +270,33 @@ def test_convert_question_to_canvas_format_multiple_choice():
     assert choices[1]["item_body"] == "<p>Paris</p>"
 
 
+def test_convert_question_to_canvas_format_uses_prebuilt_entry():
+    """Test that a prebuilt Canvas entry is wrapped without re-converting."""
+    from src.canvas.service import convert_question_to_canvas_format
+
+    canvas_entry = {"interaction_type_slug": "choice", "points_possible": 2}
+    question = {
+        "id": "test_q1",
+        "question_type": "multiple_choice",
+        "canvas_entry": canvas_entry,
+    }
+
+    with patch(
+        "src.question.types.registry.get_question_type_registry"
+    ) as mock_registry:
+        result = convert_question_to_canvas_format(question, 3)
+
+    mock_registry.assert_not_called()
+    assert result == {
+        "item": {
+            "entry_type": "Item",
+            "points_possible": 2,
+            "position": 3,
+            "entry": canvas_entry,
+        }
+    }
+
+
 @pytest.mark.parametrize(
     "correct_letter,expected_index",
     [
@@ -1,7 +1,7 @@
 """Pytest configuration and fixtures for the test suite."""
 
-import asyncio
 import os
+import time
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 from unittest.mock import MagicMock
@@ -29,8 +29,6 @@ from tests.factories import QuestionFactory, QuizFactory, UserFactory
 from tests.test_data import (
     DEFAULT_CANVAS_COURSE,
     DEFAULT_CANVAS_MODULES,
-    DEFAULT_QUIZ_CONFIG,
-    DEFAULT_USER_DATA,
     get_unique_quiz_config,
     get_unique_user_data,
 )
@@ -50,6 +48,59 @@ def pytest_configure(config: Any) -> None:
     config.addinivalue_line(
         "markers", "openai: marks tests that interact with OpenAI API"
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: marks CPU micro-benchmarks of hot code paths "
+        "(skipped unless RUN_BENCHMARKS is set)",
+    )
+
+
+def pytest_collection_modifyitems(items: list[Any]) -> None:
+    """Skip benchmarks by default; their time limits are flaky on shared CI."""
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+
+class BenchmarkTimer:
+    """Minimal stand-in for the pytest-benchmark ``benchmark`` fixture.
+
+    Calls the target a few times to warm up, then times a fixed number of
+    rounds and records min/mean/max seconds per call in ``stats``.
+    """
+
+    def __init__(self, rounds: int = 200, warmup_rounds: int = 10) -> None:
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.stats: dict[str, float] = {}
+
+    def __call__(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        result = None
+        for _ in range(self.warmup_rounds):
+            result = func(*args, **kwargs)
+
+        timings = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": sum(timings) / len(timings),
+            "rounds": float(self.rounds),
+        }
+        return result
+
+
+@pytest.fixture
+def benchmark() -> BenchmarkTimer:
+    """Time a callable; mirrors the pytest-benchmark fixture call signature."""
+    return BenchmarkTimer()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -71,6 +122,15 @@ def reset_database() -> Generator[None, None, None]:
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers() -> Generator[None, None, None]:
+    """Close circuit breakers opened by tests that simulate outages."""
+    from src.circuit_breaker import reset_circuit_breakers
+
+    reset_circuit_breakers()
+    yield
+
+
 @pytest.fixture
 def session() -> Generator[Session, None, None]:
     """Provide a database session for testing."""
@@ -534,7 +594,6 @@ def manual_module_response_data() -> dict[str, Any]:
         "module_id": "manual_test123",
         "name": "Test Manual Module",
         "content_preview": "This is sample content for testing...",
-        "full_content": "This is sample content for testing manual module creation.",
         "word_count": 10,
         "processing_metadata": {"source": "manual_text", "processing_time": 0.1},
     }
@@ -255,6 +255,7 @@ async def test_partial_question_generation_recovery(session: Session, caplog):
                 "successful_batches": [],
                 "failed_batches": [],
             }
+            mock_quiz.owner_id = None
             mock_session.get = AsyncMock(return_value=mock_quiz)
             mock_session.refresh = AsyncMock()
             mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -462,6 +463,7 @@ async def test_llm_provider_fallback_integration(session: Session, caplog):
                 "successful_batches": [],
                 "failed_batches": [],
             }
+            mock_quiz.owner_id = None
             mock_session.get = AsyncMock(return_value=mock_quiz)
             mock_session.refresh = AsyncMock()
             mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -604,12 +606,12 @@ async def test_database_transaction_rollback_integration(session: Session, caplo
     # === Assertions ===
     # Export should fail completely
     assert export_result["success"] is False
-    assert export_result["should_rollback"] is True
+    assert export_result["resumable"] is True
     assert export_result["exported_questions"] == 0
     assert export_result["total_questions"] == 3
 
     # All failures should be logged
-    assert "canvas_export_failure_rollback_needed" in caplog.text
+    assert "canvas_export_incomplete_resumable" in caplog.text
     assert str(quiz.id) in caplog.text
 
 
@@ -853,6 +855,7 @@ async def test_quiz_lifecycle_state_transitions(session: Session, caplog):
                 "successful_batches": [],
                 "failed_batches": [],
             }
+            mock_quiz.owner_id = None
             mock_session.get = AsyncMock(return_value=mock_quiz)
             mock_session.refresh = AsyncMock()
             mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -0,0 +1,193 @@
+"""EXPLAIN-based checks that hot queries are served by their composite indexes.
+
+Statements are captured from the real service functions, then explained with
+sequential scans disabled so the planner reports which index it would use.
+A missing or unusable index shows up as a Seq Scan or an explicit Sort node.
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+
+def _compile(statement: Any) -> str:
+    """Render a SQLAlchemy statement as PostgreSQL with inlined parameters."""
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def _plan_nodes(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten an EXPLAIN (FORMAT JSON) plan tree into a list of nodes."""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+async def _explain_async(session: Any, statement: Any) -> list[dict[str, Any]]:
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {_compile(statement)}"))
+    return _plan_nodes(result.scalar_one()[0]["Plan"])
+
+
+def _explain_sync(session: Any, statement: Any) -> list[dict[str, Any]]:
+    session.exec(text("SET LOCAL enable_seqscan = off"))
+    result = session.exec(text(f"EXPLAIN (FORMAT JSON) {_compile(statement)}"))
+    return _plan_nodes(result.scalar_one()[0]["Plan"])
+
+
+async def _capture_async_statement(session: Any, coro_factory: Any) -> Any:
+    """Run a service coroutine and return the first statement it executed."""
+    captured = []
+    original_execute = session.execute
+
+    async def spy_execute(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        captured.append(statement)
+        return await original_execute(statement, *args, **kwargs)
+
+    with patch.object(session, "execute", spy_execute):
+        await coro_factory()
+
+    return captured[0]
+
+
+def _index_names(nodes: list[dict[str, Any]]) -> set[str]:
+    return {node["Index Name"] for node in nodes if "Index Name" in node}
+
+
+def _node_types(nodes: list[dict[str, Any]]) -> set[str]:
+    return {node["Node Type"] for node in nodes}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_question_list_uses_active_composite_index(async_session):
+    """Question review list is ordered by the partial index, with no Sort."""
+    import uuid
+
+    from src.question.service import get_questions_by_quiz
+
+    quiz_id = uuid.uuid4()
+    statement = await _capture_async_statement(
+        async_session, lambda: get_questions_by_quiz(async_session, quiz_id, limit=50)
+    )
+
+    nodes = await _explain_async(async_session, statement)
+
+    assert "ix_question_quiz_id_created_at_id_active" in _index_names(nodes)
+    assert "Sort" not in _node_types(nodes)
+    assert "Seq Scan" not in _node_types(nodes)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_question_keyset_page_uses_active_composite_index(async_session):
+    """Keyset pages seek into the composite index instead of sorting."""
+    import uuid
+    from datetime import datetime, timezone
+
+    from src.question.service import get_questions_by_quiz
+
+    quiz_id = uuid.uuid4()
+    after = (datetime.now(timezone.utc), uuid.uuid4())
+    statement = await _capture_async_statement(
+        async_session,
+        lambda: get_questions_by_quiz(async_session, quiz_id, limit=50, after=after),
+    )
+
+    nodes = await _explain_async(async_session, statement)
+
+    assert "ix_question_quiz_id_created_at_id_active" in _index_names(nodes)
+    assert "Sort" not in _node_types(nodes)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_approved_questions_use_active_composite_index(async_session):
+    """Export's approved-only query is ordered by the active index."""
+    import uuid
+
+    from src.question.service import get_questions_by_quiz
+
+    quiz_id = uuid.uuid4()
+    statement = await _capture_async_statement(
+        async_session,
+        lambda: get_questions_by_quiz(async_session, quiz_id, approved_only=True),
+    )
+
+    nodes = await _explain_async(async_session, statement)
+
+    assert "ix_question_quiz_id_created_at_id_active" in _index_names(nodes)
+    assert "Sort" not in _node_types(nodes)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_question_counts_use_index_only_scan(async_session):
+    """Total/approved counts are answered from the active index alone."""
+    import uuid
+
+    from src.quiz.service import get_question_counts
+
+    quiz_id = uuid.uuid4()
+    statement = await _capture_async_statement(
+        async_session, lambda: get_question_counts(async_session, quiz_id)
+    )
+
+    nodes = await _explain_async(async_session, statement)
+
+    assert "ix_question_quiz_id_created_at_id_active" in _index_names(nodes)
+    assert "Index Only Scan" in _node_types(nodes)
+
+
+@pytest.mark.integration
+def test_owned_quiz_listing_uses_owner_composite_index(session):
+    """Owned quiz listing is ordered by the owner index, with no Sort."""
+    import uuid
+
+    from src.quiz.service import get_user_quizzes
+
+    captured = []
+    original_exec = session.exec
+
+    def spy_exec(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        captured.append(statement)
+        return original_exec(statement, *args, **kwargs)
+
+    with patch.object(session, "exec", spy_exec):
+        get_user_quizzes(session, uuid.uuid4(), include_shared=False)
+
+    nodes = _explain_sync(session, captured[0])
+
+    assert "ix_quiz_owner_id_created_at_id_active" in _index_names(nodes)
+    assert "Sort" not in _node_types(nodes)
+
+
+@pytest.mark.integration
+def test_owned_and_shared_quiz_listing_is_single_indexed_query(session):
+    """Owned + shared listing is one UNION ALL query using the owner index."""
+    import uuid
+
+    from src.quiz.service import get_user_quizzes
+
+    captured = []
+    original_exec = session.exec
+
+    def spy_exec(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        captured.append(statement)
+        return original_exec(statement, *args, **kwargs)
+
+    with patch.object(session, "exec", spy_exec):
+        get_user_quizzes(session, uuid.uuid4())
+
+    assert len(captured) == 1
+    nodes = _explain_sync(session, captured[0])
+
+    assert "ix_quiz_owner_id_created_at_id_active" in _index_names(nodes)
+    assert "Seq Scan" not in _node_types(nodes)
@@ -174,6 +174,7 @@ async def test_complete_canvas_workflow_integration(session: Session, caplog):
                 "successful_batches": [],
                 "failed_batches": [],
             }
+            mock_quiz.owner_id = None
             mock_session.get = AsyncMock(return_value=mock_quiz)
             mock_session.refresh = AsyncMock()
             mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -816,13 +817,13 @@ async def test_export_rollback_integration(session: Session, caplog):
     # === Assertions ===
     # Export should fail due to partial success
     assert export_result["success"] is False
-    assert export_result["should_rollback"] is True
+    assert export_result["resumable"] is True
     assert export_result["canvas_quiz_id"] == 66666
     assert export_result["exported_questions"] == 1  # Only one succeeded
     assert export_result["total_questions"] == 2
 
     # Failure should be logged
-    assert "canvas_export_failure_rollback_needed" in caplog.text
+    assert "canvas_export_incomplete_resumable" in caplog.text
     assert str(quiz.id) in caplog.text
 
 
@@ -908,6 +909,7 @@ async def test_language_workflow_integration(session: Session, caplog):
                 "successful_batches": [],
                 "failed_batches": [],
             }
+            mock_quiz.owner_id = None
             mock_session.get = AsyncMock(return_value=mock_quiz)
             mock_session.refresh = AsyncMock()
             mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -0,0 +1,176 @@
+"""Tests for hedged LLM requests."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+
+def _response(content):
+    from src.question.providers import LLMProvider, LLMResponse
+
+    return LLMResponse(
+        content=content,
+        model="mock-model",
+        provider=LLMProvider.MOCK,
+        response_time=0.1,
+    )
+
+
+def _provider(delays, budget=1.0):
+    """Mock provider answering its n-th call after delays[n] seconds."""
+    from src.question.providers import LLMConfiguration, LLMProvider, MockProvider
+    from src.question.providers.hedging import HedgingPolicy
+
+    provider = MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model")
+    )
+    provider.hedging_policy = HedgingPolicy(percentile=0.9, budget=budget)
+    calls: list[str] = []
+    cancelled: list[str] = []
+
+    async def generate(_messages, **_kwargs):
+        name = f"call-{len(calls)}"
+        calls.append(name)
+        try:
+            await asyncio.sleep(delays[len(calls) - 1])
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        return _response(name)
+
+    provider.generate = generate  # type: ignore[method-assign]
+    return provider, calls, cancelled
+
+
+def _warm_up(policy, key, latency=0.05, count=30):
+    for _ in range(count):
+        policy.request_started(key)
+        policy.record(key, latency)
+
+
+def test_policy_hedges_after_percentile_within_budget():
+    """Test the hedge delay follows the key's p90 and hedges respect the budget."""
+    from src.question.providers.hedging import HedgingPolicy
+
+    policy = HedgingPolicy(percentile=0.9, budget=0.1)
+    assert policy.request_started("essay:5") is None
+
+    for latency in range(1, 101):
+        policy.record("essay:5", float(latency))
+
+    assert policy.request_started("essay:5") == 90.0
+    assert policy.request_started("true_false:5") is None
+
+    hedges = 0
+    for _ in range(200):
+        policy.request_started("essay:5")
+        hedges += policy.try_hedge()
+    assert hedges <= 0.1 * policy.requests
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_loser_cancelled():
+    """Test that a hedge beats a stalled request and the stalled one is cancelled."""
+    from src.question.providers import LLMMessage
+
+    provider, calls, cancelled = _provider([5.0, 0.01])
+    _warm_up(provider.hedging_policy, "multiple_choice:10")
+
+    response = await asyncio.wait_for(
+        provider.generate_with_retry(
+            [LLMMessage(role="user", content="Generate")],
+            hedge_key="multiple_choice:10",
+        ),
+        timeout=2,
+    )
+    await asyncio.sleep(0)
+
+    assert response.content == "call-1"
+    assert calls == ["call-0", "call-1"]
+    assert cancelled == ["call-0"]
+    assert provider.hedging_policy.snapshot()["hedge_wins"] == 1
+    assert len(response.metadata["duplicate_request_latencies"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_key_or_budget():
+    """Test that requests are not duplicated without a key or spare budget."""
+    from src.question.providers import LLMMessage
+
+    messages = [LLMMessage(role="user", content="Generate")]
+
+    provider, calls, _ = _provider([0.2], budget=0.0)
+    _warm_up(provider.hedging_policy, "essay:5")
+    assert (await provider.generate_with_retry(messages, hedge_key="essay:5")).content
+    assert calls == ["call-0"]
+
+    provider, calls, _ = _provider([0.2])
+    _warm_up(provider.hedging_policy, "essay:5")
+    await provider.generate_with_retry(messages)
+    assert calls == ["call-0"]
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_for_a_request_slot_of_its_own():
+    """Test that a hedge counts against the request cap like any request."""
+    from src.question.providers import LLMMessage
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    messages = [LLMMessage(role="user", content="Generate")]
+
+    # A full scheduler leaves the hedge queued until the slow request ends
+    scheduler = GenerationScheduler(capacity=1, reserved_interactive=0)
+    provider, calls, _ = _provider([0.3, 0.01])
+    _warm_up(provider.hedging_policy, "essay:5")
+    response = await provider.generate_with_retry(
+        messages,
+        hedge_key="essay:5",
+        request_slot=lambda: scheduler.slot(GenerationPriority.FIRST_GENERATION),
+    )
+    await asyncio.sleep(0)
+    assert response.content == "call-0"
+    assert calls == ["call-0"]
+    assert "duplicate_request_latencies" not in response.metadata
+    assert scheduler.snapshot()["in_use"] == 0
+
+    # With room for it, the hedge runs in its own slot
+    scheduler = GenerationScheduler(capacity=2, reserved_interactive=0)
+    provider, calls, _ = _provider([0.3, 0.01])
+    _warm_up(provider.hedging_policy, "essay:5")
+    response = await provider.generate_with_retry(
+        messages,
+        hedge_key="essay:5",
+        request_slot=lambda: scheduler.slot(GenerationPriority.FIRST_GENERATION),
+    )
+    await asyncio.sleep(0)
+    assert response.content == "call-1"
+    assert scheduler.snapshot()["classes"]["first_generation"]["admitted"] == 2
+    assert scheduler.snapshot()["in_use"] == 0
+
+
+def test_hedging_endpoint_lists_provider_pools(client, admin_user):
+    """Test that hedging counters are exposed to administrators."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+    from src.question.providers import LLMProvider, get_llm_provider_registry
+    from src.question.providers.hedging import HedgingPolicy
+
+    pool = get_llm_provider_registry().get_provider_pool(LLMProvider.MOCK)
+    with patch.object(pool, "hedging_policy", HedgingPolicy()):
+        _warm_up(pool.hedging_policy, "essay:5", count=3)
+        url = f"{settings.API_V1_STR}/utils/llm-hedging/"
+        token = create_access_token(str(admin_user.id))
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get(url, headers=headers).status_code == 403
+
+        with patch("src.config.settings.ADMIN_CANVAS_IDS", [admin_user.canvas_id]):
+            response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    mock = next(p for p in response.json() if p["provider"] == "mock")
+    assert mock["requests"] >= 3
+    assert "hedge_wins" in mock
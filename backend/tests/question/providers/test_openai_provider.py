@@ -458,3 +458,68 @@ def test_provider_equality(config):
     )
     provider3 = OpenAIProvider(different_config)
     assert provider1.configuration != provider3.configuration
+
+
+@pytest.mark.asyncio
+async def test_generate_requests_structured_output(provider):
+    """Test that a response schema is sent as a strict json_schema format."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.base import LLMMessage
+
+    schema = {"type": "object", "properties": {}, "additionalProperties": False}
+    mock_response = MagicMock()
+    mock_response.content = '{"questions": []}'
+    mock_response.usage = DEFAULT_OPENAI_RESPONSE["usage"]
+
+    with patch(
+        "src.question.providers.openai_provider.AzureChatOpenAI"
+    ) as mock_azure_openai:
+        mock_client = AsyncMock()
+        mock_client.ainvoke.return_value = mock_response
+        mock_azure_openai.return_value = mock_client
+
+        response = await provider.generate(
+            [LLMMessage(role="user", content="Test")], response_schema=schema
+        )
+
+    response_format = mock_client.ainvoke.call_args.kwargs["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"] is schema
+    assert response_format["json_schema"]["strict"] is True
+    assert "response_schema" not in response.metadata
+    assert provider.supports_structured_output
+
+
+@pytest.mark.asyncio
+async def test_generate_falls_back_without_structured_output(provider):
+    """Test that deployments rejecting json_schema get free-form requests."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.base import LLMMessage
+
+    mock_response = MagicMock()
+    mock_response.content = "[]"
+    mock_response.usage = DEFAULT_OPENAI_RESPONSE["usage"]
+
+    with patch(
+        "src.question.providers.openai_provider.AzureChatOpenAI"
+    ) as mock_azure_openai:
+        mock_client = AsyncMock()
+        mock_client.ainvoke.side_effect = [
+            Exception(
+                "'response_format' of type 'json_schema' is not supported "
+                "with this model"
+            ),
+            mock_response,
+        ]
+        mock_azure_openai.return_value = mock_client
+
+        response = await provider.generate(
+            [LLMMessage(role="user", content="Test")],
+            response_schema={"type": "object"},
+        )
+
+    assert response.content == "[]"
+    assert "response_format" not in mock_client.ainvoke.call_args.kwargs
+    assert not provider.supports_structured_output
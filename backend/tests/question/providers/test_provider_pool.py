@@ -0,0 +1,159 @@
+"""Tests for load balancing and failover across provider deployments."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+def _endpoint(name, generate, **kwargs):
+    """Build a pool endpoint around a mock provider with the given generate."""
+    from src.question.providers import LLMConfiguration, LLMProvider, MockProvider
+    from src.question.providers.pool import ProviderEndpoint
+
+    provider = MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model")
+    )
+    provider.generate = generate  # type: ignore[method-assign]
+    return ProviderEndpoint(name, provider, **kwargs)
+
+
+def _response(content="ok", total_tokens=100):
+    from src.question.providers import LLMProvider, LLMResponse
+
+    return LLMResponse(
+        content=content,
+        model="mock-model",
+        provider=LLMProvider.MOCK,
+        response_time=0.1,
+        total_tokens=total_tokens,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_endpoint_fails_over_and_cools_down():
+    """Test that a 429 moves the request, and later ones, to another endpoint."""
+    from src.question.providers import LLMMessage, RateLimitError
+    from src.question.providers.pool import ProviderPool
+
+    limited = AsyncMock(side_effect=RateLimitError("429", retry_after=30))
+    healthy = AsyncMock(return_value=_response("from backup"))
+    pool = ProviderPool(
+        [
+            _endpoint("primary", limited, weight=1000.0),
+            _endpoint("backup", healthy, weight=0.001),
+        ],
+        rng=random.Random(1),
+    )
+    messages = [LLMMessage(role="user", content="Generate")]
+
+    first = await pool.generate(messages)
+    second = await pool.generate(messages)
+
+    assert first.content == second.content == "from backup"
+    assert first.metadata["endpoint"] == "backup"
+    # The primary is skipped while cooling down, despite its weight
+    assert limited.await_count == 1
+    assert healthy.await_count == 2
+    primary, backup = pool.health_snapshot()
+    assert primary["available"] is False
+    assert primary["consecutive_failures"] == 1
+    assert backup["available"] is True
+
+
+@pytest.mark.asyncio
+async def test_request_errors_are_not_failed_over():
+    """Test that errors caused by the request itself are raised directly."""
+    from src.question.providers import LLMError, LLMMessage
+    from src.question.providers.pool import ProviderPool
+
+    rejected = AsyncMock(side_effect=LLMError("bad request", retryable=False))
+    other = AsyncMock(return_value=_response())
+    pool = ProviderPool(
+        [_endpoint("a", rejected, weight=1000.0), _endpoint("b", other, weight=0.001)],
+        rng=random.Random(1),
+    )
+
+    with pytest.raises(LLMError, match="bad request"):
+        await pool.generate([LLMMessage(role="user", content="Generate")])
+
+    other.assert_not_awaited()
+    assert all(endpoint["available"] for endpoint in pool.health_snapshot())
+
+
+@pytest.mark.asyncio
+async def test_all_endpoints_failing_raises_last_error():
+    """Test that the request fails once every endpoint has failed."""
+    from src.question.providers import LLMError, LLMMessage
+    from src.question.providers.pool import ProviderPool
+
+    down = AsyncMock(
+        side_effect=LLMError("503", error_code="temporary_error", retryable=True)
+    )
+    pool = ProviderPool([_endpoint("a", down), _endpoint("b", down)])
+
+    with pytest.raises(LLMError, match="503"):
+        await pool.generate([LLMMessage(role="user", content="Generate")])
+
+    assert down.await_count == 2
+
+
+def test_routing_prefers_remaining_quota_and_low_latency():
+    """Test that traffic shifts away from exhausted or slow deployments."""
+    from src.question.providers.pool import ProviderEndpoint, ProviderPool
+
+    generate = AsyncMock(return_value=_response())
+    exhausted = _endpoint("exhausted", generate, tokens_per_minute=1000)
+    slow = _endpoint("slow", generate)
+    fast = _endpoint("fast", generate)
+    exhausted.record_success(0.0, latency=1.0, tokens=1000)
+    slow.record_success(0.0, latency=20.0, tokens=10)
+    fast.record_success(0.0, latency=2.0, tokens=10)
+    pool = ProviderPool([exhausted, slow, fast], rng=random.Random(7))
+
+    first_choices: dict[str, int] = {"exhausted": 0, "slow": 0, "fast": 0}
+    for _ in range(1000):
+        first: ProviderEndpoint = pool._routing_order(1.0)[0]
+        first_choices[first.name] += 1
+
+    assert first_choices["fast"] > 5 * first_choices["slow"]
+    assert first_choices["fast"] > 5 * first_choices["exhausted"]
+    # Usage leaves the quota window after a minute
+    assert exhausted.remaining_quota(61.0) == 1.0
+
+
+def test_registry_pools_configured_azure_deployments():
+    """Test that extra deployments join the primary one in a shared pool."""
+    from src.question.providers import LLMProvider
+    from src.question.providers.registry import LLMProviderRegistry
+
+    deployments = [
+        {
+            "name": "sweden",
+            "azure_endpoint": "https://sweden.openai.azure.com",
+            "api_key": "sweden-key",
+            "weight": 2,
+            "tokens_per_minute": 500000,
+        },
+        {"name": "broken", "azure_endpoint": "https://broken.openai.azure.com"},
+    ]
+
+    with (
+        patch("src.config.settings.AZURE_OPENAI_DEPLOYMENTS", deployments),
+        patch("src.config.settings.AZURE_OPENAI_TOKENS_PER_MINUTE", 200000),
+    ):
+        registry = LLMProviderRegistry()
+        pool = registry.get_provider_pool(LLMProvider.OPENAI)
+
+    assert [e.name for e in pool.endpoints] == ["primary", "sweden"]
+    primary, sweden = pool.endpoints
+    assert primary.tokens_per_minute == 200000
+    assert sweden.weight == 2
+    assert sweden.provider.configuration.provider_settings["azure_endpoint"] == (
+        "https://sweden.openai.azure.com"
+    )
+    assert registry.get_provider_pool(LLMProvider.OPENAI) is pool
+
+    # Without extra deployments the pool holds the default configuration
+    mock_pool = registry.get_provider_pool(LLMProvider.MOCK)
+    assert [e.name for e in mock_pool.endpoints] == ["default"]
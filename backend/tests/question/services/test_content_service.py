@@ -12,6 +12,17 @@ from tests.test_data import (
 )
 
 
+def _stream_content(content_dict):
+    """Build a fake iter_content_from_quiz yielding content module by module."""
+
+    async def _iter_content(quiz_id, module_ids=None):
+        for module_id, pages in content_dict.items():
+            if module_ids is None or module_id in module_ids:
+                yield module_id, pages
+
+    return _iter_content
+
+
 @pytest.fixture
 def sample_content_dict():
     """Create sample content dictionary using centralized data."""
@@ -169,12 +180,12 @@ async def test_prepare_content_for_generation_with_quiz_content():
     mock_content = get_sample_module_content()
 
     with patch(
-        "src.question.services.content_service.get_content_from_quiz",
-        return_value=mock_content,
-    ) as mock_get_content:
+        "src.question.services.content_service.iter_content_from_quiz",
+        side_effect=_stream_content(mock_content),
+    ) as mock_iter_content:
         result = await prepare_content_for_generation(quiz_id)
 
-        mock_get_content.assert_called_once_with(quiz_id)
+        mock_iter_content.assert_called_once_with(quiz_id, None)
         assert "module_1" in result
         assert "## Introduction to Python" in result["module_1"]
 
@@ -219,8 +230,8 @@ async def test_prepare_and_validate_content_with_quality_filter():
     }
 
     with patch(
-        "src.question.services.content_service.get_content_from_quiz",
-        return_value=mock_content,
+        "src.question.services.content_service.iter_content_from_quiz",
+        side_effect=_stream_content(mock_content),
     ):
         # With quality filter (default)
         result_filtered = await prepare_and_validate_content(quiz_id)
@@ -436,8 +447,8 @@ async def test_functional_composition_pipeline():
     mock_content = get_sample_module_content()
 
     with patch(
-        "src.question.services.content_service.get_content_from_quiz",
-        return_value=mock_content,
+        "src.question.services.content_service.iter_content_from_quiz",
+        side_effect=_stream_content(mock_content),
     ):
         # Test functional pipeline
         content = await prepare_content_for_generation(quiz_id)
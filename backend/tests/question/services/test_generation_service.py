@@ -35,6 +35,15 @@ def generation_service():
         yield service
 
 
+@pytest.fixture(autouse=True)
+def no_existing_questions():
+    """Treat every quiz as having no previously generated questions."""
+    with patch(
+        "src.question.service.get_questions_by_quiz", AsyncMock(return_value=[])
+    ) as mock_get_questions:
+        yield mock_get_questions
+
+
 @pytest.fixture
 def mock_quiz():
     """Create mock quiz with module structure."""
@@ -161,7 +170,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_success(
 
         # Mock provider registry
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         # Mock parallel processor
         mock_processor = MagicMock()
@@ -205,7 +216,7 @@ async def test_generate_questions_for_quiz_with_batch_tracking_success(
     # Verify provider was called correctly
     from src.question.providers import LLMProvider
 
-    generation_service.provider_registry.get_provider.assert_called_once_with(
+    generation_service.provider_registry.get_provider_pool.assert_called_once_with(
         LLMProvider.OPENAI
     )
 
@@ -286,7 +297,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_missing_module_co
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -334,7 +347,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_with_tone(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -386,7 +401,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_tone_extraction(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -439,7 +456,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_tone_and_language
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -485,7 +504,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_norwegian_languag
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -533,7 +554,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_preserves_questio
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -582,7 +605,7 @@ async def test_generate_questions_for_quiz_with_batch_tracking_provider_exceptio
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         # Make provider registry raise an exception
-        generation_service.provider_registry.get_provider.side_effect = Exception(
+        generation_service.provider_registry.get_provider_pool.side_effect = Exception(
             "Provider error"
         )
 
@@ -612,7 +635,9 @@ async def test_generate_questions_for_quiz_with_batch_tracking_custom_provider(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -630,7 +655,7 @@ async def test_generate_questions_for_quiz_with_batch_tracking_custom_provider(
         # Verify correct provider was requested
         from src.question.providers import LLMProvider
 
-        generation_service.provider_registry.get_provider.assert_called_once_with(
+        generation_service.provider_registry.get_provider_pool.assert_called_once_with(
             LLMProvider.ANTHROPIC
         )
 
@@ -660,7 +685,9 @@ async def test_generate_uses_quiz_question_type(generation_service, mock_quiz):
 
         # Mock provider
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         # Mock the ParallelModuleProcessor
         with patch(
@@ -717,7 +744,9 @@ async def test_generate_questions_with_custom_instructions(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         with patch(
             "src.question.services.generation_service.ParallelModuleProcessor"
@@ -782,11 +811,9 @@ async def test_workflow_uses_correct_template():
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=mock_provider,
-        template_manager=mock_template_manager,
     )
 
     # Execute prepare_prompt
@@ -930,7 +957,9 @@ async def test_generate_questions_with_difficulty_batch_keys(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -1012,7 +1041,9 @@ async def test_generate_questions_difficulty_batch_key_format(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -1095,7 +1126,9 @@ async def test_generate_questions_mixed_difficulty_same_question_type(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -1146,7 +1179,9 @@ async def test_generate_questions_difficulty_failed_batch_keys(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -1231,7 +1266,9 @@ async def test_generate_questions_all_difficulty_levels_represented(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
@@ -1291,7 +1328,9 @@ async def test_generate_questions_batch_tracking_preserves_difficulty_metadata(
         mock_session_ctx.return_value.__aenter__.return_value = mock_session
 
         mock_provider = MagicMock()
-        generation_service.provider_registry.get_provider.return_value = mock_provider
+        generation_service.provider_registry.get_provider_pool.return_value = (
+            mock_provider
+        )
 
         mock_processor = MagicMock()
         mock_processor.process_all_modules_with_batches = AsyncMock(
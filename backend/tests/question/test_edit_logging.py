@@ -7,6 +7,17 @@ import pytest
 from tests.test_data import DEFAULT_FILL_IN_BLANK_DATA, DEFAULT_MCQ_DATA
 
 
+async def _edit_log(async_session, question_id):
+    """Return a question's recorded edits as edit log entries, oldest first."""
+    from src.question.service import get_question_edit_history
+
+    edits = await get_question_edit_history(async_session, question_id)
+    return [
+        {"field": e.field, "old_value": e.old_value, "new_value": e.new_value}
+        for e in edits
+    ]
+
+
 def test_generate_edit_log_entries_with_changes():
     """Test edit log generation with field changes."""
     from src.question.utils import generate_edit_log_entries
@@ -147,7 +158,6 @@ async def test_update_question_logs_question_data_changes(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=initial_question_data,
-        edit_log=[],  # Start with empty edit log
     )
     async_session.add(question)
     await async_session.commit()
@@ -164,18 +174,16 @@ async def test_update_question_logs_question_data_changes(async_session):
     result = await update_question(async_session, question.id, updates)
 
     assert result is not None
-    assert result.edit_log is not None
-    assert len(result.edit_log) == 2
+    edit_log = await _edit_log(async_session, result.id)
+    assert len(edit_log) == 2
 
     # Check logged changes
-    logged_fields = {entry["field"] for entry in result.edit_log}
+    logged_fields = {entry["field"] for entry in edit_log}
     assert "question_text" in logged_fields
     assert "option_a" in logged_fields
 
     # Check specific values
-    question_text_entry = next(
-        e for e in result.edit_log if e["field"] == "question_text"
-    )
+    question_text_entry = next(e for e in edit_log if e["field"] == "question_text")
     assert question_text_entry["old_value"] == DEFAULT_MCQ_DATA["question_text"]
     assert question_text_entry["new_value"] == "Updated question text"
 
@@ -189,7 +197,7 @@ async def test_update_question_appends_to_existing_edit_log(async_session):
     # Create test quiz and question with existing edit log
     quiz = await create_quiz_in_async_session(async_session)
 
-    from src.question.models import Question, QuestionType
+    from src.question.models import Question, QuestionEdit, QuestionType
 
     initial_question_data = DEFAULT_MCQ_DATA.copy()
     existing_edit_log = [
@@ -200,9 +208,12 @@ async def test_update_question_appends_to_existing_edit_log(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=initial_question_data,
-        edit_log=existing_edit_log,
     )
     async_session.add(question)
+    await async_session.flush()
+    async_session.add(
+        QuestionEdit(question_id=question.id, seq=1, **existing_edit_log[0])
+    )
     await async_session.commit()
     await async_session.refresh(question)
 
@@ -216,13 +227,14 @@ async def test_update_question_appends_to_existing_edit_log(async_session):
     result = await update_question(async_session, question.id, updates)
 
     assert result is not None
-    assert len(result.edit_log) == 2  # 1 existing + 1 new
+    edit_log = await _edit_log(async_session, result.id)
+    assert len(edit_log) == 2  # 1 existing + 1 new
 
     # Check that existing entry is preserved
-    assert result.edit_log[0] == existing_edit_log[0]
+    assert edit_log[0] == existing_edit_log[0]
 
     # Check new entry
-    new_entry = result.edit_log[1]
+    new_entry = edit_log[1]
     assert new_entry["field"] == "question_text"
     assert new_entry["old_value"] == DEFAULT_MCQ_DATA["question_text"]
     assert new_entry["new_value"] == "Another update"
@@ -244,7 +256,6 @@ async def test_update_question_no_question_data_change_no_logging(async_session)
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=DEFAULT_MCQ_DATA.copy(),
         difficulty=QuestionDifficulty.EASY,
-        edit_log=[],
     )
     async_session.add(question)
     await async_session.commit()
@@ -258,7 +269,7 @@ async def test_update_question_no_question_data_change_no_logging(async_session)
 
     assert result is not None
     assert result.difficulty == QuestionDifficulty.HARD
-    assert result.edit_log == []  # Should remain empty
+    assert await _edit_log(async_session, result.id) == []  # Should remain empty
 
 
 @pytest.mark.asyncio
@@ -277,7 +288,6 @@ async def test_update_question_no_actual_changes_no_logging(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=initial_data,
-        edit_log=[],
     )
     async_session.add(question)
     await async_session.commit()
@@ -290,7 +300,8 @@ async def test_update_question_no_actual_changes_no_logging(async_session):
     result = await update_question(async_session, question.id, updates)
 
     assert result is not None
-    assert result.edit_log == []  # Should remain empty since no changes
+    # Should remain empty since no changes
+    assert await _edit_log(async_session, result.id) == []
 
 
 @pytest.mark.asyncio
@@ -308,7 +319,6 @@ async def test_update_question_handles_null_question_data(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=None,  # Start with null
-        edit_log=None,  # Start with null
     )
     async_session.add(question)
     await async_session.commit()
@@ -323,11 +333,11 @@ async def test_update_question_handles_null_question_data(async_session):
 
     assert result is not None
     assert result.question_data == new_data
-    assert result.edit_log is not None
 
     # Should log all fields as new (old_value = None)
-    assert len(result.edit_log) == len(new_data)
-    for entry in result.edit_log:
+    edit_log = await _edit_log(async_session, result.id)
+    assert len(edit_log) == len(new_data)
+    for entry in edit_log:
         assert entry["old_value"] is None
         assert entry["field"] in new_data
         assert entry["new_value"] == new_data[entry["field"]]
@@ -349,7 +359,6 @@ async def test_update_question_with_different_question_types(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.FILL_IN_BLANK,
         question_data=initial_data,
-        edit_log=[],
     )
     async_session.add(question)
     await async_session.commit()
@@ -366,10 +375,11 @@ async def test_update_question_with_different_question_types(async_session):
     result = await update_question(async_session, question.id, updates)
 
     assert result is not None
-    assert len(result.edit_log) == 2
+    edit_log = await _edit_log(async_session, result.id)
+    assert len(edit_log) == 2
 
     # Check logged changes specific to fill-in-blank
-    logged_fields = {entry["field"] for entry in result.edit_log}
+    logged_fields = {entry["field"] for entry in edit_log}
     assert "question_text" in logged_fields
     assert "correct_answers" in logged_fields
 
@@ -408,7 +418,6 @@ async def test_edit_log_persists_after_question_deletion(async_session):
         quiz_id=quiz_id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=DEFAULT_MCQ_DATA.copy(),
-        edit_log=[],
     )
     async_session.add(question)
     await async_session.commit()
@@ -425,7 +434,7 @@ async def test_edit_log_persists_after_question_deletion(async_session):
         async_session, question_id, {"question_data": updated_data}
     )
     assert result is not None
-    assert len(result.edit_log) == 1
+    assert len(await _edit_log(async_session, question_id)) == 1
 
     # Soft delete the question
     delete_success = await delete_question(async_session, question_id, quiz_id)
@@ -439,9 +448,9 @@ async def test_edit_log_persists_after_question_deletion(async_session):
     )
     assert deleted_question is not None
     assert deleted_question.deleted is True
-    assert deleted_question.edit_log is not None
-    assert len(deleted_question.edit_log) == 1
-    assert deleted_question.edit_log[0]["field"] == "question_text"
+    edit_log = await _edit_log(async_session, question_id)
+    assert len(edit_log) == 1
+    assert edit_log[0]["field"] == "question_text"
 
 
 @pytest.mark.asyncio
@@ -460,7 +469,6 @@ async def test_edit_log_accumulates_over_multiple_updates(async_session):
         quiz_id=quiz.id,
         question_type=QuestionType.MULTIPLE_CHOICE,
         question_data=initial_data,
-        edit_log=[],
     )
     async_session.add(question)
     await async_session.commit()
@@ -473,8 +481,9 @@ async def test_edit_log_accumulates_over_multiple_updates(async_session):
     result_1 = await update_question(
         async_session, question.id, {"question_data": updated_data_1}
     )
-    assert len(result_1.edit_log) == 1
-    assert result_1.edit_log[0]["field"] == "question_text"
+    edit_log = await _edit_log(async_session, result_1.id)
+    assert len(edit_log) == 1
+    assert edit_log[0]["field"] == "question_text"
 
     # Second update - change option_a
     updated_data_2 = updated_data_1.copy()
@@ -483,10 +492,11 @@ async def test_edit_log_accumulates_over_multiple_updates(async_session):
     result_2 = await update_question(
         async_session, question.id, {"question_data": updated_data_2}
     )
-    assert len(result_2.edit_log) == 2
+    edit_log = await _edit_log(async_session, result_2.id)
+    assert len(edit_log) == 2
 
     # Check both entries are present
-    logged_fields = {entry["field"] for entry in result_2.edit_log}
+    logged_fields = {entry["field"] for entry in edit_log}
     assert "question_text" in logged_fields
     assert "option_a" in logged_fields
 
@@ -497,11 +507,12 @@ async def test_edit_log_accumulates_over_multiple_updates(async_session):
     result_3 = await update_question(
         async_session, question.id, {"question_data": updated_data_3}
     )
-    assert len(result_3.edit_log) == 3
+    edit_log = await _edit_log(async_session, result_3.id)
+    assert len(edit_log) == 3
 
     # Check that question_text appears twice with different old values
     question_text_changes = [
-        entry for entry in result_3.edit_log if entry["field"] == "question_text"
+        entry for entry in edit_log if entry["field"] == "question_text"
     ]
     assert len(question_text_changes) == 2
 
@@ -518,3 +529,35 @@ async def test_edit_log_accumulates_over_multiple_updates(async_session):
         entry for entry in question_text_changes if entry["old_value"] == "First update"
     )
     assert second_change["new_value"] == "Second question text update"
+
+
+@pytest.mark.asyncio
+async def test_question_edit_history_pages_by_seq(async_session):
+    """Test that edit history is returned in seq order and paged after a seq."""
+    from src.question.models import Question, QuestionType
+    from src.question.service import get_question_edit_history, update_question
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    question = Question(
+        quiz_id=quiz.id,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data=DEFAULT_MCQ_DATA.copy(),
+    )
+    question_id = question.id
+    async_session.add(question)
+    await async_session.commit()
+
+    data = DEFAULT_MCQ_DATA.copy()
+    for text in ["First", "Second", "Third"]:
+        data = {**data, "question_text": text}
+        await update_question(async_session, question_id, {"question_data": data})
+
+    history = await get_question_edit_history(async_session, question_id)
+    assert [edit.seq for edit in history] == [1, 2, 3]
+    assert [edit.new_value for edit in history] == ["First", "Second", "Third"]
+
+    page = await get_question_edit_history(
+        async_session, question_id, after_seq=1, limit=1
+    )
+    assert [(edit.seq, edit.old_value) for edit in page] == [(2, "First")]
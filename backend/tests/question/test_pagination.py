@@ -0,0 +1,152 @@
+"""Tests for keyset pagination and filtering of the question list."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+
+def test_keyset_cursor_round_trip():
+    """Test that an encoded cursor decodes to the same keyset values."""
+    from src.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    question_id = uuid.uuid4()
+
+    cursor = encode_keyset_cursor(created_at, question_id)
+
+    assert "=" not in cursor
+    assert decode_keyset_cursor(cursor) == (created_at, question_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm90fGF1dWlk"])
+def test_decode_keyset_cursor_invalid(cursor):
+    """Test that malformed cursors raise ValueError."""
+    from src.pagination import decode_keyset_cursor
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_keyset_cursor(cursor)
+
+
+def test_build_question_list_etag_changes_with_content():
+    """Test that the ETag is stable for equal pages and changes on updates."""
+    from src.question.types import Question, QuestionType
+    from src.question.utils import build_question_list_etag
+
+    question = Question(
+        id=uuid.uuid4(),
+        quiz_id=uuid.uuid4(),
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data={},
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    etag = build_question_list_etag([question], 1, None)
+
+    assert etag.startswith('W/"')
+    assert etag == build_question_list_etag([question], 1, None)
+    assert etag != build_question_list_etag([question], 2, None)
+
+    question.updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert etag != build_question_list_etag([question], 1, None)
+
+
+@pytest.mark.asyncio
+async def test_get_questions_by_quiz_keyset_pagination(async_session):
+    """Test that keyset pages cover all questions exactly once and in order."""
+    from src.question.service import get_questions_by_quiz
+    from tests.conftest import (
+        create_question_in_async_session,
+        create_quiz_in_async_session,
+    )
+
+    quiz = await create_quiz_in_async_session(async_session)
+    # Questions created in one transaction share created_at, so id breaks ties
+    created = [
+        await create_question_in_async_session(async_session, quiz=quiz)
+        for _ in range(5)
+    ]
+
+    seen_ids = []
+    after = None
+    while True:
+        page = await get_questions_by_quiz(async_session, quiz.id, limit=2, after=after)
+        if not page:
+            break
+        seen_ids.extend(question.id for question in page)
+        after = (page[-1].created_at, page[-1].id)
+
+    expected = sorted(created, key=lambda q: (q.created_at, q.id))
+    assert seen_ids == [question.id for question in expected]
+
+
+@pytest.mark.asyncio
+async def test_get_questions_by_quiz_new_filters(async_session):
+    """Test module, difficulty, approval and rejection filters."""
+    from src.question.service import count_questions_by_quiz, get_questions_by_quiz
+    from src.question.types import QuestionDifficulty
+    from tests.conftest import (
+        create_question_in_async_session,
+        create_quiz_in_async_session,
+    )
+
+    quiz = await create_quiz_in_async_session(async_session)
+    easy = await create_question_in_async_session(
+        async_session,
+        quiz=quiz,
+        module_id="module_1",
+        difficulty=QuestionDifficulty.EASY,
+        is_approved=True,
+    )
+    hard = await create_question_in_async_session(
+        async_session,
+        quiz=quiz,
+        module_id="module_2",
+        difficulty=QuestionDifficulty.HARD,
+    )
+    rejected = await create_question_in_async_session(
+        async_session,
+        quiz=quiz,
+        module_id="module_1",
+        deleted=True,
+        rejection_reason="irrelevant_content",
+    )
+
+    by_module = await get_questions_by_quiz(
+        async_session, quiz.id, module_id="module_1"
+    )
+    assert [q.id for q in by_module] == [easy.id]
+
+    by_difficulty = await get_questions_by_quiz(
+        async_session, quiz.id, difficulty=QuestionDifficulty.HARD
+    )
+    assert [q.id for q in by_difficulty] == [hard.id]
+
+    unapproved = await get_questions_by_quiz(async_session, quiz.id, is_approved=False)
+    assert [q.id for q in unapproved] == [hard.id]
+
+    rejected_only = await get_questions_by_quiz(async_session, quiz.id, rejected=True)
+    assert [q.id for q in rejected_only] == [rejected.id]
+
+    assert await count_questions_by_quiz(async_session, quiz.id) == 2
+    assert await count_questions_by_quiz(async_session, quiz.id, rejected=True) == 1
+    assert (
+        await count_questions_by_quiz(async_session, quiz.id, include_deleted=True) == 3
+    )
+
+
+def test_question_list_rejects_cursor_with_offset(client, admin_user):
+    """Test that a cursor and an offset cannot be combined."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+    from src.pagination import encode_keyset_cursor
+
+    cursor = encode_keyset_cursor(datetime.now(timezone.utc), uuid.uuid4())
+    response = client.get(
+        f"{settings.API_V1_STR}/questions/{uuid.uuid4()}",
+        params={"cursor": cursor, "offset": 50},
+        headers={"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Use either cursor or offset, not both"
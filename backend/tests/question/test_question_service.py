@@ -819,87 +819,144 @@ async def test_prepare_questions_for_export_no_approved_questions():
     assert result == []
 
 
+def test_build_export_payloads_memoized_per_question_version():
+    """Test that Canvas payloads are reused until the question changes."""
+    from src.question.models import Question, QuestionType
+    from src.question.service import (
+        build_export_payloads,
+        calculate_total_points_for_questions,
+    )
+    from src.question.types.mcq import MultipleChoiceQuestionType
+
+    question = Question(
+        id=uuid.uuid4(),
+        quiz_id=uuid.uuid4(),
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data={
+            "question_text": "What is 2+2?",
+            "option_a": "3",
+            "option_b": "4",
+            "option_c": "5",
+            "option_d": "6",
+            "correct_answer": "B",
+        },
+        updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    with patch.object(
+        MultipleChoiceQuestionType,
+        "format_for_canvas",
+        autospec=True,
+        side_effect=MultipleChoiceQuestionType.format_for_canvas,
+    ) as format_for_canvas:
+        export_data, canvas_entry = build_export_payloads(question)
+        assert build_export_payloads(question) == (export_data, canvas_entry)
+        assert format_for_canvas.call_count == 1
+
+        question.updated_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        build_export_payloads(question)
+        assert format_for_canvas.call_count == 2
+
+    assert export_data["question_text"] == "What is 2+2?"
+    assert (
+        calculate_total_points_for_questions(
+            [{**export_data, "canvas_entry": canvas_entry}]
+        )
+        == canvas_entry["points_possible"]
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_question_canvas_ids_success(async_session):
     """Test successful Canvas ID updates."""
-    from src.question.models import Question, QuestionType
+    from sqlmodel import select
+
+    from src.question.models import Question
     from src.question.service import update_question_canvas_ids
+    from tests.conftest import (
+        create_question_in_async_session,
+        create_quiz_in_async_session,
+    )
 
-    question_id_1 = uuid.uuid4()
-    question_id_2 = uuid.uuid4()
+    quiz = await create_quiz_in_async_session(async_session)
+    question_1 = await create_question_in_async_session(async_session, quiz=quiz)
+    question_2 = await create_question_in_async_session(async_session, quiz=quiz)
+    question_id_1, question_id_2 = question_1.id, question_2.id
 
     question_data_list = [{"id": question_id_1}, {"id": question_id_2}]
-
     export_results = [
         {"success": True, "item_id": "canvas_item_1"},
-        {"success": True, "item_id": "canvas_item_2"},
+        {"success": True, "item_id": 2002},
     ]
 
-    # Mock questions as simple objects with just the attributes we need
-    question_1 = MagicMock()
-    question_1.id = question_id_1
-    question_1.canvas_item_id = None
-
-    question_2 = MagicMock()
-    question_2.id = question_id_2
-    question_2.canvas_item_id = None
-
-    # Mock session.get to return questions
-    async_session.get = AsyncMock(side_effect=[question_1, question_2])
-
-    await update_question_canvas_ids(async_session, question_data_list, export_results)
+    updated = await update_question_canvas_ids(
+        async_session, question_data_list, export_results
+    )
+    await async_session.commit()
 
-    assert question_1.canvas_item_id == "canvas_item_1"
-    assert question_2.canvas_item_id == "canvas_item_2"
+    assert updated == 2
+    result = await async_session.execute(
+        select(Question.id, Question.canvas_item_id).where(
+            Question.id.in_([question_id_1, question_id_2])
+        )
+    )
+    assert dict(result.all()) == {
+        question_id_1: "canvas_item_1",
+        question_id_2: "2002",
+    }
 
 
 @pytest.mark.asyncio
 async def test_update_question_canvas_ids_with_failures(async_session):
     """Test Canvas ID updates with some failures."""
-    from src.question.models import Question, QuestionType
+    from sqlmodel import select
+
+    from src.question.models import Question
     from src.question.service import update_question_canvas_ids
+    from tests.conftest import (
+        create_question_in_async_session,
+        create_quiz_in_async_session,
+    )
 
-    question_id_1 = uuid.uuid4()
-    question_id_2 = uuid.uuid4()
+    quiz = await create_quiz_in_async_session(async_session)
+    question_1 = await create_question_in_async_session(async_session, quiz=quiz)
+    question_2 = await create_question_in_async_session(async_session, quiz=quiz)
+    question_id_1, question_id_2 = question_1.id, question_2.id
 
     question_data_list = [{"id": question_id_1}, {"id": question_id_2}]
-
     export_results = [
         {"success": True, "item_id": "canvas_item_1"},
         {"success": False, "error": "Export failed"},
     ]
 
-    # Mock question as simple object with just the attributes we need
-    question_1 = MagicMock()
-    question_1.id = question_id_1
-    question_1.canvas_item_id = None
-
-    # Only first question should be retrieved since second failed
-    async_session.get = AsyncMock(return_value=question_1)
-
-    await update_question_canvas_ids(async_session, question_data_list, export_results)
+    updated = await update_question_canvas_ids(
+        async_session, question_data_list, export_results
+    )
+    await async_session.commit()
 
-    assert question_1.canvas_item_id == "canvas_item_1"
-    # Only one call to session.get for successful export
-    async_session.get.assert_called_once_with(Question, question_id_1)
+    assert updated == 1
+    result = await async_session.execute(
+        select(Question.id, Question.canvas_item_id).where(
+            Question.id.in_([question_id_1, question_id_2])
+        )
+    )
+    assert dict(result.all()) == {question_id_1: "canvas_item_1", question_id_2: None}
 
 
 @pytest.mark.asyncio
 async def test_update_question_canvas_ids_question_not_found(async_session):
     """Test Canvas ID update when question not found."""
-    from src.question.models import Question
     from src.question.service import update_question_canvas_ids
 
     question_data_list = [{"id": uuid.uuid4()}]
     export_results = [{"success": True, "item_id": "canvas_item_1"}]
 
-    # Mock session.get to return None (question not found)
-    async_session.get = AsyncMock(return_value=None)
-
     # Should handle gracefully without error
-    await update_question_canvas_ids(async_session, question_data_list, export_results)
+    updated = await update_question_canvas_ids(
+        async_session, question_data_list, export_results
+    )
 
-    async_session.get.assert_called_once()
+    assert updated == 0
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,160 @@
+"""Tests for batched question data validation and typed data caching."""
+
+import uuid
+
+from tests.test_data import DEFAULT_MCQ_DATA
+
+MATCHING_DATA = {
+    "question_text": "Match each country to its capital.",
+    "pairs": [
+        {"question": "France", "answer": "Paris"},
+        {"question": "Germany", "answer": "Berlin"},
+        {"question": "Norway", "answer": "Oslo"},
+    ],
+    "distractors": ["Lyon"],
+    "explanation": "Capitals of European countries.",
+}
+
+
+def _get_question_type(question_type):
+    from src.question.types import get_question_type_registry
+
+    return get_question_type_registry().get_question_type(question_type)
+
+
+def test_validate_batch_all_valid():
+    """Test that a fully valid batch returns every item in order."""
+    from src.question.types import QuestionType
+    from src.question.types.mcq import MultipleChoiceData
+
+    mcq_type = _get_question_type(QuestionType.MULTIPLE_CHOICE)
+    items = [{**DEFAULT_MCQ_DATA, "question_text": f"Question {i}?"} for i in range(5)]
+
+    result = mcq_type.validate_batch(items)
+
+    assert result.errors == {}
+    assert sorted(result.valid) == [0, 1, 2, 3, 4]
+    assert all(isinstance(data, MultipleChoiceData) for data in result.valid.values())
+    assert result.valid[3].question_text == "Question 3?"
+
+
+def test_validate_batch_reports_errors_by_index():
+    """Test that invalid items are reported by index and valid ones are kept."""
+    from src.question.types import QuestionType
+
+    mcq_type = _get_question_type(QuestionType.MULTIPLE_CHOICE)
+    items = [
+        DEFAULT_MCQ_DATA,
+        {**DEFAULT_MCQ_DATA, "correct_answer": "Z"},
+        DEFAULT_MCQ_DATA,
+        {**DEFAULT_MCQ_DATA, "unexpected_field": "value"},
+    ]
+
+    result = mcq_type.validate_batch(items)
+
+    assert sorted(result.valid) == [0, 2]
+    assert sorted(result.errors) == [1, 3]
+    assert "correct_answer" in result.errors[1]
+    assert "unexpected_field" in result.errors[3]
+
+
+def test_validate_batch_applies_post_validation_rules():
+    """Test that cross-field business rules run for batch validation too."""
+    from src.question.types import QuestionType
+
+    matching_type = _get_question_type(QuestionType.MATCHING)
+    items = [MATCHING_DATA, {**MATCHING_DATA, "distractors": ["Paris"]}]
+
+    result = matching_type.validate_batch(items)
+
+    assert list(result.valid) == [0]
+    assert "matches a correct answer" in result.errors[1]
+
+
+def test_validate_batch_matches_validate_data():
+    """Test that batch validation produces the same data as validate_data."""
+    from src.question.types import QuestionType
+
+    matching_type = _get_question_type(QuestionType.MATCHING)
+
+    result = matching_type.validate_batch([MATCHING_DATA])
+
+    assert result.valid[0] == matching_type.validate_data(MATCHING_DATA)
+
+
+def test_list_adapter_is_cached_per_data_model():
+    """Test that the compiled list validator is built once per data model."""
+    from src.question.types.base import _get_list_adapter
+    from src.question.types.mcq import MultipleChoiceData
+    from src.question.types.true_false import TrueFalseData
+
+    assert _get_list_adapter(MultipleChoiceData) is _get_list_adapter(
+        MultipleChoiceData
+    )
+    assert _get_list_adapter(MultipleChoiceData) is not _get_list_adapter(TrueFalseData)
+
+
+def test_get_typed_data_reuses_cache_until_data_reassigned():
+    """Test that cached typed data is reused until question_data changes."""
+    from unittest.mock import patch
+
+    from src.question.types import Question, QuestionType, get_question_type_registry
+    from src.question.types.mcq import MultipleChoiceQuestionType
+
+    registry = get_question_type_registry()
+    question = Question(
+        id=uuid.uuid4(),
+        quiz_id=uuid.uuid4(),
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data=dict(DEFAULT_MCQ_DATA),
+    )
+
+    with patch.object(
+        MultipleChoiceQuestionType,
+        "validate_data",
+        side_effect=MultipleChoiceQuestionType.validate_data,
+        autospec=True,
+    ) as validate_spy:
+        first = question.get_typed_data(registry)
+        second = question.get_typed_data(registry)
+        assert first is second
+        assert validate_spy.call_count == 1
+
+        question.question_data = {**DEFAULT_MCQ_DATA, "question_text": "Changed?"}
+        third = question.get_typed_data(registry)
+        assert validate_spy.call_count == 2
+        assert third.question_text == "Changed?"
+
+
+def test_format_questions_batch_prevalidates_per_type():
+    """Test that list formatting validates each type once and keeps errors."""
+    from src.question.formatters import format_questions_batch
+    from src.question.types import Question, QuestionType
+
+    questions = [
+        Question(
+            id=uuid.uuid4(),
+            quiz_id=uuid.uuid4(),
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data=dict(DEFAULT_MCQ_DATA),
+        ),
+        Question(
+            id=uuid.uuid4(),
+            quiz_id=uuid.uuid4(),
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={**DEFAULT_MCQ_DATA, "correct_answer": "Z"},
+        ),
+        Question(
+            id=uuid.uuid4(),
+            quiz_id=uuid.uuid4(),
+            question_type=QuestionType.MATCHING,
+            question_data=dict(MATCHING_DATA),
+        ),
+    ]
+
+    results = format_questions_batch(questions)
+
+    assert "formatting_error" not in results[0]
+    assert "formatting_error" in results[1]
+    assert "formatting_error" not in results[2]
+    assert results[2]["pairs"][0] == {"question": "France", "answer": "Paris"}
@@ -0,0 +1,171 @@
+"""Micro-benchmarks for question type validation and formatting hot paths.
+
+Every generated question goes through ``validate_data`` and every question
+list request through ``format_for_display``; exports go through
+``format_for_canvas``. Payloads use realistic (near-maximum) sizes and the
+time budgets are deliberately generous so only gross CPU regressions fail.
+They are skipped unless RUN_BENCHMARKS is set, e.g.
+``RUN_BENCHMARKS=1 pytest -m benchmark``.
+"""
+
+import pytest
+
+# Mean seconds per call allowed before a benchmark is considered a regression
+MAX_MEAN_SECONDS = 0.005
+
+BENCHMARK_PAYLOADS = {
+    "multiple_choice": {
+        "question_text": "Which data structure offers O(1) average-case lookup by key?",
+        "option_a": "Linked list",
+        "option_b": "Hash table",
+        "option_c": "Binary search tree",
+        "option_d": "Sorted array",
+        "correct_answer": "B",
+        "explanation": "Hash tables map keys to buckets, giving O(1) average lookup.",
+    },
+    "multiple_answer": {
+        "question_text": "Which of the following are compiled languages?",
+        "option_a": "C",
+        "option_b": "Python",
+        "option_c": "Rust",
+        "option_d": "Go",
+        "option_e": "Bash",
+        "correct_answers": ["A", "C", "D"],
+        "explanation": "C, Rust and Go are compiled ahead of time.",
+    },
+    "true_false": {
+        "question_text": "TCP guarantees in-order delivery of bytes.",
+        "correct_answer": True,
+        "explanation": "TCP reorders segments so the byte stream arrives in order.",
+    },
+    "fill_in_blank": {
+        "question_text": " ".join(
+            f"Step {i} of the pipeline is [blank_{i}]." for i in range(1, 11)
+        ),
+        "blanks": [
+            {
+                "position": i,
+                "correct_answer": f"stage{i}",
+                "answer_variations": [f"Stage{i}", f"STAGE{i}", f"stage {i}", str(i)],
+            }
+            for i in range(1, 11)
+        ],
+        "explanation": "The pipeline stages run in numeric order.",
+    },
+    "matching": {
+        "question_text": "Match each country to its capital.",
+        "pairs": [
+            {"question": country, "answer": capital}
+            for country, capital in [
+                ("France", "Paris"),
+                ("Germany", "Berlin"),
+                ("Norway", "Oslo"),
+                ("Spain", "Madrid"),
+                ("Italy", "Rome"),
+                ("Sweden", "Stockholm"),
+                ("Finland", "Helsinki"),
+                ("Denmark", "Copenhagen"),
+                ("Poland", "Warsaw"),
+                ("Austria", "Vienna"),
+            ]
+        ],
+        "distractors": ["Lyon", "Munich", "Bergen", "Barcelona", "Milan"],
+        "explanation": "Each capital is the seat of its national government.",
+    },
+    "categorization": {
+        "question_text": "Categorize these animals by their biological class.",
+        "categories": [
+            {
+                "name": f"Category {c}",
+                "correct_items": [f"item_{c}_{i}" for i in range(5)],
+            }
+            for c in range(4)
+        ],
+        "items": [
+            {"id": f"item_{c}_{i}", "text": f"Animal {c}-{i}"}
+            for c in range(4)
+            for i in range(5)
+        ],
+        "distractors": [
+            {"id": f"dist_{i}", "text": f"Distractor {i}"} for i in range(5)
+        ],
+        "explanation": "Animals are grouped by their biological class.",
+    },
+}
+
+
+def _get_question_type(question_type_value: str):
+    from src.question.types import QuestionType, get_question_type_registry
+
+    registry = get_question_type_registry()
+    return registry.get_question_type(QuestionType(question_type_value))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("question_type_value", sorted(BENCHMARK_PAYLOADS))
+def test_benchmark_validate_data(benchmark, question_type_value):
+    """Benchmark validate_data for each question type."""
+    question_type = _get_question_type(question_type_value)
+    payload = BENCHMARK_PAYLOADS[question_type_value]
+
+    result = benchmark(question_type.validate_data, payload)
+
+    assert isinstance(result, question_type.data_model)
+    assert benchmark.stats["mean"] < MAX_MEAN_SECONDS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("question_type_value", sorted(BENCHMARK_PAYLOADS))
+def test_benchmark_format_for_display(benchmark, question_type_value):
+    """Benchmark format_for_display for each question type."""
+    question_type = _get_question_type(question_type_value)
+    data = question_type.validate_data(BENCHMARK_PAYLOADS[question_type_value])
+
+    result = benchmark(question_type.format_for_display, data)
+
+    assert result["question_type"] == question_type_value
+    assert benchmark.stats["mean"] < MAX_MEAN_SECONDS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("question_type_value", sorted(BENCHMARK_PAYLOADS))
+def test_benchmark_format_for_canvas(benchmark, question_type_value):
+    """Benchmark format_for_canvas for each question type."""
+    question_type = _get_question_type(question_type_value)
+    data = question_type.validate_data(BENCHMARK_PAYLOADS[question_type_value])
+
+    result = benchmark(question_type.format_for_canvas, data)
+
+    assert "interaction_type_slug" in result
+    assert benchmark.stats["mean"] < MAX_MEAN_SECONDS
+
+
+@pytest.mark.benchmark
+def test_benchmark_format_question_for_display():
+    """Benchmark the full display formatter used by question list requests."""
+    import uuid
+    from datetime import datetime, timezone
+
+    from src.question.formatters import format_question_for_display
+    from src.question.types import Question, QuestionDifficulty, QuestionType
+    from tests.conftest import BenchmarkTimer
+
+    questions = [
+        Question(
+            id=uuid.uuid4(),
+            quiz_id=uuid.uuid4(),
+            question_type=QuestionType(question_type_value),
+            question_data=payload,
+            difficulty=QuestionDifficulty.MEDIUM,
+            is_approved=False,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        for question_type_value, payload in BENCHMARK_PAYLOADS.items()
+    ]
+    benchmark = BenchmarkTimer(rounds=50)
+
+    results = benchmark(lambda: [format_question_for_display(q) for q in questions])
+
+    assert all("formatting_error" not in result for result in results)
+    assert benchmark.stats["mean"] < MAX_MEAN_SECONDS * len(questions)
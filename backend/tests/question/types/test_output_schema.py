@@ -0,0 +1,108 @@
+"""Tests for the structured-output JSON Schemas of question types."""
+
+import pytest
+
+from tests.test_data import DEFAULT_FILL_IN_BLANK_DATA, DEFAULT_MCQ_DATA
+
+
+def _walk_objects(schema):
+    """Yield every object schema nested in a JSON Schema."""
+    if isinstance(schema, dict):
+        if schema.get("type") == "object":
+            yield schema
+        for key, value in schema.items():
+            if key in ("properties", "$defs"):
+                for sub in value.values():
+                    yield from _walk_objects(sub)
+            else:
+                yield from _walk_objects(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _walk_objects(item)
+
+
+@pytest.mark.parametrize(
+    "question_type",
+    [
+        "multiple_choice",
+        "multiple_answer",
+        "fill_in_blank",
+        "matching",
+        "categorization",
+        "true_false",
+    ],
+)
+def test_output_schema_is_strict(question_type):
+    """Test that every object requires all its fields and forbids others."""
+    from src.question.types import QuestionType, get_question_type_registry
+
+    impl = get_question_type_registry().get_question_type(QuestionType(question_type))
+    schema = impl.get_output_schema()
+
+    assert schema["required"] == ["questions"]
+    assert schema["properties"]["questions"]["type"] == "array"
+    objects = list(_walk_objects(schema))
+    assert len(objects) >= 2
+    for obj in objects:
+        assert obj["additionalProperties"] is False
+        assert sorted(obj["required"]) == sorted(obj["properties"])
+
+    # Keywords strict mode rejects are left to validation
+    serialized = str(schema)
+    for keyword in ("'minLength'", "'maxLength'", "'pattern'", "'default'"):
+        assert keyword not in serialized
+
+    # Cached per data model
+    assert impl.get_output_schema() is schema
+
+
+def test_output_schema_keeps_optional_fields_nullable():
+    """Test that optional fields may be sent as null."""
+    from src.question.types import QuestionType, get_question_type_registry
+
+    impl = get_question_type_registry().get_question_type(QuestionType.FILL_IN_BLANK)
+    schema = impl.get_output_schema()
+
+    explanation = schema["properties"]["questions"]["items"]["properties"][
+        "explanation"
+    ]
+    assert {"type": "null"} in explanation["anyOf"]
+    blank = schema["$defs"]["BlankData"]
+    assert {"type": "null"} in blank["properties"]["answer_variations"]["anyOf"]
+
+
+def test_structured_response_validates_against_data_model():
+    """Test that a schema-shaped response parses into valid question data."""
+    import json
+    from unittest.mock import MagicMock
+
+    from src.question.types import QuestionType, get_question_type_registry
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=MagicMock(), template_manager=MagicMock()
+    )
+    blank_question = {
+        **DEFAULT_FILL_IN_BLANK_DATA,
+        "explanation": None,
+        "blanks": [
+            {**blank, "answer_variations": None}
+            for blank in DEFAULT_FILL_IN_BLANK_DATA["blanks"]
+        ],
+    }
+    response = json.dumps({"questions": [blank_question]})
+
+    items = workflow._parse_batch_response(response)
+    result = (
+        get_question_type_registry()
+        .get_question_type(QuestionType.FILL_IN_BLANK)
+        .validate_batch(items)
+    )
+
+    assert result.errors == {}
+    assert result.valid[0].explanation is None
+
+    # Plain arrays are still accepted
+    assert workflow._parse_batch_response(json.dumps([DEFAULT_MCQ_DATA])) == [
+        DEFAULT_MCQ_DATA
+    ]
@@ -0,0 +1,349 @@
+"""Tests for output-token-aware batch splitting."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+
+def _question(text: str):
+    from src.question.types import Question, QuestionType
+
+    return Question(
+        quiz_id=uuid4(),
+        question_type=QuestionType.MATCHING,
+        question_data={"question_text": text},
+    )
+
+
+def test_plan_keeps_small_batches_whole_and_splits_long_ones():
+    """Test that only batches with long expected completions are split."""
+    from src.question.types import QuestionType
+    from src.question.workflows.batch_planning import OutputTokenEstimator
+
+    estimator = OutputTokenEstimator()
+
+    with (
+        patch("src.config.settings.GENERATION_SUB_BATCH_OUTPUT_TOKENS", 4000),
+        patch("src.config.settings.GENERATION_MAX_SUB_BATCHES", 4),
+    ):
+        assert estimator.plan(QuestionType.TRUE_FALSE, 10) == [10]
+        assert estimator.plan(QuestionType.MATCHING, 20) == [7, 7, 6]
+        # Capped at GENERATION_MAX_SUB_BATCHES
+        assert estimator.plan(QuestionType.CATEGORIZATION, 40) == [10, 10, 10, 10]
+
+
+def test_recorded_usage_moves_the_estimate():
+    """Test that observed completion sizes refine the split."""
+    from src.question.types import QuestionType
+    from src.question.workflows.batch_planning import OutputTokenEstimator
+
+    estimator = OutputTokenEstimator()
+    before = estimator.tokens_per_question(QuestionType.MULTIPLE_CHOICE)
+
+    for _ in range(20):
+        estimator.record(QuestionType.MULTIPLE_CHOICE, 8000, 10)
+    estimator.record(QuestionType.MULTIPLE_CHOICE, 0, 10)  # No usage reported
+
+    after = estimator.tokens_per_question(QuestionType.MULTIPLE_CHOICE)
+    assert before < after <= 800
+
+    with (
+        patch("src.config.settings.GENERATION_SUB_BATCH_OUTPUT_TOKENS", 4000),
+        patch("src.config.settings.GENERATION_MAX_SUB_BATCHES", 4),
+    ):
+        assert len(estimator.plan(QuestionType.MULTIPLE_CHOICE, 20)) == 4
+
+
+def test_dedupe_questions_ignores_case_and_whitespace():
+    """Test that repeated question texts are dropped, first one kept."""
+    from src.question.workflows.batch_planning import dedupe_questions
+
+    first = _question("Match the organelle  to its function")
+    questions = [
+        first,
+        _question("Match the organelle to its function "),
+        _question("MATCH THE ORGANELLE TO ITS FUNCTION"),
+        _question("Match the enzyme to its substrate"),
+    ]
+
+    unique = dedupe_questions(questions)
+
+    assert [q.question_data["question_text"] for q in unique] == [
+        "Match the organelle  to its function",
+        "Match the enzyme to its substrate",
+    ]
+    assert unique[0] is first
+
+
+@pytest.mark.asyncio
+async def test_processor_runs_sub_batches_and_keeps_batch_key():
+    """Test that a split batch is merged and tracked under its batch_key."""
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchWorkflow,
+        ParallelModuleProcessor,
+    )
+
+    calls = []
+
+    async def process_module(**kwargs):
+        calls.append(kwargs["question_count"])
+        index = len(calls)
+        questions = [
+            _question(f"Sub-request {index} question {i}")
+            for i in range(kwargs["question_count"])
+        ]
+        # Every sub-request repeats one shared question
+        return questions[:-1] + [_question("Shared question")]
+
+    processor = ParallelModuleProcessor(
+        llm_provider=MagicMock(), template_manager=MagicMock()
+    )
+    modules_data = {
+        "module_1": {
+            "name": "Cells",
+            "content": "Cells are the basic unit of life.",
+            "batches": [
+                {
+                    "question_type": QuestionType.MATCHING,
+                    "count": 20,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": "module_1_matching_20_medium",
+                }
+            ],
+        }
+    }
+
+    persist = AsyncMock()
+
+    with (
+        patch("src.config.settings.GENERATION_SUB_BATCH_OUTPUT_TOKENS", 4000),
+        patch("src.config.settings.GENERATION_MAX_SUB_BATCHES", 4),
+        patch.object(
+            ModuleBatchWorkflow,
+            "process_module",
+            AsyncMock(side_effect=process_module),
+        ),
+        patch.object(ModuleBatchWorkflow, "persist_questions", persist),
+        patch(
+            "src.question.workflows.module_batch_workflow.get_output_token_estimator"
+        ) as mock_estimator,
+    ):
+        mock_estimator.return_value.plan.return_value = [7, 7, 6]
+        results, batch_status = await processor.process_all_modules_with_batches(
+            uuid4(), modules_data
+        )
+
+    assert sorted(calls) == [6, 7, 7]
+    # 20 generated, the shared question kept once: short of the target, so
+    # nothing is saved and the retry regenerates the whole batch
+    assert results["module_1"] == []
+    persist.assert_not_awaited()
+    assert batch_status["failed_batches"] == ["module_1_matching_20_medium"]
+    assert batch_status["successful_batches"] == []
+
+
+@pytest.mark.asyncio
+async def test_split_batch_is_saved_once_all_sub_requests_succeed():
+    """Test that sub-request questions are saved together, not one by one."""
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchWorkflow,
+        ParallelModuleProcessor,
+    )
+
+    calls = []
+
+    async def process_module(**kwargs):
+        assert kwargs["defer_save"] is True
+        calls.append(kwargs)
+        return [
+            _question(f"Sub-request {len(calls)} question {i}")
+            for i in range(kwargs["question_count"])
+        ]
+
+    processor = ParallelModuleProcessor(
+        llm_provider=MagicMock(), template_manager=MagicMock()
+    )
+    modules_data = {
+        "module_1": {
+            "name": "Cells",
+            "content": "Cells are the basic unit of life. " * 50,
+            "batches": [
+                {
+                    "question_type": QuestionType.MATCHING,
+                    "count": 10,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": "module_1_matching_10_medium",
+                }
+            ],
+        }
+    }
+    persist = AsyncMock()
+
+    with (
+        patch.object(
+            ModuleBatchWorkflow,
+            "process_module",
+            AsyncMock(side_effect=process_module),
+        ),
+        patch.object(ModuleBatchWorkflow, "persist_questions", persist),
+        patch(
+            "src.question.workflows.module_batch_workflow.get_output_token_estimator"
+        ) as mock_estimator,
+    ):
+        mock_estimator.return_value.plan.return_value = [5, 5]
+        results, batch_status = await processor.process_all_modules_with_batches(
+            uuid4(), modules_data
+        )
+
+    persist.assert_awaited_once()
+    (saved,) = persist.await_args.args
+    assert len(saved) == 10
+    assert results["module_1"] == saved
+    assert batch_status["successful_batches"] == ["module_1_matching_10_medium"]
+
+
+@pytest.mark.asyncio
+async def test_batch_deadline_fails_stuck_batch_without_saving_it():
+    """Test that a batch past its deadline saves nothing and others complete."""
+    import asyncio
+
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchWorkflow,
+        ParallelModuleProcessor,
+    )
+
+    cancelled = []
+
+    async def process_module(**kwargs):
+        if kwargs["question_type"] is QuestionType.MATCHING and (
+            kwargs["content_key"].endswith(":1")
+        ):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["content_key"])
+                raise
+        return [
+            _question(f"{kwargs['content_key']} question {i}")
+            for i in range(kwargs["question_count"])
+        ]
+
+    def plan(question_type, count):
+        # Matching batches are split into two sub-requests
+        if question_type is QuestionType.MATCHING:
+            return [count // 2, count - count // 2]
+        return [count]
+
+    processor = ParallelModuleProcessor(
+        llm_provider=MagicMock(), template_manager=MagicMock(), batch_timeout=0.1
+    )
+    modules_data = {
+        "module_1": {
+            "name": "Cells",
+            "content": "Cells are the basic unit of life. " * 50,
+            "batches": [
+                {
+                    "question_type": QuestionType.MATCHING,
+                    "count": 6,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": "module_1_matching_6_medium",
+                },
+                {
+                    "question_type": QuestionType.TRUE_FALSE,
+                    "count": 4,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": "module_1_true_false_4_medium",
+                },
+            ],
+        }
+    }
+
+    persist = AsyncMock()
+
+    with (
+        patch.object(
+            ModuleBatchWorkflow,
+            "process_module",
+            AsyncMock(side_effect=process_module),
+        ),
+        patch.object(ModuleBatchWorkflow, "persist_questions", persist),
+        patch(
+            "src.question.workflows.module_batch_workflow.get_output_token_estimator"
+        ) as mock_estimator,
+    ):
+        mock_estimator.return_value.plan.side_effect = plan
+        results, batch_status = await asyncio.wait_for(
+            processor.process_all_modules_with_batches(uuid4(), modules_data),
+            timeout=5,
+        )
+
+    assert cancelled == ["module_1:1"]
+    assert batch_status["failed_batches"] == ["module_1_matching_6_medium"]
+    assert batch_status["successful_batches"] == ["module_1_true_false_4_medium"]
+    # Only the true/false batch is saved; the finished matching sub-request
+    # is dropped with its batch, which is regenerated in full on retry
+    persist.assert_awaited_once()
+    assert len(results["module_1"]) == 4
+    assert persist.await_args.args[0] == results["module_1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_deadline_leaves_out_queue_wait():
+    """Test that a batch waiting for a generation slot is not timed out."""
+    import asyncio
+
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchWorkflow,
+        ParallelModuleProcessor,
+    )
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    scheduler = GenerationScheduler(capacity=1, reserved_interactive=0)
+
+    async def process_module(self, **kwargs):
+        async with scheduler.slot(self.priority, self.clock):
+            return [_question(f"Question {i}") for i in range(kwargs["question_count"])]
+
+    async def busy_slot():
+        async with scheduler.slot(GenerationPriority.INTERACTIVE):
+            await asyncio.sleep(0.3)
+
+    processor = ParallelModuleProcessor(
+        llm_provider=MagicMock(), template_manager=MagicMock(), batch_timeout=0.1
+    )
+    modules_data = {
+        "module_1": {
+            "name": "Cells",
+            "content": "Cells are the basic unit of life.",
+            "batches": [
+                {
+                    "question_type": QuestionType.TRUE_FALSE,
+                    "count": 3,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": "module_1_true_false_3_medium",
+                }
+            ],
+        }
+    }
+
+    busy = asyncio.create_task(busy_slot())
+    await asyncio.sleep(0)
+    with (
+        patch.object(ModuleBatchWorkflow, "process_module", process_module),
+        patch.object(ModuleBatchWorkflow, "persist_questions", AsyncMock()),
+    ):
+        results, batch_status = await processor.process_all_modules_with_batches(
+            uuid4(), modules_data
+        )
+    await busy
+
+    assert batch_status["successful_batches"] == ["module_1_true_false_3_medium"]
+    assert len(results["module_1"]) == 3
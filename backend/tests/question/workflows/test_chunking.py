@@ -0,0 +1,97 @@
+"""Tests for token-bounded content chunking and selection."""
+
+
+def _paragraphs(count: int, words: int = 60) -> list[str]:
+    """Build distinct paragraphs that each discuss their own topic."""
+    return [
+        " ".join([f"topic{i:02d} concept{i:02d} detail{i:02d}"] * (words // 3)) + "."
+        for i in range(count)
+    ]
+
+
+def test_small_content_sent_unchanged_to_every_batch():
+    """Test that content within the budget is not chunked."""
+    from src.question.workflows.chunking import select_batch_contents
+
+    content = "Photosynthesis converts light energy.\n\nChlorophyll absorbs light."
+
+    assert select_batch_contents(content, 3, token_budget=1000) == [content] * 3
+
+
+def test_split_into_chunks_bounds_tokens_and_overlaps():
+    """Test that chunks stay within the token limit and share boundary text."""
+    from src.content_extraction.utils import estimate_token_count
+    from src.question.workflows.chunking import split_into_chunks
+
+    paragraphs = _paragraphs(12)
+    content = "\n\n".join(paragraphs)
+    paragraph_tokens = estimate_token_count(paragraphs[0])
+
+    chunks = split_into_chunks(
+        content,
+        max_tokens=paragraph_tokens * 3 + 5,
+        overlap_tokens=paragraph_tokens,
+        source="module_1",
+    )
+
+    assert len(chunks) > 1
+    for index, chunk in enumerate(chunks):
+        assert chunk.metadata["index"] == index
+        assert chunk.metadata["token_count"] <= paragraph_tokens * 3 + 5
+        assert chunk.source == "module_1"
+
+    # The last paragraph of a chunk is repeated at the start of the next one
+    for previous, following in zip(chunks, chunks[1:], strict=False):
+        assert following.content.startswith(previous.content.split("\n\n")[-1])
+
+    # Every paragraph is covered
+    assert all(any(p in chunk.content for chunk in chunks) for p in paragraphs)
+
+
+def test_split_into_chunks_cuts_oversized_paragraphs():
+    """Test that a paragraph without sentence breaks is cut to the limit."""
+    from src.question.workflows.chunking import split_into_chunks
+
+    chunks = split_into_chunks("x" * 1000, max_tokens=50, overlap_tokens=0)
+
+    assert len(chunks) == 5
+    assert all(chunk.metadata["token_count"] <= 50 for chunk in chunks)
+
+
+def test_score_chunks_prefers_distinctive_content():
+    """Test that boilerplate repeated across chunks scores lowest."""
+    from src.question.workflows.base import ContentChunk
+    from src.question.workflows.chunking import score_chunks
+
+    boilerplate = "course page footer copyright university course page footer"
+    chunks = [
+        ContentChunk(content=f"{boilerplate} mitochondria produce atp energy"),
+        ContentChunk(content=f"{boilerplate} ribosomes translate messenger rna"),
+        ContentChunk(content=f"{boilerplate} {boilerplate} {boilerplate}"),
+    ]
+
+    scores = score_chunks(chunks)
+
+    assert scores[2] < min(scores[0], scores[1])
+    assert score_chunks([]) == []
+
+
+def test_select_batch_contents_spreads_batches_within_budget():
+    """Test that large modules are bounded and batches cover different chunks."""
+    from src.content_extraction.utils import estimate_token_count
+    from src.question.workflows.chunking import select_batch_contents
+
+    paragraphs = _paragraphs(20)
+    content = "\n\n".join(paragraphs)
+    budget = estimate_token_count(content) // 4
+
+    contents = select_batch_contents(content, 2, token_budget=budget)
+
+    assert len(contents) == 2
+    assert all(0 < estimate_token_count(text) <= budget for text in contents)
+    assert contents[0] != contents[1]
+
+    # Selected passages keep their document order
+    for text in contents:
+        positions = [content.index(p) for p in text.split("\n\n")]
+        assert positions == sorted(positions)
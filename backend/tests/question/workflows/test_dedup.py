@@ -0,0 +1,188 @@
+"""Tests for near-duplicate question detection."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+
+def _mcq(question_text: str, options: tuple[str, str, str, str]) -> dict:
+    return {
+        "question_text": question_text,
+        "option_a": options[0],
+        "option_b": options[1],
+        "option_c": options[2],
+        "option_d": options[3],
+        "correct_answer": "A",
+        "explanation": "Explanations are not compared.",
+    }
+
+
+def test_reworded_question_is_detected_as_duplicate():
+    """Test that small rewordings of an indexed question are caught."""
+    from src.question.workflows.dedup import DuplicateIndex
+
+    index = DuplicateIndex(threshold=0.5)
+    original = _mcq(
+        "Which organelle produces most of the ATP used by a eukaryotic cell?",
+        ("Mitochondrion", "Ribosome", "Golgi apparatus", "Lysosome"),
+    )
+    reworded = _mcq(
+        "Which organelle produces most of the ATP used by the eukaryotic cell?",
+        ("Mitochondrion", "Ribosome", "Golgi apparatus", "Lysosome"),
+    )
+
+    assert index.add_if_unique(original) is None
+    assert index.add_if_unique(reworded) == original["question_text"]
+    assert len(index) == 1
+
+
+def test_distinct_questions_are_kept():
+    """Test that questions on different facts are not flagged."""
+    from src.question.workflows.dedup import DuplicateIndex
+
+    index = DuplicateIndex(threshold=0.5)
+    questions = [
+        _mcq(
+            "Which organelle produces most of the ATP used by a eukaryotic cell?",
+            ("Mitochondrion", "Ribosome", "Golgi apparatus", "Lysosome"),
+        ),
+        _mcq(
+            "Which molecule carries amino acids to the ribosome during translation?",
+            ("Transfer RNA", "Messenger RNA", "DNA polymerase", "Glucose"),
+        ),
+        _mcq(
+            "What is the capital of Norway?",
+            ("Oslo", "Bergen", "Trondheim", "Stavanger"),
+        ),
+    ]
+
+    assert [index.add_if_unique(q) for q in questions] == [None, None, None]
+    assert len(index) == 3
+
+
+def test_similarity_estimate_tracks_overlap():
+    """Test that signatures of identical text match and unrelated text does not."""
+    from src.question.workflows.dedup import estimate_similarity, minhash_signature
+
+    text = "photosynthesis converts light energy into chemical energy in plants"
+    signature = minhash_signature(text)
+
+    assert signature == minhash_signature(text.upper())
+    assert estimate_similarity(signature, minhash_signature(text)) == 1.0
+    assert (
+        estimate_similarity(
+            signature, minhash_signature("the treaty of westphalia ended the war")
+        )
+        < 0.2
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_batch_drops_duplicates_of_other_batches():
+    """Test that a question already generated for the quiz is not kept again."""
+    from src.question.providers import BaseLLMProvider
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import QuestionType
+    from src.question.workflows.dedup import DuplicateIndex
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    existing = _mcq(
+        "Which organelle produces most of the ATP used by a eukaryotic cell?",
+        ("Mitochondrion", "Ribosome", "Golgi apparatus", "Lysosome"),
+    )
+    new = _mcq(
+        "What is the capital of Norway?",
+        ("Oslo", "Bergen", "Trondheim", "Stavanger"),
+    )
+    index = DuplicateIndex(threshold=0.7)
+    index.add(existing)
+
+    provider = MagicMock(spec=BaseLLMProvider)
+    template_manager = MagicMock(spec=TemplateManager)
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider,
+        template_manager=template_manager,
+        duplicate_index=index,
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Cells",
+        content_key=workflow.add_content("Cells are the basic unit of life."),
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        raw_response=json.dumps([existing, new]),
+    )
+
+    result = await workflow.validate_batch(state)
+
+    assert [q.question_data["question_text"] for q in result.generated_questions] == [
+        new["question_text"]
+    ]
+    assert result.duplicate_question_texts == [existing["question_text"]]
+    # One question short, so the batch is retried for the missing question
+    assert workflow.should_retry(result) == "retry"
+    # Not saved yet, so not in the quiz's index
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_unsaved_questions_do_not_block_other_batches():
+    """Test that questions enter the quiz's index only once they are saved."""
+    from src.question.providers import BaseLLMProvider
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import QuestionType
+    from src.question.workflows.dedup import DuplicateIndex
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    question = _mcq(
+        "What is the capital of Norway?",
+        ("Oslo", "Bergen", "Trondheim", "Stavanger"),
+    )
+    index = DuplicateIndex(threshold=0.7)
+
+    def validate(workflow):
+        state = ModuleBatchState(
+            quiz_id=uuid4(),
+            module_id="module_1",
+            module_name="Geography",
+            content_key=workflow.add_content("Norway is a country."),
+            target_question_count=1,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            raw_response=json.dumps([question]),
+        )
+        return workflow.validate_batch(state)
+
+    def batch_workflow():
+        return ModuleBatchWorkflow(
+            llm_provider=MagicMock(spec=BaseLLMProvider),
+            template_manager=MagicMock(spec=TemplateManager),
+            duplicate_index=index,
+        )
+
+    # A batch that fails after validation leaves the question available
+    failed = await validate(batch_workflow())
+    assert len(failed.generated_questions) == 1
+
+    saved = batch_workflow()
+    result = await validate(saved)
+    assert len(result.generated_questions) == 1
+    with patch(
+        "src.question.workflows.module_batch_workflow.get_async_session"
+    ) as mock_get_session:
+        mock_get_session.return_value.__aenter__.return_value = AsyncMock()
+        await saved.persist_questions(result.generated_questions)
+    assert len(index) == 1
+
+    # Once saved, other batches drop it
+    later = await validate(batch_workflow())
+    assert later.generated_questions == []
+    assert later.duplicate_question_texts == [question["question_text"]]
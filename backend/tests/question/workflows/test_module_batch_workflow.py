@@ -1,5 +1,6 @@
 """Tests for module batch workflow."""
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -363,9 +364,7 @@ def test_processor_initialization_with_tone(test_llm_provider, test_template_man
 
 
 @pytest.mark.asyncio
-async def test_state_creation_with_valid_providers(
-    test_llm_provider, test_template_manager
-):
+async def test_state_creation_with_valid_providers():
     """Test ModuleBatchState creation with valid providers."""
     from src.question.workflows.module_batch_workflow import ModuleBatchState
 
@@ -373,12 +372,10 @@ async def test_state_creation_with_valid_providers(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key="test-content",
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     assert state.module_id == "test-module"
@@ -390,7 +387,7 @@ async def test_state_creation_with_valid_providers(
 
 
 @pytest.mark.asyncio
-async def test_state_creation_with_tone(test_llm_provider, test_template_manager):
+async def test_state_creation_with_tone():
     """Test ModuleBatchState creation with tone parameter."""
     from src.question.workflows.module_batch_workflow import ModuleBatchState
 
@@ -398,12 +395,10 @@ async def test_state_creation_with_tone(test_llm_provider, test_template_manager
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key="test-content",
         target_question_count=8,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         tone="casual",
     )
 
@@ -417,9 +412,7 @@ async def test_state_creation_with_tone(test_llm_provider, test_template_manager
 
 
 @pytest.mark.asyncio
-async def test_state_creation_with_tone_and_norwegian(
-    test_llm_provider, test_template_manager
-):
+async def test_state_creation_with_tone_and_norwegian():
     """Test ModuleBatchState creation with tone and Norwegian language."""
     from src.question.workflows.module_batch_workflow import ModuleBatchState
 
@@ -427,12 +420,10 @@ async def test_state_creation_with_tone_and_norwegian(
         quiz_id=uuid4(),
         module_id="norsk-modul",
         module_name="Norsk Modul",
-        module_content="Norsk innhold for spørsmålsgenerering",
+        content_key="test-content",
         target_question_count=6,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.NORWEGIAN,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         tone="encouraging",
     )
 
@@ -462,12 +453,10 @@ async def test_prepare_prompt_workflow_node(test_llm_provider, test_template_man
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key=workflow.add_content("Test content for generating questions"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     result = await workflow.prepare_prompt(state)
@@ -497,12 +486,10 @@ async def test_prepare_prompt_workflow_node_with_tone(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key=workflow.add_content("Test content for generating questions"),
         target_question_count=7,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         tone="academic",
     )
 
@@ -535,12 +522,10 @@ async def test_prepare_prompt_workflow_node_with_tone_and_norwegian(
         quiz_id=uuid4(),
         module_id="norsk-modul",
         module_name="Norsk Modul",
-        module_content="Norsk innhold for spørsmålsgenerering",
+        content_key=workflow.add_content("Norsk innhold for spørsmålsgenerering"),
         target_question_count=4,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.NORWEGIAN,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         tone="professional",
     )
 
@@ -570,12 +555,10 @@ async def test_generate_batch_workflow_node(test_llm_provider, test_template_man
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         system_prompt="You are an expert educator creating multiple-choice quiz questions.",
         user_prompt="Generate questions about France",
     )
@@ -587,6 +570,141 @@ async def test_generate_batch_workflow_node(test_llm_provider, test_template_man
     assert "Paris is the capital of France" in result.raw_response
 
 
+@pytest.mark.asyncio
+async def test_generate_batch_records_calls_in_usage_ledger(
+    test_llm_provider, test_template_manager
+):
+    """Test that each LLM call is recorded with why it was made."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+    from src.quiz.usage_ledger import LLMUsageLedger
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="test-module",
+        module_name="Test Module",
+        content_key=workflow.add_content("Test content"),
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        batch_key="test-module_multiple_choice_5_medium",
+        system_prompt="You are an expert educator.",
+        user_prompt="Generate questions about France",
+    )
+    ledger = LLMUsageLedger(flush_size=100)
+
+    with patch("src.quiz.usage_ledger._llm_usage_ledger", ledger):
+        state = await workflow.generate_batch(state)
+        state.parsing_error = True
+        state = await workflow.prepare_correction(state)
+        await workflow.generate_batch(state)
+
+    calls = ledger._buffer
+    assert [call["call_kind"] for call in calls] == ["initial", "json_correction"]
+    assert calls[0]["batch_key"] == "test-module_multiple_choice_5_medium"
+    assert calls[0]["question_type"] == "multiple_choice"
+    assert calls[0]["language"] == "en"
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_records_both_copies_of_a_hedged_request(
+    test_llm_provider, test_template_manager
+):
+    """Test that the cut-off copy of a hedged request is counted too."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+    from src.quiz.usage_ledger import LLMUsageLedger
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="test-module",
+        module_name="Test Module",
+        content_key=workflow.add_content("Test content"),
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        batch_key="test-module_multiple_choice_5_medium",
+        system_prompt="You are an expert educator.",
+        user_prompt="Generate questions about France",
+    )
+    response = await test_llm_provider.generate([])
+    response.metadata["duplicate_request_latencies"] = [4.5]
+    ledger = LLMUsageLedger(flush_size=100)
+
+    with (
+        patch.object(
+            test_llm_provider,
+            "generate_with_retry",
+            AsyncMock(return_value=response),
+        ),
+        patch("src.quiz.usage_ledger._llm_usage_ledger", ledger),
+        patch("src.quiz.usage.add_generation_tokens") as add_tokens,
+    ):
+        await workflow.generate_batch(state)
+
+    assert [call["latency"] for call in ledger._buffer] == [
+        response.response_time,
+        4.5,
+    ]
+    assert add_tokens.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_requests_question_type_schema(
+    test_llm_provider, test_template_manager
+):
+    """Test that providers with structured output get the question type schema."""
+    from src.question.types import get_question_type_registry
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="test-module",
+        module_name="Test Module",
+        content_key=workflow.add_content("Test content"),
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        system_prompt="System",
+        user_prompt="User",
+    )
+    generate = AsyncMock(wraps=test_llm_provider.generate_with_retry)
+
+    with (
+        patch.object(
+            type(test_llm_provider),
+            "supports_structured_output",
+            new_callable=lambda: property(lambda self: True),
+        ),
+        patch.object(test_llm_provider, "generate_with_retry", generate),
+    ):
+        result = await workflow.generate_batch(state)
+
+    expected = (
+        get_question_type_registry()
+        .get_question_type(QuestionType.MULTIPLE_CHOICE)
+        .get_output_schema()
+    )
+    assert generate.call_args.kwargs["response_schema"] is expected
+    assert result.workflow_metadata["structured_output"] is True
+
+
 @pytest.mark.asyncio
 async def test_validate_batch_workflow_node(
     test_llm_provider, test_template_manager, valid_mcq_response
@@ -606,12 +724,10 @@ async def test_validate_batch_workflow_node(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         raw_response=valid_mcq_response,
     )
 
@@ -647,12 +763,10 @@ async def test_validate_batch_invalid_json_workflow_node(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         raw_response="Invalid JSON response",
     )
 
@@ -680,11 +794,9 @@ def test_check_json_error_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         parsing_error=True,
         correction_attempts=0,
         max_corrections=2,
@@ -697,11 +809,9 @@ def test_check_json_error_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         parsing_error=False,
     )
 
@@ -737,11 +847,9 @@ def test_should_retry_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         generated_questions=mock_questions,
     )
 
@@ -752,11 +860,9 @@ def test_should_retry_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         generated_questions=[],
         retry_count=1,
         max_retries=3,
@@ -769,11 +875,9 @@ def test_should_retry_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         error_message="Critical error",
     )
 
@@ -988,11 +1092,9 @@ def test_check_error_type_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         parsing_error=True,
         correction_attempts=0,
         max_corrections=2,
@@ -1005,11 +1107,9 @@ def test_check_error_type_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         validation_error=True,
         validation_correction_attempts=0,
         max_validation_corrections=2,
@@ -1025,11 +1125,9 @@ def test_check_error_type_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         parsing_error=False,
         validation_error=False,
     )
@@ -1041,11 +1139,9 @@ def test_check_error_type_conditions(test_llm_provider, test_template_manager):
         quiz_id=uuid4(),
         module_id="test",
         module_name="Test",
-        module_content="Test",
+        content_key=workflow.add_content("Test"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         validation_error=True,
         validation_correction_attempts=2,
         max_validation_corrections=2,
@@ -1074,12 +1170,10 @@ async def test_prepare_validation_correction_workflow_node(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         validation_error=True,
         failed_questions_data=[
             {"question_text": "What is 2 + 2?", "option_a": "3", "option_b": "4"},
@@ -1128,12 +1222,10 @@ async def test_prepare_validation_correction_fib_workflow_node(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=3,
         question_type=QuestionType.FILL_IN_BLANK,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         validation_error=True,
         failed_questions_data=[
             {
@@ -1191,12 +1283,10 @@ async def test_validate_batch_sets_validation_error_flags(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         raw_response=invalid_mcq_response,
     )
 
@@ -1335,11 +1425,9 @@ async def test_preserve_successful_questions_on_validation_failure(
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=2,
         question_type=QuestionType.CATEGORIZATION,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         raw_response=mock_mixed_success_response,
     )
 
@@ -1399,11 +1487,9 @@ async def test_validation_correction_with_specific_questions(
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=2,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         validation_error=True,
         failed_questions_data=[
             {
@@ -1467,11 +1553,9 @@ async def test_question_counting_with_mixed_success(test_template_manager):
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=10,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         successful_questions_preserved=[
             Mock(spec=Question)
             for _ in range(7)  # 7 successful questions
@@ -1522,11 +1606,9 @@ async def test_save_questions_combines_preserved_and_new(test_template_manager):
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         successful_questions_preserved=preserved_questions,
         generated_questions=new_questions,
     )
@@ -1574,11 +1656,9 @@ async def test_retry_generation_clears_failed_question_state(test_template_manag
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         failed_questions_data=[{"question": "failed"}],
         failed_questions_errors=["error message"],
         successful_questions_preserved=[Mock(spec=Question) for _ in range(2)],
@@ -1627,11 +1707,9 @@ async def test_prepare_prompt_calculates_remaining_questions_correctly(
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content for questions",
+        content_key=workflow.add_content("Test content for questions"),
         target_question_count=10,
         question_type=QuestionType.MULTIPLE_CHOICE,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         successful_questions_preserved=[
             Mock(spec=Question) for _ in range(6)
         ],  # 6 preserved
@@ -1710,11 +1788,9 @@ async def test_no_questions_preserved_when_all_succeed(test_template_manager):
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=2,
         question_type=QuestionType.CATEGORIZATION,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         raw_response=valid_response,
     )
 
@@ -1753,11 +1829,9 @@ async def test_all_questions_fail_validation(
         quiz_id=uuid4(),
         module_id="test_module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=2,
         question_type=QuestionType.CATEGORIZATION,
-        llm_provider=llm_provider,
-        template_manager=test_template_manager,
         raw_response=mock_all_invalid_response,
     )
 
@@ -1805,7 +1879,7 @@ def test_workflow_initialization_with_difficulty(
 
 
 @pytest.mark.asyncio
-async def test_state_creation_with_difficulty(test_llm_provider, test_template_manager):
+async def test_state_creation_with_difficulty():
     """Test ModuleBatchState creation with difficulty parameter."""
     from src.question.types import QuestionDifficulty
     from src.question.workflows.module_batch_workflow import ModuleBatchState
@@ -1814,13 +1888,11 @@ async def test_state_creation_with_difficulty(test_llm_provider, test_template_m
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key="test-content",
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.HARD,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     assert state.module_id == "test-module"
@@ -1833,9 +1905,7 @@ async def test_state_creation_with_difficulty(test_llm_provider, test_template_m
 
 
 @pytest.mark.asyncio
-async def test_state_creation_with_difficulty_and_tone(
-    test_llm_provider, test_template_manager
-):
+async def test_state_creation_with_difficulty_and_tone():
     """Test ModuleBatchState creation with both difficulty and tone."""
     from src.question.types import QuestionDifficulty
     from src.question.workflows.module_batch_workflow import ModuleBatchState
@@ -1844,14 +1914,12 @@ async def test_state_creation_with_difficulty_and_tone(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key="test-content",
         target_question_count=8,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.EASY,
         tone="professional",
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     assert state.module_id == "test-module"
@@ -1884,13 +1952,11 @@ async def test_prepare_prompt_workflow_node_with_difficulty(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key=workflow.add_content("Test content for generating questions"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.HARD,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     result = await workflow.prepare_prompt(state)
@@ -1922,14 +1988,12 @@ async def test_prepare_prompt_workflow_node_with_difficulty_and_tone(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content for generating questions",
+        content_key=workflow.add_content("Test content for generating questions"),
         target_question_count=7,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.MEDIUM,
         tone="academic",
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     result = await workflow.prepare_prompt(state)
@@ -1961,13 +2025,11 @@ async def test_validate_batch_applies_difficulty_to_questions(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=5,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.HARD,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         raw_response=valid_mcq_response,
     )
 
@@ -2009,13 +2071,11 @@ async def test_validate_batch_with_all_difficulty_levels(
         quiz_id=uuid4(),
         module_id="test-module",
         module_name="Test Module",
-        module_content="Test content",
+        content_key=workflow.add_content("Test content"),
         target_question_count=2,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=difficulty,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
         raw_response=valid_mcq_response,
     )
 
@@ -2157,13 +2217,11 @@ async def test_difficulty_flows_through_workflow_pipeline(
         quiz_id=uuid4(),
         module_id="pipeline-test",
         module_name="Pipeline Test Module",
-        module_content="Test content for pipeline",
+        content_key=workflow.add_content("Test content for pipeline"),
         target_question_count=1,
         question_type=QuestionType.MULTIPLE_CHOICE,
         language=QuizLanguage.ENGLISH,
         difficulty=QuestionDifficulty.MEDIUM,
-        llm_provider=test_llm_provider,
-        template_manager=test_template_manager,
     )
 
     # Step 1: Prepare prompt
@@ -2186,3 +2244,93 @@ async def test_difficulty_flows_through_workflow_pipeline(
     # Verify final question has correct difficulty
     question = final_state.generated_questions[0]
     assert question.difficulty == QuestionDifficulty.MEDIUM
+
+
+def test_workflows_share_compiled_graph(test_llm_provider, test_template_manager):
+    """Test that the graph is compiled once and shared, not rebuilt per batch."""
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider, template_manager=test_template_manager
+    )
+    other = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider, template_manager=test_template_manager
+    )
+    assert workflow.graph is other.graph
+
+
+# Benchmarks - Per-batch overhead
+
+
+@pytest.mark.benchmark
+def test_benchmark_workflow_construction(
+    benchmark, test_llm_provider, test_template_manager
+):
+    """Benchmark creating a workflow, done once per generation batch."""
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    benchmark(
+        ModuleBatchWorkflow,
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+
+    assert benchmark.stats["mean"] < 0.001
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_concurrent_batches_share_module_content(
+    test_llm_provider, test_template_manager
+):
+    """Benchmark hundreds of concurrent batches sharing one module content."""
+    import time
+    import tracemalloc
+
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    batch_count = 200
+    module_contents = {"module_1:0": "Cells are the basic unit of life. " * 6000}
+    content_size = len(module_contents["module_1:0"])
+    quiz_id = uuid4()
+
+    async def skip_save(self, state):
+        return state
+
+    tracemalloc.start()
+    start = time.process_time()
+    try:
+        workflows = [
+            ModuleBatchWorkflow(
+                llm_provider=test_llm_provider,
+                template_manager=test_template_manager,
+                module_contents=module_contents,
+            )
+            for _ in range(batch_count)
+        ]
+        with patch.object(ModuleBatchWorkflow, "save_questions", skip_save):
+            results = await asyncio.gather(
+                *(
+                    workflow.process_module(
+                        quiz_id=quiz_id,
+                        module_id="module_1",
+                        module_name="Cells",
+                        content_key="module_1:0",
+                        question_count=1,
+                        question_type=QuestionType.MULTIPLE_CHOICE,
+                    )
+                    for workflow in workflows
+                )
+            )
+        cpu_per_batch = (time.process_time() - start) / batch_count
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert all(len(questions) == 1 for questions in results)
+    # Neither the content nor a compiled graph is held per batch
+    # In-flight batches hold their rendered prompt, but no copy of the content
+    # in their state snapshots; budgets are generous so only gross
+    # regressions (e.g. recompiling the graph per batch) fail
+    assert peak / batch_count < 2 * content_size
+    assert cpu_per_batch < 0.25
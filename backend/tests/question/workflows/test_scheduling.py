@@ -0,0 +1,181 @@
+"""Tests for priority scheduling of generation requests."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+
+async def _hold(scheduler, priority, order, release):
+    """Take a slot, note the admission and keep it until released."""
+    async with scheduler.slot(priority):
+        order.append(priority.name)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_reserved_capacity_admits_interactive_past_bulk_work():
+    """Test that bulk work cannot use the slots reserved for interactive work."""
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    scheduler = GenerationScheduler(capacity=3, reserved_interactive=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_hold(scheduler, GenerationPriority.BULK, order, release))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(
+        _hold(scheduler, GenerationPriority.INTERACTIVE, order, release)
+    )
+    await asyncio.sleep(0)
+
+    assert order == ["BULK", "BULK", "INTERACTIVE"]
+    snapshot = scheduler.snapshot()
+    assert snapshot["in_use"] == 3
+    assert snapshot["classes"]["bulk"]["waiting"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks, interactive)
+    assert order[-1] == "BULK"
+    assert scheduler.snapshot()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_by_priority_and_waits_reported():
+    """Test that queued requests run most urgent class first, FIFO within one."""
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    scheduler = GenerationScheduler(capacity=1, reserved_interactive=0)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        _hold(scheduler, GenerationPriority.BULK, order, release)
+    )
+    await asyncio.sleep(0)
+
+    async def run(priority):
+        async with scheduler.slot(priority):
+            order.append(priority.name)
+
+    queued = [
+        asyncio.create_task(run(priority))
+        for priority in (
+            GenerationPriority.BULK,
+            GenerationPriority.RETRY,
+            GenerationPriority.FIRST_GENERATION,
+            GenerationPriority.INTERACTIVE,
+        )
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.gather(holder, *queued)
+
+    assert order == ["BULK", "INTERACTIVE", "FIRST_GENERATION", "RETRY", "BULK"]
+    classes = scheduler.snapshot()["classes"]
+    assert classes["bulk"]["admitted"] == 2
+    assert classes["interactive"]["max_wait"] >= 0.05
+    assert classes["retry"]["p95_wait"] >= classes["interactive"]["p95_wait"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    """Test that a request cancelled while queued gives up its place."""
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    scheduler = GenerationScheduler(capacity=1, reserved_interactive=0)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        _hold(scheduler, GenerationPriority.BULK, order, release)
+    )
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(
+        _hold(scheduler, GenerationPriority.INTERACTIVE, order, release)
+    )
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    release.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert order == ["BULK"]
+    async with scheduler.slot(GenerationPriority.RETRY):
+        assert scheduler.snapshot()["in_use"] == 1
+    assert scheduler.snapshot()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_clock_stops_while_the_batch_only_waits_for_slots():
+    """Test that queue waits are left out of a batch's time in service."""
+    from src.question.workflows.scheduling import (
+        BatchClock,
+        GenerationPriority,
+        GenerationScheduler,
+    )
+
+    scheduler = GenerationScheduler(capacity=1, reserved_interactive=0)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        _hold(scheduler, GenerationPriority.BULK, order, release)
+    )
+    await asyncio.sleep(0)
+
+    clock = BatchClock()
+
+    async def request():
+        async with scheduler.slot(GenerationPriority.RETRY, clock):
+            await asyncio.sleep(0.05)
+
+    queued = asyncio.create_task(request())
+    await asyncio.sleep(0.2)
+    assert clock.elapsed() < 0.1
+
+    release.set()
+    await asyncio.gather(holder, queued)
+    assert 0.05 <= clock.elapsed() < 0.2
+
+
+def test_generation_priority_classifies_runs():
+    """Test that retries and large generations queue behind normal ones."""
+    from src.question.workflows.scheduling import (
+        GenerationPriority,
+        generation_priority,
+    )
+
+    with patch("src.config.settings.GENERATION_BULK_QUESTION_COUNT", 100):
+        assert generation_priority(20) is GenerationPriority.FIRST_GENERATION
+        assert generation_priority(200) is GenerationPriority.BULK
+        assert generation_priority(200, retry=True) is GenerationPriority.RETRY
+
+
+def test_generation_queue_endpoint_requires_admin(client, admin_user):
+    """Test that queue state is served to administrators only."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+
+    url = f"{settings.API_V1_STR}/utils/generation-queue/"
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+
+    assert client.get(url).status_code == 403
+    assert client.get(url, headers=headers).status_code == 403
+
+    with patch("src.config.settings.ADMIN_CANVAS_IDS", [admin_user.canvas_id]):
+        response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    assert "first_generation" in response.json()["classes"]
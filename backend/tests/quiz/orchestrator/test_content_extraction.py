@@ -159,6 +159,46 @@ async def test_execute_content_extraction_workflow_manual_only(caplog):
     assert "content_modules_categorized" in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_execute_content_extraction_workflow_uses_stored_manual_pages():
+    """Test that manual modules are extracted from the pages stored at creation."""
+    from src.quiz.orchestrator.content_extraction import (
+        _execute_content_extraction_workflow,
+    )
+
+    stored_page = {
+        "content": "Uploaded notes stored with the quiz",
+        "word_count": 6,
+        "source_type": "manual",
+        "processing_metadata": {},
+        "content_type": "text",
+        "title": "Manual Module 1",
+    }
+    selected_modules = {
+        "manual_1": {
+            "name": "Manual Module 1",
+            "source_type": "manual",
+            "question_batches": [{"question_type": "multiple_choice", "count": 5}],
+        },
+    }
+    mock_summarizer = Mock(
+        return_value={"modules_processed": 1, "total_pages": 1, "total_word_count": 6}
+    )
+
+    extracted_content, final_status, _ = await _execute_content_extraction_workflow(
+        uuid.uuid4(),
+        123,
+        "test_token",
+        selected_modules,
+        AsyncMock(),
+        mock_summarizer,
+        {"manual_1": [stored_page]},
+    )
+
+    assert final_status == "completed"
+    assert extracted_content == {"manual_1": [stored_page]}
+
+
 @pytest.mark.asyncio
 async def test_execute_content_extraction_workflow_mixed_sources(caplog):
     """Test content extraction workflow with both Canvas and manual modules."""
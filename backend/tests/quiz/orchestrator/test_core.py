@@ -401,6 +401,91 @@ async def test_timeout_operation_nested_operations():
     assert result == "outer-inner"
 
 
+@pytest.mark.asyncio
+async def test_profile_operation_disabled_does_not_profile(tmp_path):
+    """Test that profiling is skipped when the setting is disabled."""
+    from src.quiz.orchestrator.core import profile_operation
+
+    @profile_operation("test_operation")
+    async def test_operation(value):
+        return value
+
+    with patch("src.quiz.orchestrator.core.settings") as mock_settings:
+        mock_settings.ORCHESTRATION_PROFILING_ENABLED = False
+        mock_settings.ORCHESTRATION_PROFILE_DIR = str(tmp_path)
+
+        result = await test_operation("ok")
+
+    assert result == "ok"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_profile_operation_writes_cprofile_output(tmp_path, caplog):
+    """Test that an enabled profiler writes one stats file per run."""
+    import pstats
+
+    from src.quiz.orchestrator.core import profile_operation
+
+    quiz_id = uuid.uuid4()
+
+    @profile_operation("test_operation")
+    async def test_operation(quiz_id):
+        await asyncio.sleep(0)
+        return "done"
+
+    with patch("src.quiz.orchestrator.core.settings") as mock_settings:
+        mock_settings.ORCHESTRATION_PROFILING_ENABLED = True
+        mock_settings.ORCHESTRATION_PROFILE_DIR = str(tmp_path)
+
+        result = await test_operation(quiz_id)
+
+    assert result == "done"
+    profile_files = list(tmp_path.glob(f"test_operation_{quiz_id}_*.prof"))
+    assert len(profile_files) == 1
+    assert pstats.Stats(str(profile_files[0])).total_calls > 0
+    assert "orchestration_profile_written" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_profile_operation_writes_profile_on_failure(tmp_path):
+    """Test that profile output is written even when the operation fails."""
+    from src.quiz.orchestrator.core import profile_operation
+
+    @profile_operation("test_operation")
+    async def failing_operation(quiz_id):
+        raise ValueError("boom")
+
+    with patch("src.quiz.orchestrator.core.settings") as mock_settings:
+        mock_settings.ORCHESTRATION_PROFILING_ENABLED = True
+        mock_settings.ORCHESTRATION_PROFILE_DIR = str(tmp_path)
+
+        with pytest.raises(ValueError, match="boom"):
+            await failing_operation(uuid.uuid4())
+
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_operation_concurrent_runs_profile_only_one(tmp_path):
+    """Test that concurrent operations do not fight over the profiler."""
+    from src.quiz.orchestrator.core import profile_operation
+
+    @profile_operation("test_operation")
+    async def test_operation(quiz_id):
+        await asyncio.sleep(0.01)
+        return quiz_id
+
+    with patch("src.quiz.orchestrator.core.settings") as mock_settings:
+        mock_settings.ORCHESTRATION_PROFILING_ENABLED = True
+        mock_settings.ORCHESTRATION_PROFILE_DIR = str(tmp_path)
+
+        results = await asyncio.gather(*(test_operation(i) for i in range(3)))
+
+    assert results == [0, 1, 2]
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
 def test_type_aliases_exist():
     """Test that type aliases are defined for dependency injection."""
     from src.quiz.orchestrator.core import (
@@ -92,6 +92,8 @@ async def test_orchestrate_export_canvas_success(caplog):
 
             mock_execute_transaction.side_effect = [
                 mock_export_data,  # Validate and reserve
+                None,  # Checkpoint Canvas quiz
+                None,  # Checkpoint exported questions
                 {  # Save success results
                     "success": True,
                     "canvas_quiz_id": DEFAULT_CANVAS_QUIZ_RESPONSE["id"],
@@ -237,6 +239,8 @@ async def test_orchestrate_export_canvas_api_integration(caplog):
 
             mock_execute_transaction.side_effect = [
                 mock_export_data,  # Validate and reserve
+                None,  # Checkpoint Canvas quiz
+                None,  # Checkpoint exported questions
                 {  # Save success
                     "success": True,
                     "canvas_quiz_id": DEFAULT_CANVAS_QUIZ_RESPONSE["id"],
@@ -350,6 +354,8 @@ async def test_orchestrate_export_question_format_conversion(caplog):
 
             mock_execute_transaction.side_effect = [
                 mock_export_data,
+                None,
+                None,
                 {
                     "success": True,
                     "canvas_quiz_id": DEFAULT_CANVAS_QUIZ_RESPONSE["id"],
@@ -382,8 +388,8 @@ async def test_orchestrate_export_question_format_conversion(caplog):
 
 
 @pytest.mark.asyncio
-async def test_orchestrate_export_failure_rollback(caplog):
-    """Test export failure handling and Canvas quiz rollback."""
+async def test_orchestrate_export_failure_keeps_canvas_quiz(caplog):
+    """Test that a failed export keeps the Canvas quiz for resume."""
     from src.quiz.orchestrator.export import orchestrate_quiz_export_to_canvas
 
     # Arrange
@@ -439,31 +445,32 @@ async def test_orchestrate_export_failure_rollback(caplog):
                 "questions": mock_question_data,
             }
 
-            # Mock: validate/reserve succeeds, but failure status update also succeeds
             mock_execute_transaction.side_effect = [
                 mock_export_data,  # Validate and reserve
+                None,  # Checkpoint Canvas quiz
+                None,  # Checkpoint exported questions
                 None,  # Mark as failed
             ]
 
-            # Mock Canvas quiz deletion during rollback
             with patch("src.canvas.service.delete_canvas_quiz") as mock_delete_quiz:
-                mock_delete_quiz.return_value = True  # Rollback succeeds
-
                 # Act & Assert
                 with pytest.raises(Exception):  # CanvasQuizExportError
                     await orchestrate_quiz_export_to_canvas(
                         quiz_id, canvas_token, mock_quiz_creator, mock_question_exporter
                     )
 
-    # Assert rollback was attempted
-    mock_delete_quiz.assert_called_once_with(
-        canvas_token, course_id, DEFAULT_CANVAS_QUIZ_RESPONSE["id"]
-    )
+    # The Canvas quiz is kept so the export can be resumed
+    mock_delete_quiz.assert_not_called()
+
+    # The exported chunk was checkpointed before the failure was handled
+    checkpoint_call = mock_execute_transaction.call_args_list[2]
+    assert checkpoint_call[0][1] == str(DEFAULT_CANVAS_QUIZ_RESPONSE["id"])
+    assert checkpoint_call[0][2] == mock_question_data
+    assert checkpoint_call[0][3] == FAILED_QUIZ_ITEMS_RESPONSE
 
-    # Verify failure and rollback logging
-    assert "canvas_export_failure_rollback_needed" in caplog.text
-    assert "quiz_export_initiating_rollback" in caplog.text
-    assert "quiz_export_rollback_completed" in caplog.text
+    # Verify failure logging
+    assert "canvas_export_incomplete_resumable" in caplog.text
+    assert "quiz_export_checkpoint_kept" in caplog.text
     assert str(quiz_id) in caplog.text
 
 
@@ -526,6 +533,8 @@ async def test_orchestrate_export_completion_status(caplog):
 
             mock_execute_transaction.side_effect = [
                 mock_export_data,  # Validate and reserve
+                None,  # Checkpoint Canvas quiz
+                None,  # Checkpoint exported questions
                 mock_completion_result,  # Save success results
             ]
 
@@ -540,8 +549,8 @@ async def test_orchestrate_export_completion_status(caplog):
     assert result["canvas_quiz_id"] == DEFAULT_CANVAS_QUIZ_RESPONSE["id"]
     assert result["exported_questions"] == 2
 
-    # Verify status update transactions
-    assert mock_execute_transaction.call_count == 2
+    # Verify reserve, two checkpoints and the status update transaction
+    assert mock_execute_transaction.call_count == 4
 
     # Verify completion logging
     assert "quiz_export_orchestration_completed_success" in caplog.text
@@ -646,3 +655,133 @@ async def test_orchestrate_export_no_approved_questions(caplog):
     # Verify logging
     assert "quiz_export_orchestration_started" in caplog.text
     assert str(quiz_id) in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_orchestrate_export_resumes_into_existing_canvas_quiz(caplog):
+    """Test that a retried export skips questions already in Canvas."""
+    from src.quiz.orchestrator.export import orchestrate_quiz_export_to_canvas
+
+    # Arrange
+    quiz_id = uuid.uuid4()
+    canvas_token = "resume_token"
+    course_data = get_unique_course_data()
+    quiz_config = get_unique_quiz_config()
+
+    mock_quiz_creator = AsyncMock()
+    mock_question_exporter = AsyncMock()
+    mock_question_exporter.return_value = [
+        {"success": True, "question_id": "q2", "item_id": "item-2", "position": 2}
+    ]
+
+    mock_question_data = [
+        {
+            "id": "q1",
+            "question_type": "multiple_choice",
+            "position": 1,
+            "canvas_item_id": "item-1",
+            **DEFAULT_MCQ_DATA,
+        },
+        {
+            "id": "q2",
+            "question_type": "multiple_choice",
+            "position": 2,
+            "canvas_item_id": None,
+            **DEFAULT_MCQ_DATA,
+        },
+    ]
+
+    with patch(
+        "src.question.service.prepare_questions_for_export"
+    ) as mock_prepare_questions:
+        mock_prepare_questions.return_value = mock_question_data
+
+        with patch(
+            "src.quiz.orchestrator.export.execute_in_transaction"
+        ) as mock_execute_transaction:
+            mock_export_data = {
+                "course_id": course_data["id"],
+                "title": quiz_config["title"],
+                "already_exported": False,
+                "canvas_quiz_id": "existing_canvas_quiz",
+                "questions": mock_question_data,
+            }
+
+            mock_execute_transaction.side_effect = [
+                mock_export_data,  # Validate and reserve
+                None,  # Checkpoint exported questions
+                {  # Save success results
+                    "success": True,
+                    "canvas_quiz_id": "existing_canvas_quiz",
+                    "exported_questions": 2,
+                    "message": "Quiz successfully exported to Canvas",
+                },
+            ]
+
+            # Act
+            result = await orchestrate_quiz_export_to_canvas(
+                quiz_id, canvas_token, mock_quiz_creator, mock_question_exporter
+            )
+
+    # Assert
+    assert result["success"] is True
+    assert result["exported_questions"] == 2
+
+    # No new Canvas quiz; only the missing question is exported
+    mock_quiz_creator.assert_not_called()
+    mock_question_exporter.assert_called_once()
+    call_args = mock_question_exporter.call_args
+    assert call_args[0][2] == "existing_canvas_quiz"
+    assert call_args[0][3] == [mock_question_data[1]]
+
+    assert "canvas_export_workflow_resumed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_export_workflow_checkpoints_each_chunk():
+    """Test that questions are exported and checkpointed in chunks."""
+    from src.quiz.constants import EXPORT_CHECKPOINT_SIZE
+    from src.quiz.orchestrator.export import _execute_export_workflow
+
+    questions = [
+        {
+            "id": f"q{i}",
+            "question_type": "multiple_choice",
+            "position": i,
+            "canvas_item_id": None,
+            **DEFAULT_MCQ_DATA,
+        }
+        for i in range(1, EXPORT_CHECKPOINT_SIZE * 2 + 2)
+    ]
+
+    mock_quiz_creator = AsyncMock(return_value={"id": "canvas_quiz"})
+
+    async def exporter(token, course_id, canvas_quiz_id, chunk, session):
+        return [
+            {"success": True, "question_id": q["id"], "item_id": f"item-{q['id']}"}
+            for q in chunk
+        ]
+
+    checkpoint = AsyncMock()
+
+    result = await _execute_export_workflow(
+        uuid.uuid4(),
+        "chunk_token",
+        mock_quiz_creator,
+        exporter,
+        {"course_id": 1, "title": "Chunked", "questions": questions},
+        AsyncMock(),
+        checkpoint=checkpoint,
+    )
+
+    assert result["success"] is True
+    assert result["exported_questions"] == len(questions)
+
+    # One checkpoint for the Canvas quiz, then one per chunk
+    calls = checkpoint.call_args_list
+    assert calls[0][0] == ("canvas_quiz", [], [])
+    assert [len(call[0][1]) for call in calls[1:]] == [
+        EXPORT_CHECKPOINT_SIZE,
+        EXPORT_CHECKPOINT_SIZE,
+        1,
+    ]
@@ -77,6 +77,7 @@ async def test_orchestrate_question_generation_success(caplog):
                     "successful_batches": [],
                     "failed_batches": [],
                 }
+                mock_quiz.owner_id = None
                 mock_session.get = AsyncMock(return_value=mock_quiz)
                 mock_session.refresh = AsyncMock()
                 mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -216,6 +217,7 @@ async def test_orchestrate_question_generation_validation_retry(caplog):
                     "successful_batches": [],
                     "failed_batches": [],
                 }
+                mock_quiz.owner_id = None
                 mock_session.get = AsyncMock(return_value=mock_quiz)
                 mock_session.refresh = AsyncMock()
                 mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -304,6 +306,7 @@ async def test_orchestrate_question_generation_mixed_types(caplog):
                     "successful_batches": [],
                     "failed_batches": [],
                 }
+                mock_quiz.owner_id = None
                 mock_session.get = AsyncMock(return_value=mock_quiz)
                 mock_session.refresh = AsyncMock()
                 mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -433,6 +436,7 @@ async def test_orchestrate_question_generation_batch_coordination(caplog):
                     "successful_batches": [],  # No previous successes to ensure partial success
                     "failed_batches": [],
                 }
+                mock_quiz.owner_id = None
                 mock_session.get = AsyncMock(return_value=mock_quiz)
                 mock_session.refresh = AsyncMock()
                 mock_get_session.return_value.__aenter__ = AsyncMock(
@@ -528,3 +532,59 @@ async def test_orchestrate_question_generation_no_content_found(caplog):
     # Verify error logging
     assert "generation_workflow_no_content_found" in caplog.text
     assert str(quiz_id) in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_single_batch_regeneration_uses_provider_pool():
+    """Test that batch regeneration goes through the configured deployment pool."""
+    from contextlib import asynccontextmanager
+
+    from src.question.providers import LLMProvider
+    from src.question.types import QuestionDifficulty, QuestionType, QuizLanguage
+    from src.quiz.orchestrator.question_generation import (
+        orchestrate_single_batch_regeneration,
+    )
+
+    @asynccontextmanager
+    async def admit(_quiz_id, _operation, _reservation=None):
+        yield
+
+    registry = Mock()
+    workflow = Mock()
+    workflow.process_module = AsyncMock(return_value=["q1", "q2"])
+
+    with (
+        patch(
+            "src.question.providers.get_llm_provider_registry", return_value=registry
+        ),
+        patch("src.question.templates.get_template_manager"),
+        patch(
+            "src.question.workflows.module_batch_workflow.ModuleBatchWorkflow",
+            return_value=workflow,
+        ) as workflow_class,
+        patch("src.quiz.usage.generation_admission", admit),
+        patch(
+            "src.quiz.orchestrator.question_generation.execute_in_transaction",
+            AsyncMock(),
+        ),
+        patch("src.config.settings.LLM_PROVIDER", "mock"),
+    ):
+        await orchestrate_single_batch_regeneration(
+            uuid.uuid4(),
+            "module_1",
+            "Module 1",
+            "Module content",
+            QuestionType.MULTIPLE_CHOICE,
+            2,
+            QuestionDifficulty.MEDIUM,
+            "gpt-4",
+            0.7,
+            QuizLanguage.ENGLISH,
+        )
+
+    registry.get_provider_pool.assert_called_once_with(LLMProvider.MOCK)
+    registry.get_provider.assert_not_called()
+    assert (
+        workflow_class.call_args.kwargs["llm_provider"]
+        is registry.get_provider_pool.return_value
+    )
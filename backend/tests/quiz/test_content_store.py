@@ -0,0 +1,222 @@
+"""Tests for the normalized per-page quiz content store."""
+
+import pytest
+from sqlalchemy import func, select
+
+PAGE_ONE = {
+    "title": "Introduction",
+    "content": "Shared introduction text used by several courses.",
+    "type": "page",
+}
+PAGE_TWO = {
+    "title": "Details",
+    "content": "Module specific details.",
+    "type": "file",
+}
+MANUAL_PAGE = {
+    "title": "Notes",
+    "content": "Manual notes pasted by the teacher.",
+    "source_type": "manual",
+    "word_count": 6,
+    "processing_metadata": {"source": "manual_text"},
+    "content_type": "text",
+}
+
+
+async def _count_texts(async_session) -> int:
+    from src.quiz.models import ContentText
+
+    result = await async_session.execute(select(func.count()).select_from(ContentText))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_extracted_content_round_trips_through_page_store(async_session):
+    """Test that saved extraction results are read back in the same shape."""
+    from src.quiz.models import ContentPage, Quiz
+    from src.quiz.schemas import QuizStatus
+    from src.quiz.service import get_content_from_quiz, update_quiz_status
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    quiz_id = quiz.id
+    extracted = {"101": [PAGE_ONE, PAGE_TWO], "manual_abc": [MANUAL_PAGE]}
+
+    await update_quiz_status(
+        async_session,
+        quiz_id,
+        QuizStatus.EXTRACTING_CONTENT,
+        extracted_content=extracted,
+    )
+    await async_session.commit()
+
+    stored = await async_session.get(Quiz, quiz_id)
+    await async_session.refresh(stored)
+    assert stored.extracted_content is None
+    assert stored.content_extracted_at is not None
+
+    page_count = await async_session.execute(
+        select(func.count()).where(ContentPage.quiz_id == quiz_id)
+    )
+    assert page_count.scalar_one() == 3
+
+    assert await get_content_from_quiz(async_session, quiz_id) == extracted
+
+
+@pytest.mark.asyncio
+async def test_page_text_is_deduplicated_across_quizzes(async_session):
+    """Test that identical pages in two quizzes share one text row."""
+    from src.quiz.content_store import replace_quiz_content_pages
+    from src.quiz.models import ContentText
+    from tests.conftest import create_quiz_in_async_session
+
+    first = await create_quiz_in_async_session(async_session)
+    second = await create_quiz_in_async_session(async_session)
+
+    await replace_quiz_content_pages(async_session, first.id, {"101": [PAGE_ONE]})
+    await replace_quiz_content_pages(
+        async_session, second.id, {"101": [PAGE_ONE, PAGE_TWO]}
+    )
+
+    assert await _count_texts(async_session) == 2
+
+    text = (await async_session.execute(select(ContentText))).scalars().first()
+    assert text.token_estimate > 0
+    assert text.word_count > 0
+
+
+@pytest.mark.asyncio
+async def test_replacing_pages_removes_only_orphaned_text(async_session):
+    """Test that re-extraction drops text no quiz references any more."""
+    from src.quiz.content_store import replace_quiz_content_pages
+    from tests.conftest import create_quiz_in_async_session
+
+    first = await create_quiz_in_async_session(async_session)
+    second = await create_quiz_in_async_session(async_session)
+
+    await replace_quiz_content_pages(
+        async_session, first.id, {"101": [PAGE_ONE, PAGE_TWO]}
+    )
+    await replace_quiz_content_pages(async_session, second.id, {"101": [PAGE_ONE]})
+    assert await _count_texts(async_session) == 2
+
+    # PAGE_TWO was only used by the first quiz; PAGE_ONE is still shared
+    await replace_quiz_content_pages(async_session, first.id, {"101": [MANUAL_PAGE]})
+
+    assert await _count_texts(async_session) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_quiz_content_modules_streams_requested_modules(async_session):
+    """Test per-module streaming, module filtering and cleared content."""
+    from datetime import datetime, timezone
+
+    from src.quiz.content_store import (
+        iter_quiz_content_modules,
+        replace_quiz_content_pages,
+    )
+    from src.quiz.models import Quiz
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    quiz_id = quiz.id
+    await replace_quiz_content_pages(
+        async_session, quiz_id, {"101": [PAGE_ONE, PAGE_TWO], "102": [PAGE_TWO]}
+    )
+    stored = await async_session.get(Quiz, quiz_id)
+    stored.content_extracted_at = datetime.now(timezone.utc)
+    await async_session.commit()
+
+    modules = [
+        (module_id, pages)
+        async for module_id, pages in iter_quiz_content_modules(async_session, quiz_id)
+    ]
+    assert modules == [("101", [PAGE_ONE, PAGE_TWO]), ("102", [PAGE_TWO])]
+
+    only_102 = [
+        module_id
+        async for module_id, _ in iter_quiz_content_modules(
+            async_session, quiz_id, module_ids=["102"]
+        )
+    ]
+    assert only_102 == ["102"]
+
+    # Clearing content for re-extraction hides the stale pages
+    await async_session.refresh(stored)
+    stored.content_extracted_at = None
+    await async_session.commit()
+
+    assert [m async for m in iter_quiz_content_modules(async_session, quiz_id)] == []
+
+
+@pytest.mark.asyncio
+async def test_stored_module_pages_are_read_before_extraction(async_session):
+    """Test that pages stored ahead of extraction, as manual ones are, load back."""
+    from src.quiz.content_store import (
+        get_stored_module_pages,
+        iter_quiz_content_modules,
+        replace_quiz_content_pages,
+    )
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    await replace_quiz_content_pages(
+        async_session, quiz.id, {"manual_abc": [MANUAL_PAGE], "101": [PAGE_ONE]}
+    )
+
+    stored = await get_stored_module_pages(async_session, quiz.id, ["manual_abc"])
+
+    assert stored == {"manual_abc": [MANUAL_PAGE]}
+    # Readers of extracted content still wait for the extraction
+    assert [
+        module async for module in iter_quiz_content_modules(async_session, quiz.id)
+    ] == []
+
+
+def test_single_batch_generation_reads_module_pages(session):
+    """Test that single batch regeneration loads its module from the page store."""
+    from datetime import datetime, timezone
+
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.quiz.content_store import compute_content_hash
+    from src.quiz.models import ContentPage, ContentText
+    from src.quiz.schemas import RegenerateBatchRequest
+    from src.quiz.service import prepare_single_batch_generation
+    from tests.conftest import create_quiz_in_session
+
+    quiz = create_quiz_in_session(session)
+    quiz.content_extracted_at = datetime.now(timezone.utc)
+    content_hash = compute_content_hash(PAGE_ONE["content"])
+    session.add(
+        ContentText(
+            content_hash=content_hash,
+            content=PAGE_ONE["content"],
+            word_count=7,
+            token_estimate=13,
+        )
+    )
+    session.flush()
+    session.add(
+        ContentPage(
+            quiz_id=quiz.id,
+            module_id="456",
+            position=0,
+            content_hash=content_hash,
+            page_metadata={"title": PAGE_ONE["title"]},
+        )
+    )
+    session.commit()
+
+    params = prepare_single_batch_generation(
+        session,
+        quiz.id,
+        quiz.owner_id,
+        RegenerateBatchRequest(
+            module_id="456",
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            count=5,
+            difficulty=QuestionDifficulty.MEDIUM,
+        ),
+    )
+
+    assert PAGE_ONE["content"] in params["module_content"]
@@ -0,0 +1,240 @@
+"""Tests for LLM usage accounting and generation quotas."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tests.conftest import (
+    create_quiz_in_async_session,
+    create_quiz_in_session,
+    create_user_in_async_session,
+    create_user_in_session,
+)
+
+
+def _add_usage(session, quiz, tokens, course_prefix=None):
+    from src.quiz.models import GenerationUsage
+
+    session.add(
+        GenerationUsage(
+            quiz_id=quiz.id,
+            owner_id=quiz.owner_id,
+            course_prefix=course_prefix,
+            operation="generation",
+            total_tokens=tokens,
+        )
+    )
+    session.commit()
+
+
+def test_course_prefix_for_matches_configured_prefixes():
+    """Test that a course maps to the first configured prefix it starts with."""
+    from src.quiz.usage import course_prefix_for
+
+    with patch("src.config.settings.CANVAS_COURSE_PREFIX_FILTER", "INF, MAT"):
+        assert course_prefix_for("INF-1100 Programming") == "INF"
+        assert course_prefix_for("MAT-1001 Calculus") == "MAT"
+        assert course_prefix_for("FYS-1001 Physics") is None
+
+
+def test_token_quota_refuses_generation_once_used(session):
+    """Test that owners and course prefixes over their token quota are refused."""
+    from src.quiz.exceptions import GenerationQuotaExceededError
+    from src.quiz.usage import reserve_generation_quota
+
+    owner = create_user_in_session(session)
+    quiz = create_quiz_in_session(session, owner=owner, canvas_course_name="INF-1100")
+    other_quiz = create_quiz_in_session(session, canvas_course_name="INF-2200")
+    _add_usage(session, quiz, 6000, "INF")
+    _add_usage(session, other_quiz, 3000, "INF")
+
+    with (
+        patch("src.config.settings.CANVAS_COURSE_PREFIX_FILTER", "INF"),
+        patch("src.config.settings.GENERATION_USER_TOKEN_QUOTA", 10000),
+        patch("src.config.settings.GENERATION_COURSE_PREFIX_TOKEN_QUOTA", 9000),
+    ):
+        with pytest.raises(GenerationQuotaExceededError) as exc_info:
+            reserve_generation_quota(session, other_quiz)
+        assert exc_info.value.scope == "prefix:INF"
+        assert exc_info.value.status_code == 429
+
+        with patch("src.config.settings.GENERATION_COURSE_PREFIX_TOKEN_QUOTA", None):
+            reserve_generation_quota(session, quiz)
+
+            _add_usage(session, quiz, 4000, "INF")
+            with pytest.raises(GenerationQuotaExceededError) as exc_info:
+                reserve_generation_quota(session, quiz)
+            assert exc_info.value.scope == f"user:{owner.id}"
+
+
+def _patch_async_session(async_session):
+    session_context = MagicMock()
+    session_context.return_value.__aenter__.return_value = async_session
+    return patch("src.database.get_async_session", session_context)
+
+
+@pytest.mark.asyncio
+async def test_admission_limits_concurrent_runs_and_records_tokens(async_session):
+    """Test that concurrent runs per owner are capped and run tokens recorded."""
+    from src.quiz.exceptions import GenerationQuotaExceededError
+    from src.quiz.usage import add_generation_tokens, generation_admission
+
+    owner = await create_user_in_async_session(async_session)
+    quizzes = [
+        await create_quiz_in_async_session(async_session, owner=owner) for _ in range(3)
+    ]
+    quiz_ids = [quiz.id for quiz in quizzes]
+    record_usage = AsyncMock()
+
+    with (
+        patch(
+            "src.quiz.usage._load_quota_usage",
+            AsyncMock(return_value=(owner.id, "INF", [])),
+        ),
+        patch("src.quiz.usage._record_usage", record_usage),
+        _patch_async_session(async_session),
+        patch("src.config.settings.GENERATION_USER_MAX_CONCURRENT", 2),
+    ):
+        async with generation_admission(quiz_ids[0], "generation"):
+            async with generation_admission(quiz_ids[1], "generation"):
+                add_generation_tokens(quiz_ids[0], 1200)
+                add_generation_tokens(quiz_ids[0], 300)
+
+                with pytest.raises(GenerationQuotaExceededError):
+                    async with generation_admission(quiz_ids[2], "generation"):
+                        pass
+
+        # Tokens outside an admitted run are not counted
+        add_generation_tokens(quiz_ids[0], 500)
+        async with generation_admission(quiz_ids[2], "single_batch_regeneration"):
+            pass
+
+    record_usage.assert_awaited_once_with(
+        quiz_ids[0], owner.id, "INF", "generation", 1500
+    )
+
+
+def test_concurrency_quota_counts_runs_of_all_workers(session):
+    """Test that live runs started by any worker hold slots until they expire."""
+    from datetime import datetime, timezone
+
+    from src.quiz.exceptions import GenerationQuotaExceededError
+    from src.quiz.models import GenerationRun
+    from src.quiz.usage import RUN_SLOT_EXPIRY, reserve_generation_quota
+
+    owner = create_user_in_session(session)
+    quiz = create_quiz_in_session(session, owner=owner)
+    other_worker_run = GenerationRun(quiz_id=quiz.id, owner_id=owner.id)
+    session.add(other_worker_run)
+    session.commit()
+
+    with patch("src.config.settings.GENERATION_USER_MAX_CONCURRENT", 1):
+        with pytest.raises(GenerationQuotaExceededError) as exc_info:
+            reserve_generation_quota(session, quiz)
+        assert exc_info.value.scope == f"user:{owner.id}"
+
+        # The run of a worker that stopped mid-run no longer holds its slot
+        other_worker_run.started_at = datetime.now(timezone.utc) - RUN_SLOT_EXPIRY
+        session.add(other_worker_run)
+        session.commit()
+        reservation = reserve_generation_quota(session, quiz)
+
+    assert session.get(GenerationRun, reservation.run_id) is not None
+
+
+def test_generation_requests_reserve_run_slots(client, session, admin_user):
+    """Test that quick requests beyond the concurrency quota get 429 up front."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+    from src.quiz.models import GenerationRun, Quiz
+    from src.quiz.schemas import QuizStatus
+
+    quizzes = [
+        create_quiz_in_session(session, owner=admin_user, status=QuizStatus.FAILED)
+        for _ in range(2)
+    ]
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    background = AsyncMock()
+
+    with (
+        patch("src.quiz.router.safe_background_orchestration", background),
+        patch("src.config.settings.GENERATION_USER_MAX_CONCURRENT", 1),
+    ):
+        urls = [
+            f"{settings.API_V1_STR}/quiz/{quiz.id}/generate-questions"
+            for quiz in quizzes
+        ]
+        assert client.post(urls[0], headers=headers).status_code == 200
+
+        response = client.post(urls[1], headers=headers)
+        assert response.status_code == 429
+        session.expire_all()
+        assert session.get(Quiz, quizzes[1].id).status == QuizStatus.FAILED
+
+        # The first run hands its slot back once it ends
+        run_id = background.call_args.kwargs["reservation"].run_id
+        session.delete(session.get(GenerationRun, run_id))
+        session.commit()
+        assert client.post(urls[1], headers=headers).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_admission_takes_over_reserved_slots(async_session):
+    """Test that a reserved run is admitted on its slots and frees them once."""
+    from sqlalchemy import func
+    from sqlmodel import select
+
+    from src.quiz import usage
+    from src.quiz.models import GenerationRun
+
+    owner = await create_user_in_async_session(async_session)
+    quiz = await create_quiz_in_async_session(async_session, owner=owner)
+    run = GenerationRun(quiz_id=quiz.id, owner_id=owner.id)
+    async_session.add(run)
+    await async_session.flush()
+    reservation = usage.GenerationReservation(run.id)
+    count_runs = select(func.count()).select_from(GenerationRun)
+
+    with (
+        patch(
+            "src.quiz.usage._load_quota_usage",
+            AsyncMock(return_value=(owner.id, None, [])),
+        ),
+        _patch_async_session(async_session),
+        patch("src.config.settings.GENERATION_USER_MAX_CONCURRENT", 1),
+    ):
+        async with usage.generation_admission(quiz.id, "generation", reservation):
+            assert (await async_session.execute(count_runs)).scalar_one() == 1
+        assert (await async_session.execute(count_runs)).scalar_one() == 0
+
+        await reservation.release()
+        assert (await async_session.execute(count_runs)).scalar_one() == 0
+
+
+def test_llm_usage_endpoint_requires_admin(client, session, admin_user):
+    """Test the usage summary is served to administrators only."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+
+    quiz = create_quiz_in_session(session, owner=admin_user, title="Big Quiz")
+    _add_usage(session, quiz, 2500, "INF")
+    _add_usage(session, quiz, 500, "INF")
+    other = create_user_in_session(session)
+    url = f"{settings.API_V1_STR}/admin/llm-usage"
+
+    with patch("src.config.settings.ADMIN_CANVAS_IDS", [admin_user.canvas_id]):
+        token = create_access_token(str(other.id))
+        response = client.get(url, headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 403
+
+        token = create_access_token(str(admin_user.id))
+        response = client.get(url, headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["total_tokens"] == 3000
+    assert summary["by_course_prefix"] == [
+        {"key": "INF", "label": None, "total_tokens": 3000, "runs": 2}
+    ]
+    assert summary["by_user"][0]["label"] == "Admin User"
+    assert summary["top_quizzes"][0]["label"] == "Big Quiz"
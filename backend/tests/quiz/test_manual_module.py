@@ -94,34 +94,27 @@ async def test_process_multiple_uploaded_files_success():
     # Mock UploadFile objects
     mock_file_1 = MagicMock(spec=UploadFile)
     mock_file_1.filename = "doc1.pdf"
-    mock_file_1.read = AsyncMock(return_value=pdf_content_1)
+    mock_file_1.read = AsyncMock(side_effect=[pdf_content_1, b""])
 
     mock_file_2 = MagicMock(spec=UploadFile)
     mock_file_2.filename = "doc2.pdf"
-    mock_file_2.read = AsyncMock(return_value=pdf_content_2)
+    mock_file_2.read = AsyncMock(side_effect=[pdf_content_2, b""])
 
     files = [mock_file_1, mock_file_2]
 
-    # Mock content processors and process_content
-    with (
-        patch("src.quiz.manual.CONTENT_PROCESSORS") as mock_processors,
-        patch("src.quiz.manual.process_content") as mock_process_content,
-    ):
-        # Mock processor
-        mock_processors.__contains__ = Mock(return_value=True)
-        mock_processors.__getitem__ = Mock(return_value=Mock())
-
-        # Mock processed content for each file
-        mock_processed_1 = Mock()
-        mock_processed_1.content = "Extracted text from PDF 1"
-        mock_processed_1.word_count = 5
-
-        mock_processed_2 = Mock()
-        mock_processed_2.content = "Extracted text from PDF 2"
-        mock_processed_2.word_count = 5
+    # Mock the PDF processor; files are processed concurrently in worker threads
+    extracted = {
+        "doc1.pdf": "Extracted text from PDF 1",
+        "doc2.pdf": "Extracted text from PDF 2",
+    }
 
-        mock_process_content.side_effect = [mock_processed_1, mock_processed_2]
+    def mock_processor(raw_content):
+        processed = Mock()
+        processed.content = extracted[raw_content.title]
+        processed.word_count = 5
+        return processed
 
+    with patch.dict("src.quiz.manual.CONTENT_PROCESSORS", {"pdf": mock_processor}):
         result = await process_multiple_uploaded_files(files)
 
         # Verify result structure
@@ -137,6 +130,81 @@ async def test_process_multiple_uploaded_files_success():
         assert "--- Document 2: doc2.pdf ---" in result.content
 
 
+@pytest.mark.asyncio
+async def test_process_multiple_uploaded_files_keeps_upload_order():
+    """Test that results are merged in upload order with per-file timings."""
+    import time
+
+    from src.quiz.manual import process_multiple_uploaded_files
+
+    files = []
+    for i in range(3):
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.filename = f"deck{i + 1}.pdf"
+        mock_file.read = AsyncMock(side_effect=[b"%PDF-1.4 deck", b""])
+        files.append(mock_file)
+
+    def slow_first_processor(raw_content):
+        # The first deck finishes last, so completion order differs from upload order
+        if raw_content.title == "deck1.pdf":
+            time.sleep(0.05)
+        processed = Mock()
+        processed.content = f"Text of {raw_content.title}"
+        processed.word_count = 3
+        return processed
+
+    with patch.dict(
+        "src.quiz.manual.CONTENT_PROCESSORS", {"pdf": slow_first_processor}
+    ):
+        result = await process_multiple_uploaded_files(files)
+
+    positions = [result.content.index(f"Text of deck{i}.pdf") for i in (1, 2, 3)]
+    assert positions == sorted(positions)
+    assert len(result.metadata["individual_processing_times"]) == 3
+    assert result.metadata["individual_processing_times"][0] >= 0.05
+    assert result.metadata["total_processing_time"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_process_multiple_uploaded_files_stops_reading_oversized_file():
+    """Test that an oversized upload is rejected while streaming, not after."""
+    from src.quiz.manual import (
+        MAX_FILE_SIZE,
+        UPLOAD_CHUNK_SIZE,
+        process_multiple_uploaded_files,
+    )
+
+    mock_file = MagicMock(spec=UploadFile)
+    mock_file.filename = "huge.pdf"
+    mock_file.size = None
+    # An endless stream of chunks; reading must stop once the cap is passed
+    mock_file.read = AsyncMock(return_value=b"x" * UPLOAD_CHUNK_SIZE)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await process_multiple_uploaded_files([mock_file])
+
+    assert exc_info.value.status_code == 400
+    assert "exceeds maximum size of 5.0MB" in exc_info.value.detail
+    assert mock_file.read.await_count == MAX_FILE_SIZE // UPLOAD_CHUNK_SIZE + 1
+
+
+@pytest.mark.asyncio
+async def test_process_multiple_uploaded_files_rejects_declared_size():
+    """Test that a declared oversized upload is rejected before reading."""
+    from src.quiz.manual import MAX_FILE_SIZE, process_multiple_uploaded_files
+
+    mock_file = MagicMock(spec=UploadFile)
+    mock_file.filename = "huge.pdf"
+    mock_file.size = MAX_FILE_SIZE + 1
+    mock_file.read = AsyncMock(return_value=b"")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await process_multiple_uploaded_files([mock_file])
+
+    assert exc_info.value.status_code == 400
+    mock_file.read.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_process_multiple_uploaded_files_empty_list():
     """Test multiple file processing with empty file list."""
@@ -235,7 +303,7 @@ async def test_process_multiple_uploaded_files_total_size_validation():
             mock_file = MagicMock(spec=UploadFile)
             mock_file.filename = f"test_doc{i+1}.pdf"
             content = b"x" * int(4.1 * 1024 * 1024)  # 4.1MB each
-            mock_file.read = AsyncMock(return_value=content)
+            mock_file.read = AsyncMock(side_effect=[content, b""])
             files.append(mock_file)
 
         with pytest.raises(HTTPException) as exc_info:
@@ -316,13 +384,14 @@ async def test_create_manual_module_with_text_success():
 
         mock_process_content.return_value = mock_processed
 
-        result = await create_manual_module(module_data)
+        result, processed = await create_manual_module(module_data)
 
         # Verify result structure
         assert result.name == "Test Text Module"
         assert result.module_id.startswith("manual_")
         assert result.word_count == 135
-        assert result.full_content == test_content
+        assert processed.content == test_content
+        assert "full_content" not in result.model_dump()
         assert result.processing_metadata == {"processing_time": 0.1}
 
 
@@ -355,14 +424,14 @@ async def test_create_manual_module_with_file_success():
 
         mock_process_content.return_value = mock_processed
 
-        result = await create_manual_module(module_data, file=mock_file)
+        result, processed = await create_manual_module(module_data, file=mock_file)
 
         # Verify result structure
         assert result.name == "Test PDF Module"
         assert result.module_id.startswith("manual_")
         assert result.word_count == 5
         assert result.content_preview == "Extracted PDF content for testing"
-        assert result.full_content == "Extracted PDF content for testing"
+        assert processed.content == "Extracted PDF content for testing"
 
 
 @pytest.mark.asyncio
@@ -482,12 +551,12 @@ async def test_create_manual_module_content_preview_truncation():
 
         mock_process_content.return_value = mock_processed
 
-        result = await create_manual_module(module_data)
+        result, processed = await create_manual_module(module_data)
 
         # Verify preview is truncated
         assert len(result.content_preview) == 503  # 500 + "..."
         assert result.content_preview.endswith("...")
-        assert result.full_content == long_content  # Full content preserved
+        assert processed.content == long_content  # Full content preserved
 
 
 def test_generate_module_id():
@@ -543,7 +612,6 @@ def test_create_manual_module_selection_from_response():
         module_id="manual_test123",
         name="Test Response Module",
         content_preview="Preview content...",
-        full_content="Full content for testing",
         word_count=4,
         processing_metadata={"source": "test"},
     )
@@ -561,10 +629,7 @@ def test_create_manual_module_selection_from_response():
     # Verify structure
     assert result["name"] == "Test Response Module"
     assert result["source_type"] == "manual"
-    assert result["content"] == "Full content for testing"
-    assert result["word_count"] == 4
-    assert result["processing_metadata"] == {"source": "test"}
-    assert result["content_type"] == "text"
+    assert "content" not in result  # Taken from the staged upload
     assert result["question_batches"] == question_batches
 
 
@@ -625,3 +690,145 @@ def test_get_full_manual_content():
     result = get_full_manual_content(processed_content)
 
     assert result == "Full content for retrieval"
+
+
+def _staged_upload(module_id: str = "manual_stage01"):
+    from src.content_extraction.models import ProcessedContent
+    from src.quiz.schemas import ManualModuleResponse
+
+    response = ManualModuleResponse(
+        module_id=module_id,
+        name="Staged Module",
+        content_preview="Staged content",
+        word_count=5,
+        processing_metadata={"source": "manual_text"},
+    )
+    processed_content = ProcessedContent(
+        title="Staged Module",
+        content="Staged content for question generation",
+        word_count=5,
+        content_type="text",
+        processing_metadata={"source": "manual_text"},
+    )
+    return response, processed_content
+
+
+def test_stage_manual_module_round_trip(session):
+    """Test that staged content is returned only to its owner."""
+    from src.quiz.manual import get_staged_manual_module, stage_manual_module
+    from tests.conftest import create_user_in_session
+
+    owner = create_user_in_session(session)
+    other_user = create_user_in_session(session)
+
+    staged = stage_manual_module(session, owner.id, *_staged_upload())
+
+    assert staged.expires_at > staged.created_at
+
+    fetched = get_staged_manual_module(session, "manual_stage01", owner.id)
+    assert fetched is not None
+    assert fetched.content == "Staged content for question generation"
+    assert fetched.word_count == 5
+    assert fetched.processing_metadata == {"source": "manual_text"}
+
+    assert get_staged_manual_module(session, "manual_stage01", other_user.id) is None
+    assert get_staged_manual_module(session, "manual_missing", owner.id) is None
+
+
+def test_staged_manual_module_expires(session):
+    """Test that expired staged content is hidden and purged."""
+    from datetime import datetime, timedelta, timezone
+
+    from src.quiz.manual import (
+        get_staged_manual_module,
+        purge_expired_staged_modules,
+        stage_manual_module,
+    )
+    from tests.conftest import create_user_in_session
+
+    owner = create_user_in_session(session)
+    staged = stage_manual_module(session, owner.id, *_staged_upload())
+    staged.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    session.add(staged)
+    session.commit()
+
+    assert get_staged_manual_module(session, "manual_stage01", owner.id) is None
+    assert purge_expired_staged_modules(session) == 1
+    assert purge_expired_staged_modules(session) == 0
+
+
+def test_create_quiz_resolves_staged_manual_module(session):
+    """Test that quiz creation pulls manual content from the staging table."""
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.quiz.content_store import get_quiz_module_pages
+    from src.quiz.manual import get_staged_manual_module, stage_manual_module
+    from src.quiz.schemas import ModuleSelection, QuestionBatch, QuizCreate
+    from src.quiz.service import create_quiz
+    from tests.conftest import create_user_in_session
+
+    owner = create_user_in_session(session)
+    stage_manual_module(session, owner.id, *_staged_upload())
+
+    quiz_data = QuizCreate(
+        canvas_course_id=123,
+        canvas_course_name="Manual Test Course",
+        selected_modules={
+            "manual_stage01": ModuleSelection(
+                name="Staged Module",
+                source_type="manual",
+                question_batches=[
+                    QuestionBatch(
+                        question_type=QuestionType.MULTIPLE_CHOICE,
+                        count=5,
+                        difficulty=QuestionDifficulty.MEDIUM,
+                    )
+                ],
+            )
+        },
+        title="Staged Quiz",
+    )
+
+    quiz = create_quiz(session, quiz_data, owner.id)
+
+    # The content is stored as the module's page, not in selected_modules
+    assert "content" not in quiz.selected_modules["manual_stage01"]
+    [page] = get_quiz_module_pages(session, quiz.id, "manual_stage01")
+    assert page["content"] == "Staged content for question generation"
+    assert page["word_count"] == 5
+    assert page["content_type"] == "text"
+    assert page["title"] == "Staged Module"
+    # Staged content is consumed by quiz creation
+    assert get_staged_manual_module(session, "manual_stage01", owner.id) is None
+
+
+def test_create_quiz_rejects_missing_staged_manual_module(session):
+    """Test that referencing unknown staged content is a validation error."""
+    from src.exceptions import ValidationError
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.quiz.schemas import ModuleSelection, QuestionBatch, QuizCreate
+    from src.quiz.service import create_quiz
+    from tests.conftest import create_user_in_session
+
+    owner = create_user_in_session(session)
+
+    quiz_data = QuizCreate(
+        canvas_course_id=123,
+        canvas_course_name="Manual Test Course",
+        selected_modules={
+            "manual_unknown": ModuleSelection(
+                name="Missing Module",
+                source_type="manual",
+                question_batches=[
+                    QuestionBatch(
+                        question_type=QuestionType.MULTIPLE_CHOICE,
+                        count=5,
+                        difficulty=QuestionDifficulty.MEDIUM,
+                    )
+                ],
+            )
+        },
+        title="Missing Quiz",
+    )
+
+    with pytest.raises(ValidationError, match="expired or was not found"):
+        create_quiz(session, quiz_data, owner.id)
@@ -210,9 +210,11 @@ def test_create_quiz_with_manual_modules(session: Session):
     # Test behavior: manual module handling
     assert has_module(quiz, "manual_123")
     assert get_module_source_type(quiz, "manual_123") == "manual"
-    assert get_module_content(quiz, "manual_123") == "Test manual content"
-    assert get_module_word_count(quiz, "manual_123") == 50
-    assert get_module_content_type(quiz, "manual_123") == "text"
+    assert "content" not in quiz.selected_modules["manual_123"]
+    page = get_module_page(session, quiz, "manual_123")
+    assert page["content"] == "Test manual content"
+    assert page["word_count"] == 50
+    assert page["content_type"] == "text"
     assert quiz.question_count == 5
 
 
@@ -323,6 +325,65 @@ def test_get_user_quizzes_ordering(session: Session):
     )
 
 
+def test_get_user_quiz_listing_flags_owned_and_shared(session: Session):
+    """Test that owned and shared quizzes come back in one ordered listing."""
+    from datetime import timedelta
+
+    from src.quiz.models import QuizCollaborator
+    from src.quiz.service import get_user_quiz_listing
+    from tests.conftest import create_quiz_in_session
+
+    user = create_user_in_session(session)
+    other_user = create_user_in_session(session, canvas_id=55555)
+    now = datetime.now(timezone.utc)
+
+    owned_old = create_quiz_in_session(
+        session, owner=user, created_at=now - timedelta(days=2)
+    )
+    shared = create_quiz_in_session(
+        session, owner=other_user, created_at=now - timedelta(days=1)
+    )
+    owned_new = create_quiz_in_session(session, owner=user, created_at=now)
+    create_quiz_in_session(session, owner=other_user)  # not shared with user
+    session.add(QuizCollaborator(quiz_id=shared.id, user_id=user.id))
+    session.commit()
+
+    listing = get_user_quiz_listing(session, user.id)
+
+    assert [(quiz.id, is_owner) for quiz, is_owner in listing] == [
+        (owned_new.id, True),
+        (shared.id, False),
+        (owned_old.id, True),
+    ]
+
+
+def test_get_user_quiz_listing_keyset_pagination(session: Session):
+    """Test paging through quizzes with a (created_at, id) cursor."""
+    from datetime import timedelta
+
+    from src.quiz.service import get_user_quiz_listing
+    from tests.conftest import create_quiz_in_session
+
+    user = create_user_in_session(session)
+    now = datetime.now(timezone.utc)
+    quizzes = [
+        create_quiz_in_session(session, owner=user, created_at=now - timedelta(hours=i))
+        for i in range(5)
+    ]
+
+    seen_ids = []
+    after = None
+    while True:
+        page = get_user_quiz_listing(session, user.id, limit=2, after=after)
+        if not page:
+            break
+        seen_ids.extend(quiz.id for quiz, _ in page)
+        last_quiz = page[-1][0]
+        after = (last_quiz.created_at, last_quiz.id)
+
+    assert seen_ids == [quiz.id for quiz in quizzes]
+
+
 def test_delete_quiz_success(session: Session):
     """Test successful quiz deletion behavior."""
     from src.quiz.service import delete_quiz
@@ -418,19 +479,12 @@ def get_module_source_type(quiz, module_id: str) -> str:
     return quiz.selected_modules[module_id].get("source_type", "canvas")
 
 
-def get_module_content(quiz, module_id: str) -> str:
-    """Get module content (for manual modules)."""
-    return quiz.selected_modules[module_id].get("content", "")
-
-
-def get_module_word_count(quiz, module_id: str) -> int:
-    """Get module word count (for manual modules)."""
-    return quiz.selected_modules[module_id].get("word_count", 0)
-
+def get_module_page(session: Session, quiz, module_id: str) -> dict:
+    """Get the stored content page of a manual module."""
+    from src.quiz.content_store import get_quiz_module_pages
 
-def get_module_content_type(quiz, module_id: str) -> str:
-    """Get module content type (for manual modules)."""
-    return quiz.selected_modules[module_id].get("content_type", "text")
+    [page] = get_quiz_module_pages(session, quiz.id, module_id)
+    return page
 
 
 def has_question_type(quiz, module_id: str, question_type: str) -> bool:
@@ -1124,6 +1124,7 @@ def test_create_quiz_mixed_difficulty_multiple_modules(session: Session):
 def test_create_quiz_with_manual_modules_only(session: Session):
     """Test quiz creation with only manual modules."""
     from src.question.types import QuestionDifficulty, QuestionType
+    from src.quiz.content_store import get_quiz_module_pages
     from src.quiz.schemas import ModuleSelection, QuestionBatch, QuizCreate
     from src.quiz.service import create_quiz
     from tests.conftest import create_user_in_session
@@ -1181,10 +1182,6 @@ def test_create_quiz_with_manual_modules_only(session: Session):
         "manual_abc123": {
             "name": "Manual Module 1",
             "source_type": "manual",
-            "content": "This is manual content for testing",
-            "word_count": 7,
-            "processing_metadata": {"source": "manual_text"},
-            "content_type": "text",
             "question_batches": [
                 {
                     "question_type": "multiple_choice",
@@ -1196,10 +1193,6 @@ def test_create_quiz_with_manual_modules_only(session: Session):
         "manual_def456": {
             "name": "Manual Module 2",
             "source_type": "manual",
-            "content": "Another manual content block",
-            "word_count": 5,
-            "processing_metadata": {"source": "manual_pdf", "pages": 2},
-            "content_type": "text",
             "question_batches": [
                 {
                     "question_type": "true_false",
@@ -1211,6 +1204,14 @@ def test_create_quiz_with_manual_modules_only(session: Session):
     }
     assert quiz.selected_modules == expected_modules
 
+    # Manual content is stored as each module's content page
+    [page] = get_quiz_module_pages(session, quiz.id, "manual_abc123")
+    assert page["content"] == "This is manual content for testing"
+    assert page["word_count"] == 7
+    [page] = get_quiz_module_pages(session, quiz.id, "manual_def456")
+    assert page["content"] == "Another manual content block"
+    assert page["processing_metadata"] == {"source": "manual_pdf", "pages": 2}
+
 
 def test_create_quiz_with_mixed_canvas_and_manual_modules(session: Session):
     """Test quiz creation with both Canvas and manual modules."""
@@ -1286,10 +1287,6 @@ def test_create_quiz_with_mixed_canvas_and_manual_modules(session: Session):
         "manual_mixed123": {
             "name": "Manual Module 1",
             "source_type": "manual",
-            "content": "Mixed content testing",
-            "word_count": 3,
-            "content_type": None,
-            "processing_metadata": None,
             "question_batches": [
                 {
                     "question_type": "true_false",
@@ -1323,7 +1320,8 @@ def test_create_quiz_manual_module_validation_missing_fields(session: Session):
 
     user = create_user_in_session(session)
 
-    # This should fail - manual modules with source_type="manual" must have content and word_count
+    # This should fail - inline manual content must be non-empty with a word_count
+    # (omitting content entirely refers to content staged at upload time)
     with pytest.raises(ValidationError) as exc_info:
         QuizCreate(
             canvas_course_id=123,
@@ -1332,7 +1330,8 @@ def test_create_quiz_manual_module_validation_missing_fields(session: Session):
                 "manual_test123": ModuleSelection(
                     name="Manual Module",
                     source_type="manual",
-                    # Missing content, word_count, etc. - should fail validation
+                    content="",
+                    # Empty content, missing word_count - should fail validation
                     question_batches=[
                         {
                             "question_type": "multiple_choice",
@@ -1827,3 +1826,41 @@ def test_prepare_question_generation_with_none_custom_instructions(session: Sess
     # Verify custom_instructions is None or not present
     assert result.get("custom_instructions") is None
     assert result["question_count"] == 20
+
+
+@pytest.mark.asyncio
+async def test_failed_export_reservation_returns_checkpointed_canvas_quiz(
+    async_session,
+):
+    """Test that retrying a failed export resumes into the checkpointed quiz."""
+    from src.quiz.schemas import FailureReason, QuizStatus
+    from src.quiz.service import (
+        reserve_quiz_job,
+        save_canvas_export_checkpoint,
+        update_quiz_status,
+    )
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(
+        async_session, status=QuizStatus.READY_FOR_REVIEW
+    )
+    quiz_id = quiz.id
+
+    result = await reserve_quiz_job(async_session, quiz_id, "export")
+    assert result is not None
+    assert result["canvas_quiz_id"] is None
+
+    await save_canvas_export_checkpoint(async_session, quiz_id, "canvas_quiz_42")
+    await update_quiz_status(
+        async_session,
+        quiz_id,
+        QuizStatus.FAILED,
+        FailureReason.CANVAS_EXPORT_ERROR,
+    )
+    await async_session.commit()
+
+    result = await reserve_quiz_job(async_session, quiz_id, "export")
+
+    assert result is not None
+    assert result["already_exported"] is False
+    assert result["canvas_quiz_id"] == "canvas_quiz_42"
@@ -119,7 +119,6 @@ def test_manual_module_response_schema():
         module_id="manual_test123",
         name="Test Module",
         content_preview="Preview content...",
-        full_content="Full content for testing",
         word_count=10,
         processing_metadata={"source": "test"},
     )
@@ -127,7 +126,7 @@ def test_manual_module_response_schema():
     assert response.module_id == "manual_test123"
     assert response.name == "Test Module"
     assert response.content_preview == "Preview content..."
-    assert response.full_content == "Full content for testing"
+    assert "full_content" not in response.model_dump()
     assert response.word_count == 10
     assert response.processing_metadata == {"source": "test"}
 
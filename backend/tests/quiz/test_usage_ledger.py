@@ -0,0 +1,167 @@
+"""Tests for the per-call LLM usage ledger."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import select
+
+from tests.conftest import create_quiz_in_session
+
+
+def _call(quiz_id, **overrides):
+    call = {
+        "quiz_id": quiz_id,
+        "question_type": "multiple_choice",
+        "language": "en",
+        "model": "gpt-test",
+        "call_kind": "initial",
+        "latency": 2.0,
+        "prompt_tokens": 1000,
+        "completion_tokens": 500,
+        "total_tokens": 1500,
+        "batch_key": "module_1_multiple_choice_10_medium",
+        "module_id": "module_1",
+    }
+    call.update(overrides)
+    return call
+
+
+@pytest.mark.asyncio
+async def test_ledger_writes_buffered_calls_in_batches(async_session):
+    """Test that calls are written once the buffer fills or on flush."""
+    import asyncio
+
+    from src.quiz.models import LLMCallUsage, Quiz
+    from src.quiz.usage_ledger import LLMUsageLedger
+
+    quiz = Quiz(
+        owner_id=None,
+        canvas_course_id=1,
+        canvas_course_name="Course",
+        selected_modules={},
+        title="Quiz",
+    )
+    async_session.add(quiz)
+    await async_session.flush()
+
+    @asynccontextmanager
+    async def test_session():
+        yield async_session
+
+    ledger = LLMUsageLedger(flush_size=3)
+    with patch("src.database.get_async_session", test_session):
+        ledger.record(**_call(quiz.id))
+        ledger.record(**_call(quiz.id, call_kind="json_correction"))
+        assert ledger.snapshot()["buffered"] == 2
+
+        ledger.record(**_call(quiz.id))
+        await asyncio.sleep(0.1)
+        assert ledger.snapshot() == {"buffered": 0, "written": 3, "dropped": 0}
+
+        ledger.record(**_call(quiz.id, call_kind="retry"))
+        assert await ledger.flush() == 1
+        assert await ledger.flush() == 0
+
+    result = await async_session.execute(
+        select(LLMCallUsage.call_kind).where(LLMCallUsage.quiz_id == quiz.id)
+    )
+    assert sorted(result.scalars().all()) == [
+        "initial",
+        "initial",
+        "json_correction",
+        "retry",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ledger_drops_batch_when_write_fails():
+    """Test that a failed write is counted and does not raise."""
+    from src.quiz.usage_ledger import LLMUsageLedger
+
+    @asynccontextmanager
+    async def broken_session():
+        raise RuntimeError("database unavailable")
+        yield
+
+    ledger = LLMUsageLedger(flush_size=10)
+    ledger.record(**_call(uuid.uuid4()))
+    with patch("src.database.get_async_session", broken_session):
+        assert await ledger.flush() == 0
+    assert ledger.snapshot() == {"buffered": 0, "written": 0, "dropped": 1}
+
+
+def test_llm_cost_endpoint_reports_cost_per_quiz_and_question_type(
+    client, session, admin_user
+):
+    """Test cost and tokens per approved question from the ledger."""
+    from src.auth.utils import create_access_token
+    from src.config import settings
+    from src.question.types import QuestionType
+    from src.quiz.models import LLMCallUsage
+    from tests.factories import QuestionFactory
+
+    quiz = create_quiz_in_session(session, owner=admin_user, title="Costly Quiz")
+    now = datetime.now(timezone.utc)
+    session.add(LLMCallUsage(**_call(quiz.id), created_at=now))
+    session.add(
+        LLMCallUsage(
+            **_call(quiz.id, call_kind="validation_correction", model="unpriced"),
+            created_at=now,
+        )
+    )
+    session.add(
+        LLMCallUsage(
+            **_call(
+                quiz.id,
+                question_type="true_false",
+                prompt_tokens=200,
+                completion_tokens=100,
+                total_tokens=300,
+            ),
+            created_at=now,
+        )
+    )
+    QuestionFactory._meta.sqlalchemy_session = session
+    for is_approved in (True, True, False):
+        session.add(QuestionFactory.build(quiz=quiz, is_approved=is_approved))
+    session.add(
+        QuestionFactory.build(
+            quiz=quiz, question_type=QuestionType.TRUE_FALSE, is_approved=True
+        )
+    )
+    session.commit()
+
+    token = create_access_token(str(admin_user.id))
+    with (
+        patch("src.config.settings.ADMIN_CANVAS_IDS", [admin_user.canvas_id]),
+        patch(
+            "src.config.settings.LLM_TOKEN_PRICES",
+            {"gpt-test": {"prompt": 2.0, "completion": 8.0}},
+        ),
+    ):
+        response = client.get(
+            f"{settings.API_V1_STR}/admin/llm-cost",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["calls"] == 3
+    assert report["total_tokens"] == 3300
+    assert report["cost"] is None
+
+    (quiz_report,) = report["by_quiz"]
+    assert quiz_report["label"] == "Costly Quiz"
+    assert quiz_report["corrective_calls"] == 1
+    assert quiz_report["approved_questions"] == 3
+    assert quiz_report["tokens_per_approved_question"] == 1100
+
+    by_type = {entry["key"]: entry for entry in report["by_question_type"]}
+    true_false = by_type["true_false:en"]
+    assert true_false["cost"] == pytest.approx((200 * 2.0 + 100 * 8.0) / 1_000_000)
+    assert true_false["tokens_per_approved_question"] == 300
+    assert by_type["multiple_choice:en"]["cost"] is None
+    assert by_type["multiple_choice:en"]["approved_questions"] == 2
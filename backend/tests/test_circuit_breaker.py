@@ -0,0 +1,177 @@
+"""Tests for circuit breakers around external dependencies."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+def _outage():
+    from src.exceptions import ExternalServiceError
+
+    return ExternalServiceError("canvas", "Service unavailable", 503)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_threshold_and_fails_fast():
+    """Test that repeated outages open the breaker and later calls skip it."""
+    from src.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+    from src.exceptions import ExternalServiceError
+
+    breaker = CircuitBreaker("canvas", failure_threshold=3, recovery_timeout=30)
+    func = AsyncMock(side_effect=_outage())
+
+    for _ in range(3):
+        with pytest.raises(ExternalServiceError):
+            await breaker.call(func)
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await breaker.call(func)
+
+    assert func.await_count == 3
+    assert exc_info.value.status_code == 503
+    assert 0 < exc_info.value.retry_after <= 30
+    assert breaker.snapshot()["rejected_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_errors_do_not_open_breaker():
+    """Test that client errors show the dependency is up and reset the count."""
+    from src.circuit_breaker import CircuitBreaker, CircuitState
+    from src.exceptions import ExternalServiceError
+
+    breaker = CircuitBreaker("canvas", failure_threshold=2, recovery_timeout=30)
+    not_found = AsyncMock(side_effect=ExternalServiceError("canvas", "Missing", 404))
+
+    with pytest.raises(ExternalServiceError):
+        await breaker.call(AsyncMock(side_effect=_outage()))
+    with pytest.raises(ExternalServiceError):
+        await breaker.call(not_found)
+    with pytest.raises(ExternalServiceError):
+        await breaker.call(AsyncMock(side_effect=_outage()))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_or_reopens_breaker():
+    """Test that one probe is let through after the timeout and decides the state."""
+    from src.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+    from src.exceptions import ExternalServiceError
+
+    breaker = CircuitBreaker("canvas", failure_threshold=1, recovery_timeout=30)
+    with patch("src.circuit_breaker.time.monotonic", return_value=100.0):
+        with pytest.raises(ExternalServiceError):
+            await breaker.call(AsyncMock(side_effect=_outage()))
+
+    with patch("src.circuit_breaker.time.monotonic", return_value=131.0):
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.before_call() is True
+        # Only the probe is admitted while it is in flight
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure(_outage())
+        assert breaker.state is CircuitState.OPEN
+
+    with patch("src.circuit_breaker.time.monotonic", return_value=162.0):
+        assert await breaker.call(AsyncMock(return_value="ok")) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.snapshot()["times_opened"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_on_failure_does_not_retry_open_circuit():
+    """Test that retries stop as soon as the dependency's breaker opens."""
+    from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+    from src.retry import retry_on_failure
+
+    breaker = CircuitBreaker("canvas", failure_threshold=2, recovery_timeout=30)
+    func = AsyncMock(side_effect=_outage())
+    decorated = retry_on_failure(
+        max_attempts=5, initial_delay=0.01, circuit_breaker=breaker
+    )(func)
+
+    with patch("src.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(CircuitOpenError):
+            await decorated()
+
+    assert func.await_count == 2
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_fails_fast_when_every_endpoint_circuit_is_open():
+    """Test that a pool skips open endpoints and raises without calling them."""
+    from src.circuit_breaker import CircuitOpenError
+    from src.question.providers import (
+        LLMConfiguration,
+        LLMError,
+        LLMMessage,
+        LLMProvider,
+        MockProvider,
+    )
+    from src.question.providers.pool import ProviderEndpoint, ProviderPool
+
+    provider = MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model")
+    )
+    down = AsyncMock(
+        side_effect=LLMError("503", error_code="temporary_error", retryable=True)
+    )
+    provider.generate = down  # type: ignore[method-assign]
+    endpoint = ProviderEndpoint("west", provider)
+    endpoint.circuit_breaker.failure_threshold = 1
+    pool = ProviderPool([endpoint])
+    messages = [LLMMessage(role="user", content="Generate")]
+
+    with pytest.raises(LLMError):
+        await pool.generate(messages)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await pool.generate_with_retry(messages)
+
+    assert down.await_count == 1
+    assert exc_info.value.dependency == "llm:mock:west"
+    assert pool.health_snapshot()[0]["circuit_state"] == "open"
+
+
+def test_open_circuits_map_to_network_error():
+    """Test that fast-failed operations are reported as network errors."""
+    from src.circuit_breaker import CircuitOpenError
+    from src.quiz.exceptions import (
+        categorize_generation_error,
+        determine_failure_reason,
+    )
+    from src.quiz.schemas import FailureReason
+
+    error = CircuitOpenError("canvas", 12.0)
+
+    for operation in ("content_extraction", "canvas_export", "question_generation"):
+        assert determine_failure_reason(operation, error) == (
+            FailureReason.NETWORK_ERROR
+        )
+    assert categorize_generation_error(None) == FailureReason.LLM_GENERATION_ERROR
+    assert categorize_generation_error(CircuitOpenError("llm:openai:primary", 5.0)) == (
+        FailureReason.NETWORK_ERROR
+    )
+
+
+def test_circuit_breaker_endpoint_lists_breakers(client, admin_user):
+    """Test that breaker state is exposed to administrators for monitoring."""
+    from src.auth.utils import create_access_token
+    from src.circuit_breaker import get_circuit_breaker
+    from src.config import settings
+
+    get_circuit_breaker("canvas").record_failure(_outage())
+    url = f"{settings.API_V1_STR}/utils/circuit-breakers/"
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+
+    assert client.get(url).status_code == 403
+    assert client.get(url, headers=headers).status_code == 403
+
+    with patch("src.config.settings.ADMIN_CANVAS_IDS", [admin_user.canvas_id]):
+        response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    canvas = next(b for b in response.json() if b["name"] == "canvas")
+    assert canvas["state"] == "closed"
+    assert canvas["consecutive_failures"] == 1
@@ -0,0 +1,135 @@
+"""Tests for zstd-compressed column types."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select, text
+
+LONG_TEXT = "Photosynthesis converts light energy into chemical energy. " * 50
+
+
+def test_compress_bytes_round_trip_and_small_values_stay_plain():
+    """Test that large values are compressed and small ones stored as-is."""
+    from src.compression import ZSTD_MAGIC, compress_bytes, decompress_bytes
+
+    raw = LONG_TEXT.encode("utf-8")
+    compressed = compress_bytes(raw)
+    assert compressed.startswith(ZSTD_MAGIC)
+    assert len(compressed) < len(raw)
+    assert decompress_bytes(compressed) == raw
+
+    small = "Short note ø".encode()
+    assert compress_bytes(small) == small
+    assert decompress_bytes(small) == small
+
+
+def test_dictionary_frames_decode_with_any_retained_dictionary(tmp_path):
+    """Test values stay readable after the write dictionary is rotated."""
+    import zstandard
+
+    import src.compression as compression
+
+    samples = [
+        f"Module {i}: Canvas page about cell biology, topic {i * 7}. " * (i % 5 + 3)
+        for i in range(300)
+    ]
+    old_path = tmp_path / "old.dict"
+    new_path = tmp_path / "new.dict"
+    old_path.write_bytes(
+        compression.train_compression_dictionary(samples[:150], dict_size=4096)
+    )
+    new_path.write_bytes(
+        compression.train_compression_dictionary(samples[150:], dict_size=4096)
+    )
+    raw = samples[42].encode("utf-8")
+
+    def configure(path, directory):
+        # Dictionaries and contexts are cached, reset them per configuration
+        compression.get_compression_dictionary.cache_clear()
+        compression.get_compression_dictionaries.cache_clear()
+        compression._local.__dict__.clear()
+        return patch.multiple(
+            compression.settings,
+            DB_COMPRESSION_DICTIONARY_PATH=path,
+            DB_COMPRESSION_DICTIONARY_DIR=directory,
+            DB_COMPRESSION_MIN_BYTES=1,
+        )
+
+    try:
+        with configure(str(old_path), None):
+            old_frame = compression.compress_bytes(raw)
+            old_id = compression.get_compression_dictionary().dict_id()
+        assert zstandard.get_frame_parameters(old_frame).dict_id == old_id
+
+        with configure(str(new_path), str(tmp_path)):
+            new_frame = compression.compress_bytes(raw)
+            assert zstandard.get_frame_parameters(new_frame).dict_id != old_id
+            assert compression.decompress_bytes(old_frame) == raw
+            assert compression.decompress_bytes(new_frame) == raw
+
+        with configure(None, str(tmp_path)):
+            assert compression.decompress_bytes(old_frame) == raw
+
+        with configure(None, None):
+            with pytest.raises(ValueError, match="dictionary"):
+                compression.decompress_bytes(old_frame)
+    finally:
+        compression.get_compression_dictionary.cache_clear()
+        compression.get_compression_dictionaries.cache_clear()
+        compression._local.__dict__.clear()
+
+
+@pytest.mark.asyncio
+async def test_content_text_is_stored_compressed(async_session):
+    """Test that page text round-trips and is compressed in the database."""
+    from src.compression import ZSTD_MAGIC
+    from src.quiz.content_store import replace_quiz_content_pages
+    from src.quiz.models import ContentText
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    await replace_quiz_content_pages(
+        async_session, quiz.id, {"101": [{"title": "Intro", "content": LONG_TEXT}]}
+    )
+
+    stored = await async_session.execute(
+        text("SELECT content FROM contenttext LIMIT 1")
+    )
+    raw = bytes(stored.scalar_one())
+    assert raw.startswith(ZSTD_MAGIC)
+    assert len(raw) < len(LONG_TEXT)
+
+    content = await async_session.execute(select(ContentText.content))
+    assert content.scalar_one() == LONG_TEXT
+
+    size = await async_session.execute(select(func.octet_length(ContentText.content)))
+    assert size.scalar_one() == len(raw)
+
+
+@pytest.mark.asyncio
+async def test_content_text_is_not_decompressed_when_row_is_loaded(async_session):
+    """Test that loading a page row leaves its text unloaded until requested."""
+    from sqlalchemy import inspect
+    from sqlalchemy.orm import undefer
+
+    from src.quiz.content_store import replace_quiz_content_pages
+    from src.quiz.models import ContentText
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    await replace_quiz_content_pages(
+        async_session, quiz.id, {"101": [{"title": "Intro", "content": LONG_TEXT}]}
+    )
+    async_session.expunge_all()
+
+    row = (await async_session.execute(select(ContentText))).scalar_one()
+    assert "content" in inspect(row).unloaded
+    assert row.word_count > 0
+
+    async_session.expunge_all()
+    row = (
+        await async_session.execute(
+            select(ContentText).options(undefer(ContentText.content))
+        )
+    ).scalar_one()
+    assert row.content == LONG_TEXT
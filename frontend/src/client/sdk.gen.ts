@@ -42,6 +42,7 @@ import type {
   QuizGetQuizQuestionStatsData,
   QuizGetQuizQuestionStatsResponse,
   QuizGetQuizResponse,
+  QuizGetUserQuizzesEndpointData,
   QuizGetUserQuizzesEndpointResponse,
   QuizRegenerateSingleBatchData,
   QuizRegenerateSingleBatchResponse,
@@ -727,13 +728,19 @@ export class QuestionsService {
 export class QuizService {
   /**
    * Get User Quizzes Endpoint
-   * Retrieve all quizzes created by the authenticated user.
+   * Retrieve quizzes owned by or shared with the authenticated user.
    *
-   * Returns a list of all quizzes owned by the current user, ordered by creation date
-   * (most recent first). Each quiz includes full details including settings and metadata.
+   * Returns quizzes ordered by creation date (most recent first). Each quiz
+   * includes full details plus an `is_owner` flag distinguishing owned from
+   * shared quizzes. When `limit` is given and more quizzes exist, the
+   * X-Next-Cursor response header holds the cursor for the next page.
+   *
+   * **Parameters:**
+   * limit: Maximum number of quizzes to return (optional)
+   * cursor: Keyset cursor for the next page (optional)
    *
    * **Returns:**
-   * List[Quiz]: List of quiz objects owned by the user
+   * List[QuizListItem]: List of quiz objects with ownership flag
    *
    * **Authentication:**
    * Requires valid JWT token in Authorization header
@@ -762,17 +769,30 @@ export class QuizService {
    * "llm_model": "gpt-4o",
    * "llm_temperature": 1,
    * "created_at": "2023-01-01T12:00:00Z",
-   * "updated_at": "2023-01-01T12:00:00Z"
+   * "updated_at": "2023-01-01T12:00:00Z",
+   * "is_owner": true
    * }
    * ]
    * ```
-   * @returns Quiz Successful Response
+   * @param data The data for the request.
+   * @param data.limit Maximum quizzes to return
+   * @param data.cursor Keyset cursor from the X-Next-Cursor header
+   * @returns QuizListItem Successful Response
    * @throws ApiError
    */
-  public static getUserQuizzesEndpoint(): CancelablePromise<QuizGetUserQuizzesEndpointResponse> {
+  public static getUserQuizzesEndpoint(
+    data: QuizGetUserQuizzesEndpointData = {},
+  ): CancelablePromise<QuizGetUserQuizzesEndpointResponse> {
     return __request(OpenAPI, {
       method: "GET",
       url: "/quiz/",
+      query: {
+        limit: data.limit,
+        cursor: data.cursor,
+      },
+      errors: {
+        422: "Validation Error",
+      },
     })
   }
 
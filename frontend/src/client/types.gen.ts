@@ -147,10 +147,6 @@ export type ManualModuleResponse = {
    * Preview of processed content
    */
   content_preview: string
-  /**
-   * Full processed content
-   */
-  full_content: string
   /**
    * Word count of processed content
    */
@@ -440,6 +436,46 @@ export type QuizLanguage = "en" | "no"
 /**
  * Consolidated status values for quiz workflow.
  */
+/**
+ * Quiz entry in the user's quiz list, flagged as owned or shared.
+ */
+export type QuizListItem = {
+  id: string
+  owner_id: string
+  canvas_course_id: number
+  canvas_course_name: string
+  selected_modules: {
+    [key: string]: {
+      [key: string]: unknown
+    }
+  }
+  title: string
+  question_count: number
+  llm_model: string
+  llm_temperature: number
+  language: QuizLanguage
+  tone: QuizTone
+  custom_instructions?: string | null
+  status: QuizStatus
+  failure_reason?: FailureReason | null
+  last_status_update: string
+  extracted_content: {
+    [key: string]: unknown
+  } | null
+  content_extracted_at: string | null
+  created_at: string | null
+  updated_at: string | null
+  canvas_quiz_id: string | null
+  exported_at: string | null
+  generation_metadata?: {
+    [key: string]: unknown
+  }
+  module_question_distribution?: {
+    [key: string]: number
+  }
+  is_owner: boolean
+}
+
 export type QuizStatus =
   | "created"
   | "extracting_content"
@@ -642,7 +678,18 @@ export type QuestionsApproveQuestionData = {
 
 export type QuestionsApproveQuestionResponse = QuestionResponse
 
-export type QuizGetUserQuizzesEndpointResponse = Array<Quiz>
+export type QuizGetUserQuizzesEndpointData = {
+  /**
+   * Keyset cursor from the X-Next-Cursor header
+   */
+  cursor?: string | null
+  /**
+   * Maximum quizzes to return
+   */
+  limit?: number | null
+}
+
+export type QuizGetUserQuizzesEndpointResponse = Array<QuizListItem>
 
 export type QuizCreateNewQuizData = {
   requestBody: QuizCreate
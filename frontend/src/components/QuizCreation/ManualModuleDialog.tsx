@@ -30,7 +30,6 @@ interface ManualModuleDialogProps {
     moduleId: string
     name: string
     contentPreview: string
-    fullContent: string
     wordCount: number
     processingMetadata?: Record<string, any>
   }) => void
@@ -73,7 +72,6 @@ export const ManualModuleDialog = memo(function ManualModuleDialog({
   const [previewData, setPreviewData] = useState<{
     moduleId: string
     contentPreview: string
-    fullContent: string
     wordCount: number
     metadata?: Record<string, any>
   } | null>(null)
@@ -165,7 +163,6 @@ export const ManualModuleDialog = memo(function ManualModuleDialog({
       setPreviewData({
         moduleId: result.module_id,
         contentPreview: result.content_preview,
-        fullContent: result.full_content,
         wordCount: result.word_count,
         metadata: result.processing_metadata,
       })
@@ -197,7 +194,6 @@ export const ManualModuleDialog = memo(function ManualModuleDialog({
         moduleId: previewData.moduleId,
         name: moduleName,
         contentPreview: previewData.contentPreview,
-        fullContent: previewData.fullContent,
         wordCount: previewData.wordCount,
         processingMetadata: previewData.metadata,
       })
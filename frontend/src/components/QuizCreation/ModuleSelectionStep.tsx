@@ -27,7 +27,6 @@ interface ManualModule {
   id: string
   name: string
   contentPreview: string
-  fullContent: string
   wordCount: number
   processingMetadata?: Record<string, any>
   isManual: true
@@ -99,7 +98,6 @@ export function ModuleSelectionStep({
       moduleId: string
       name: string
       contentPreview: string
-      fullContent: string
       wordCount: number
       processingMetadata?: Record<string, any>
     }) => {
@@ -107,7 +105,6 @@ export function ModuleSelectionStep({
         id: moduleData.moduleId,
         name: moduleData.name,
         contentPreview: moduleData.contentPreview,
-        fullContent: moduleData.fullContent,
         wordCount: moduleData.wordCount,
         processingMetadata: moduleData.processingMetadata,
         isManual: true,
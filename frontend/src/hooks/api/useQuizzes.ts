@@ -6,7 +6,7 @@ import { useQuery } from "@tanstack/react-query"
 export function useUserQuizzes() {
   return useQuery({
     queryKey: queryKeys.userQuizzes(),
-    queryFn: QuizService.getUserQuizzesEndpoint,
+    queryFn: () => QuizService.getUserQuizzesEndpoint(),
     refetchInterval: useUserQuizzesPolling(), // Optimized polling for quiz arrays
     refetchIntervalInBackground: false, // Only poll when tab is active
   })
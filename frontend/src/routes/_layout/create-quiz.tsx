@@ -33,7 +33,6 @@ interface ManualModule {
   id: string
   name: string
   contentPreview: string
-  fullContent: string // Required - full processed content
   wordCount: number
   processingMetadata?: Record<string, any>
   isManual: true
@@ -160,19 +159,8 @@ function CreateQuiz() {
           source_type: isManual ? "manual" : "canvas",
         }
 
-        // For manual modules, add content fields
-        if (isManual) {
-          const manualModule = formData.manualModules?.find(
-            (m) => m.id === moduleId,
-          )
-          if (manualModule) {
-            moduleData.content = manualModule.fullContent
-            moduleData.word_count = manualModule.wordCount
-            moduleData.processing_metadata =
-              manualModule.processingMetadata || {}
-            moduleData.content_type = "text" // Default content type
-          }
-        }
+        // Manual module content is staged server-side at upload time and
+        // resolved from the module ID, so it is not posted back here
 
         return {
           ...acc,
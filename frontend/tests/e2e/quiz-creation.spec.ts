@@ -141,7 +141,6 @@ test.describe("Quiz Creation", () => {
       module_id: "manual-module-uuid-123",
       name: manualModuleName,
       content_preview: `${manualModuleContent.substring(0, 200)}...`,
-      full_content: manualModuleContent,
       word_count: manualModuleContent.split(/\s+/).length,
     }
 